@@ -0,0 +1,10 @@
+"""Performance benchmarks for mortgage-cli.
+
+Run the suite and write a baseline:
+
+    python -m benchmarks run --output benchmarks/baseline.json
+
+Compare a fresh run (or a saved one) against the baseline:
+
+    python -m benchmarks compare benchmarks/baseline.json --threshold 0.15
+"""
@@ -0,0 +1,121 @@
+"""Command line entry point: python -m benchmarks {run,compare,list}."""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from benchmarks import suite  # noqa: F401  (registers the benchmarks)
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    compare,
+    format_seconds,
+    load_results,
+    registered,
+    run_suite,
+    save_results,
+)
+
+
+def _print_progress(name: str, timings: dict[str, float]) -> None:
+    print(
+        f"{name:<40} {format_seconds(timings['median']):>10}  (min {format_seconds(timings['min'])})",
+        file=sys.stderr,
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    document = run_suite(args.filter, args.repeat, args.min_time, _print_progress)
+    if args.output:
+        save_results(document, args.output)
+        print(f"Wrote {len(document['results'])} results to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = run_suite(args.filter, args.repeat, args.min_time, _print_progress)
+        if args.output:
+            save_results(current, args.output)
+
+    comparisons = compare(baseline, current, args.threshold, args.stat)
+    if args.filter:
+        comparisons = [c for c in comparisons if args.filter in c.name]
+
+    print(f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    for c in comparisons:
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "-"
+        print(
+            f"{c.name:<40} {format_seconds(c.baseline):>10} "
+            f"{format_seconds(c.current):>10} {ratio:>7}  {c.status}"
+        )
+
+    regressions = [c for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: "
+            + ", ".join(c.name for c in regressions)
+        )
+        return 1
+    return 0
+
+
+def _list(args: argparse.Namespace) -> int:
+    for bench in registered(args.filter):
+        print(bench.name)
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmark command line.
+
+    Args:
+        argv: Arguments (sys.argv[1:] if None)
+
+    Returns:
+        Exit code (1 if compare found regressions)
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument("-k", "--filter", help="only benchmarks whose name contains this")
+        command.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+        command.add_argument(
+            "--min-time", type=float, default=0.2, help="minimum seconds per timed run"
+        )
+        command.add_argument("-o", "--output", type=Path, help="write results JSON here")
+
+    run = commands.add_parser("run", help="run benchmarks and optionally save results")
+    add_run_options(run)
+    run.set_defaults(handler=_run)
+
+    comp = commands.add_parser("compare", help="compare results against a baseline")
+    comp.add_argument("baseline", type=Path, help="baseline results JSON")
+    comp.add_argument("current", type=Path, nargs="?", help="results JSON (runs the suite if omitted)")
+    comp.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"fraction slower that counts as a regression (default {DEFAULT_THRESHOLD})",
+    )
+    comp.add_argument(
+        "--stat", choices=("min", "median", "mean"), default="median", help="statistic to compare"
+    )
+    add_run_options(comp)
+    comp.set_defaults(handler=_compare)
+
+    listing = commands.add_parser("list", help="list benchmark names")
+    listing.add_argument("-k", "--filter", help="only benchmarks whose name contains this")
+    listing.set_defaults(handler=_list)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Benchmark registry, timing and baseline comparison."""
+
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from mortgage_cli import __version__
+
+# Bump when the results file layout changes
+RESULTS_FORMAT = 1
+
+# Fraction slower than baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named benchmark.
+
+    setup is called once per benchmark and returns the callable to time, so
+    profile loading and input generation stay out of the measurement.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    # Time each call on its own instead of in auto-ranged loops (slow benchmarks)
+    single_shot: bool = False
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One benchmark compared against its baseline."""
+
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    threshold: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Current time divided by baseline time."""
+        if self.baseline is None or self.current is None or self.baseline <= 0:
+            return None
+        return self.current / self.baseline
+
+    @property
+    def status(self) -> str:
+        """One of: regression, improvement, ok, new, missing."""
+        if self.baseline is None:
+            return "new"
+        if self.current is None:
+            return "missing"
+        ratio = self.ratio
+        if ratio is not None and ratio > 1 + self.threshold:
+            return "regression"
+        if ratio is not None and ratio < 1 / (1 + self.threshold):
+            return "improvement"
+        return "ok"
+
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    params: Optional[Iterable[Any]] = None,
+    single_shot: bool = False,
+) -> Callable[[Callable[..., Callable[[], object]]], Callable[..., Callable[[], object]]]:
+    """Register a benchmark setup function.
+
+    With params, one benchmark is registered per value as name[value], and
+    the value is passed to the setup function.
+
+    Args:
+        name: Benchmark name
+        params: Optional parameter values
+        single_shot: Time each call separately (for calls taking 10+ ms)
+
+    Returns:
+        Decorator that registers the setup function unchanged
+    """
+
+    def register(setup: Callable[..., Callable[[], object]]) -> Callable[..., Callable[[], object]]:
+        if params is None:
+            _add(Benchmark(name, setup, single_shot))
+        else:
+            for value in params:
+                _add(Benchmark(f"{name}[{value}]", _bind(setup, value), single_shot))
+        return setup
+
+    return register
+
+
+def _bind(setup: Callable[..., Callable[[], object]], value: Any) -> Callable[[], Callable[[], object]]:
+    """Bind a parameter value to a setup function."""
+    return lambda: setup(value)
+
+
+def _add(bench: Benchmark) -> None:
+    """Add a benchmark to the registry."""
+    if bench.name in _REGISTRY:
+        raise ValueError(f"Duplicate benchmark name: {bench.name}")
+    _REGISTRY[bench.name] = bench
+
+
+def registered(pattern: Optional[str] = None) -> list[Benchmark]:
+    """Get registered benchmarks, optionally filtered by a name substring.
+
+    Args:
+        pattern: Only include benchmarks whose name contains this
+
+    Returns:
+        Benchmarks in registration order
+    """
+    return [b for name, b in _REGISTRY.items() if pattern is None or pattern in name]
+
+
+def measure(bench: Benchmark, repeat: int = 5, min_time: float = 0.2) -> dict[str, float]:
+    """Time a benchmark.
+
+    Args:
+        bench: Benchmark to run
+        repeat: Number of timed runs
+        min_time: Minimum duration of each run in seconds (ignored for single-shot)
+
+    Returns:
+        Per-call timings in seconds: min, median, mean, plus loops per run
+    """
+    fn = bench.setup()
+    if bench.single_shot:
+        loops = 1
+        fn()  # warm caches outside the measurement
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    else:
+        timer = timeit.Timer(fn)
+        loops, elapsed = timer.autorange()
+        if elapsed < min_time:
+            loops = max(loops, int(loops * min_time / max(elapsed, 1e-9)))
+        times = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "loops": loops,
+        "runs": repeat,
+    }
+
+
+def run_suite(
+    pattern: Optional[str] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[str, dict[str, float]], None]] = None,
+) -> dict[str, Any]:
+    """Run registered benchmarks and build a results document.
+
+    Args:
+        pattern: Only run benchmarks whose name contains this
+        repeat: Number of timed runs per benchmark
+        min_time: Minimum duration of each run in seconds
+        progress: Called with (name, timings) after each benchmark
+
+    Returns:
+        Results document as written by save_results
+    """
+    results = {}
+    for bench in registered(pattern):
+        timings = measure(bench, repeat=repeat, min_time=min_time)
+        results[bench.name] = timings
+        if progress is not None:
+            progress(bench.name, timings)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mortgage_cli": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "argv": sys.argv[1:],
+        "results": results,
+    }
+
+
+def save_results(document: dict[str, Any], path: Path) -> None:
+    """Write a results document as JSON.
+
+    Args:
+        document: Output of run_suite
+        path: Destination file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=False) + "\n")
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Read a results document.
+
+    Args:
+        path: Results file written by save_results
+
+    Returns:
+        Results document
+
+    Raises:
+        ValueError: If the file is not a results document of a known format
+    """
+    document = json.loads(path.read_text())
+    if not isinstance(document, dict) or document.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} is not a benchmark results file (format {RESULTS_FORMAT})")
+    return document
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    stat: str = "median",
+) -> list[Comparison]:
+    """Compare two results documents benchmark by benchmark.
+
+    Args:
+        baseline: Reference results
+        current: New results
+        threshold: Fraction slower than baseline that counts as a regression
+        stat: Timing statistic to compare (min, median or mean)
+
+    Returns:
+        One comparison per benchmark present in either document
+    """
+    base_results = baseline["results"]
+    current_results = current["results"]
+    names = list(base_results) + [name for name in current_results if name not in base_results]
+
+    return [
+        Comparison(
+            name=name,
+            baseline=base_results[name][stat] if name in base_results else None,
+            current=current_results[name][stat] if name in current_results else None,
+            threshold=threshold,
+        )
+        for name in names
+    ]
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Format a duration with a readable unit."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
@@ -0,0 +1,206 @@
+"""Benchmark definitions.
+
+Importing this module registers every benchmark with the harness.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from rich.console import Console
+
+import mortgage_cli
+from benchmarks.harness import benchmark
+from mortgage_cli.config.defaults import DEFAULT_PROFILE
+from mortgage_cli.core.amortization import AmortizationGenerator
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.boundary import find_boundaries
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.core.solver import GoalSolver
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.output.csv_fmt import CsvFormatter
+from mortgage_cli.output.json_fmt import JsonFormatter
+from mortgage_cli.output.summary import SummaryFormatter
+from mortgage_cli.output.table import TableFormatter
+from mortgage_cli.store import ResultQuery, ResultStore
+
+PROFILE = DEFAULT_PROFILE
+
+# Matrix grid sizes as (down payment rows, price columns)
+GRID_SIZES = ("11x21", "21x101", "101x1001", "1001x1001")
+BATCH_SIZES = (1_000, 100_000)
+LOAN_TERMS = (10, 20, 30)
+
+# Formatters rendered into memory so terminal I/O is not measured
+FORMATTERS: dict[str, Callable[[], object]] = {
+    "table": lambda: TableFormatter(Console(file=io.StringIO(), width=120)),
+    "json": JsonFormatter,
+    "csv": CsvFormatter,
+    "summary": SummaryFormatter,
+}
+
+SRC_DIR = str(Path(mortgage_cli.__file__).resolve().parent.parent)
+
+
+def _grid(size: str) -> tuple[np.ndarray, np.ndarray]:
+    """Price and down payment axes for a ROWSxCOLS grid size."""
+    rows, cols = (int(n) for n in size.split("x"))
+    return np.linspace(50_000, 900_000, cols), np.linspace(0.0, 0.5, rows)
+
+
+# Analyzer
+
+
+@benchmark("analyzer.analyze")
+def analyze_single() -> Callable[[], object]:
+    analyzer = InvestmentAnalyzer(PROFILE)
+    property_input = PropertyInput(price=165_000, expected_rent=950)
+    return lambda: analyzer.analyze(property_input)
+
+
+@benchmark("analyzer.analyze_batch", params=BATCH_SIZES)
+def analyze_batch(size: int) -> Callable[[], object]:
+    analyzer = InvestmentAnalyzer(PROFILE)
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(50_000, 900_000, size)
+    rents = rng.uniform(400, 4_000, size)
+    return lambda: analyzer.analyze_batch(prices, rents)
+
+
+# Matrix
+
+
+@benchmark("matrix.evaluate", params=GRID_SIZES)
+def matrix_evaluate(size: str) -> Callable[[], object]:
+    engine = MatrixEngine(PROFILE)
+    prices, downs = _grid(size)
+    return lambda: engine.evaluate(prices, downs)
+
+
+@benchmark("matrix.adaptive", params=GRID_SIZES)
+def matrix_adaptive(size: str) -> Callable[[], object]:
+    # Boundaries only, at the resolution of the matching dense grid
+    rows, cols = (int(n) for n in size.split("x"))
+    price_step = (900_000 - 50_000) / (cols - 1)
+    down_step = 0.5 / (rows - 1)
+    return lambda: find_boundaries(PROFILE, 50_000, 900_000, price_step, 0.0, 0.5, down_step)
+
+
+@benchmark("matrix.to_cells", params=GRID_SIZES[:3])
+def matrix_to_cells(size: str) -> Callable[[], object]:
+    result = MatrixEngine(PROFILE).evaluate(*_grid(size))
+    return result.to_cells
+
+
+# Goal-seek solvers
+
+
+@benchmark("solve.max_price", params=BATCH_SIZES)
+def solve_max_price(size: int) -> Callable[[], object]:
+    solver = GoalSolver(PROFILE)
+    rng = np.random.default_rng(0)
+    rents = rng.uniform(400, 4_000, size)
+    downs = rng.uniform(0.0, 0.5, size)
+    return lambda: solver.max_price(rents, downs)
+
+
+@benchmark("solve.max_interest_rate", params=BATCH_SIZES)
+def solve_max_interest_rate(size: int) -> Callable[[], object]:
+    solver = GoalSolver(PROFILE)
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(50_000, 900_000, size)
+    rents = rng.uniform(400, 4_000, size)
+    return lambda: solver.max_interest_rate(prices, rents, 0.2)
+
+
+# Results store (history of stored results, queried through the indexes)
+
+
+@benchmark("store.query", params=BATCH_SIZES)
+def store_query(size: int) -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    batch = InvestmentAnalyzer(PROFILE).analyze_batch(
+        rng.uniform(50_000, 900_000, size), rng.uniform(400, 4_000, size)
+    )
+    store = ResultStore(Path(tempfile.mkdtemp()) / "results.db")
+    with store.run("batch", PROFILE.name) as run:
+        run.add_batch(batch)
+    query = ResultQuery(verdicts=("green",), max_price=180_000, min_return=0.04)
+    return lambda: store.query(query)
+
+
+# Amortization
+
+
+@benchmark("amortize.generate_arrays", params=LOAN_TERMS)
+def amortize_arrays(years: int) -> Callable[[], object]:
+    generator = AmortizationGenerator()
+    return lambda: generator.generate_arrays(132_000, 0.041, years, 165_000)
+
+
+@benchmark("amortize.generate_schedule", params=LOAN_TERMS)
+def amortize_schedule(years: int) -> Callable[[], object]:
+    generator = AmortizationGenerator()
+    return lambda: generator.generate_schedule(132_000, 0.041, years, 165_000)
+
+
+# Formatters
+
+
+@benchmark("format.analysis", params=tuple(FORMATTERS))
+def format_analysis(name: str) -> Callable[[], object]:
+    formatter = FORMATTERS[name]()
+    result = InvestmentAnalyzer(PROFILE).analyze(PropertyInput(price=165_000, expected_rent=950))
+    return lambda: formatter.format_analysis(result, PROFILE)
+
+
+@benchmark("format.matrix", params=tuple(FORMATTERS))
+def format_matrix(name: str) -> Callable[[], object]:
+    formatter = FORMATTERS[name]()
+    prices, downs = _grid(GRID_SIZES[1])
+    matrix = MatrixEngine(PROFILE).evaluate(prices, downs)
+    return lambda: formatter.format_matrix(matrix, PROFILE.budget.target_rent, PROFILE)
+
+
+# Streamed JSON matrix layouts, written to a discarding stream
+JSON_MATRIX_LAYOUTS = ("cells", "cells-compact", "columns", "columns-compact")
+
+
+@benchmark("format.matrix_json", params=JSON_MATRIX_LAYOUTS)
+def format_matrix_json(variant: str) -> Callable[[], object]:
+    layout, _, compact = variant.partition("-")
+    formatter = JsonFormatter()
+    prices, downs = _grid(GRID_SIZES[1])
+    matrix = MatrixEngine(PROFILE).evaluate(prices, downs)
+    sink = open(os.devnull, "w")
+    return lambda: formatter.write_matrix(
+        matrix,
+        PROFILE.budget.target_rent,
+        PROFILE,
+        sink,
+        layout=layout,
+        compact=bool(compact),
+    )
+
+
+# Cold CLI startup (each call starts a fresh interpreter)
+
+STARTUP_COMMANDS: dict[str, list[str]] = {
+    "python": ["-c", "pass"],
+    "import": ["-c", "import mortgage_cli.main"],
+    "import_api": ["-c", "import mortgage_cli.api"],
+    "version": ["-m", "mortgage_cli", "--version"],
+    "analyze": ["-m", "mortgage_cli", "analyze", "-p", "165000", "-r", "950", "-o", "json"],
+}
+
+
+@benchmark("startup", params=tuple(STARTUP_COMMANDS), single_shot=True)
+def startup(name: str) -> Callable[[], object]:
+    command = [sys.executable, *STARTUP_COMMANDS[name]]
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    return lambda: subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
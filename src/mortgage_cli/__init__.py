@@ -1,3 +1,9 @@
 """mortgage-cli: CLI tool for analyzing rental property investments."""
 
+import time
+
 __version__ = "0.1.0"
+
+# perf_counter() when the package was first imported; --timings measures the
+# import stage and the total run time from here
+IMPORT_STARTED = time.perf_counter()
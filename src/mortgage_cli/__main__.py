@@ -1,6 +1,6 @@
 """Entry point for python -m mortgage_cli."""
 
-from mortgage_cli.main import app
+from mortgage_cli.main import main
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1,347 @@
+"""Programmatic API for using mortgage-cli as a library.
+
+Functions take plain numbers or arrays and return dataclasses or NumPy
+arrays. Nothing here imports Typer, Rich or the output formatters, and the
+module itself only imports the standard library: NumPy, pydantic and the
+profile loader are imported by the first call that needs them, so
+importing it in a short-lived worker costs next to nothing (guarded by
+tests/test_startup.py).
+
+Profiles are given by name (loaded like --profile), as a Profile, or as
+None for the default profile. Down payments are decimals (0.2 for 20%);
+None uses the profile's default down payment.
+
+Example:
+    >>> from mortgage_cli import api
+    >>> api.analyze(150000, 900).verdict
+    'yellow'
+    >>> prices, _ = api.max_price(rent=950, down=0.2)
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from mortgage_cli.core.amortization import AmortizationSchedule
+    from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+    from mortgage_cli.core.solver import GoalSolver
+    from mortgage_cli.models.profile import Profile
+    from mortgage_cli.models.results import Verdict
+
+ProfileLike = Union[str, "Profile", None]
+ArrayLike = Union[Sequence[float], "np.ndarray"]
+Values = Union[float, ArrayLike]
+
+__all__ = [
+    "Amortization",
+    "Analysis",
+    "amortize",
+    "analyze",
+    "analyze_batch",
+    "load_profile",
+    "matrix",
+    "max_interest_rate",
+    "max_price",
+    "min_down_payment",
+    "rent_for_return",
+]
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """Investment analysis of one property (see analyze)."""
+
+    price: float
+    rent: float
+    down_payment_percent: float
+    upfront_total: float
+    mortgage_payment: float
+    fixed_costs: float
+    break_even_rent: float
+    cash_on_cash_return: float
+    monthly_surplus_shortfall: float
+    verdict: str
+    within_budget: bool
+    warnings: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Amortization:
+    """Loan details with a yearly amortization schedule (see amortize)."""
+
+    loan_amount: float
+    effective_rate: float
+    monthly_payment: float
+    schedule: "AmortizationSchedule"
+
+
+def load_profile(profile: ProfileLike = None) -> "Profile":
+    """Resolve a profile argument.
+
+    Args:
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        Profile instance
+
+    Raises:
+        ProfileNotFoundError: If no profile has that name
+    """
+    if profile is None or isinstance(profile, str):
+        from mortgage_cli.config.manager import ConfigManager
+
+        return ConfigManager().load_profile(profile or "default")
+    return profile
+
+
+def analyze(
+    price: float,
+    rent: float,
+    down: Optional[float] = None,
+    profile: ProfileLike = None,
+) -> Analysis:
+    """Analyze a single property investment.
+
+    Args:
+        price: Purchase price
+        rent: Expected monthly rent
+        down: Down payment percentage as decimal
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        Analysis with costs, break-even rent, return and verdict
+
+    Raises:
+        ValueError: If an input is out of range
+    """
+    from mortgage_cli.core.analyzer import InvestmentAnalyzer
+    from mortgage_cli.models.property import PropertyInput
+
+    result = InvestmentAnalyzer(load_profile(profile)).evaluate(
+        PropertyInput(price=price, expected_rent=rent, down_payment_percent=down)
+    )
+    return Analysis(
+        price=result.property_price,
+        rent=result.expected_rent,
+        down_payment_percent=result.down_payment_percent,
+        upfront_total=result.upfront_costs.total,
+        mortgage_payment=result.monthly.mortgage_payment,
+        fixed_costs=result.monthly.fixed_costs,
+        break_even_rent=result.break_even_rent,
+        cash_on_cash_return=result.cash_on_cash_return,
+        monthly_surplus_shortfall=result.monthly_surplus_shortfall,
+        verdict=result.verdict.value,
+        within_budget=result.within_budget,
+        warnings=tuple(result.warnings),
+    )
+
+
+def analyze_batch(
+    prices: ArrayLike,
+    rents: ArrayLike,
+    downs: Optional[ArrayLike] = None,
+    profile: ProfileLike = None,
+) -> "BatchAnalysis":
+    """Analyze many properties in one vectorized pass.
+
+    Args:
+        prices: Purchase prices
+        rents: Expected monthly rents
+        downs: Down payment percentages as decimals (NaN uses the default)
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        BatchAnalysis of NumPy arrays, one entry per property (verdicts as
+        uint8 codes; see its verdicts property)
+
+    Raises:
+        ValueError: If the columns differ in length or hold invalid values
+    """
+    from mortgage_cli.core.analyzer import InvestmentAnalyzer
+
+    return InvestmentAnalyzer(load_profile(profile)).analyze_batch(prices, rents, downs)
+
+
+def matrix(
+    prices: ArrayLike,
+    down_payments: ArrayLike,
+    profile: ProfileLike = None,
+    workers: int = 1,
+) -> "MatrixArrays":
+    """Evaluate break-even rent and verdicts over a price x down payment grid.
+
+    Args:
+        prices: Purchase prices (matrix columns)
+        down_payments: Down payment percentages as decimals (matrix rows)
+        profile: Profile name, Profile, or None for 'default'
+        workers: Worker processes (0 = one per CPU, 1 = in-process)
+
+    Returns:
+        MatrixArrays with (len(down_payments), len(prices)) result arrays
+    """
+    from mortgage_cli.core.parallel import evaluate_matrix
+
+    return evaluate_matrix(load_profile(profile), prices, down_payments, workers=workers)
+
+
+def amortize(
+    price: float,
+    down: Optional[float] = None,
+    years: Optional[int] = None,
+    profile: ProfileLike = None,
+) -> Amortization:
+    """Build the yearly amortization schedule of a purchase's loan.
+
+    Args:
+        price: Purchase price
+        down: Down payment percentage as decimal
+        years: Only schedule the first N years (default: the full term)
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        Amortization with the loan, its payment and schedule arrays
+    """
+    from mortgage_cli.core.amortization import AmortizationGenerator
+    from mortgage_cli.core.compiled import annuity_factor
+
+    mortgage = load_profile(profile).mortgage
+    loan_amount = price * (1 - (mortgage.default_down_payment if down is None else down))
+    effective_rate = mortgage.interest_rate + mortgage.insurance_rate
+    return Amortization(
+        loan_amount=loan_amount,
+        effective_rate=effective_rate,
+        monthly_payment=loan_amount * annuity_factor(effective_rate, mortgage.duration_years),
+        schedule=AmortizationGenerator().generate_arrays(
+            principal=loan_amount,
+            annual_rate=effective_rate,
+            years=mortgage.duration_years,
+            original_property_value=price,
+            limit_years=years,
+        ),
+    )
+
+
+def max_price(
+    rent: Values,
+    down: Optional[Values] = None,
+    verdict: str = "green",
+    profile: ProfileLike = None,
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Highest price that keeps a verdict and stays within budget.
+
+    Args:
+        rent: Target rent(s) the verdict is judged against
+        down: Down payment percentage(s) as decimal
+        verdict: Worst acceptable verdict: green or yellow
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        (prices, limited_by_budget) arrays; NaN where no price qualifies
+    """
+    solver, profile_data = _solver(profile)
+    return solver.max_price(_array(rent), _array(_down(down, profile_data)), _verdict(verdict))
+
+
+def min_down_payment(
+    price: Values,
+    rent: Values,
+    verdict: str = "green",
+    profile: ProfileLike = None,
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Lowest down payment that reaches a verdict within budget.
+
+    Args:
+        price: Purchase price(s)
+        rent: Target rent(s) the verdict is judged against
+        verdict: Worst acceptable verdict: green or yellow
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        (min_down, max_down) arrays as decimals; NaN where none qualifies
+    """
+    solver, _ = _solver(profile)
+    return solver.min_down_payment(_array(price), _array(rent), _verdict(verdict))
+
+
+def rent_for_return(
+    price: Values,
+    cash_on_cash: Values,
+    down: Optional[Values] = None,
+    profile: ProfileLike = None,
+) -> "np.ndarray":
+    """Rent needed for a cash-on-cash return.
+
+    Args:
+        price: Purchase price(s)
+        cash_on_cash: Target annual return(s) as decimal
+        down: Down payment percentage(s) as decimal
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        Monthly rents
+    """
+    solver, profile_data = _solver(profile)
+    return solver.rent_for_return(
+        _array(price), _array(_down(down, profile_data)), _array(cash_on_cash)
+    )
+
+
+def max_interest_rate(
+    price: Values,
+    rent: Values,
+    down: Optional[Values] = None,
+    verdict: str = "green",
+    profile: ProfileLike = None,
+) -> "np.ndarray":
+    """Highest interest rate (before insurance) that keeps a verdict.
+
+    Args:
+        price: Purchase price(s)
+        rent: Target rent(s) the verdict is judged against
+        down: Down payment percentage(s) as decimal
+        verdict: Worst acceptable verdict: green or yellow
+        profile: Profile name, Profile, or None for 'default'
+
+    Returns:
+        Annual rates as decimals; NaN where even a zero rate misses the
+        verdict or the property is over budget
+    """
+    solver, profile_data = _solver(profile)
+    return solver.max_interest_rate(
+        _array(price), _array(rent), _array(_down(down, profile_data)), _verdict(verdict)
+    )
+
+
+def _solver(profile: ProfileLike) -> tuple["GoalSolver", "Profile"]:
+    """Build a goal solver for a profile argument."""
+    from mortgage_cli.core.solver import GoalSolver
+
+    profile_data = load_profile(profile)
+    return GoalSolver(profile_data), profile_data
+
+
+def _down(down: Optional[Values], profile: "Profile") -> Values:
+    """Down payment argument, defaulting to the profile's."""
+    return profile.mortgage.default_down_payment if down is None else down
+
+
+def _array(values: Values) -> "np.ndarray":
+    """Solver input as a float array (scalars become 0-d arrays)."""
+    import numpy as np
+
+    return np.asarray(values, dtype=np.float64)
+
+
+def _verdict(verdict: str) -> "Verdict":
+    """Parse a verdict name.
+
+    Raises:
+        ValueError: If verdict is not green or yellow
+    """
+    from mortgage_cli.models.results import Verdict
+
+    if verdict not in ("green", "yellow"):
+        raise ValueError(f"Cannot solve for verdict '{verdict}'. Use green or yellow")
+    return Verdict(verdict)
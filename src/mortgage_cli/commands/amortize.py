@@ -6,9 +6,11 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from mortgage_cli import result_cache, timings
 from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
 from mortgage_cli.core.amortization import AmortizationGenerator
-from mortgage_cli.core.calculator import MortgageCalculator
+from mortgage_cli.core.compiled import annuity_factor
+from mortgage_cli.output.ndjson_fmt import NdjsonFormatter
 from mortgage_cli.utils.currency import format_currency
 from mortgage_cli.utils.percentage import format_percentage, parse_percentage
 
@@ -32,6 +34,10 @@ def amortize(
         str,
         typer.Option("--profile", help="Profile name to use"),
     ] = "default",
+    output: Annotated[
+        str,
+        typer.Option("--output", "-o", help="Output format: table, ndjson (one line per year)"),
+    ] = "table",
 ) -> None:
     """Generate amortization schedule.
 
@@ -41,6 +47,7 @@ def amortize(
     Examples:
         mortgage-cli amortize --price 150000
         mortgage-cli amortize --price 150000 --down 25% --years 5
+        mortgage-cli amortize --price 150000 --output ndjson | jq .interest_paid
     """
     # Load profile
     config_manager = ConfigManager()
@@ -59,62 +66,83 @@ def amortize(
             console.print(f"[red]Error: Invalid down payment '{down}'[/red]")
             raise typer.Exit(1)
 
+    if output not in ("table", "ndjson"):
+        console.print(f"[red]Error: Unknown format '{output}'. Supported: table, ndjson[/red]")
+        raise typer.Exit(1)
+
+    # ndjson output can be replayed from the result cache (--cache)
+    key = None
+    if output == "ndjson":
+        key = result_cache.lookup(
+            "amortize", profile_data, {"price": price, "down": down_pct, "years": years}
+        )
+        if result_cache.replay(key):
+            return
+
     # Calculate loan details
-    calculator = MortgageCalculator()
-    loan_amount = calculator.calculate_loan_amount(price, down_pct)
-    effective_rate = calculator.calculate_effective_rate(
-        profile_data.mortgage.interest_rate,
-        profile_data.mortgage.insurance_rate,
-    )
-    monthly_payment = calculator.calculate_monthly_payment(
-        loan_amount,
-        effective_rate,
-        profile_data.mortgage.duration_years,
-    )
-
-    # Generate schedule
-    generator = AmortizationGenerator()
-    schedule = generator.generate_schedule(
-        principal=loan_amount,
-        annual_rate=effective_rate,
-        years=profile_data.mortgage.duration_years,
-        original_property_value=price,
-        limit_years=years,
-    )
+    with timings.stage("compute"):
+        mortgage = profile_data.mortgage
+        loan_amount = price * (1 - down_pct)
+        effective_rate = mortgage.interest_rate + mortgage.insurance_rate
+        # Same payment factor as analyze, matrix and batch
+        monthly_payment = loan_amount * annuity_factor(effective_rate, mortgage.duration_years)
+
+        # Generate schedule
+        generator = AmortizationGenerator()
+        schedule = generator.generate_arrays(
+            principal=loan_amount,
+            annual_rate=effective_rate,
+            years=mortgage.duration_years,
+            original_property_value=price,
+            limit_years=years,
+        )
 
-    # Header
-    console.print()
-    title = (
-        f"Amortization Schedule: {format_currency(loan_amount)} loan "
-        f"@ {format_percentage(effective_rate, 1)} over {profile_data.mortgage.duration_years} years"
-    )
-    console.print(f"[bold]{title}[/bold]")
-    console.print(f"Monthly Payment: {format_currency(monthly_payment, decimals=2)}")
-    console.print()
+    has_schedule = len(schedule) > 0 and loan_amount > 0
+    # Entries are rounded to cents, so the table and totals match the JSON output
+    entries = schedule.to_entries() if has_schedule else []
+    if output == "ndjson":
+        with timings.stage("format"), result_cache.recording(key) as out:
+            NdjsonFormatter().write_schedule(entries, out)
+        return
 
-    # Table
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("Year", justify="right")
-    table.add_column("Principal", justify="right")
-    table.add_column("Interest", justify="right")
-    table.add_column("Balance", justify="right")
-    table.add_column("Equity", justify="right")
-
-    for entry in schedule:
-        table.add_row(
-            str(entry.year),
-            format_currency(entry.principal_paid),
-            format_currency(entry.interest_paid),
-            format_currency(entry.remaining_balance),
-            format_percentage(entry.equity_percent, 1),
+    # Header
+    with timings.stage("write"):
+        console.print()
+        title = (
+            f"Amortization Schedule: {format_currency(loan_amount)} loan "
+            f"@ {format_percentage(effective_rate, 1)} "
+            f"over {profile_data.mortgage.duration_years} years"
         )
+        console.print(f"[bold]{title}[/bold]")
+        console.print(f"Monthly Payment: {format_currency(monthly_payment, decimals=2)}")
+        console.print()
 
-    console.print(table)
+    # Table
+    with timings.stage("format"):
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Year", justify="right")
+        table.add_column("Principal", justify="right")
+        table.add_column("Interest", justify="right")
+        table.add_column("Balance", justify="right")
+        table.add_column("Equity", justify="right")
+
+        for entry in entries:
+            table.add_row(
+                str(entry.year),
+                format_currency(entry.principal_paid),
+                format_currency(entry.interest_paid),
+                format_currency(entry.remaining_balance),
+                format_percentage(entry.equity_percent, 1),
+            )
+        timings.count("cells_rendered", len(table.rows) * len(table.columns))
+
+    with timings.stage("write"):
+        console.print(table)
 
     # Summary
-    if schedule:
-        total_principal = sum(e.principal_paid for e in schedule)
-        total_interest = sum(e.interest_paid for e in schedule)
+    if has_schedule:
+        total_principal = sum(entry.principal_paid for entry in entries)
+        total_interest = sum(entry.interest_paid for entry in entries)
         console.print()
         console.print(f"Total Principal Paid: {format_currency(total_principal)}")
         console.print(f"Total Interest Paid: {format_currency(total_interest)}")
@@ -1,14 +1,19 @@
 """Analyze command for single property analysis."""
 
+import sys
+from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
 
+from mortgage_cli import result_cache, timings
 from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
 from mortgage_cli.core.analyzer import InvestmentAnalyzer
 from mortgage_cli.models.property import PropertyInput
-from mortgage_cli.output import get_formatter
+from mortgage_cli.models.results import AnalysisResult
+from mortgage_cli.output import STREAM_FORMATTERS, get_formatter
+from mortgage_cli.store import open_store
 from mortgage_cli.utils.percentage import parse_percentage
 
 console = Console()
@@ -37,8 +42,16 @@ def analyze(
     ] = "default",
     output: Annotated[
         str,
-        typer.Option("--output", "-o", help="Output format: table, json"),
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson, csv, summary"),
     ] = "table",
+    store: Annotated[
+        bool,
+        typer.Option("--store", help="Save the result to the results store (see 'query')"),
+    ] = False,
+    db: Annotated[
+        Optional[Path],
+        typer.Option("--db", help="Results store for --store (default: results.db in config dir)"),
+    ] = None,
 ) -> None:
     """Analyze a single property investment.
 
@@ -49,6 +62,7 @@ def analyze(
         mortgage-cli analyze --price 150000 --rent 900
         mortgage-cli analyze -p 200000 -r 1200 --down 25%
         mortgage-cli analyze --price 150000 --rent 900 --output json
+        mortgage-cli analyze --price 150000 --rent 900 --store
     """
     # Load profile
     config_manager = ConfigManager()
@@ -74,9 +88,26 @@ def analyze(
         down_payment_percent=down_pct,
     )
 
+    # Machine formats can be replayed from the result cache (--cache), unless
+    # the result has to be computed for --store
+    key = None
+    if output in result_cache.CACHED_FORMATS and not store:
+        key = result_cache.lookup(
+            "analyze",
+            profile_data,
+            {"price": price, "rent": rent, "down": down_pct, "output": output},
+        )
+        if result_cache.replay(key):
+            return
+
     # Run analysis
-    analyzer = InvestmentAnalyzer(profile_data)
-    result = analyzer.analyze(property_input)
+    with timings.stage("compute"):
+        analyzer = InvestmentAnalyzer(profile_data)
+        result = analyzer.analyze(property_input)
+    timings.count("analyses")
+
+    if store:
+        _store_result(result, profile_data.name, db)
 
     # Output result
     try:
@@ -86,7 +117,31 @@ def analyze(
         raise typer.Exit(1)
 
     if output == "table":
-        formatter.format_analysis(result, profile_data)
+        # The table formatter renders straight to the console
+        with timings.stage("format"):
+            formatter.format_analysis(result, profile_data)
+    elif isinstance(formatter, STREAM_FORMATTERS):
+        # Machine formats bypass Rich and write straight to stdout
+        with timings.stage("format"), result_cache.recording(key) as out:
+            formatter.write_analysis(result, profile_data, out)
+        with timings.stage("write"):
+            sys.stdout.flush()
     else:
-        # JSON and CSV formatters return strings
-        console.print(formatter.format_analysis(result, profile_data))
+        # The summary formatter returns a string
+        with timings.stage("format"):
+            text = formatter.format_analysis(result, profile_data)
+        with timings.stage("write"):
+            console.print(text)
+
+
+def _store_result(result: AnalysisResult, profile_name: str, db: Optional[Path]) -> None:
+    """Save an analysis to the results store."""
+    try:
+        with timings.stage("store"), open_store(db) as results, results.run(
+            "analyze", profile_name
+        ) as run:
+            run.add_analysis(result)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    timings.count("results_stored")
@@ -0,0 +1,54 @@
+"""API command for the local HTTP JSON API."""
+
+import signal
+from types import FrameType
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from mortgage_cli.daemon.http_api import DEFAULT_PORT, ENDPOINTS, LOCALHOST, ApiServer
+
+console = Console(stderr=True)
+
+
+def api(
+    port: Annotated[
+        int,
+        typer.Option("--port", help="TCP port on 127.0.0.1 (0 = any free port)", min=0),
+    ] = DEFAULT_PORT,
+) -> None:
+    """Serve analyze, batch, matrix and amortize as a local HTTP JSON API.
+
+    POST a JSON object to /analyze, /batch, /matrix or /amortize and get a
+    JSON object back. Profiles stay compiled in memory between requests, and
+    keep-alive connections accept pipelined requests, so a client can push
+    thousands of analyses per second. The server only listens on
+    127.0.0.1. Stop it with Ctrl+C.
+
+    Examples:
+        mortgage-cli api --port 8765 &
+        curl -s localhost:8765/analyze -d '{"price": 150000, "rent": 900}'
+        curl -s localhost:8765/batch -d '{"listings": [{"price": 150000, "rent": 900}]}'
+    """
+    server = ApiServer(port)
+
+    # Treat SIGTERM like Ctrl+C so the server shuts down cleanly
+    signal.signal(signal.SIGTERM, _interrupt)
+
+    def ready(bound_port: int) -> None:
+        endpoints = ", ".join(ENDPOINTS)
+        console.print(f"Serving {endpoints} on http://{LOCALHOST}:{bound_port}")
+
+    try:
+        server.serve_forever(on_ready=ready)
+    except OSError as e:
+        console.print(f"[red]Error: Cannot listen on port {port}: {e.strerror}[/red]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def _interrupt(signum: int, frame: Optional[FrameType]) -> None:
+    """Signal handler that stops the server via KeyboardInterrupt."""
+    raise KeyboardInterrupt
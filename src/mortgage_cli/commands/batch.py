@@ -0,0 +1,268 @@
+"""Batch command for analyzing listing files."""
+
+import csv
+import io
+import sys
+from collections import deque
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from typing import Annotated, Any, Iterable, Iterator, Optional, TextIO
+
+import numpy as np
+import typer
+from rich.console import Console
+
+from mortgage_cli import timings
+from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
+from mortgage_cli.core.parallel import analyze_chunks
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.output.csv_fmt import ANALYSIS_COLUMNS, CsvDialect, CsvFormatter
+from mortgage_cli.output.json_fmt import JsonFormatter
+from mortgage_cli.output.ndjson_fmt import NdjsonFormatter
+from mortgage_cli.store import StoreRun, open_store
+from mortgage_cli.utils.listings import JSONL_SUFFIXES, lookup, read_listings
+from mortgage_cli.utils.percentage import parse_percentage
+
+console = Console()
+
+# Accepted column names for each listing field
+PRICE_COLUMNS = ("price", "property_price")
+RENT_COLUMNS = ("rent", "expected_rent")
+DOWN_COLUMNS = ("down", "down_payment_percent")
+
+
+def batch(
+    input_file: Annotated[
+        Optional[Path],
+        typer.Argument(
+            help="Listings file (CSV or JSONL). Reads stdin when omitted or '-'",
+        ),
+    ] = None,
+    input_format: Annotated[
+        Optional[str],
+        typer.Option(
+            "--input-format",
+            "-f",
+            help="Input format: csv, jsonl (default: from file extension, csv for stdin)",
+        ),
+    ] = None,
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Output format: csv, json (one document), ndjson (one object per line)",
+        ),
+    ] = "csv",
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", help="Listings analyzed per chunk", min=1),
+    ] = 10000,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Worker processes (0 = one per CPU)", min=0),
+    ] = 1,
+    profile: Annotated[
+        str,
+        typer.Option("--profile", help="Profile name to use"),
+    ] = "default",
+    store: Annotated[
+        bool,
+        typer.Option("--store", help="Save the results to the results store (see 'query')"),
+    ] = False,
+    db: Annotated[
+        Optional[Path],
+        typer.Option("--db", help="Results store for --store (default: results.db in config dir)"),
+    ] = None,
+) -> None:
+    """Analyze a file of property listings.
+
+    Each listing needs a price and rent column; an optional down column
+    overrides the profile's default down payment. Listings are read and
+    analyzed in fixed-size chunks and results are streamed to stdout in
+    the same columns as 'analyze --output csv' (or json). With --store the
+    results are also saved, all or nothing, to the results store.
+
+    Examples:
+        mortgage-cli batch listings.csv
+        mortgage-cli batch listings.jsonl --output json
+        cat listings.csv | mortgage-cli batch --profile conservative
+        mortgage-cli batch listings.csv --store > /dev/null
+    """
+    # Load profile
+    config_manager = ConfigManager()
+    try:
+        profile_data = config_manager.load_profile(profile)
+    except ProfileNotFoundError:
+        console.print(f"[red]Error: Profile '{profile}' not found[/red]")
+        raise typer.Exit(1)
+
+    if output not in ("csv", "json", "ndjson"):
+        console.print(
+            f"[red]Error: Unknown format '{output}'. Supported: csv, json, ndjson[/red]"
+        )
+        raise typer.Exit(1)
+
+    if input_file is not None and str(input_file) == "-":
+        input_file = None
+    if input_format is None:
+        is_jsonl = input_file is not None and input_file.suffix.lower() in JSONL_SUFFIXES
+        input_format = "jsonl" if is_jsonl else "csv"
+    if input_format not in ("csv", "jsonl"):
+        console.print(
+            f"[red]Error: Unknown input format '{input_format}'. Supported: csv, jsonl[/red]"
+        )
+        raise typer.Exit(1)
+
+    with ExitStack() as stack:
+        # Listings are read as UTF-8 whatever the locale
+        if input_file is None:
+            stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+            # Leave stdin itself open when the wrapper goes away
+            stack.callback(stdin.detach)
+            stream: TextIO = stdin
+        else:
+            try:
+                stream = stack.enter_context(open(input_file, encoding="utf-8", newline=""))
+            except OSError as e:
+                console.print(f"[red]Error: Cannot read '{input_file}': {e.strerror}[/red]")
+                raise typer.Exit(1)
+
+        # Every chunk goes into one store transaction, committed at the end
+        run = None
+        if store:
+            try:
+                results = stack.enter_context(open_store(db))
+            except ValueError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                raise typer.Exit(1)
+            run = stack.enter_context(results.run("batch", profile_data.name))
+
+        _run_batch(stream, input_format, output, chunk_size, workers, profile_data, run)
+
+
+def _run_batch(
+    stream: TextIO,
+    input_format: str,
+    output: str,
+    chunk_size: int,
+    workers: int,
+    profile_data: Profile,
+    run: Optional[StoreRun] = None,
+) -> None:
+    """Analyze listings chunk by chunk and stream results to stdout (and run)."""
+    csv_formatter = CsvFormatter()
+    json_formatter = JsonFormatter()
+    ndjson_formatter = NdjsonFormatter()
+    out = sys.stdout
+
+    if output == "csv":
+        csv.writer(out, CsvDialect).writerow(ANALYSIS_COLUMNS)
+    elif output == "json":
+        json_formatter.write_batch_start(out)
+
+    # Sizes of chunks submitted but not yet written, for error messages
+    pending_sizes: deque[int] = deque()
+
+    def columns() -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        offset = 0
+        for chunk in _chunks(read_listings(stream, input_format), chunk_size):
+            pending_sizes.append(len(chunk))
+            yield _to_columns(chunk, offset)
+            offset += len(chunk)
+
+    written = 0
+    results = analyze_chunks(
+        profile_data,
+        columns(),
+        workers=workers,
+        with_warnings=output != "csv",
+    )
+    try:
+        while True:
+            # Chunks are read and analyzed lazily as results are consumed
+            with timings.stage("compute"):
+                item = next(results, None)
+            if item is None:
+                break
+            result, warnings = item
+            with timings.stage("format"):
+                if output == "csv":
+                    csv_formatter.write_batch(result, profile_data, out, include_header=False)
+                elif output == "ndjson":
+                    ndjson_formatter.write_batch(result, warnings or [], profile_data, out)
+                else:
+                    json_formatter.write_batch(
+                        result, warnings or [], profile_data, out, first=not written
+                    )
+            with timings.stage("write"):
+                out.flush()
+            if run is not None:
+                with timings.stage("store"):
+                    run.add_batch(result)
+                timings.count("results_stored", len(result))
+            size = pending_sizes.popleft()
+            timings.count("analyses", size)
+            timings.count("rows_rendered", size)
+            written += size
+    except ValueError as e:
+        message = str(e)
+        if message.startswith("Row ") and pending_sizes:
+            message = f"Listings {written + 1}-{written + pending_sizes[0]}: {message}"
+        console.print(f"[red]Error: {message}[/red]")
+        raise typer.Exit(1)
+
+    if output == "json":
+        json_formatter.write_batch_end(written, out)
+
+
+def _chunks(
+    listings: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Split listings into lists of at most size items."""
+    iterator = iter(listings)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _to_columns(
+    chunk: list[dict[str, Any]], offset: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert a chunk of listings into price, rent and down payment columns.
+
+    Args:
+        chunk: Listings to convert
+        offset: Number of listings before this chunk (for error messages)
+
+    Raises:
+        ValueError: If a listing is missing a field or has an unparsable value
+    """
+    count = len(chunk)
+    prices = np.empty(count)
+    rents = np.empty(count)
+    downs = np.full(count, np.nan)
+
+    for row, listing in enumerate(chunk):
+        number = offset + row + 1
+        prices[row] = _number(listing, PRICE_COLUMNS, number)
+        rents[row] = _number(listing, RENT_COLUMNS, number)
+        down = lookup(listing, DOWN_COLUMNS)
+        if down not in (None, ""):
+            try:
+                downs[row] = parse_percentage(str(down))
+            except ValueError:
+                raise ValueError(f"Listing {number}: invalid down payment '{down}'") from None
+
+    return prices, rents, downs
+
+
+def _number(listing: dict[str, Any], columns: tuple[str, ...], number: int) -> float:
+    """Read a required numeric field from a listing."""
+    value = lookup(listing, columns)
+    if value in (None, ""):
+        raise ValueError(f"Listing {number}: missing '{columns[0]}'")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Listing {number}: invalid {columns[0]} '{value}'") from None
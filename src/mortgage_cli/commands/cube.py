@@ -0,0 +1,174 @@
+"""Cube command for multi-dimensional sensitivity analysis."""
+
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from mortgage_cli import timings
+from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
+from mortgage_cli.core.cube import DEFAULT_CHUNK_CELLS, MANIFEST_NAME, CubeAxes, write_cube
+from mortgage_cli.utils.percentage import parse_percentage
+from mortgage_cli.utils.ranges import inclusive_range
+
+console = Console()
+
+
+def cube(
+    out: Annotated[
+        Path,
+        typer.Option("--out", help="Directory to write the cube to"),
+    ],
+    price_min: Annotated[
+        float,
+        typer.Option("--price-min", help="Minimum property price"),
+    ],
+    price_max: Annotated[
+        float,
+        typer.Option("--price-max", help="Maximum property price"),
+    ],
+    price_step: Annotated[
+        float,
+        typer.Option("--price-step", help="Price increment"),
+    ] = 20000,
+    down_min: Annotated[
+        str,
+        typer.Option("--down-min", help="Minimum down payment % (e.g., '10%')"),
+    ] = "10%",
+    down_max: Annotated[
+        str,
+        typer.Option("--down-max", help="Maximum down payment % (e.g., '50%')"),
+    ] = "50%",
+    down_step: Annotated[
+        str,
+        typer.Option("--down-step", help="Down payment increment % (e.g., '5%')"),
+    ] = "5%",
+    rate_min: Annotated[
+        Optional[str],
+        typer.Option("--rate-min", help="Minimum interest rate (default: profile rate)"),
+    ] = None,
+    rate_max: Annotated[
+        Optional[str],
+        typer.Option("--rate-max", help="Maximum interest rate (default: --rate-min)"),
+    ] = None,
+    rate_step: Annotated[
+        str,
+        typer.Option("--rate-step", help="Interest rate increment (e.g., '0.25%')"),
+    ] = "0.25%",
+    terms: Annotated[
+        Optional[str],
+        typer.Option("--terms", help="Loan terms in years, comma-separated (e.g., '20,25,30')"),
+    ] = None,
+    rent_min: Annotated[
+        Optional[float],
+        typer.Option("--rent-min", help="Minimum rent (default: profile target rent)"),
+    ] = None,
+    rent_max: Annotated[
+        Optional[float],
+        typer.Option("--rent-max", help="Maximum rent (default: --rent-min)"),
+    ] = None,
+    rent_step: Annotated[
+        float,
+        typer.Option("--rent-step", help="Rent increment"),
+    ] = 50,
+    profile: Annotated[
+        str,
+        typer.Option("--profile", help="Profile name to use"),
+    ] = "default",
+    chunk_cells: Annotated[
+        int,
+        typer.Option("--chunk-cells", help="Cells evaluated per chunk (bounds memory)", min=1),
+    ] = DEFAULT_CHUNK_CELLS,
+    force: Annotated[
+        bool,
+        typer.Option("--force", help="Overwrite an existing cube in the directory"),
+    ] = False,
+) -> None:
+    """Write a price x down payment x rate x term x rent sensitivity cube.
+
+    Results are stored as memory-mapped .npy files (break-even rent,
+    cash-on-cash return and verdict codes) with a manifest.json describing
+    the axes, so cubes larger than memory can be computed in chunks and
+    sliced later with numpy.load(..., mmap_mode="r").
+
+    Examples:
+        mortgage-cli cube --out cube/ --price-min 100000 --price-max 300000
+        mortgage-cli cube --out cube/ --price-min 100000 --price-max 300000 \\
+            --rate-min 2% --rate-max 6% --terms 20,25,30 --rent-min 700 --rent-max 1500
+    """
+    # Load profile
+    config_manager = ConfigManager()
+    try:
+        profile_data = config_manager.load_profile(profile)
+    except ProfileNotFoundError:
+        console.print(f"[red]Error: Profile '{profile}' not found[/red]")
+        raise typer.Exit(1)
+
+    # Parse percentages
+    try:
+        down_min_pct = parse_percentage(down_min)
+        down_max_pct = parse_percentage(down_max)
+        down_step_pct = parse_percentage(down_step)
+        rate_min_pct = (
+            parse_percentage(rate_min)
+            if rate_min is not None
+            else profile_data.mortgage.interest_rate
+        )
+        rate_max_pct = parse_percentage(rate_max) if rate_max is not None else rate_min_pct
+        rate_step_pct = parse_percentage(rate_step)
+    except ValueError as e:
+        console.print(f"[red]Error: Invalid percentage: {e}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        durations = (
+            [int(term) for term in terms.split(",")]
+            if terms is not None
+            else [profile_data.mortgage.duration_years]
+        )
+    except ValueError:
+        console.print(f"[red]Error: Invalid loan terms '{terms}'[/red]")
+        raise typer.Exit(1)
+
+    for name, step in (
+        ("--price-step", price_step),
+        ("--down-step", down_step_pct),
+        ("--rate-step", rate_step_pct),
+        ("--rent-step", rent_step),
+    ):
+        if step <= 0:
+            console.print(f"[red]Error: {name} must be positive[/red]")
+            raise typer.Exit(1)
+
+    if (out / MANIFEST_NAME).exists() and not force:
+        console.print(
+            f"[red]Error: '{out}' already holds a cube. Use --force to overwrite it[/red]"
+        )
+        raise typer.Exit(1)
+
+    low_rent = rent_min if rent_min is not None else profile_data.budget.target_rent
+    high_rent = rent_max if rent_max is not None else low_rent
+
+    try:
+        axes = CubeAxes.from_values(
+            prices=inclusive_range(price_min, price_max, price_step),
+            down_payments=inclusive_range(down_min_pct, down_max_pct, down_step_pct),
+            interest_rates=inclusive_range(rate_min_pct, rate_max_pct, rate_step_pct),
+            durations=durations,
+            rents=inclusive_range(low_rent, high_rent, rent_step),
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    with timings.stage("compute"):
+        try:
+            write_cube(profile_data, axes, out, chunk_cells=chunk_cells)
+        except OSError as e:
+            console.print(f"[red]Error: Cannot write cube to '{out}': {e.strerror}[/red]")
+            raise typer.Exit(1)
+    timings.count("analyses", axes.cells)
+
+    shape = " x ".join(str(size) for size in axes.shape)
+    console.print(f"Wrote {axes.cells:,} cells ({shape}) to {out}")
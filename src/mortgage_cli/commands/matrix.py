@@ -1,16 +1,22 @@
 """Matrix command for sensitivity analysis."""
 
-from typing import Annotated
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
 
+from mortgage_cli import result_cache, timings
 from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
-from mortgage_cli.core.analyzer import InvestmentAnalyzer
-from mortgage_cli.models.property import PropertyInput
-from mortgage_cli.models.results import MatrixCell
-from mortgage_cli.output import get_formatter
+from mortgage_cli.core.boundary import find_boundaries
+from mortgage_cli.core.engine import MatrixArrays
+from mortgage_cli.core.parallel import evaluate_matrix
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.output import STREAM_FORMATTERS, CsvFormatter, JsonFormatter, get_formatter
+from mortgage_cli.store import open_store
 from mortgage_cli.utils.percentage import parse_percentage
+from mortgage_cli.utils.ranges import inclusive_range
 
 console = Console()
 
@@ -50,8 +56,38 @@ def matrix(
     ] = "default",
     output: Annotated[
         str,
-        typer.Option("--output", "-o", help="Output format: table, json"),
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson, csv, summary"),
     ] = "table",
+    json_layout: Annotated[
+        str,
+        typer.Option(
+            "--json-layout",
+            help="JSON layout: cells (one object per cell) or columns (one row list per value)",
+        ),
+    ] = "cells",
+    compact: Annotated[
+        bool,
+        typer.Option("--compact", help="Write JSON without indentation"),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Worker processes (0 = one per CPU)", min=0),
+    ] = 1,
+    adaptive: Annotated[
+        bool,
+        typer.Option(
+            "--adaptive",
+            help="Only locate verdict boundaries, refining to the price and down steps",
+        ),
+    ] = False,
+    store: Annotated[
+        bool,
+        typer.Option("--store", help="Save every cell to the results store (see 'query')"),
+    ] = False,
+    db: Annotated[
+        Optional[Path],
+        typer.Option("--db", help="Results store for --store (default: results.db in config dir)"),
+    ] = None,
 ) -> None:
     """Generate a sensitivity matrix for break-even rent analysis.
 
@@ -61,6 +97,11 @@ def matrix(
     Examples:
         mortgage-cli matrix --price-min 100000 --price-max 200000
         mortgage-cli matrix --price-min 100000 --price-max 300000 --rent 1200
+        mortgage-cli matrix --price-min 50000 --price-max 900000 --price-step 100 --workers 0
+        mortgage-cli matrix --price-min 50000 --price-max 900000 -o json --json-layout columns
+        mortgage-cli matrix --price-min 50000 --price-max 900000 --price-step 100 \\
+            --down-step 0.1% --adaptive -o csv
+        mortgage-cli matrix --price-min 100000 --price-max 300000 --store
     """
     # Load profile
     config_manager = ConfigManager()
@@ -79,37 +120,63 @@ def matrix(
         console.print(f"[red]Error: Invalid percentage: {e}[/red]")
         raise typer.Exit(1)
 
+    if json_layout not in ("cells", "columns"):
+        console.print(
+            f"[red]Error: Unknown JSON layout '{json_layout}'. Supported: cells, columns[/red]"
+        )
+        raise typer.Exit(1)
+
     # Use profile's target rent if not specified
     target_rent = rent if rent is not None else profile_data.budget.target_rent
 
+    if adaptive and store:
+        console.print("[red]Error: --store cannot be combined with --adaptive[/red]")
+        raise typer.Exit(1)
+
+    # Machine formats can be replayed from the result cache (--cache), unless
+    # the cells have to be computed for --store
+    key = None
+    if output in result_cache.CACHED_FORMATS and not store:
+        key = result_cache.lookup(
+            "matrix",
+            profile_data,
+            {
+                "prices": [price_min, price_max, price_step],
+                "down_payments": [down_min_pct, down_max_pct, down_step_pct],
+                "rent": target_rent,
+                "output": output,
+                "json_layout": json_layout,
+                "compact": compact,
+                "adaptive": adaptive,
+            },
+        )
+
+    if adaptive:
+        _write_boundaries(
+            profile_data,
+            (price_min, price_max, price_step),
+            (down_min_pct, down_max_pct, down_step_pct),
+            output,
+            compact,
+            key,
+        )
+        return
+
+    if result_cache.replay(key):
+        return
+
     # Generate ranges
-    prices = _generate_range(price_min, price_max, price_step)
-    down_payments = _generate_range(down_min_pct, down_max_pct, down_step_pct)
+    prices = inclusive_range(price_min, price_max, price_step)
+    down_payments = inclusive_range(down_min_pct, down_max_pct, down_step_pct)
 
     # Calculate matrix
-    analyzer = InvestmentAnalyzer(profile_data)
-    matrix_data: list[list[MatrixCell]] = []
-
-    for down_pct in down_payments:
-        row: list[MatrixCell] = []
-        for price in prices:
-            result = analyzer.analyze(
-                PropertyInput(
-                    price=price,
-                    expected_rent=target_rent,
-                    down_payment_percent=down_pct,
-                )
-            )
-            row.append(
-                MatrixCell(
-                    price=price,
-                    down_payment_percent=down_pct,
-                    break_even_rent=result.break_even_rent,
-                    verdict=result.verdict,
-                    within_budget=result.within_budget,
-                )
-            )
-        matrix_data.append(row)
+    with timings.stage("compute"):
+        arrays = evaluate_matrix(profile_data, prices, down_payments, workers=workers)
+    cell_count = len(prices) * len(down_payments)
+    timings.count("analyses", cell_count)
+
+    if store:
+        _store_matrix(arrays, target_rent, profile_data.name, db)
 
     # Output
     try:
@@ -119,23 +186,80 @@ def matrix(
         raise typer.Exit(1)
 
     if output == "table":
-        formatter.format_matrix(
-            matrix_data, prices, down_payments, target_rent, profile_data
-        )
+        # The table formatter renders straight to the console
+        with timings.stage("format"):
+            formatter.format_matrix(arrays, target_rent, profile_data)
+    elif isinstance(formatter, JsonFormatter):
+        # Streamed straight to stdout, one matrix row at a time
+        with timings.stage("format"), result_cache.recording(key) as out:
+            formatter.write_matrix(
+                arrays, target_rent, profile_data, out, layout=json_layout, compact=compact
+            )
+        with timings.stage("write"):
+            sys.stdout.flush()
+    elif isinstance(formatter, STREAM_FORMATTERS):
+        # Other machine formats also bypass Rich and write straight to stdout
+        with timings.stage("format"), result_cache.recording(key) as out:
+            formatter.write_matrix(arrays, target_rent, profile_data, out)
+        with timings.stage("write"):
+            sys.stdout.flush()
     else:
-        # JSON and CSV formatters return strings
+        # The summary formatter returns a string
+        with timings.stage("format"):
+            text = formatter.format_matrix(arrays, target_rent, profile_data)
+        with timings.stage("write"):
+            console.print(text)
+    timings.count("cells_rendered", cell_count)
+
+
+def _store_matrix(
+    arrays: MatrixArrays, target_rent: float, profile_name: str, db: Optional[Path]
+) -> None:
+    """Save every matrix cell to the results store."""
+    try:
+        with timings.stage("store"), open_store(db) as results, results.run(
+            "matrix", profile_name
+        ) as run:
+            run.add_matrix(arrays, target_rent)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    timings.count("results_stored", run.count)
+
+
+def _write_boundaries(
+    profile_data: Profile,
+    price_range: tuple[float, float, float],
+    down_range: tuple[float, float, float],
+    output: str,
+    compact: bool,
+    key: Optional[str],
+) -> None:
+    """Run the adaptive boundary search and write the curves to stdout."""
+    if output not in ("json", "csv"):
         console.print(
-            formatter.format_matrix(
-                matrix_data, prices, down_payments, target_rent, profile_data
-            )
+            f"[red]Error: --adaptive supports json and csv output, not '{output}'[/red]"
         )
+        raise typer.Exit(1)
+    if result_cache.replay(key):
+        return
 
+    price_min, price_max, price_step = price_range
+    down_min, down_max, down_step = down_range
+    try:
+        with timings.stage("compute"):
+            search = find_boundaries(
+                profile_data, price_min, price_max, price_step, down_min, down_max, down_step
+            )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    timings.count("analyses", search.evaluations)
 
-def _generate_range(start: float, end: float, step: float) -> list[float]:
-    """Generate a list of values from start to end (inclusive) with step."""
-    result = []
-    current = start
-    while current <= end + step / 2:  # Small tolerance for floating point
-        result.append(current)
-        current += step
-    return result
+    with timings.stage("format"), result_cache.recording(key) as out:
+        if output == "json":
+            JsonFormatter().write_boundaries(search, profile_data, out, compact=compact)
+        else:
+            CsvFormatter().write_boundaries(search, out)
+    with timings.stage("write"):
+        sys.stdout.flush()
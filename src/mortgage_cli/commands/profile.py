@@ -1,5 +1,6 @@
 """Profile management commands."""
 
+import sys
 from typing import Annotated, Optional
 
 import typer
@@ -10,9 +11,8 @@ from mortgage_cli.config.manager import (
     ProfileExistsError,
     ProfileNotFoundError,
 )
-from mortgage_cli.core.analyzer import InvestmentAnalyzer
 from mortgage_cli.models.property import PropertyInput
-from mortgage_cli.output import get_formatter
+from mortgage_cli.output import STREAM_FORMATTERS, get_formatter
 
 console = Console()
 app = typer.Typer(help="Manage investment profiles")
@@ -22,7 +22,7 @@ app = typer.Typer(help="Manage investment profiles")
 def list_profiles(
     output: Annotated[
         str,
-        typer.Option("--output", "-o", help="Output format: table, json"),
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson"),
     ] = "table",
 ) -> None:
     """List all available profiles."""
@@ -33,8 +33,11 @@ def list_profiles(
 
     if output == "table":
         formatter.format_profile_list(profiles)
+    elif isinstance(formatter, STREAM_FORMATTERS):
+        # Machine formats bypass Rich and write straight to stdout
+        formatter.write_profile_list(profiles, sys.stdout)
     else:
-        # JSON and CSV formatters return strings
+        # The summary formatter returns a string
         console.print(formatter.format_profile_list(profiles))
 
 
@@ -171,7 +174,7 @@ def compare_profiles(
     ],
     output: Annotated[
         str,
-        typer.Option("--output", "-o", help="Output format: table, json"),
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson"),
     ] = "table",
 ) -> None:
     """Compare analysis across multiple profiles.
@@ -179,6 +182,9 @@ def compare_profiles(
     Example:
         mortgage-cli profile compare --price 150000 --rent 900 --profiles default,conservative
     """
+    # Deferred so the other profile commands start without loading NumPy
+    from mortgage_cli.core.analyzer import InvestmentAnalyzer
+
     config_manager = ConfigManager()
     profile_names = [p.strip() for p in profiles.split(",")]
 
@@ -199,6 +205,8 @@ def compare_profiles(
     formatter = get_formatter(output)
     if output == "table":
         formatter.format_profile_comparison(comparisons, price, rent)
+    elif isinstance(formatter, STREAM_FORMATTERS):
+        formatter.write_profile_comparison(comparisons, price, rent, sys.stdout)
     else:
-        # JSON and CSV formatters return strings
+        # The summary formatter returns a string
         console.print(formatter.format_profile_comparison(comparisons, price, rent))
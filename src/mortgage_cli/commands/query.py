@@ -0,0 +1,224 @@
+"""Query command for the results store."""
+
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Any, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from mortgage_cli import timings
+from mortgage_cli.config.paths import get_results_db_path
+from mortgage_cli.models.results import Verdict
+from mortgage_cli.output.colors import VERDICT_LABELS, VERDICT_STYLES
+from mortgage_cli.output.csv_fmt import CsvDialect
+from mortgage_cli.store import RESULT_COLUMNS, ResultQuery, open_store
+from mortgage_cli.utils.currency import format_currency
+from mortgage_cli.utils.percentage import format_percentage, parse_percentage
+
+console = Console()
+
+# --sort values: (column, descending)
+SORT_ORDERS: dict[str, tuple[str, bool]] = {
+    "price": ("property_price", False),
+    "break-even": ("break_even_rent", False),
+    "return": ("cash_on_cash_return", True),
+    "newest": ("created_at", True),
+}
+
+QUERY_COLUMNS: tuple[str, ...] = ("run_id", "created_at", "profile", *RESULT_COLUMNS)
+
+RUN_COLUMNS: tuple[str, ...] = ("run_id", "command", "profile", "created_at", "results")
+
+
+def query(
+    verdict: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            "--verdict", help="Verdict to match: green, yellow, red, over_budget (repeatable)"
+        ),
+    ] = None,
+    min_price: Annotated[
+        Optional[float],
+        typer.Option("--min-price", help="Lowest property price"),
+    ] = None,
+    max_price: Annotated[
+        Optional[float],
+        typer.Option("--max-price", help="Highest property price"),
+    ] = None,
+    min_return: Annotated[
+        Optional[str],
+        typer.Option("--min-return", help="Lowest cash-on-cash return (e.g., '4%')"),
+    ] = None,
+    max_break_even: Annotated[
+        Optional[float],
+        typer.Option("--max-break-even", help="Highest break-even rent"),
+    ] = None,
+    profile: Annotated[
+        Optional[str],
+        typer.Option("--profile", help="Only results computed with this profile"),
+    ] = None,
+    run: Annotated[
+        Optional[int],
+        typer.Option("--run", help="Only results from this run (see --runs)"),
+    ] = None,
+    sort: Annotated[
+        str,
+        typer.Option("--sort", help="Order: price, break-even, return, newest"),
+    ] = "price",
+    limit: Annotated[
+        Optional[int],
+        typer.Option("--limit", "-n", help="Maximum number of results", min=1),
+    ] = None,
+    runs: Annotated[
+        bool,
+        typer.Option("--runs", help="List stored runs instead of results"),
+    ] = False,
+    db: Annotated[
+        Optional[Path],
+        typer.Option("--db", help="Results store (default: results.db in config dir)"),
+    ] = None,
+    output: Annotated[
+        str,
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson, csv"),
+    ] = "table",
+) -> None:
+    """Query results saved with --store, without recomputing them.
+
+    Results of analyze, matrix and batch runs given --store are kept in a
+    SQLite database indexed on verdict, price, break-even rent, cash-on-cash
+    return and profile, so filters stay fast as the history grows.
+
+    Examples:
+        mortgage-cli query --verdict green --max-price 180000 --min-return 4%
+        mortgage-cli query --profile conservative --sort return --limit 10
+        mortgage-cli query --runs
+    """
+    verdicts = [value.lower() for value in verdict or []]
+    known = [item.value for item in Verdict]
+    for value in verdicts:
+        if value not in known:
+            console.print(
+                f"[red]Error: Unknown verdict '{value}'. Supported: {', '.join(known)}[/red]"
+            )
+            raise typer.Exit(1)
+    if sort not in SORT_ORDERS:
+        console.print(
+            f"[red]Error: Unknown sort '{sort}'. Supported: {', '.join(SORT_ORDERS)}[/red]"
+        )
+        raise typer.Exit(1)
+    if output not in ("table", "json", "ndjson", "csv"):
+        console.print(
+            f"[red]Error: Unknown format '{output}'. Supported: table, json, ndjson, csv[/red]"
+        )
+        raise typer.Exit(1)
+
+    try:
+        min_return_pct = parse_percentage(min_return) if min_return is not None else None
+    except ValueError:
+        console.print(f"[red]Error: Invalid return '{min_return}'[/red]")
+        raise typer.Exit(1)
+
+    path = db if db is not None else get_results_db_path()
+    if not path.exists():
+        console.print(
+            f"[red]Error: No results store at '{path}'. Save results with --store first[/red]"
+        )
+        raise typer.Exit(1)
+
+    order_by, descending = SORT_ORDERS[sort]
+    try:
+        with timings.stage("compute"), open_store(path) as store:
+            if runs:
+                rows = store.runs()
+            else:
+                rows = store.query(
+                    ResultQuery(
+                        verdicts=tuple(verdicts) or None,
+                        profile=profile,
+                        min_price=min_price,
+                        max_price=max_price,
+                        min_return=min_return_pct,
+                        max_break_even=max_break_even,
+                        run_id=run,
+                        order_by=order_by,
+                        descending=descending,
+                        limit=limit,
+                    )
+                )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    columns = RUN_COLUMNS if runs else QUERY_COLUMNS
+    with timings.stage("format"):
+        if output == "table":
+            if runs:
+                _render_runs(rows)
+            else:
+                _render_results(rows)
+        elif output == "csv":
+            writer = csv.writer(sys.stdout, CsvDialect)
+            writer.writerow(columns)
+            writer.writerows([row[name] for name in columns] for row in rows)
+        elif output == "ndjson":
+            for row in rows:
+                sys.stdout.write(json.dumps(row, separators=(",", ":")))
+                sys.stdout.write("\n")
+        else:
+            key = "runs" if runs else "results"
+            sys.stdout.write(json.dumps({key: rows, "count": len(rows)}, indent=2))
+            sys.stdout.write("\n")
+    with timings.stage("write"):
+        sys.stdout.flush()
+    timings.count("rows_rendered", len(rows))
+
+
+def _render_results(rows: list[dict[str, Any]]) -> None:
+    """Render stored results as a Rich table."""
+    table = Table(title=f"Stored Results ({len(rows):,})")
+    table.add_column("Run", justify="right")
+    table.add_column("Profile")
+    table.add_column("Price", justify="right")
+    table.add_column("Rent", justify="right")
+    table.add_column("Down", justify="right")
+    table.add_column("Break-even", justify="right")
+    table.add_column("Return", justify="right")
+    table.add_column("Verdict")
+
+    for row in rows:
+        verdict = Verdict(row["verdict"])
+        table.add_row(
+            str(row["run_id"]),
+            row["profile"],
+            format_currency(row["property_price"]),
+            format_currency(row["expected_rent"]),
+            format_percentage(row["down_payment_percent"], 1),
+            format_currency(row["break_even_rent"]),
+            format_percentage(row["cash_on_cash_return"], 1),
+            f"[{VERDICT_STYLES[verdict]}]{VERDICT_LABELS[verdict]}[/]",
+        )
+    console.print(table)
+
+
+def _render_runs(rows: list[dict[str, Any]]) -> None:
+    """Render stored runs as a Rich table."""
+    table = Table(title="Stored Runs")
+    table.add_column("Run", justify="right")
+    table.add_column("Command")
+    table.add_column("Profile")
+    table.add_column("Created (UTC)")
+    table.add_column("Results", justify="right")
+
+    for row in rows:
+        table.add_row(
+            str(row["run_id"]),
+            row["command"],
+            row["profile"],
+            row["created_at"],
+            f"{row['results']:,}",
+        )
+    console.print(table)
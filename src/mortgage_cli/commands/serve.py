@@ -0,0 +1,58 @@
+"""Serve command for the local daemon."""
+
+import signal
+from pathlib import Path
+from types import FrameType
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from mortgage_cli.daemon.client import DAEMON_COMMANDS, default_socket_path
+from mortgage_cli.daemon.server import DaemonServer
+
+console = Console(stderr=True)
+
+
+def serve(
+    socket_path: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--socket",
+            help="Unix socket path (default: $MORTGAGE_CLI_SOCKET or $XDG_RUNTIME_DIR)",
+        ),
+    ] = None,
+) -> None:
+    """Run a local daemon that answers commands from a warm process.
+
+    Clients forward analyze, matrix and amortize to the daemon when run with
+    --daemon or MORTGAGE_CLI_DAEMON=1, skipping interpreter startup, imports
+    and profile parsing. Profiles are kept in memory and reloaded when their
+    files change. Stop the daemon with Ctrl+C.
+
+    Examples:
+        mortgage-cli serve &
+        MORTGAGE_CLI_DAEMON=1 mortgage-cli analyze --price 150000 --rent 900
+        mortgage-cli --daemon matrix --price-min 100000 --price-max 200000
+    """
+    path = socket_path or default_socket_path()
+    try:
+        server = DaemonServer(path)
+    except (RuntimeError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    # Treat SIGTERM like Ctrl+C so the socket file is removed on shutdown
+    signal.signal(signal.SIGTERM, _interrupt)
+
+    console.print(f"Serving {', '.join(DAEMON_COMMANDS)} on {path}")
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _interrupt(signum: int, frame: Optional[FrameType]) -> None:
+    """Signal handler that stops serve_forever via KeyboardInterrupt."""
+    raise KeyboardInterrupt
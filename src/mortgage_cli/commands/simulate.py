@@ -0,0 +1,227 @@
+"""Simulate command for Monte Carlo stress testing."""
+
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Any, Callable, Optional
+
+import typer
+import yaml
+from pydantic import ValidationError
+from rich.console import Console
+from rich.table import Table
+
+from mortgage_cli import timings
+from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
+from mortgage_cli.core.simulation import MonteCarloSimulator, SimulationResult
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.simulation import SimulationSpec
+from mortgage_cli.output.colors import verdict_to_label, verdict_to_style
+from mortgage_cli.utils.currency import format_currency
+from mortgage_cli.utils.percentage import format_percentage, parse_percentage
+
+console = Console()
+
+
+def simulate(
+    price: Annotated[
+        float,
+        typer.Option("--price", "-p", help="Property purchase price"),
+    ],
+    rent: Annotated[
+        float,
+        typer.Option("--rent", "-r", help="Expected monthly rental income"),
+    ],
+    distributions: Annotated[
+        Path,
+        typer.Option(
+            "--distributions",
+            "-D",
+            help="YAML file declaring input distributions",
+        ),
+    ],
+    down: Annotated[
+        Optional[str],
+        typer.Option("--down", "-d", help="Down payment percentage (e.g., '20%')"),
+    ] = None,
+    draws: Annotated[
+        int,
+        typer.Option("--draws", "-n", help="Number of Monte Carlo draws", min=1),
+    ] = 100_000,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Random seed (same seed, same results)"),
+    ] = 0,
+    profile: Annotated[
+        str,
+        typer.Option("--profile", help="Profile name to use"),
+    ] = "default",
+    output: Annotated[
+        str,
+        typer.Option("--output", "-o", help="Output format: table, json"),
+    ] = "table",
+) -> None:
+    """Stress-test a property with Monte Carlo simulation.
+
+    Samples interest rate, insurance rate, monthly costs and rent from the
+    distributions in a YAML file and reports percentiles of break-even rent,
+    cash-on-cash return and monthly surplus, plus the chance of each verdict.
+
+    Examples:
+        mortgage-cli simulate --price 165000 --rent 950 --distributions stress.yaml
+        mortgage-cli simulate -p 165000 -r 950 -D stress.yaml --draws 500000 --seed 7
+    """
+    # Load profile
+    config_manager = ConfigManager()
+    try:
+        profile_data = config_manager.load_profile(profile)
+    except ProfileNotFoundError:
+        console.print(f"[red]Error: Profile '{profile}' not found[/red]")
+        raise typer.Exit(1)
+
+    # Parse down payment if provided
+    down_pct: float | None = None
+    if down is not None:
+        try:
+            down_pct = parse_percentage(down)
+        except ValueError:
+            console.print(f"[red]Error: Invalid down payment '{down}'[/red]")
+            raise typer.Exit(1)
+
+    if output not in ("table", "json"):
+        console.print(f"[red]Error: Unknown format '{output}'. Supported: table, json[/red]")
+        raise typer.Exit(1)
+
+    spec = _load_spec(distributions)
+
+    with timings.stage("compute"):
+        simulator = MonteCarloSimulator(profile_data, spec)
+        try:
+            result = simulator.run(price, rent, down_pct, draws=draws, seed=seed)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+    timings.count("analyses", draws)
+
+    if output == "json":
+        with timings.stage("format"):
+            text = json.dumps(_to_dict(result, price, rent, profile_data), indent=2)
+        # Written straight to stdout rather than through the Rich console
+        with timings.stage("write"):
+            sys.stdout.write(text)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+    else:
+        with timings.stage("format"):
+            _render_table(result, price, rent, profile_data)
+
+
+def _load_spec(path: Path) -> SimulationSpec:
+    """Load distributions from YAML, accepting an optional 'simulation' block."""
+    try:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+    except OSError as e:
+        console.print(f"[red]Error: Cannot read '{path}': {e.strerror}[/red]")
+        raise typer.Exit(1)
+    except yaml.YAMLError as e:
+        console.print(f"[red]Error: Invalid YAML in '{path}': {e}[/red]")
+        raise typer.Exit(1)
+
+    if isinstance(data, dict) and "simulation" in data:
+        data = data["simulation"]
+
+    try:
+        return SimulationSpec.model_validate(data)
+    except ValidationError as e:
+        console.print(f"[red]Error: Invalid distributions in '{path}':[/red]")
+        for error in e.errors():
+            location = ".".join(str(part) for part in error["loc"])
+            console.print(f"  [red]{location}: {error['msg']}[/red]")
+        raise typer.Exit(1)
+
+
+def _to_dict(
+    result: SimulationResult, price: float, rent: float, profile: Profile
+) -> dict[str, Any]:
+    """Build the JSON output structure."""
+    return {
+        "property": {
+            "price": price,
+            "expected_rent": rent,
+        },
+        "simulation": {
+            "draws": result.draws,
+            "seed": result.seed,
+            "upfront_total": round(result.upfront_total, 2),
+            "within_budget": result.within_budget,
+            "shortfall_probability": round(result.shortfall_probability, 4),
+        },
+        "percentiles": {
+            metric: {f"p{p:g}": round(value, 4) for p, value in values.items()}
+            for metric, values in result.percentiles().items()
+        },
+        "verdict_probabilities": {
+            verdict.value: round(probability, 4)
+            for verdict, probability in result.verdict_probabilities().items()
+        },
+        "profile": {
+            "name": profile.name,
+            "interest_rate": profile.mortgage.interest_rate,
+            "duration_years": profile.mortgage.duration_years,
+            "target_rent": profile.budget.target_rent,
+            "budget": profile.budget.total_available,
+        },
+    }
+
+
+def _format_return(value: float) -> str:
+    """Format a cash-on-cash return with one decimal."""
+    return format_percentage(value, decimals=1)
+
+
+def _render_table(result: SimulationResult, price: float, rent: float, profile: Profile) -> None:
+    """Render percentiles and verdict probabilities as Rich tables."""
+    console.print()
+    console.print(
+        f"[bold]Monte Carlo Stress Test: {format_currency(price)} "
+        f"@ {format_currency(rent)}/month rent[/bold]"
+    )
+    console.print(
+        f"{result.draws:,} draws (seed {result.seed}) | "
+        f"Upfront: {format_currency(result.upfront_total)} / "
+        f"{format_currency(profile.budget.total_available)}"
+    )
+    console.print()
+
+    percentiles = result.percentiles()
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Metric")
+    for p in next(iter(percentiles.values())):
+        table.add_column(f"P{p:g}", justify="right")
+
+    rows: list[tuple[str, str, Callable[[float], str]]] = [
+        ("Break-Even Rent", "break_even_rent", format_currency),
+        ("Monthly Surplus", "monthly_surplus_shortfall", format_currency),
+        ("Cash-on-Cash", "cash_on_cash_return", _format_return),
+    ]
+    for label, metric, fmt in rows:
+        table.add_row(label, *(fmt(value) for value in percentiles[metric].values()))
+    console.print(table)
+    console.print()
+
+    verdicts = Table(show_header=True, header_style="bold")
+    verdicts.add_column("Verdict")
+    verdicts.add_column("Probability", justify="right")
+    for verdict, probability in result.verdict_probabilities().items():
+        style = verdict_to_style(verdict)
+        verdicts.add_row(
+            f"[{style}]{verdict_to_label(verdict)}[/{style}]",
+            format_percentage(probability, 1),
+        )
+    console.print(verdicts)
+    console.print()
+    console.print(
+        f"Probability of a monthly shortfall: {format_percentage(result.shortfall_probability, 1)}"
+    )
+    console.print()
@@ -0,0 +1,379 @@
+"""Solve command for goal-seek questions."""
+
+import csv
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Annotated, Any, Iterator, Optional
+
+import numpy as np
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from mortgage_cli import timings
+from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
+from mortgage_cli.core.solver import GoalSolver
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+from mortgage_cli.output.csv_fmt import CsvDialect
+from mortgage_cli.utils.currency import format_currency
+from mortgage_cli.utils.listings import JSONL_SUFFIXES, lookup, read_listings
+from mortgage_cli.utils.percentage import format_percentage, parse_percentage
+
+console = Console()
+
+# Inputs each goal needs, and the fields it solves for
+GOALS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "max-price": (("target_rent", "down_payment_percent"), ("max_price", "limited_by")),
+    "min-down": (("price", "target_rent"), ("min_down_payment", "max_down_payment")),
+    "rent": (("price", "down_payment_percent", "cash_on_cash_return"), ("rent",)),
+    "max-rate": (("price", "target_rent", "down_payment_percent"), ("max_interest_rate",)),
+}
+
+# Accepted input file columns for each input
+INPUT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "price": ("price", "property_price"),
+    "target_rent": ("rent", "target_rent", "expected_rent"),
+    "down_payment_percent": ("down", "down_payment_percent"),
+    "cash_on_cash_return": ("return", "cash_on_cash_return"),
+}
+
+# Fields holding decimals shown as percentages; the rest are amounts
+PERCENT_FIELDS = {
+    "down_payment_percent",
+    "cash_on_cash_return",
+    "min_down_payment",
+    "max_down_payment",
+    "max_interest_rate",
+}
+
+FIELD_TITLES = {
+    "price": "Price",
+    "target_rent": "Target Rent",
+    "down_payment_percent": "Down",
+    "cash_on_cash_return": "Return",
+    "max_price": "Max Price",
+    "limited_by": "Limited By",
+    "min_down_payment": "Min Down",
+    "max_down_payment": "Max Down (Budget)",
+    "rent": "Rent Needed",
+    "max_interest_rate": "Max Rate",
+}
+
+
+def solve(
+    goal: Annotated[
+        str,
+        typer.Argument(help="What to solve for: max-price, min-down, rent, max-rate"),
+    ],
+    price: Annotated[
+        Optional[list[float]],
+        typer.Option("--price", "-p", help="Property price (repeat for several)"),
+    ] = None,
+    rent: Annotated[
+        Optional[list[float]],
+        typer.Option("--rent", "-r", help="Target rent (default: profile target rent)"),
+    ] = None,
+    down: Annotated[
+        Optional[list[str]],
+        typer.Option("--down", "-d", help="Down payment % (default: profile default)"),
+    ] = None,
+    target_return: Annotated[
+        Optional[list[str]],
+        typer.Option("--return", help="Cash-on-cash return for 'rent' (e.g., '8%')"),
+    ] = None,
+    verdict: Annotated[
+        str,
+        typer.Option("--verdict", help="Worst acceptable verdict: green, yellow"),
+    ] = "green",
+    input_file: Annotated[
+        Optional[Path],
+        typer.Option("--input", "-i", help="CSV or JSONL file of targets, one per row"),
+    ] = None,
+    input_format: Annotated[
+        Optional[str],
+        typer.Option(
+            "--input-format",
+            "-f",
+            help="Input format: csv, jsonl (default: from file extension)",
+        ),
+    ] = None,
+    profile: Annotated[
+        str,
+        typer.Option("--profile", help="Profile name to use"),
+    ] = "default",
+    output: Annotated[
+        str,
+        typer.Option("--output", "-o", help="Output format: table, json, ndjson, csv"),
+    ] = "table",
+) -> None:
+    """Solve inverse questions instead of sweeping a matrix.
+
+    Goals:
+      max-price  highest price that stays at the verdict within budget
+      min-down   lowest down payment that reaches the verdict within budget
+      rent       rent needed for a cash-on-cash return
+      max-rate   highest interest rate that keeps the verdict
+
+    Repeated options are combined (every price with every down payment and
+    so on); --input solves one target per row of a CSV or JSONL file with
+    price, rent, down and return columns.
+
+    Examples:
+        mortgage-cli solve max-price --rent 950 --down 20%
+        mortgage-cli solve min-down -p 150000 -p 175000 -p 200000 --verdict yellow
+        mortgage-cli solve rent -p 165000 --return 5% --return 8%
+        mortgage-cli solve max-rate --input targets.csv -o csv
+    """
+    # Load profile
+    config_manager = ConfigManager()
+    try:
+        profile_data = config_manager.load_profile(profile)
+    except ProfileNotFoundError:
+        console.print(f"[red]Error: Profile '{profile}' not found[/red]")
+        raise typer.Exit(1)
+
+    if goal not in GOALS:
+        console.print(
+            f"[red]Error: Unknown goal '{goal}'. Supported: {', '.join(GOALS)}[/red]"
+        )
+        raise typer.Exit(1)
+    if verdict not in ("green", "yellow"):
+        console.print(f"[red]Error: Unknown verdict '{verdict}'. Supported: green, yellow[/red]")
+        raise typer.Exit(1)
+    if output not in ("table", "json", "ndjson", "csv"):
+        console.print(
+            f"[red]Error: Unknown format '{output}'. Supported: table, json, ndjson, csv[/red]"
+        )
+        raise typer.Exit(1)
+
+    inputs, _ = GOALS[goal]
+    defaults = {
+        "target_rent": profile_data.budget.target_rent,
+        "down_payment_percent": profile_data.mortgage.default_down_payment,
+        "cash_on_cash_return": 0.0,
+    }
+    try:
+        if input_file is not None:
+            targets = _read_targets(input_file, input_format, inputs, defaults)
+        else:
+            options = {
+                "price": price,
+                "target_rent": rent,
+                "down_payment_percent": _percentages(down, "down payment"),
+                "cash_on_cash_return": _percentages(target_return, "return"),
+            }
+            targets = _combine_targets(options, inputs, defaults)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    with timings.stage("compute"):
+        results = _solve(GoalSolver(profile_data), goal, targets, Verdict(verdict))
+    count = len(next(iter(targets.values())))
+    timings.count("analyses", count)
+
+    fields = {**targets, **results}
+    with timings.stage("format"):
+        if output == "table":
+            _render_table(goal, verdict, fields, count)
+        elif output == "csv":
+            _write_csv(fields, count)
+        elif output == "ndjson":
+            for row in _rows(fields, count):
+                sys.stdout.write(json.dumps(row, separators=(",", ":")))
+                sys.stdout.write("\n")
+        else:
+            document = {
+                "goal": goal,
+                "verdict": verdict,
+                "results": list(_rows(fields, count)),
+                "profile": _profile_dict(profile_data),
+            }
+            sys.stdout.write(json.dumps(document, indent=2))
+            sys.stdout.write("\n")
+    with timings.stage("write"):
+        sys.stdout.flush()
+    timings.count("rows_rendered", count)
+
+
+def _solve(
+    solver: GoalSolver, goal: str, targets: dict[str, np.ndarray], verdict: Verdict
+) -> dict[str, np.ndarray]:
+    """Run the solver for a goal."""
+    if goal == "max-price":
+        prices, by_budget = solver.max_price(
+            targets["target_rent"], targets["down_payment_percent"], verdict
+        )
+        limited_by = np.where(by_budget, "budget", "rent")
+        return {"max_price": prices, "limited_by": np.where(np.isnan(prices), "", limited_by)}
+    if goal == "min-down":
+        min_down, max_down = solver.min_down_payment(
+            targets["price"], targets["target_rent"], verdict
+        )
+        return {"min_down_payment": min_down, "max_down_payment": max_down}
+    if goal == "rent":
+        return {
+            "rent": solver.rent_for_return(
+                targets["price"],
+                targets["down_payment_percent"],
+                targets["cash_on_cash_return"],
+            )
+        }
+    return {
+        "max_interest_rate": solver.max_interest_rate(
+            targets["price"], targets["target_rent"], targets["down_payment_percent"], verdict
+        )
+    }
+
+
+def _percentages(values: Optional[list[str]], name: str) -> Optional[list[float]]:
+    """Parse repeated percentage options."""
+    if values is None:
+        return None
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(parse_percentage(value))
+        except ValueError:
+            raise ValueError(f"Invalid {name} '{value}'") from None
+    return parsed
+
+
+def _combine_targets(
+    options: dict[str, Optional[list[float]]],
+    inputs: tuple[str, ...],
+    defaults: dict[str, float],
+) -> dict[str, np.ndarray]:
+    """Build one target per combination of the option values."""
+    axes = []
+    for name in inputs:
+        values = options[name]
+        if not values:
+            if name not in defaults:
+                raise ValueError(f"--{name} is required for this goal")
+            values = [defaults[name]]
+        axes.append(np.asarray(values, dtype=np.float64))
+
+    grids = np.meshgrid(*axes, indexing="ij")
+    targets = {name: grid.ravel() for name, grid in zip(inputs, grids)}
+    _validate(targets)
+    return targets
+
+
+def _read_targets(
+    path: Path,
+    input_format: Optional[str],
+    inputs: tuple[str, ...],
+    defaults: dict[str, float],
+) -> dict[str, np.ndarray]:
+    """Read one target per row of a CSV or JSONL file."""
+    if input_format is None:
+        input_format = "jsonl" if path.suffix.lower() in JSONL_SUFFIXES else "csv"
+    if input_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unknown input format '{input_format}'. Supported: csv, jsonl")
+
+    columns: dict[str, list[float]] = {name: [] for name in inputs}
+    try:
+        with open(path, encoding="utf-8", newline="") as stream:
+            for number, listing in enumerate(read_listings(stream, input_format), 1):
+                for name in inputs:
+                    columns[name].append(_field(listing, name, number, defaults))
+    except OSError as e:
+        raise ValueError(f"Cannot read '{path}': {e.strerror}") from None
+    if not columns[inputs[0]]:
+        raise ValueError(f"No targets in '{path}'")
+
+    targets = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+    _validate(targets)
+    return targets
+
+
+def _field(listing: dict[str, Any], name: str, number: int, defaults: dict[str, float]) -> float:
+    """Read one input of a target row, falling back to its default."""
+    value = lookup(listing, INPUT_COLUMNS[name])
+    if value in (None, ""):
+        if name not in defaults:
+            raise ValueError(f"Row {number}: missing '{INPUT_COLUMNS[name][0]}'")
+        return defaults[name]
+    try:
+        if name in PERCENT_FIELDS:
+            return parse_percentage(str(value))
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Row {number}: invalid {INPUT_COLUMNS[name][0]} '{value}'") from None
+
+
+def _validate(targets: dict[str, np.ndarray]) -> None:
+    """Check that target inputs are in range."""
+    if "price" in targets and (targets["price"] <= 0).any():
+        raise ValueError("Prices must be positive")
+    down = targets.get("down_payment_percent")
+    if down is not None and ((down < 0) | (down > 1)).any():
+        raise ValueError("Down payments must be between 0% and 100%")
+
+
+def _rows(fields: dict[str, np.ndarray], count: int) -> Iterator[dict[str, Any]]:
+    """Yield one JSON-ready dict per target (None where unsolvable)."""
+    columns = {name: values.tolist() for name, values in fields.items()}
+    for index in range(count):
+        yield {name: _json_value(name, values[index]) for name, values in columns.items()}
+
+
+def _json_value(name: str, value: Any) -> Any:
+    """Round a solved value for output."""
+    if isinstance(value, str):
+        return value or None
+    if math.isnan(value):
+        return None
+    return round(value, 6 if name in PERCENT_FIELDS else 2)
+
+
+def _write_csv(fields: dict[str, np.ndarray], count: int) -> None:
+    """Write targets and results as CSV to stdout."""
+    writer = csv.writer(sys.stdout, CsvDialect)
+    writer.writerow(list(fields))
+    writer.writerows(
+        ["" if value is None else value for value in row.values()]
+        for row in _rows(fields, count)
+    )
+
+
+def _render_table(goal: str, verdict: str, fields: dict[str, np.ndarray], count: int) -> None:
+    """Render targets and results as a Rich table."""
+    title = f"Solve: {goal}" if goal == "rent" else f"Solve: {goal} ({verdict} or better)"
+    table = Table(title=title)
+    for name in fields:
+        table.add_column(FIELD_TITLES[name], justify="left" if name == "limited_by" else "right")
+
+    for row in _rows(fields, count):
+        table.add_row(*(_cell_text(name, value) for name, value in row.items()))
+    console.print(table)
+
+
+def _cell_text(name: str, value: Any) -> str:
+    """Format one table cell."""
+    if value is None:
+        return "[dim]none[/dim]"
+    if isinstance(value, str):
+        return value
+    if name in PERCENT_FIELDS:
+        return format_percentage(value, decimals=2)
+    return format_currency(value)
+
+
+def _profile_dict(profile: Profile) -> dict[str, Any]:
+    """Profile settings the results depend on."""
+    return {
+        "name": profile.name,
+        "interest_rate": profile.mortgage.interest_rate,
+        "insurance_rate": profile.mortgage.insurance_rate,
+        "duration_years": profile.mortgage.duration_years,
+        "budget": profile.budget.total_available,
+        "thresholds": {
+            "green_below": profile.thresholds.green_below,
+            "yellow_below": profile.thresholds.yellow_below,
+        },
+    }
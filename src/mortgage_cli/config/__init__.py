@@ -2,7 +2,12 @@
 
 from mortgage_cli.config.defaults import DEFAULT_PROFILE
 from mortgage_cli.config.manager import ConfigManager
-from mortgage_cli.config.paths import get_config_dir, get_global_config_path, get_profiles_dir
+from mortgage_cli.config.paths import (
+    get_config_dir,
+    get_global_config_path,
+    get_profiles_dir,
+    get_results_db_path,
+)
 
 __all__ = [
     "ConfigManager",
@@ -10,4 +15,5 @@ __all__ = [
     "get_config_dir",
     "get_profiles_dir",
     "get_global_config_path",
+    "get_results_db_path",
 ]
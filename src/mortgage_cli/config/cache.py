@@ -0,0 +1,166 @@
+"""On-disk cache of validated profiles."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from mortgage_cli import __version__
+from mortgage_cli.models.profile import (
+    Budget,
+    CostItem,
+    MonthlyCosts,
+    MortgageTerms,
+    Profile,
+    PurchaseCosts,
+    Thresholds,
+)
+
+# Bump when the cached layout changes; entries written by other versions are ignored
+CACHE_FORMAT = 1
+
+# Process-wide profiles by path, as (mtime_ns, size, profile); used when
+# ProfileCache.keep_in_memory is enabled (by the daemon)
+_memory: dict[str, tuple[int, int, Profile]] = {}
+
+
+class ProfileCache:
+    """JSON cache of parsed profiles, keyed by path, mtime and size.
+
+    A hit skips both YAML parsing and pydantic validation: the cached data
+    was validated when it was stored, so profiles are rebuilt with
+    model_construct. The cache is best-effort; a missing, corrupt or
+    unwritable cache file only means profiles are parsed from YAML.
+
+    Long-running processes can set keep_in_memory to also keep profiles in
+    memory; the same mtime/size check drops them as soon as a file changes.
+    """
+
+    keep_in_memory = False
+
+    def __init__(self, path: Path):
+        """Initialize cache.
+
+        Args:
+            path: Cache file location
+        """
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    def get(self, profile_path: Path, stat: os.stat_result) -> Profile | None:
+        """Get a cached profile if the file is unchanged.
+
+        Args:
+            profile_path: Profile YAML file
+            stat: Current stat of the profile file
+
+        Returns:
+            Cached profile, or None on a miss
+        """
+        key = str(profile_path)
+        if self.keep_in_memory and key in _memory:
+            mtime_ns, size, profile = _memory[key]
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return profile
+            del _memory[key]
+
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        try:
+            if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                return None
+            profile = construct_profile(entry["profile"])
+        except (KeyError, TypeError, AttributeError):
+            # Missing, partial or malformed entry (e.g. written by a crashed run)
+            return None
+        if self.keep_in_memory:
+            _memory[key] = (stat.st_mtime_ns, stat.st_size, profile)
+        return profile
+
+    def put(self, profile_path: Path, stat: os.stat_result, profile: Profile) -> None:
+        """Store a validated profile.
+
+        Args:
+            profile_path: Profile YAML file
+            stat: Stat of the profile file when it was read
+            profile: Validated profile
+        """
+        key = str(profile_path)
+        self._load()[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "profile": profile.model_dump(mode="json"),
+        }
+        self._dirty = True
+        if self.keep_in_memory:
+            _memory[key] = (stat.st_mtime_ns, stat.st_size, profile)
+
+    def discard(self, profile_path: Path) -> None:
+        """Remove a profile's entry.
+
+        Args:
+            profile_path: Profile YAML file
+        """
+        _memory.pop(str(profile_path), None)
+        if self._load().pop(str(profile_path), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending changes to disk (atomically, ignoring I/O errors)."""
+        if not self._dirty or self._entries is None:
+            return
+        payload = {"format": CACHE_FORMAT, "version": __version__, "entries": self._entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file on first use."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path) as f:
+                    payload = json.load(f)
+            except (OSError, ValueError):
+                return self._entries
+            if (
+                isinstance(payload, dict)
+                and payload.get("format") == CACHE_FORMAT
+                and payload.get("version") == __version__
+                and isinstance(payload.get("entries"), dict)
+            ):
+                self._entries = payload["entries"]
+        return self._entries
+
+
+def construct_profile(data: dict[str, Any]) -> Profile:
+    """Rebuild a Profile from model_dump data without validation.
+
+    Args:
+        data: Output of Profile.model_dump(mode="json") for a valid profile
+
+    Returns:
+        Profile instance
+    """
+    # Cached entries are dumps of validated profiles, so the items are CostItem fields
+    purchase_costs: dict[str, Any] = {
+        name: CostItem.model_construct(**item) for name, item in data["purchase_costs"].items()
+    }
+    return Profile.model_construct(
+        name=data["name"],
+        description=data["description"],
+        mortgage=MortgageTerms.model_construct(**data["mortgage"]),
+        budget=Budget.model_construct(**data["budget"]),
+        monthly_costs=MonthlyCosts.model_construct(**data["monthly_costs"]),
+        purchase_costs=PurchaseCosts.model_construct(**purchase_costs),
+        thresholds=Thresholds.model_construct(**data["thresholds"]),
+    )
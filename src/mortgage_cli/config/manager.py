@@ -1,11 +1,14 @@
 """Configuration and profile management."""
 
+import os
 from pathlib import Path
 
 import yaml
 
+from mortgage_cli import timings
+from mortgage_cli.config.cache import ProfileCache
 from mortgage_cli.config.defaults import DEFAULT_PROFILE
-from mortgage_cli.config.paths import get_profiles_dir
+from mortgage_cli.config.paths import get_cache_dir, get_profiles_dir
 from mortgage_cli.models.profile import Profile
 
 
@@ -31,14 +34,18 @@ class ConfigManager:
     Handles CRUD operations for profiles stored as YAML files.
     """
 
-    def __init__(self, profiles_dir: Path | None = None):
+    def __init__(self, profiles_dir: Path | None = None, cache_dir: Path | None = None):
         """Initialize config manager.
 
         Args:
             profiles_dir: Custom profiles directory (for testing).
                          Uses default XDG path if not specified.
+            cache_dir: Directory for the parsed-profile cache.
+                       Uses the config cache directory if not specified,
+                       also for a custom profiles_dir.
         """
         self.profiles_dir = profiles_dir or get_profiles_dir()
+        self.cache = ProfileCache((cache_dir or get_cache_dir()) / "profiles.json")
 
     def ensure_directories(self) -> None:
         """Create config directories if they don't exist."""
@@ -71,15 +78,40 @@ class ConfigManager:
         """
         path = self._get_profile_path(name)
 
-        if not path.exists():
-            if name == "default":
-                return DEFAULT_PROFILE
-            raise ProfileNotFoundError(name)
+        with timings.stage("profile"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                if name == "default":
+                    return DEFAULT_PROFILE
+                raise ProfileNotFoundError(name)
+
+            profile = self._read_profile(path, stat)
+            self.cache.save()
+        return profile
+
+    def _read_profile(self, path: Path, stat: os.stat_result) -> Profile:
+        """Read a profile file, using the parsed-profile cache when fresh.
+
+        Args:
+            path: Profile YAML file
+            stat: Current stat of the file
+
+        Returns:
+            Profile instance
+        """
+        profile = self.cache.get(path, stat)
+        if profile is not None:
+            timings.count("profile_cache_hits")
+            return profile
 
+        timings.count("profile_cache_misses")
         with open(path) as f:
             data = yaml.safe_load(f)
 
-        return Profile(**data)
+        profile = Profile(**data)
+        self.cache.put(path, stat, profile)
+        return profile
 
     def save_profile(self, profile: Profile, overwrite: bool = True) -> None:
         """Save profile to YAML file.
@@ -121,6 +153,8 @@ class ConfigManager:
             raise ProfileNotFoundError(name)
 
         path.unlink()
+        self.cache.discard(path)
+        self.cache.save()
 
     def list_profiles(self) -> list[tuple[str, str]]:
         """List all available profiles.
@@ -139,11 +173,12 @@ class ConfigManager:
             for path in sorted(self.profiles_dir.glob("*.yaml")):
                 name = path.stem
                 try:
-                    profile = self.load_profile(name)
+                    profile = self._read_profile(path, path.stat())
                     profiles.append((name, profile.description))
                 except Exception:
                     # Skip invalid profiles
                     profiles.append((name, "(invalid profile)"))
+            self.cache.save()
 
         return profiles
 
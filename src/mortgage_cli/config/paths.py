@@ -36,3 +36,21 @@ def get_global_config_path() -> Path:
         Path to ~/.config/mortgage-cli/config.yaml
     """
     return get_config_dir() / "config.yaml"
+
+
+def get_cache_dir() -> Path:
+    """Get directory for cached profiles and command results.
+
+    Returns:
+        Path to ~/.config/mortgage-cli/cache
+    """
+    return get_config_dir() / "cache"
+
+
+def get_results_db_path() -> Path:
+    """Get path to the results store used by --store and query.
+
+    Returns:
+        Path to ~/.config/mortgage-cli/results.db
+    """
+    return get_config_dir() / "results.db"
@@ -2,5 +2,14 @@
 
 from mortgage_cli.core.analyzer import InvestmentAnalyzer
 from mortgage_cli.core.calculator import MortgageCalculator
+from mortgage_cli.core.compiled import CompiledProfile
+from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays, MatrixEngine
 
-__all__ = ["MortgageCalculator", "InvestmentAnalyzer"]
+__all__ = [
+    "MortgageCalculator",
+    "InvestmentAnalyzer",
+    "CompiledProfile",
+    "BatchAnalysis",
+    "MatrixEngine",
+    "MatrixArrays",
+]
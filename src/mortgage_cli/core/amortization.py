@@ -1,13 +1,154 @@
 """Amortization schedule generation."""
 
-import numpy_financial as npf
+from dataclasses import dataclass
+from typing import Sequence, Union
 
+import numpy as np
+
+from mortgage_cli.models.lite import LiteAmortizationEntry
 from mortgage_cli.models.results import AmortizationEntry
 
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass(frozen=True)
+class AmortizationSchedule:
+    """Year-by-year amortization schedule(s) as NumPy arrays.
+
+    Per-year arrays have shape batch_shape + (len(years),), where batch_shape
+    is the broadcast shape of the loan inputs (empty for a single loan).
+    """
+
+    years: np.ndarray
+    principal_paid: np.ndarray
+    interest_paid: np.ndarray
+    remaining_balance: np.ndarray
+    equity_percent: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of years in the schedule."""
+        return len(self.years)
+
+    @property
+    def total_principal(self) -> np.ndarray:
+        """Total principal paid over the scheduled years."""
+        total: np.ndarray = self.principal_paid.sum(axis=-1)
+        return total
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        """Total interest paid over the scheduled years."""
+        total: np.ndarray = self.interest_paid.sum(axis=-1)
+        return total
+
+    def to_entries(self) -> list[LiteAmortizationEntry]:
+        """Materialize a single-loan schedule as slotted entries.
+
+        Returns:
+            List of LiteAmortizationEntry objects, one per year
+
+        Raises:
+            ValueError: If the schedule holds more than one loan
+        """
+        if self.principal_paid.ndim != 1:
+            raise ValueError("to_entries() requires a single-loan schedule")
+
+        return [
+            LiteAmortizationEntry(
+                year=year,
+                principal_paid=round(principal, 2),
+                interest_paid=round(interest, 2),
+                remaining_balance=round(balance, 2),
+                equity_percent=round(equity, 4),
+            )
+            for year, principal, interest, balance, equity in zip(
+                self.years.tolist(),
+                self.principal_paid.tolist(),
+                self.interest_paid.tolist(),
+                self.remaining_balance.tolist(),
+                self.equity_percent.tolist(),
+            )
+        ]
+
 
 class AmortizationGenerator:
     """Generate amortization schedules."""
 
+    def generate_arrays(
+        self,
+        principal: ArrayLike,
+        annual_rate: ArrayLike,
+        years: int,
+        original_property_value: ArrayLike,
+        limit_years: int | None = None,
+    ) -> AmortizationSchedule:
+        """Generate year-by-year schedules using the annuity closed form.
+
+        The balance after k payments is P(1+r)^k - M((1+r)^k - 1)/r, so every
+        year-end balance is computed directly without stepping through months.
+        Loan inputs broadcast against each other, so many schedules sharing
+        the same term are produced in one pass.
+
+        Args:
+            principal: Loan principal amount(s)
+            annual_rate: Annual interest rate(s) as decimal
+            years: Total loan term in years
+            original_property_value: Original property purchase price(s) (for equity %)
+            limit_years: Only return first N years (default: all)
+
+        Returns:
+            AmortizationSchedule with one column per year
+        """
+        principal_arr, rate_arr, value_arr = np.broadcast_arrays(
+            np.asarray(principal, dtype=np.float64),
+            np.asarray(annual_rate, dtype=np.float64),
+            np.asarray(original_property_value, dtype=np.float64),
+        )
+        principal_arr = np.maximum(principal_arr, 0.0)
+
+        num_years = max(min(limit_years or years, years), 0)
+        year_numbers = np.arange(1, num_years + 1)
+
+        # Add a trailing axis for the per-year dimension
+        p = principal_arr[..., np.newaxis]
+        rate = np.maximum(rate_arr, 0.0)[..., np.newaxis]
+        monthly_rate = rate / 12
+        total_months = years * 12
+        months = 12 * np.arange(0, num_years + 1)
+
+        has_interest = monthly_rate > 0
+        safe_rate = np.where(has_interest, monthly_rate, 1.0)
+        growth_total = (1 + safe_rate) ** total_months
+        monthly_payment = np.where(
+            has_interest,
+            p * safe_rate * growth_total / (growth_total - 1),
+            p / max(total_months, 1),
+        )
+
+        growth = (1 + safe_rate) ** months
+        balances = np.where(
+            has_interest,
+            p * growth - monthly_payment * (growth - 1) / safe_rate,
+            p - monthly_payment * months,
+        )
+        balances = np.where(months >= total_months, 0.0, np.maximum(balances, 0.0))
+
+        principal_paid = balances[..., :-1] - balances[..., 1:]
+        interest_paid = np.where(has_interest, 12 * monthly_payment - principal_paid, 0.0)
+        remaining_balance = balances[..., 1:]
+
+        value = value_arr[..., np.newaxis]
+        safe_value = np.where(value > 0, value, 1.0)
+        equity_percent = np.where(value > 0, (value - remaining_balance) / safe_value, 0.0)
+
+        return AmortizationSchedule(
+            years=year_numbers,
+            principal_paid=principal_paid,
+            interest_paid=interest_paid,
+            remaining_balance=remaining_balance,
+            equity_percent=equity_percent,
+        )
+
     def generate_schedule(
         self,
         principal: float,
@@ -31,50 +172,11 @@ class AmortizationGenerator:
         if principal <= 0 or years <= 0:
             return []
 
-        monthly_rate = annual_rate / 12 if annual_rate > 0 else 0
-        total_months = years * 12
-        monthly_payment = -npf.pmt(monthly_rate, total_months, principal) if annual_rate > 0 else principal / total_months
-
-        schedule: list[AmortizationEntry] = []
-        balance = principal
-
-        num_years = limit_years if limit_years else years
-
-        for year in range(1, num_years + 1):
-            year_principal = 0.0
-            year_interest = 0.0
-
-            for _ in range(12):
-                if balance <= 0:
-                    break
-
-                if annual_rate > 0:
-                    interest_payment = balance * monthly_rate
-                    principal_payment = min(monthly_payment - interest_payment, balance)
-                else:
-                    interest_payment = 0
-                    principal_payment = monthly_payment
-
-                year_interest += interest_payment
-                year_principal += principal_payment
-                balance = max(0, balance - principal_payment)
-
-            # Calculate equity percentage
-            # Equity = (property value - remaining loan) / property value
-            equity_value = original_property_value - balance
-            equity_percent = equity_value / original_property_value if original_property_value > 0 else 0
-
-            schedule.append(
-                AmortizationEntry(
-                    year=year,
-                    principal_paid=round(year_principal, 2),
-                    interest_paid=round(year_interest, 2),
-                    remaining_balance=round(balance, 2),
-                    equity_percent=round(equity_percent, 4),
-                )
-            )
-
-            if balance <= 0:
-                break
-
-        return schedule
+        schedule = self.generate_arrays(
+            principal=principal,
+            annual_rate=annual_rate,
+            years=years,
+            original_property_value=original_property_value,
+            limit_years=limit_years,
+        )
+        return [entry.to_model() for entry in schedule.to_entries()]
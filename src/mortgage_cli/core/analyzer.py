@@ -1,6 +1,13 @@
 """Investment analysis orchestration."""
 
+from warnings import warn
+
+import numpy as np
+
 from mortgage_cli.core.calculator import MortgageCalculator
+from mortgage_cli.core.compiled import VERDICTS, CompiledProfile
+from mortgage_cli.core.engine import ArrayLike, BatchAnalysis
+from mortgage_cli.models.lite import LiteAnalysisResult, LiteMonthlyBreakdown, LiteUpfrontCosts
 from mortgage_cli.models.profile import Profile
 from mortgage_cli.models.property import PropertyInput
 from mortgage_cli.models.results import (
@@ -14,19 +21,26 @@ from mortgage_cli.models.results import (
 class InvestmentAnalyzer:
     """Orchestrates complete investment analysis.
 
-    Combines the calculator with profile configuration to produce
-    a full analysis of a property investment.
+    Compiles the profile once and evaluates properties against it to
+    produce a full analysis of a property investment.
     """
 
     def __init__(self, profile: Profile, calculator: MortgageCalculator | None = None):
-        """Initialize analyzer with profile and optional calculator.
+        """Initialize analyzer with profile.
 
         Args:
             profile: Investment profile with mortgage terms and costs
-            calculator: MortgageCalculator instance (creates one if not provided)
+            calculator: Deprecated and ignored; all calculations use the
+                        compiled profile. Passing one emits a DeprecationWarning.
         """
+        if calculator is not None:
+            warn(
+                "InvestmentAnalyzer's calculator argument is ignored and will be removed",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.profile = profile
-        self.calculator = calculator or MortgageCalculator()
+        self.compiled = CompiledProfile.from_profile(profile)
 
     def analyze(self, property_input: PropertyInput) -> AnalysisResult:
         """Perform complete investment analysis.
@@ -37,56 +51,58 @@ class InvestmentAnalyzer:
         Returns:
             Complete analysis result with costs, metrics, and verdict
         """
+        return self.evaluate(property_input).to_model()
+
+    def evaluate(self, property_input: PropertyInput) -> LiteAnalysisResult:
+        """Perform the analysis without building the pydantic result.
+
+        Args:
+            property_input: Property details (price, expected rent, optional down payment)
+
+        Returns:
+            Slotted result with the same attributes as analyze()'s
+        """
+        compiled = self.compiled
+        price = property_input.price
+        expected_rent = property_input.expected_rent
+
         # Determine down payment percentage
         down_pct = (
             property_input.down_payment_percent
             if property_input.down_payment_percent is not None
-            else self.profile.mortgage.default_down_payment
+            else compiled.default_down_payment
         )
 
         # Calculate upfront costs
-        upfront_costs = self._calculate_upfront_costs(property_input.price, down_pct)
+        upfront_costs = LiteUpfrontCosts(**compiled.upfront_items(price, down_pct))
+        upfront_total = compiled.upfront_total(price, down_pct)
 
-        # Calculate mortgage payment
-        loan_amount = self.calculator.calculate_loan_amount(property_input.price, down_pct)
-        effective_rate = self.calculator.calculate_effective_rate(
-            self.profile.mortgage.interest_rate,
-            self.profile.mortgage.insurance_rate,
-        )
-        mortgage_payment = self.calculator.calculate_monthly_payment(
-            loan_amount,
-            effective_rate,
-            self.profile.mortgage.duration_years,
-        )
-
-        # Calculate break-even rent
-        monthly = MonthlyBreakdown(
-            mortgage_payment=mortgage_payment,
-            fixed_costs=self.profile.monthly_costs.total,
+        # Calculate mortgage payment and break-even rent
+        monthly = LiteMonthlyBreakdown(
+            mortgage_payment=compiled.monthly_payment(price * (1 - down_pct)),
+            fixed_costs=compiled.fixed_monthly,
         )
-        break_even_rent = monthly.total
+        break_even_rent = monthly.mortgage_payment + compiled.fixed_monthly
 
         # Calculate returns
-        monthly_surplus_shortfall = property_input.expected_rent - break_even_rent
-        annual_net_income = monthly_surplus_shortfall * 12
-        cash_on_cash_return = self.calculator.calculate_cash_on_cash_return(
-            annual_net_income,
-            upfront_costs.total,
+        monthly_surplus_shortfall = expected_rent - break_even_rent
+        cash_on_cash_return = (
+            monthly_surplus_shortfall * 12 / upfront_total if upfront_total > 0 else 0.0
         )
 
         # Determine verdict and budget status
-        within_budget = upfront_costs.total <= self.profile.budget.total_available
-        verdict = self._determine_verdict(break_even_rent, within_budget)
+        within_budget = upfront_total <= compiled.budget
+        verdict = compiled.verdict(break_even_rent, within_budget)
 
         # Generate warnings
         warnings = self._generate_warnings(
             break_even_rent=break_even_rent,
-            expected_rent=property_input.expected_rent,
-            upfront_total=upfront_costs.total,
+            expected_rent=expected_rent,
+            upfront_total=upfront_total,
             within_budget=within_budget,
         )
 
-        return AnalysisResult(
+        return LiteAnalysisResult(
             property_price=property_input.price,
             expected_rent=property_input.expected_rent,
             down_payment_percent=down_pct,
@@ -100,52 +116,170 @@ class InvestmentAnalyzer:
             warnings=warnings,
         )
 
-    def _calculate_upfront_costs(self, price: float, down_pct: float) -> UpfrontCosts:
-        """Calculate all one-time purchase costs.
+    def analyze_batch(
+        self,
+        prices: ArrayLike,
+        expected_rents: ArrayLike,
+        down_payment_percents: ArrayLike | None = None,
+    ) -> BatchAnalysis:
+        """Analyze many properties at once.
+
+        Validation and every calculation run column-wise over NumPy arrays,
+        so no PropertyInput or AnalysisResult is built per property.
 
         Args:
-            price: Property purchase price
-            down_pct: Down payment percentage as decimal
+            prices: Property purchase prices
+            expected_rents: Expected monthly rental incomes
+            down_payment_percents: Down payment percentages as decimals.
+                                   None or NaN entries use the profile default.
 
         Returns:
-            Itemized upfront costs
+            Struct-of-arrays result with one entry per property
+
+        Raises:
+            ValueError: If the columns differ in length or contain invalid values
         """
-        down_payment = self.calculator.calculate_down_payment(price, down_pct)
-        purchase_costs = self.profile.purchase_costs
-
-        return UpfrontCosts(
-            down_payment=down_payment,
-            notary_legal=purchase_costs.notary_legal.calculate(price),
-            bank_arrangement=purchase_costs.bank_arrangement.calculate(price),
-            survey_valuation=purchase_costs.survey_valuation.calculate(price),
-            mortgage_broker=purchase_costs.mortgage_broker.calculate(price),
-            other=purchase_costs.other.calculate(price),
+        price = np.asarray(prices, dtype=np.float64)
+        expected_rent = np.asarray(expected_rents, dtype=np.float64)
+        default_down = self.compiled.default_down_payment
+        if down_payment_percents is None:
+            down_pct = np.full(price.shape, default_down)
+        else:
+            down_pct = np.asarray(down_payment_percents, dtype=np.float64)
+            down_pct = np.where(np.isnan(down_pct), default_down, down_pct)
+
+        self._validate_batch(price, expected_rent, down_pct)
+        compiled = self.compiled
+
+        # Calculate upfront costs
+        items = compiled.upfront_items(price, down_pct)
+        upfront_total = compiled.upfront_total(price, down_pct)
+
+        # Calculate mortgage payment and break-even rent
+        mortgage_payment = compiled.monthly_payments(price * (1 - down_pct))
+        fixed_costs = np.full(price.shape, compiled.fixed_monthly)
+        break_even_rent = mortgage_payment + fixed_costs
+
+        # Calculate returns
+        monthly_surplus_shortfall = expected_rent - break_even_rent
+        annual_net_income = monthly_surplus_shortfall * 12
+        has_investment = upfront_total > 0
+        cash_on_cash_return = np.where(
+            has_investment,
+            annual_net_income / np.where(has_investment, upfront_total, 1.0),
+            0.0,
         )
 
-    def _determine_verdict(self, break_even_rent: float, within_budget: bool) -> Verdict:
-        """Determine color-coded verdict based on thresholds.
+        # Determine verdict and budget status
+        verdict_codes, within_budget = compiled.classify(break_even_rent, upfront_total)
+
+        return BatchAnalysis(
+            property_price=price,
+            expected_rent=expected_rent,
+            down_payment_percent=down_pct,
+            upfront_total=upfront_total,
+            mortgage_payment=mortgage_payment,
+            fixed_costs=fixed_costs,
+            break_even_rent=break_even_rent,
+            cash_on_cash_return=cash_on_cash_return,
+            monthly_surplus_shortfall=monthly_surplus_shortfall,
+            verdict_codes=verdict_codes,
+            within_budget=within_budget,
+            **items,
+        )
+
+    def result_at(self, batch: BatchAnalysis, index: int) -> AnalysisResult:
+        """Materialize one row of a batch as a full AnalysisResult.
 
         Args:
-            break_even_rent: Calculated break-even rent
-            within_budget: Whether upfront costs are within budget
+            batch: Result of analyze_batch
+            index: Row to materialize
 
         Returns:
-            Verdict enum value
+            Analysis result equivalent to analyze() for that property
         """
-        if not within_budget:
-            return Verdict.OVER_BUDGET
+        upfront_costs = UpfrontCosts(
+            down_payment=float(batch.down_payment[index]),
+            notary_legal=float(batch.notary_legal[index]),
+            bank_arrangement=float(batch.bank_arrangement[index]),
+            survey_valuation=float(batch.survey_valuation[index]),
+            mortgage_broker=float(batch.mortgage_broker[index]),
+            other=float(batch.other[index]),
+        )
+        break_even_rent = float(batch.break_even_rent[index])
+        expected_rent = float(batch.expected_rent[index])
+        within_budget = bool(batch.within_budget[index])
+
+        return AnalysisResult(
+            property_price=float(batch.property_price[index]),
+            expected_rent=expected_rent,
+            down_payment_percent=float(batch.down_payment_percent[index]),
+            upfront_costs=upfront_costs,
+            monthly=MonthlyBreakdown(
+                mortgage_payment=float(batch.mortgage_payment[index]),
+                fixed_costs=float(batch.fixed_costs[index]),
+            ),
+            break_even_rent=break_even_rent,
+            cash_on_cash_return=float(batch.cash_on_cash_return[index]),
+            monthly_surplus_shortfall=float(batch.monthly_surplus_shortfall[index]),
+            verdict=VERDICTS[int(batch.verdict_codes[index])],
+            within_budget=within_budget,
+            warnings=self._generate_warnings(
+                break_even_rent=break_even_rent,
+                expected_rent=expected_rent,
+                upfront_total=float(batch.upfront_total[index]),
+                within_budget=within_budget,
+            ),
+        )
+
+    def batch_warnings(self, batch: BatchAnalysis) -> list[list[str]]:
+        """Generate validation warnings for every property in a batch.
+
+        Warning text is only built for rows that trigger at least one warning.
+
+        Args:
+            batch: Result of analyze_batch
 
+        Returns:
+            List of warning messages per property
+        """
+        flagged = ~batch.within_budget | (batch.break_even_rent > batch.expected_rent)
         target_rent = self.profile.budget.target_rent
-        if target_rent <= 0:
-            return Verdict.RED
+        if target_rent > 0:
+            flagged |= batch.break_even_rent > target_rent * 1.5
+
+        warnings: list[list[str]] = [[] for _ in range(len(batch))]
+        for index in np.flatnonzero(flagged).tolist():
+            warnings[index] = self._generate_warnings(
+                break_even_rent=float(batch.break_even_rent[index]),
+                expected_rent=float(batch.expected_rent[index]),
+                upfront_total=float(batch.upfront_total[index]),
+                within_budget=bool(batch.within_budget[index]),
+            )
+        return warnings
 
-        ratio = break_even_rent / target_rent
+    @staticmethod
+    def _validate_batch(price: np.ndarray, expected_rent: np.ndarray, down_pct: np.ndarray) -> None:
+        """Apply PropertyInput's constraints column-wise.
+
+        Raises:
+            ValueError: If columns are mismatched or any value is out of range
+        """
+        if price.ndim != 1 or price.shape != expected_rent.shape or price.shape != down_pct.shape:
+            raise ValueError(
+                "prices, expected_rents and down_payment_percents must be "
+                "1-D columns of equal length"
+            )
 
-        if ratio < self.profile.thresholds.green_below:
-            return Verdict.GREEN
-        elif ratio < self.profile.thresholds.yellow_below:
-            return Verdict.YELLOW
-        return Verdict.RED
+        checks = [
+            ("price", ~(price > 0), "must be greater than 0"),
+            ("expected_rent", ~(expected_rent > 0), "must be greater than 0"),
+            ("down_payment_percent", ~((down_pct >= 0) & (down_pct <= 1)), "must be between 0 and 1"),
+        ]
+        for name, invalid, message in checks:
+            if invalid.any():
+                row = int(np.argmax(invalid))
+                raise ValueError(f"Row {row}: {name} {message}")
 
     def _generate_warnings(
         self,
@@ -0,0 +1,252 @@
+"""Adaptive search for verdict boundaries across price and down payment."""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from mortgage_cli.core.compiled import VERDICTS, CompiledProfile
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+
+# Cells per axis in the starting grid. Refinement only follows cells whose
+# corners disagree, so a verdict region must span more than one starting
+# cell along some side to be found.
+INITIAL_CELLS = 16
+
+
+@dataclass(frozen=True)
+class BoundaryCurve:
+    """Where the verdict changes from one value to another.
+
+    Points hold one crossing per down payment row, at the midpoint of the
+    price step in which the verdict changes (so within half a step of the
+    exact crossing).
+    """
+
+    from_verdict: Verdict
+    to_verdict: Verdict
+    down_payments: np.ndarray
+    prices: np.ndarray
+
+
+@dataclass(frozen=True)
+class BoundarySearch:
+    """Result of an adaptive boundary search."""
+
+    curves: list[BoundaryCurve]
+    price_step: float
+    down_step: float
+    evaluations: int
+    grid_points: int
+
+
+def find_boundaries(
+    profile: Profile,
+    price_min: float,
+    price_max: float,
+    price_resolution: float,
+    down_min: float,
+    down_max: float,
+    down_resolution: float,
+    initial_cells: int = INITIAL_CELLS,
+) -> BoundarySearch:
+    """Find verdict boundaries without evaluating the whole grid.
+
+    The price/down-payment plane is divided into a lattice no coarser than
+    the requested resolutions, and a quadtree over it is refined only where
+    a cell's corner verdicts disagree: each mixed cell is bisected along
+    both axes until it is one lattice step wide. Only the corners of
+    visited cells are evaluated, roughly O(n log n) points for an n x n
+    lattice instead of n^2, with each level of the tree evaluated in one
+    vectorized pass.
+
+    The boundaries match those of a dense matrix over the same lattice,
+    except for verdict regions too small to change any corner of the
+    starting grid (see INITIAL_CELLS).
+
+    Args:
+        profile: Investment profile
+        price_min: Lowest price
+        price_max: Highest price
+        price_resolution: Largest price step between lattice points
+        down_min: Lowest down payment percentage as decimal
+        down_max: Highest down payment percentage as decimal
+        down_resolution: Largest down payment step between lattice rows
+        initial_cells: Cells per axis in the starting grid
+
+    Returns:
+        BoundarySearch with one curve per verdict transition
+
+    Raises:
+        ValueError: If a range is reversed or a resolution is not positive
+    """
+    if price_resolution <= 0 or down_resolution <= 0:
+        raise ValueError("Resolutions must be positive")
+    if price_max < price_min or down_max < down_min:
+        raise ValueError("Range minimum exceeds maximum")
+
+    columns = _steps(price_max - price_min, price_resolution)
+    rows = _steps(down_max - down_min, down_resolution)
+    price_step = (price_max - price_min) / columns if columns else 0.0
+    down_step = (down_max - down_min) / rows if rows else 0.0
+
+    lattice = _Lattice(
+        CompiledProfile.from_profile(profile), price_min, price_step, down_min, down_step, columns
+    )
+    if columns:
+        edges = lattice.refine(_initial_cells(columns, rows, initial_cells))
+    else:
+        edges = np.zeros((0, 4), dtype=np.int64)
+
+    return BoundarySearch(
+        curves=_curves(lattice, edges),
+        price_step=price_step,
+        down_step=down_step,
+        evaluations=lattice.evaluations,
+        grid_points=(columns + 1) * (rows + 1),
+    )
+
+
+class _Lattice:
+    """Verdict codes at integer (column, row) lattice points."""
+
+    def __init__(
+        self,
+        compiled: CompiledProfile,
+        price_min: float,
+        price_step: float,
+        down_min: float,
+        down_step: float,
+        columns: int,
+    ):
+        self.compiled = compiled
+        self.price_min = price_min
+        self.price_step = price_step
+        self.down_min = down_min
+        self.down_step = down_step
+        self.width = columns + 1
+        self.evaluations = 0
+
+    def price(self, column: np.ndarray) -> np.ndarray:
+        """Price at lattice columns."""
+        return self.price_min + column * self.price_step
+
+    def down(self, row: np.ndarray) -> np.ndarray:
+        """Down payment at lattice rows."""
+        return self.down_min + row * self.down_step
+
+    def codes(self, columns: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Verdict codes at lattice points, evaluating each distinct point once.
+
+        Args:
+            columns: Price indices
+            rows: Down payment indices (same shape as columns)
+
+        Returns:
+            uint8 verdict codes, shaped like columns
+        """
+        # Neighbouring cells share corners, so evaluate distinct points only
+        points, inverse = np.unique(rows * self.width + columns, return_inverse=True)
+        self.evaluations += len(points)
+        row, column = np.divmod(points, self.width)
+        compiled = self.compiled
+        price, down_pct = self.price(column), self.down(row)
+
+        upfront_total = compiled.upfront_total(price, down_pct)
+        break_even_rent = compiled.monthly_payments(price * (1 - down_pct)) + compiled.fixed_monthly
+        codes, _ = compiled.classify(break_even_rent, upfront_total)
+        return codes[inverse].reshape(columns.shape)
+
+    def refine(self, cells: np.ndarray) -> np.ndarray:
+        """Refine mixed cells down to single lattice steps.
+
+        Args:
+            cells: Starting cells as (column, row, width, height) rows
+
+        Returns:
+            Distinct price steps whose two ends disagree, as (column, row,
+            code before, code after) rows
+        """
+        edges = []
+        while len(cells):
+            x, y, w, h = cells.T
+            corners = self.codes(
+                np.stack([x, x + w, x, x + w], axis=1),
+                np.stack([y, y, y + h, y + h], axis=1),
+            )
+            mixed = (corners != corners[:, :1]).any(axis=1)
+            cells, corners = cells[mixed], corners[mixed]
+
+            # One step wide: record the bottom and top edges that change
+            leaf = (cells[:, 2] <= 1) & (cells[:, 3] <= 1)
+            leaves, codes = cells[leaf], corners[leaf].astype(np.int64)
+            column, row, height = leaves[:, 0], leaves[:, 1], leaves[:, 3]
+            bottom = codes[:, 0] != codes[:, 1]
+            top = (height > 0) & (codes[:, 2] != codes[:, 3])
+            edges.append(np.stack([column, row, codes[:, 0], codes[:, 1]], axis=1)[bottom])
+            edges.append(np.stack([column, row + height, codes[:, 2], codes[:, 3]], axis=1)[top])
+
+            cells = _split(cells[~leaf])
+        return np.unique(np.concatenate(edges), axis=0)
+
+
+def _steps(span: float, resolution: float) -> int:
+    """Number of equal steps no larger than resolution covering span."""
+    # The tolerance keeps exact multiples (e.g. 100000 / 20000) from rounding up
+    return math.ceil(span / resolution - 1e-9) if span > 0 else 0
+
+
+def _initial_cells(columns: int, rows: int, count: int) -> np.ndarray:
+    """Starting grid cells as (column, row, width, height) rows."""
+    x0, w = _cuts(columns, count)
+    y0, h = _cuts(rows, count)
+    x0, y0 = np.meshgrid(x0, y0)
+    w, h = np.meshgrid(w, h)
+    return np.stack([x0.ravel(), y0.ravel(), w.ravel(), h.ravel()], axis=1)
+
+
+def _cuts(steps: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Split an axis of steps into at most count segments (starts, lengths)."""
+    if not steps:
+        # A single lattice line: one zero-length segment
+        return np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    bounds = np.unique(np.linspace(0, steps, min(count, steps) + 1).round().astype(np.int64))
+    return bounds[:-1], np.diff(bounds)
+
+
+def _split(cells: np.ndarray) -> np.ndarray:
+    """Bisect cells along every axis longer than one step."""
+    x, y, w, h = cells.T
+    left = np.where(w > 1, w // 2, w)
+    bottom = np.where(h > 1, h // 2, h)
+    split_x, split_y = w > 1, h > 1
+
+    children = [
+        np.stack([x, y, left, bottom], axis=1),
+        np.stack([x + left, y, w - left, bottom], axis=1)[split_x],
+        np.stack([x, y + bottom, left, h - bottom], axis=1)[split_y],
+        np.stack([x + left, y + bottom, w - left, h - bottom], axis=1)[split_x & split_y],
+    ]
+    return np.concatenate(children)
+
+
+def _curves(lattice: _Lattice, edges: np.ndarray) -> list[BoundaryCurve]:
+    """Group boundary steps into curves by verdict transition."""
+    # Order points by down payment, then price
+    edges = edges[np.lexsort((edges[:, 0], edges[:, 1]))]
+    columns, rows, before, after = edges.T
+
+    curves = []
+    for from_code, to_code in sorted(set(zip(before.tolist(), after.tolist()))):
+        selected = (before == from_code) & (after == to_code)
+        curves.append(
+            BoundaryCurve(
+                from_verdict=VERDICTS[from_code],
+                to_verdict=VERDICTS[to_code],
+                # Rounded to drop float noise from the step arithmetic
+                down_payments=lattice.down(rows[selected]).round(10),
+                prices=lattice.price(columns[selected] + 0.5).round(6),
+            )
+        )
+    return curves
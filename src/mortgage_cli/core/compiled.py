@@ -0,0 +1,264 @@
+"""Profiles reduced to the constants analysis actually needs."""
+
+import math
+from dataclasses import dataclass
+from typing import Mapping, Union, overload
+
+import numpy as np
+
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+
+# Verdict codes are indices into this tuple (GREEN=0 ... OVER_BUDGET=3)
+VERDICTS: tuple[Verdict, ...] = tuple(Verdict)
+VERDICT_CODES: dict[Verdict, int] = {verdict: code for code, verdict in enumerate(VERDICTS)}
+
+# uint8 constants keep verdict_codes' arithmetic in uint8 for floats and arrays
+_RED = np.uint8(VERDICT_CODES[Verdict.RED])
+_OVER_BUDGET = np.uint8(VERDICT_CODES[Verdict.OVER_BUDGET])
+
+# Purchase cost line items, in UpfrontCosts order
+PURCHASE_ITEMS: tuple[str, ...] = (
+    "notary_legal",
+    "bank_arrangement",
+    "survey_valuation",
+    "mortgage_broker",
+    "other",
+)
+
+# Arithmetic methods take scalars or arrays; any array argument makes an array result
+FloatOrArray = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """A Profile flattened into plain floats for fast evaluation.
+
+    Every purchase cost is linear in the price (rate * price + fixed), the
+    mortgage payment is the loan times a precomputed annuity factor, and the
+    monthly costs collapse to one total. Arithmetic methods accept floats or
+    NumPy arrays, so the scalar and batch paths share the same formulas.
+    """
+
+    # (name, rate, fixed) per purchase cost item
+    purchase_items: tuple[tuple[str, float, float], ...]
+    purchase_rate: float
+    purchase_fixed: float
+
+    payment_factor: float
+    fixed_monthly: float
+
+    default_down_payment: float
+    budget: float
+    target_rent: float
+    green_below: float
+    yellow_below: float
+
+    @classmethod
+    def from_profile(cls, profile: Profile) -> "CompiledProfile":
+        """Compile a profile.
+
+        Args:
+            profile: Investment profile
+
+        Returns:
+            CompiledProfile with every derived constant precomputed
+        """
+        purchase_items = []
+        for name in PURCHASE_ITEMS:
+            item = getattr(profile.purchase_costs, name)
+            if item.type == "percentage":
+                purchase_items.append((name, item.value, 0.0))
+            else:
+                purchase_items.append((name, 0.0, item.value))
+
+        mortgage = profile.mortgage
+        return cls(
+            purchase_items=tuple(purchase_items),
+            purchase_rate=sum(rate for _, rate, _ in purchase_items),
+            purchase_fixed=sum(fixed for _, _, fixed in purchase_items),
+            payment_factor=annuity_factor(
+                mortgage.interest_rate + mortgage.insurance_rate, mortgage.duration_years
+            ),
+            fixed_monthly=profile.monthly_costs.total,
+            default_down_payment=mortgage.default_down_payment,
+            budget=profile.budget.total_available,
+            target_rent=profile.budget.target_rent,
+            green_below=profile.thresholds.green_below,
+            yellow_below=profile.thresholds.yellow_below,
+        )
+
+    @overload
+    def upfront_items(self, price: float, down_pct: float) -> dict[str, float]: ...
+
+    @overload
+    def upfront_items(self, price: np.ndarray, down_pct: FloatOrArray) -> dict[str, np.ndarray]: ...
+
+    @overload
+    def upfront_items(self, price: float, down_pct: np.ndarray) -> dict[str, np.ndarray]: ...
+
+    def upfront_items(
+        self, price: FloatOrArray, down_pct: FloatOrArray
+    ) -> Mapping[str, FloatOrArray]:
+        """Upfront cost line items, keyed like UpfrontCosts fields.
+
+        Args:
+            price: Purchase price(s)
+            down_pct: Down payment percentage(s) as decimal
+
+        Returns:
+            Down payment and every purchase cost item
+        """
+        items: dict[str, FloatOrArray] = {"down_payment": price * down_pct}
+        for name, rate, fixed in self.purchase_items:
+            items[name] = price * rate + fixed
+        return items
+
+    @overload
+    def upfront_total(self, price: float, down_pct: float) -> float: ...
+
+    @overload
+    def upfront_total(self, price: np.ndarray, down_pct: FloatOrArray) -> np.ndarray: ...
+
+    @overload
+    def upfront_total(self, price: float, down_pct: np.ndarray) -> np.ndarray: ...
+
+    def upfront_total(self, price: FloatOrArray, down_pct: FloatOrArray) -> FloatOrArray:
+        """Total upfront cash required.
+
+        Args:
+            price: Purchase price(s)
+            down_pct: Down payment percentage(s) as decimal
+
+        Returns:
+            Down payment plus all purchase costs
+        """
+        return price * (down_pct + self.purchase_rate) + self.purchase_fixed
+
+    def monthly_payment(self, loan_amount: float) -> float:
+        """Monthly mortgage payment for one loan.
+
+        Args:
+            loan_amount: Loan principal
+
+        Returns:
+            Monthly payment (0 for non-positive loans)
+        """
+        if loan_amount <= 0:
+            return 0.0
+        return loan_amount * self.payment_factor
+
+    def monthly_payments(self, loan_amounts: np.ndarray) -> np.ndarray:
+        """Vectorized monthly_payment.
+
+        Args:
+            loan_amounts: Loan principals
+
+        Returns:
+            Monthly payments (0 where the loan is non-positive)
+        """
+        return np.where(loan_amounts <= 0, 0.0, loan_amounts * self.payment_factor)
+
+    def verdict(self, break_even_rent: float, within_budget: bool) -> Verdict:
+        """Color-coded verdict for one property.
+
+        Thin wrapper around verdict_codes, so the scalar and batch paths
+        share one classification rule.
+
+        Args:
+            break_even_rent: Calculated break-even rent
+            within_budget: Whether upfront costs are within budget
+
+        Returns:
+            Verdict enum value
+        """
+        return VERDICTS[int(self.verdict_codes(break_even_rent, within_budget))]
+
+    def classify(
+        self, break_even_rent: np.ndarray, upfront_total: FloatOrArray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized budget check and verdict.
+
+        Args:
+            break_even_rent: Calculated break-even rents
+            upfront_total: Upfront investments, broadcastable to break_even_rent
+
+        Returns:
+            (verdict_codes, within_budget): uint8 verdict codes and budget
+            flags, both shaped like break_even_rent (flags that had to be
+            broadcast are a read-only view)
+        """
+        within_budget = np.asarray(upfront_total) <= self.budget
+        if within_budget.shape != np.shape(break_even_rent):
+            within_budget = np.broadcast_to(within_budget, np.shape(break_even_rent))
+        return self.verdict_codes(break_even_rent, within_budget), within_budget
+
+    def verdict_codes(
+        self,
+        break_even_rent: FloatOrArray,
+        within_budget: Union[bool, np.ndarray],
+    ) -> np.ndarray:
+        """Verdict codes for floats or arrays, without branching per value.
+
+        Codes count down from RED by one for each threshold the
+        break-even/target ratio is below (relying on the GREEN, YELLOW, RED
+        order of VERDICTS); NaN ratios fail both comparisons and stay RED.
+        Over-budget entries are then lifted to OVER_BUDGET arithmetically.
+
+        Args:
+            break_even_rent: Calculated break-even rent(s)
+            within_budget: Whether upfront costs are within budget
+
+        Returns:
+            uint8 verdict code(s) (indices into VERDICTS), shaped like the
+            broadcast inputs
+        """
+        if self.target_rent > 0:
+            ratio = break_even_rent / self.target_rent
+            # A yellow threshold below the green one leaves no yellow band
+            yellow_below = max(self.green_below, self.yellow_below)
+            codes = _RED - (ratio < yellow_below) - (ratio < self.green_below)
+        else:
+            codes = np.full(np.shape(break_even_rent), _RED)
+        result: np.ndarray = _OVER_BUDGET - (_OVER_BUDGET - codes) * within_budget
+        return result
+
+
+def annuity_factor(annual_rate: float, years: int) -> float:
+    """Monthly payment per unit of principal.
+
+    Equivalent to -npf.pmt(annual_rate / 12, years * 12, 1), computed with
+    log1p/expm1 so it stays accurate for small rates.
+
+    Args:
+        annual_rate: Annual interest rate as decimal
+        years: Loan term in years
+
+    Returns:
+        Payment factor (1 / months when the rate is not positive)
+    """
+    months = years * 12
+    if annual_rate <= 0:
+        return 1 / months
+    monthly_rate = annual_rate / 12
+    return monthly_rate / -math.expm1(-months * math.log1p(monthly_rate))
+
+
+def annuity_factors(
+    annual_rates: FloatOrArray, years: Union[int, np.ndarray]
+) -> np.ndarray:
+    """Vectorized annuity_factor.
+
+    Args:
+        annual_rates: Annual interest rates as decimals
+        years: Loan terms in years (broadcast against annual_rates)
+
+    Returns:
+        Payment factors (1 / months where the rate is not positive)
+    """
+    months = np.asarray(years, dtype=np.float64) * 12
+    monthly_rate = np.asarray(annual_rates, dtype=np.float64) / 12
+    positive = monthly_rate > 0
+    safe_rate = np.where(positive, monthly_rate, 1.0)
+    factor = safe_rate / -np.expm1(-months * np.log1p(safe_rate))
+    return np.where(positive, factor, 1 / months)
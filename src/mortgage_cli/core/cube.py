@@ -0,0 +1,289 @@
+"""Multi-dimensional sensitivity cubes stored as memory-mapped .npy files."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from mortgage_cli import __version__
+from mortgage_cli.core.compiled import VERDICTS, CompiledProfile, annuity_factors
+from mortgage_cli.models.profile import Profile
+
+# Bump when the manifest or file layout changes
+CUBE_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+
+# Sweep axes in storage order; chunks are blocks of prices and down payments
+AXES: tuple[str, ...] = (
+    "price",
+    "down_payment_percent",
+    "interest_rate",
+    "duration_years",
+    "rent",
+)
+
+# Stored arrays as (name, dtype, axes). Break-even rent and the verdict do
+# not depend on the rent, so they are stored without that axis.
+ARRAYS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("break_even_rent", "float64", AXES[:4]),
+    ("cash_on_cash_return", "float64", AXES),
+    ("verdict_codes", "uint8", AXES[:4]),
+)
+
+# Cells computed at once by default (bounds the working memory per chunk)
+DEFAULT_CHUNK_CELLS = 4_000_000
+
+
+@dataclass(frozen=True)
+class CubeAxes:
+    """Values swept along each cube axis."""
+
+    prices: np.ndarray
+    down_payments: np.ndarray
+    interest_rates: np.ndarray
+    durations: np.ndarray
+    rents: np.ndarray
+
+    @classmethod
+    def from_values(
+        cls,
+        prices: Sequence[float],
+        down_payments: Sequence[float],
+        interest_rates: Sequence[float],
+        durations: Sequence[int],
+        rents: Sequence[float],
+    ) -> "CubeAxes":
+        """Build axes from plain sequences.
+
+        Raises:
+            ValueError: If an axis is empty or a duration is not positive
+        """
+        axes = cls(
+            prices=np.asarray(prices, dtype=np.float64),
+            down_payments=np.asarray(down_payments, dtype=np.float64),
+            interest_rates=np.asarray(interest_rates, dtype=np.float64),
+            durations=np.asarray(durations, dtype=np.int64),
+            rents=np.asarray(rents, dtype=np.float64),
+        )
+        for name, values in zip(AXES, axes.values()):
+            if len(values) == 0:
+                raise ValueError(f"The {name} axis is empty")
+        if (axes.durations <= 0).any():
+            raise ValueError("Loan durations must be positive")
+        return axes
+
+    def values(self) -> tuple[np.ndarray, ...]:
+        """Axis values in AXES order."""
+        return (self.prices, self.down_payments, self.interest_rates, self.durations, self.rents)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Full cube shape in AXES order."""
+        return tuple(len(values) for values in self.values())
+
+    @property
+    def cells(self) -> int:
+        """Number of cells in the full cube."""
+        return int(np.prod(self.shape))
+
+
+@dataclass(frozen=True)
+class Cube:
+    """A cube opened from disk; arrays are read-only memory maps."""
+
+    path: Path
+    manifest: dict[str, Any]
+    axes: dict[str, np.ndarray]
+    arrays: dict[str, np.ndarray]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Get a stored array by name."""
+        return self.arrays[name]
+
+    def axis_index(self, axis: str, value: float) -> int:
+        """Index of the axis entry closest to a value.
+
+        Args:
+            axis: Axis name (see AXES)
+            value: Value to look up
+
+        Returns:
+            Index along that axis
+        """
+        return int(np.abs(self.axes[axis] - value).argmin())
+
+
+def write_cube(
+    profile: Profile,
+    axes: CubeAxes,
+    directory: Path,
+    chunk_cells: int = DEFAULT_CHUNK_CELLS,
+) -> dict[str, Any]:
+    """Evaluate a sensitivity cube and store it under a directory.
+
+    Every combination of price, down payment, interest rate, loan term and
+    rent is evaluated with the profile's costs, insurance rate, budget and
+    thresholds. Results go straight into memory-mapped .npy files, a block
+    of prices and down payments at a time, so cubes larger than RAM can be
+    written; the manifest is written last.
+
+    Args:
+        profile: Investment profile
+        axes: Values to sweep
+        directory: Output directory (created if needed)
+        chunk_cells: Maximum cells evaluated per chunk (at least one price
+            and down payment, i.e. every rate, term and rent, per chunk)
+
+    Returns:
+        The manifest
+
+    Raises:
+        OSError: If the directory or its files cannot be created
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    # A manifest left from an earlier cube would describe the wrong files
+    (directory / MANIFEST_NAME).unlink(missing_ok=True)
+
+    sizes = dict(zip(AXES, axes.shape))
+    shapes = {name: tuple(sizes[axis] for axis in names) for name, _, names in ARRAYS}
+    outputs = {
+        name: np.lib.format.open_memmap(
+            directory / f"{name}.npy", mode="w+", dtype=dtype, shape=shapes[name]
+        )
+        for name, dtype, _ in ARRAYS
+    }
+
+    evaluator = _CubeEvaluator(profile, axes)
+    price_count, down_count = len(axes.prices), len(axes.down_payments)
+    # Whole down payment rows per chunk when they fit, otherwise one price
+    # and a block of down payments
+    cells_per_down = axes.cells // (price_count * down_count)
+    down_step = min(down_count, max(1, chunk_cells // cells_per_down))
+    price_step = max(1, chunk_cells // (cells_per_down * down_step))
+    for price_start in range(0, price_count, price_step):
+        prices = slice(price_start, min(price_start + price_step, price_count))
+        for down_start in range(0, down_count, down_step):
+            downs = slice(down_start, min(down_start + down_step, down_count))
+            block = evaluator.evaluate(axes.prices[prices], axes.down_payments[downs])
+            for name, values in block.items():
+                outputs[name][prices, downs] = values
+
+    for array in outputs.values():
+        array.flush()
+    del outputs
+
+    manifest = _manifest(profile, axes, shapes)
+    with open(directory / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return manifest
+
+
+def open_cube(directory: Path) -> Cube:
+    """Open a cube written by write_cube without loading its arrays.
+
+    Args:
+        directory: Cube directory
+
+    Returns:
+        Cube with read-only memory-mapped arrays
+
+    Raises:
+        ValueError: If the directory holds no cube, or one in another format
+    """
+    try:
+        with open(directory / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"No cube manifest in '{directory}': {e}") from None
+    if manifest.get("format") != CUBE_FORMAT:
+        raise ValueError(f"Unsupported cube format: {manifest.get('format')}")
+
+    axes = {name: np.asarray(values) for name, values in manifest["axes"].items()}
+    arrays = {
+        name: np.load(directory / entry["file"], mmap_mode="r")
+        for name, entry in manifest["arrays"].items()
+    }
+    return Cube(path=directory, manifest=manifest, axes=axes, arrays=arrays)
+
+
+class _CubeEvaluator:
+    """Evaluates blocks of the cube for a fixed set of axes."""
+
+    def __init__(self, profile: Profile, axes: CubeAxes):
+        self.compiled = CompiledProfile.from_profile(profile)
+        self.axes = axes
+        insurance = profile.mortgage.insurance_rate
+        # Payment per unit of loan for every (rate, term), shape (1, 1, R, T)
+        self.factors = annuity_factors(
+            axes.interest_rates[:, np.newaxis] + insurance,
+            axes.durations[np.newaxis, :],
+        )[np.newaxis, np.newaxis]
+        self.rents = axes.rents
+
+    def evaluate(self, prices: np.ndarray, down_payments: np.ndarray) -> dict[str, np.ndarray]:
+        """Evaluate every cell for a block of prices and down payments.
+
+        Args:
+            prices: Price axis values of the block
+            down_payments: Down payment axis values of the block
+
+        Returns:
+            Arrays keyed like ARRAYS, each with the block's price and down
+            payment axes first
+        """
+        compiled = self.compiled
+        price = prices[:, np.newaxis, np.newaxis, np.newaxis]
+        down_pct = down_payments[np.newaxis, :, np.newaxis, np.newaxis]
+
+        loan = price * (1 - down_pct)
+        payment = np.where(loan <= 0, 0.0, loan * self.factors)
+        break_even_rent = payment + compiled.fixed_monthly
+
+        upfront_total = compiled.upfront_total(price, down_pct)
+        verdict_codes, within_budget = compiled.classify(break_even_rent, upfront_total)
+
+        # Cash-on-cash return gains the rent axis last
+        has_investment = upfront_total > 0
+        annual_net_income = (self.rents - break_even_rent[..., np.newaxis]) * 12
+        divisor = np.where(has_investment, upfront_total, 1.0)[..., np.newaxis]
+        cash_on_cash_return = np.where(
+            has_investment[..., np.newaxis], annual_net_income / divisor, 0.0
+        )
+
+        return {
+            "break_even_rent": break_even_rent,
+            "cash_on_cash_return": cash_on_cash_return,
+            "verdict_codes": verdict_codes,
+        }
+
+
+def _manifest(
+    profile: Profile, axes: CubeAxes, shapes: dict[str, tuple[int, ...]]
+) -> dict[str, Any]:
+    """Describe a cube's axes and files."""
+    arrays: dict[str, Any] = {}
+    for name, dtype, names in ARRAYS:
+        arrays[name] = {
+            "file": f"{name}.npy",
+            "dtype": dtype,
+            "axes": list(names),
+            "shape": list(shapes[name]),
+        }
+    arrays["verdict_codes"]["labels"] = [verdict.value for verdict in VERDICTS]
+
+    return {
+        "format": CUBE_FORMAT,
+        "version": __version__,
+        "profile": {
+            "name": profile.name,
+            "insurance_rate": profile.mortgage.insurance_rate,
+            "target_rent": profile.budget.target_rent,
+            "budget": profile.budget.total_available,
+        },
+        "axes": {name: values.tolist() for name, values in zip(AXES, axes.values())},
+        "arrays": arrays,
+    }
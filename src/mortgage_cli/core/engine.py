@@ -0,0 +1,235 @@
+"""Vectorized evaluation engine for batch and matrix analysis."""
+
+from dataclasses import dataclass
+from typing import Sequence, Union
+
+import numpy as np
+
+from mortgage_cli.core.compiled import VERDICT_CODES, VERDICTS, CompiledProfile
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.lite import LiteMatrixCell
+from mortgage_cli.models.results import MatrixCell, Verdict
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Verdict values indexed by verdict code, for decoding whole arrays at once
+VERDICT_VALUES = np.array([verdict.value for verdict in VERDICTS])
+
+
+@dataclass(frozen=True)
+class MatrixArrays:
+    """Sensitivity matrix results as NumPy arrays.
+
+    All result arrays have shape (len(down_payments), len(prices)), matching
+    the row/column layout used by the formatters. The axes are stored once;
+    formatters read the arrays directly and cells are only materialized on
+    request (cell, to_cells).
+    """
+
+    prices: np.ndarray
+    down_payments: np.ndarray
+    break_even_rent: np.ndarray
+    upfront_total: np.ndarray
+    verdict_codes: np.ndarray
+    within_budget: np.ndarray
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: Sequence[Sequence[Union[MatrixCell, LiteMatrixCell]]],
+        prices: ArrayLike,
+        down_payments: ArrayLike,
+    ) -> "MatrixArrays":
+        """Build arrays from a 2D list of cells, the formatters' former input.
+
+        Cells carry no upfront cost, so upfront_total is NaN.
+
+        Args:
+            cells: 2D list of cells (rows are down payments)
+            prices: Purchase prices (matrix columns)
+            down_payments: Down payment percentages (matrix rows)
+
+        Returns:
+            MatrixArrays holding the cells' values
+        """
+        price_axis = np.asarray(prices, dtype=np.float64)
+        down_axis = np.asarray(down_payments, dtype=np.float64)
+        shape = (len(down_axis), len(price_axis))
+        flat = [cell for row in cells for cell in row]
+        rents = [cell.break_even_rent for cell in flat]
+        codes = [VERDICT_CODES[cell.verdict] for cell in flat]
+        budget = [cell.within_budget for cell in flat]
+        return cls(
+            prices=price_axis,
+            down_payments=down_axis,
+            break_even_rent=np.array(rents, dtype=np.float64).reshape(shape),
+            upfront_total=np.full(shape, np.nan),
+            verdict_codes=np.array(codes, dtype=np.uint8).reshape(shape),
+            within_budget=np.array(budget, dtype=bool).reshape(shape),
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Matrix shape as (rows, columns)."""
+        return (len(self.down_payments), len(self.prices))
+
+    def verdict_at(self, row: int, col: int) -> Verdict:
+        """Get the verdict for a single cell.
+
+        Args:
+            row: Down payment index
+            col: Price index
+
+        Returns:
+            Verdict enum value
+        """
+        return VERDICTS[int(self.verdict_codes[row, col])]
+
+    def verdict_values(self) -> np.ndarray:
+        """Verdict value strings for every cell, decoded in one pass."""
+        values: np.ndarray = VERDICT_VALUES[self.verdict_codes]
+        return values
+
+    def verdict_mask(self, *verdicts: Verdict) -> np.ndarray:
+        """Boolean array marking the cells that have any of the given verdicts."""
+        mask: np.ndarray = np.isin(self.verdict_codes, [VERDICT_CODES[v] for v in verdicts])
+        return mask
+
+    def verdict_counts(self) -> dict[Verdict, int]:
+        """Number of cells with each verdict."""
+        counts = np.bincount(self.verdict_codes.ravel(), minlength=len(VERDICTS))
+        return dict(zip(VERDICTS, counts.tolist()))
+
+    def cell(self, row: int, col: int) -> LiteMatrixCell:
+        """Materialize a single cell.
+
+        Args:
+            row: Down payment index
+            col: Price index
+
+        Returns:
+            Slotted cell with that price and down payment's results
+        """
+        return LiteMatrixCell(
+            price=float(self.prices[col]),
+            down_payment_percent=float(self.down_payments[row]),
+            break_even_rent=float(self.break_even_rent[row, col]),
+            verdict=self.verdict_at(row, col),
+            within_budget=bool(self.within_budget[row, col]),
+        )
+
+    def to_cells(self) -> list[list[LiteMatrixCell]]:
+        """Materialize the whole matrix as slotted cell rows.
+
+        Returns:
+            2D list of LiteMatrixCell objects (rows are down payments)
+        """
+        prices = self.prices.tolist()
+        break_even = self.break_even_rent.tolist()
+        codes = self.verdict_codes.tolist()
+        budget = self.within_budget.tolist()
+
+        return [
+            [
+                LiteMatrixCell(
+                    price=price,
+                    down_payment_percent=down_pct,
+                    break_even_rent=break_even[row][col],
+                    verdict=VERDICTS[codes[row][col]],
+                    within_budget=budget[row][col],
+                )
+                for col, price in enumerate(prices)
+            ]
+            for row, down_pct in enumerate(self.down_payments.tolist())
+        ]
+
+
+@dataclass(frozen=True)
+class BatchAnalysis:
+    """Struct-of-arrays analysis results, one entry per property.
+
+    Mirrors every metric exposed by AnalysisResult, with warnings left to
+    InvestmentAnalyzer.result_at when a single row is materialized.
+    """
+
+    property_price: np.ndarray
+    expected_rent: np.ndarray
+    down_payment_percent: np.ndarray
+
+    # Upfront cost line items
+    down_payment: np.ndarray
+    notary_legal: np.ndarray
+    bank_arrangement: np.ndarray
+    survey_valuation: np.ndarray
+    mortgage_broker: np.ndarray
+    other: np.ndarray
+    upfront_total: np.ndarray
+
+    # Monthly breakdown
+    mortgage_payment: np.ndarray
+    fixed_costs: np.ndarray
+
+    # Key metrics
+    break_even_rent: np.ndarray
+    cash_on_cash_return: np.ndarray
+    monthly_surplus_shortfall: np.ndarray
+
+    # Assessment
+    verdict_codes: np.ndarray
+    within_budget: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of analyzed properties."""
+        return len(self.property_price)
+
+    @property
+    def verdicts(self) -> list[Verdict]:
+        """Verdict enum values for every property."""
+        return [VERDICTS[code] for code in self.verdict_codes.tolist()]
+
+
+class MatrixEngine:
+    """Evaluate a whole price/down-payment grid in one broadcasted pass.
+
+    Produces the same numbers as running InvestmentAnalyzer.analyze on every
+    cell, without building a PropertyInput or AnalysisResult per cell.
+    """
+
+    def __init__(self, profile: Profile):
+        """Initialize engine with a profile.
+
+        Args:
+            profile: Investment profile with mortgage terms and costs
+        """
+        self.profile = profile
+        self.compiled = CompiledProfile.from_profile(profile)
+
+    def evaluate(self, prices: ArrayLike, down_payments: ArrayLike) -> MatrixArrays:
+        """Evaluate every price/down-payment combination.
+
+        Args:
+            prices: Purchase prices (matrix columns)
+            down_payments: Down payment percentages as decimals (matrix rows)
+
+        Returns:
+            MatrixArrays with one entry per cell
+        """
+        price_axis = np.asarray(prices, dtype=np.float64)
+        down_axis = np.asarray(down_payments, dtype=np.float64)
+
+        price = price_axis[np.newaxis, :]
+        down_pct = down_axis[:, np.newaxis]
+        compiled = self.compiled
+
+        upfront_total = compiled.upfront_total(price, down_pct)
+        break_even_rent = compiled.monthly_payments(price * (1 - down_pct)) + compiled.fixed_monthly
+        verdict_codes, within_budget = compiled.classify(break_even_rent, upfront_total)
+
+        return MatrixArrays(
+            prices=price_axis,
+            down_payments=down_axis,
+            break_even_rent=break_even_rent,
+            upfront_total=upfront_total,
+            verdict_codes=verdict_codes,
+            within_budget=within_budget,
+        )
@@ -0,0 +1,191 @@
+"""Process-pool execution for large matrices and batches."""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+import numpy as np
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import ArrayLike, BatchAnalysis, MatrixArrays, MatrixEngine
+from mortgage_cli.models.profile import Profile
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Target number of cells evaluated per tile
+DEFAULT_TILE_CELLS = 1 << 18
+
+# Per-process state, set once by _init_worker so the profile is only
+# pickled when a worker starts rather than with every task
+_worker_analyzer: Optional[InvestmentAnalyzer] = None
+_worker_engine: Optional[MatrixEngine] = None
+
+
+def resolve_workers(workers: int) -> int:
+    """Resolve a --workers value to a process count.
+
+    Args:
+        workers: Requested worker count (0 means one per CPU)
+
+    Returns:
+        Number of worker processes to use (at least 1)
+    """
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _init_worker(profile: Profile) -> None:
+    """Build the per-process analyzer and engine."""
+    global _worker_analyzer, _worker_engine
+    _worker_analyzer = InvestmentAnalyzer(profile)
+    _worker_engine = MatrixEngine(profile)
+
+
+def _evaluate_tile(prices: np.ndarray, down_payments: np.ndarray) -> MatrixArrays:
+    """Evaluate one matrix tile in a worker process."""
+    assert _worker_engine is not None
+    return _worker_engine.evaluate(prices, down_payments)
+
+
+def _analyze_chunk(
+    columns: tuple[np.ndarray, np.ndarray, np.ndarray],
+    with_warnings: bool,
+) -> tuple[BatchAnalysis, Optional[list[list[str]]]]:
+    """Analyze one batch chunk in a worker process."""
+    assert _worker_analyzer is not None
+    result = _worker_analyzer.analyze_batch(*columns)
+    warnings = _worker_analyzer.batch_warnings(result) if with_warnings else None
+    return result, warnings
+
+
+def _ordered_map(
+    executor: ProcessPoolExecutor,
+    fn: Callable[..., R],
+    items: Iterable[T],
+    window: int,
+    *args: object,
+) -> Iterator[R]:
+    """Like executor.map, but keeps at most window tasks in flight.
+
+    Results are yielded in submission order, and the input iterable is only
+    consumed as results are drained, so memory stays bounded for long
+    streams.
+    """
+    pending: deque[Future[R]] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _tile_slices(rows: int, cols: int, tile_cells: int) -> list[tuple[slice, slice]]:
+    """Split a rows x cols grid into row-major tiles of about tile_cells cells."""
+    tile_cols = max(1, min(cols, tile_cells))
+    tile_rows = max(1, tile_cells // tile_cols)
+    return [
+        (slice(r, min(r + tile_rows, rows)), slice(c, min(c + tile_cols, cols)))
+        for r in range(0, rows, tile_rows)
+        for c in range(0, cols, tile_cols)
+    ]
+
+
+def evaluate_matrix(
+    profile: Profile,
+    prices: ArrayLike,
+    down_payments: ArrayLike,
+    workers: int = 1,
+    tile_cells: int = DEFAULT_TILE_CELLS,
+) -> MatrixArrays:
+    """Evaluate a sensitivity matrix, splitting it across worker processes.
+
+    Args:
+        profile: Investment profile
+        prices: Purchase prices (matrix columns)
+        down_payments: Down payment percentages (matrix rows)
+        workers: Number of worker processes (0 = one per CPU, 1 = in-process)
+        tile_cells: Approximate number of cells per tile
+
+    Returns:
+        MatrixArrays identical to MatrixEngine(profile).evaluate(...)
+    """
+    price_axis = np.asarray(prices, dtype=np.float64)
+    down_axis = np.asarray(down_payments, dtype=np.float64)
+    workers = resolve_workers(workers)
+    tiles = _tile_slices(len(down_axis), len(price_axis), tile_cells)
+
+    if workers == 1 or len(tiles) == 1:
+        return MatrixEngine(profile).evaluate(price_axis, down_axis)
+
+    shape = (len(down_axis), len(price_axis))
+    break_even_rent = np.empty(shape)
+    upfront_total = np.empty(shape)
+    verdict_codes = np.empty(shape, dtype=np.uint8)
+    within_budget = np.empty(shape, dtype=bool)
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tiles)),
+        initializer=_init_worker,
+        initargs=(profile,),
+    ) as executor:
+        results = executor.map(
+            _evaluate_tile,
+            [price_axis[cols] for _, cols in tiles],
+            [down_axis[rows] for rows, _ in tiles],
+        )
+        # executor.map yields in submission order, so each tile lands in place
+        for (rows, cols), tile in zip(tiles, results):
+            break_even_rent[rows, cols] = tile.break_even_rent
+            upfront_total[rows, cols] = tile.upfront_total
+            verdict_codes[rows, cols] = tile.verdict_codes
+            within_budget[rows, cols] = tile.within_budget
+
+    return MatrixArrays(
+        prices=price_axis,
+        down_payments=down_axis,
+        break_even_rent=break_even_rent,
+        upfront_total=upfront_total,
+        verdict_codes=verdict_codes,
+        within_budget=within_budget,
+    )
+
+
+def analyze_chunks(
+    profile: Profile,
+    chunks: Iterable[tuple[np.ndarray, np.ndarray, np.ndarray]],
+    workers: int = 1,
+    with_warnings: bool = False,
+) -> Iterator[tuple[BatchAnalysis, Optional[list[list[str]]]]]:
+    """Analyze a stream of (prices, rents, downs) chunks, in input order.
+
+    Args:
+        profile: Investment profile
+        chunks: Column chunks as accepted by InvestmentAnalyzer.analyze_batch
+        workers: Number of worker processes (0 = one per CPU, 1 = in-process)
+        with_warnings: Also generate warning messages for each property
+
+    Yields:
+        (batch result, warnings or None) per chunk, in the order given
+
+    Raises:
+        ValueError: If a chunk fails validation
+    """
+    workers = resolve_workers(workers)
+
+    if workers == 1:
+        analyzer = InvestmentAnalyzer(profile)
+        for columns in chunks:
+            result = analyzer.analyze_batch(*columns)
+            yield result, analyzer.batch_warnings(result) if with_warnings else None
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(profile,),
+    ) as executor:
+        yield from _ordered_map(executor, _analyze_chunk, chunks, workers * 2, with_warnings)
@@ -0,0 +1,208 @@
+"""Vectorized Monte Carlo stress testing."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mortgage_cli.core.compiled import VERDICTS, CompiledProfile, annuity_factors
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+from mortgage_cli.models.simulation import Distribution, SimulationSpec
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Per-draw simulation outcomes as NumPy arrays."""
+
+    seed: int
+    upfront_total: float
+    within_budget: bool
+    interest_rate: np.ndarray
+    rent: np.ndarray
+    break_even_rent: np.ndarray
+    cash_on_cash_return: np.ndarray
+    monthly_surplus_shortfall: np.ndarray
+    verdict_codes: np.ndarray
+
+    @property
+    def draws(self) -> int:
+        """Number of simulated draws."""
+        return len(self.break_even_rent)
+
+    def percentiles(
+        self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+    ) -> dict[str, dict[float, float]]:
+        """Percentiles of the key metrics.
+
+        Args:
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            Mapping of metric name to {percentile: value}
+        """
+        metrics = {
+            "break_even_rent": self.break_even_rent,
+            "cash_on_cash_return": self.cash_on_cash_return,
+            "monthly_surplus_shortfall": self.monthly_surplus_shortfall,
+        }
+        return {
+            name: dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
+            for name, values in metrics.items()
+        }
+
+    def verdict_probabilities(self) -> dict[Verdict, float]:
+        """Share of draws ending in each verdict."""
+        counts = np.bincount(self.verdict_codes, minlength=len(VERDICTS))
+        return {verdict: float(count) / self.draws for verdict, count in zip(VERDICTS, counts)}
+
+    @property
+    def shortfall_probability(self) -> float:
+        """Share of draws where rent does not cover break-even."""
+        return float(np.mean(self.monthly_surplus_shortfall < 0))
+
+
+class MonteCarloSimulator:
+    """Sample uncertain inputs and evaluate every draw in one vectorized pass."""
+
+    def __init__(self, profile: Profile, spec: SimulationSpec):
+        """Initialize simulator.
+
+        Args:
+            profile: Investment profile supplying every non-simulated input
+            spec: Distributions for the simulated inputs
+        """
+        self.profile = profile
+        self.spec = spec
+        self.compiled = CompiledProfile.from_profile(profile)
+
+    def run(
+        self,
+        price: float,
+        rent: float,
+        down_payment_percent: float | None = None,
+        draws: int = 100_000,
+        seed: int = 0,
+    ) -> SimulationResult:
+        """Simulate a property under the configured uncertainty.
+
+        Args:
+            price: Property purchase price
+            rent: Expected monthly rent (used when rent is not simulated)
+            down_payment_percent: Down payment as decimal (profile default if None)
+            draws: Number of Monte Carlo draws
+            seed: Random seed; the same seed always gives the same draws
+
+        Returns:
+            Per-draw simulation outcomes
+
+        Raises:
+            ValueError: If the price is not positive or the rent is negative
+        """
+        if not price > 0:
+            raise ValueError("Price must be positive")
+        if not rent >= 0:
+            raise ValueError("Rent must not be negative")
+        rng = np.random.default_rng(seed)
+        mortgage = self.profile.mortgage
+        costs = self.profile.monthly_costs
+        spec = self.spec
+
+        # Sample in a fixed order so results depend only on the seed
+        interest_rate = _sample(rng, spec.interest_rate, mortgage.interest_rate, draws, 0.0)
+        insurance_rate = _sample(rng, spec.insurance_rate, mortgage.insurance_rate, draws, 0.0)
+        fixed_costs = np.zeros(draws)
+        for name in ("property_tax", "insurance", "maintenance", "management"):
+            distribution = getattr(spec.monthly_costs, name)
+            fixed_costs = fixed_costs + _sample(rng, distribution, getattr(costs, name), draws, 0.0)
+        sampled_rent = _sample(rng, spec.rent, rent, draws, 0.0)
+
+        # Upfront costs do not depend on any sampled input
+        compiled = self.compiled
+        down_pct = compiled.default_down_payment if down_payment_percent is None else down_payment_percent
+        upfront_total = compiled.upfront_total(price, down_pct)
+        within_budget = upfront_total <= compiled.budget
+
+        loan_amount = price * (1 - down_pct)
+        effective_rate = interest_rate + insurance_rate
+        mortgage_payment = np.where(
+            loan_amount <= 0,
+            0.0,
+            loan_amount * annuity_factors(effective_rate, mortgage.duration_years),
+        )
+        break_even_rent = mortgage_payment + fixed_costs
+
+        monthly_surplus_shortfall = sampled_rent - break_even_rent
+        if upfront_total > 0:
+            cash_on_cash_return = monthly_surplus_shortfall * 12 / upfront_total
+        else:
+            cash_on_cash_return = np.zeros(draws)
+
+        verdict_codes = compiled.verdict_codes(break_even_rent, within_budget)
+
+        return SimulationResult(
+            seed=seed,
+            upfront_total=upfront_total,
+            within_budget=within_budget,
+            interest_rate=interest_rate,
+            rent=sampled_rent,
+            break_even_rent=break_even_rent,
+            cash_on_cash_return=cash_on_cash_return,
+            monthly_surplus_shortfall=monthly_surplus_shortfall,
+            verdict_codes=verdict_codes,
+        )
+
+
+def _sample(
+    rng: np.random.Generator,
+    distribution: Distribution | None,
+    default: float,
+    size: int,
+    floor: float | None = None,
+) -> np.ndarray:
+    """Draw samples from a distribution, or repeat the default value.
+
+    Args:
+        rng: Random generator
+        distribution: Distribution to sample (None keeps the default)
+        default: Value used when no distribution is given
+        size: Number of samples
+        floor: Lower clip applied on top of the distribution's own min
+
+    Returns:
+        Array of samples
+    """
+    if distribution is None:
+        return np.full(size, default, dtype=np.float64)
+
+    parameters = distribution.parameters()
+    if distribution.type == "fixed":
+        (value,) = parameters
+        return np.full(size, value, dtype=np.float64)
+
+    if distribution.type == "uniform":
+        low, high = parameters
+        samples = rng.uniform(low, high, size)
+    elif distribution.type == "normal":
+        mean, std = parameters
+        samples = rng.normal(mean, std, size)
+    elif distribution.type == "triangular":
+        low, mode, high = parameters
+        if low == high:
+            samples = np.full(size, low, dtype=np.float64)
+        else:
+            samples = rng.triangular(low, mode, high, size)
+    else:
+        # Convert the value-space mean/std to the underlying normal's parameters
+        mean, std = parameters
+        sigma_sq = np.log1p((std / mean) ** 2)
+        mu = np.log(mean) - sigma_sq / 2
+        samples = rng.lognormal(mu, np.sqrt(sigma_sq), size)
+
+    lower = distribution.min
+    if floor is not None:
+        lower = floor if lower is None else max(lower, floor)
+    if lower is not None or distribution.max is not None:
+        samples = np.clip(samples, lower, distribution.max)
+    return samples
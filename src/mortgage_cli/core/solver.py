@@ -0,0 +1,228 @@
+"""Goal-seek solvers: inverse questions about the analysis formulas."""
+
+import numpy as np
+
+from mortgage_cli.core.compiled import CompiledProfile, annuity_factors
+from mortgage_cli.core.engine import ArrayLike
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+
+# Upper end of the interest rate bracket searched by max_interest_rate
+RATE_CEILING = 1.0
+
+# Bisection steps for the interest rate; each halves the bracket, so 50
+# steps leave it below 1e-15 (finer than float64 resolves near 1.0)
+RATE_ITERATIONS = 50
+
+# Verdicts compare break-even rent with a strict "<", so a limit found on the
+# boundary is moved inside it by one cent of price or one basis point of down
+PRICE_STEP = 0.01
+DOWN_STEP = 1e-4
+
+
+class GoalSolver:
+    """Answer inverse questions for many targets at once.
+
+    Break-even rent is linear in the price and the down payment, and upfront
+    cost is linear in both, so the price and down payment limits and the
+    rent for a given return are closed-form inversions of the
+    InvestmentAnalyzer formulas. The interest rate enters through the
+    annuity factor, which has no closed-form inverse, so it is found by
+    bisection over all targets at once.
+
+    Every method accepts scalars or arrays (broadcast together) and returns
+    float arrays with NaN where no value satisfies the goal.
+    """
+
+    def __init__(self, profile: Profile):
+        """Initialize solver with a profile.
+
+        Args:
+            profile: Investment profile with mortgage terms and costs
+        """
+        self.profile = profile
+        self.compiled = CompiledProfile.from_profile(profile)
+
+    def max_price(
+        self,
+        target_rent: ArrayLike,
+        down_pct: ArrayLike,
+        verdict: Verdict = Verdict.GREEN,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Highest price that keeps a verdict and stays within budget.
+
+        The returned price and any lower one meet the goal; a rent-limited
+        price lies PRICE_STEP below the verdict boundary.
+
+        Args:
+            target_rent: Target rent(s) the verdict is judged against
+            down_pct: Down payment percentage(s) as decimal
+            verdict: Worst acceptable verdict (GREEN or YELLOW)
+
+        Returns:
+            (prices, limited_by_budget): the price limit, and whether the
+            budget rather than the rent sets it
+        """
+        compiled = self.compiled
+        target_rent, down_pct = np.broadcast_arrays(
+            np.asarray(target_rent, dtype=np.float64), np.asarray(down_pct, dtype=np.float64)
+        )
+        margin = self._rent_ceiling(target_rent, verdict) - compiled.fixed_monthly
+
+        # Break-even rent is price * (1 - down) * factor + fixed monthly costs
+        per_price = (1 - down_pct) * compiled.payment_factor
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rent_limit = np.where(per_price > 0, margin / per_price - PRICE_STEP, np.inf)
+        # A margin under PRICE_STEP * per_price leaves no positive price
+        rent_limit = np.where((margin > 0) & (rent_limit > 0), rent_limit, np.nan)
+
+        # Upfront cost is price * (down + purchase rate) + fixed purchase costs
+        spare = compiled.budget - compiled.purchase_fixed
+        per_price_upfront = down_pct + compiled.purchase_rate
+        with np.errstate(divide="ignore", invalid="ignore"):
+            budget_limit = np.where(per_price_upfront > 0, spare / per_price_upfront, np.inf)
+        budget_limit = np.where(spare > 0, budget_limit, np.nan)
+
+        prices = np.fmin(rent_limit, budget_limit)
+        prices = np.where(np.isnan(rent_limit) | np.isnan(budget_limit), np.nan, prices)
+        return prices, budget_limit < rent_limit
+
+    def min_down_payment(
+        self,
+        price: ArrayLike,
+        target_rent: ArrayLike,
+        verdict: Verdict = Verdict.GREEN,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Lowest down payment that reaches a verdict within budget.
+
+        The returned down payment and any higher one (within budget) meet the
+        goal; a positive minimum lies DOWN_STEP above the verdict boundary.
+
+        Args:
+            price: Purchase price(s)
+            target_rent: Target rent(s) the verdict is judged against
+            verdict: Worst acceptable verdict (GREEN or YELLOW)
+
+        Returns:
+            (min_down, max_down): the lowest down payment meeting the goal
+            (NaN if none does) and the highest one the budget allows (NaN if
+            even no down payment fits), both as decimals
+        """
+        compiled = self.compiled
+        price, target_rent = np.broadcast_arrays(
+            np.asarray(price, dtype=np.float64), np.asarray(target_rent, dtype=np.float64)
+        )
+        margin = self._rent_ceiling(target_rent, verdict) - compiled.fixed_monthly
+
+        # The loan share (1 - down) may be at most margin / (price * factor)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loan_share = margin / (price * compiled.payment_factor)
+        boundary = 1 - loan_share
+        min_down = np.where(boundary > 0, np.minimum(boundary + DOWN_STEP, 1.0), 0.0)
+        min_down = np.where(margin > 0, min_down, np.nan)
+
+        max_down = np.minimum(
+            (compiled.budget - compiled.purchase_fixed) / price - compiled.purchase_rate, 1.0
+        )
+        max_down = np.where(max_down >= 0, max_down, np.nan)
+
+        min_down = np.where(min_down <= max_down, min_down, np.nan)
+        return min_down, max_down
+
+    def rent_for_return(
+        self,
+        price: ArrayLike,
+        down_pct: ArrayLike,
+        cash_on_cash: ArrayLike,
+    ) -> np.ndarray:
+        """Rent needed for a cash-on-cash return.
+
+        Args:
+            price: Purchase price(s)
+            down_pct: Down payment percentage(s) as decimal
+            cash_on_cash: Target annual cash-on-cash return(s) as decimal
+
+        Returns:
+            Monthly rents
+        """
+        compiled = self.compiled
+        price = np.asarray(price, dtype=np.float64)
+        down_pct = np.asarray(down_pct, dtype=np.float64)
+
+        break_even_rent = compiled.monthly_payments(price * (1 - down_pct)) + compiled.fixed_monthly
+        upfront_total = compiled.upfront_total(price, down_pct)
+        rents: np.ndarray = (
+            break_even_rent + np.asarray(cash_on_cash, dtype=np.float64) * upfront_total / 12
+        )
+        return rents
+
+    def max_interest_rate(
+        self,
+        price: ArrayLike,
+        target_rent: ArrayLike,
+        down_pct: ArrayLike,
+        verdict: Verdict = Verdict.GREEN,
+    ) -> np.ndarray:
+        """Highest interest rate that keeps a verdict.
+
+        The rate excludes the profile's insurance rate, which is added on
+        top as in the analysis. Rates are searched up to RATE_CEILING; a
+        property that keeps the verdict even there gets RATE_CEILING.
+
+        Args:
+            price: Purchase price(s)
+            target_rent: Target rent(s) the verdict is judged against
+            down_pct: Down payment percentage(s) as decimal
+            verdict: Worst acceptable verdict (GREEN or YELLOW)
+
+        Returns:
+            Annual interest rates as decimals (NaN where even a zero rate
+            misses the verdict or the property is over budget)
+        """
+        compiled = self.compiled
+        price, target_rent, down_pct = np.broadcast_arrays(
+            np.asarray(price, dtype=np.float64),
+            np.asarray(target_rent, dtype=np.float64),
+            np.asarray(down_pct, dtype=np.float64),
+        )
+        loan = price * (1 - down_pct)
+        ceiling = self._rent_ceiling(target_rent, verdict)
+        insurance = self.profile.mortgage.insurance_rate
+        years = self.profile.mortgage.duration_years
+
+        def meets_goal(rate: np.ndarray) -> np.ndarray:
+            payment = np.where(loan <= 0, 0.0, loan * annuity_factors(rate + insurance, years))
+            return payment + compiled.fixed_monthly < ceiling
+
+        # Bisect [low, high] where low meets the goal and high does not
+        low = np.zeros(price.shape)
+        high = np.full(price.shape, RATE_CEILING)
+        feasible = meets_goal(low)
+        unbounded = meets_goal(high)
+        for _ in range(RATE_ITERATIONS):
+            middle = (low + high) / 2
+            ok = meets_goal(middle)
+            low = np.where(ok, middle, low)
+            high = np.where(ok, high, middle)
+
+        rates = np.where(unbounded, RATE_CEILING, low)
+        within_budget = compiled.upfront_total(price, down_pct) <= compiled.budget
+        return np.where(feasible & within_budget, rates, np.nan)
+
+    def _rent_ceiling(self, target_rent: np.ndarray, verdict: Verdict) -> np.ndarray:
+        """Break-even rent the verdict must stay below.
+
+        Raises:
+            ValueError: If verdict is not GREEN or YELLOW
+        """
+        # As in CompiledProfile.verdict_codes, a YELLOW threshold below the
+        # GREEN one is raised to it
+        green_below = self.compiled.green_below
+        thresholds = {
+            Verdict.GREEN: green_below,
+            Verdict.YELLOW: max(green_below, self.compiled.yellow_below),
+        }
+        if verdict not in thresholds:
+            raise ValueError(f"Cannot solve for verdict '{verdict.value}'. Use green or yellow")
+        # A non-positive target rent is always RED
+        return np.where(target_rent > 0, target_rent * thresholds[verdict], -np.inf)
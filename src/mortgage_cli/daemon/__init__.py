@@ -0,0 +1,14 @@
+"""Local daemon that runs commands in a warm process.
+
+The server (mortgage-cli serve) imports the CLI once and then serves
+requests one at a time, keeping parsed profiles in memory between them.
+The client forwards commands to it and prints the replies.
+
+Protocol: the client sends one JSON line {"argv": [...], "columns": N} and
+the server replies with one JSON line {"stdout": ..., "stderr": ...,
+"exit_code": ...}. Output is rendered at the client's terminal width, so it
+matches what the command would print locally.
+
+The HTTP API (mortgage-cli api, see http_api) serves the same calculations
+as JSON over HTTP on 127.0.0.1 for programs rather than the CLI.
+"""
@@ -0,0 +1,178 @@
+"""Thin client that forwards commands to a running daemon.
+
+Uses only the standard library so that forwarding a command costs little
+more than starting Python and connecting to a Unix socket.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, TextIO
+
+# Set to 1/true/yes to forward supported commands to the daemon
+DAEMON_ENV = "MORTGAGE_CLI_DAEMON"
+# Overrides the socket location
+SOCKET_ENV = "MORTGAGE_CLI_SOCKET"
+
+# Commands the client forwards; everything else always runs locally
+DAEMON_COMMANDS = ("analyze", "matrix", "amortize")
+
+# Largest response the client will read
+MAX_RESPONSE_BYTES = 256 * 1024 * 1024
+
+# Environment variables Rich reads to pick colors and terminal handling;
+# the daemon renders with the client's values
+TERMINAL_ENV = ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR", "TTY_COMPATIBLE")
+
+
+def default_socket_path() -> Path:
+    """Get the daemon socket path.
+
+    Uses $MORTGAGE_CLI_SOCKET if set, otherwise mortgage-cli.sock in
+    $XDG_RUNTIME_DIR, falling back to a per-user file in the temp dir.
+
+    Returns:
+        Path to the Unix domain socket
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "mortgage-cli.sock"
+    return Path(tempfile.gettempdir()) / f"mortgage-cli-{os.getuid()}.sock"
+
+
+def daemon_requested(argv: list[str]) -> bool:
+    """Check whether the client should try the daemon for these arguments.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        True if --daemon or $MORTGAGE_CLI_DAEMON asks for it
+    """
+    if argv[:1] == ["--daemon"]:
+        return True
+    return os.environ.get(DAEMON_ENV, "").lower() in ("1", "true", "yes")
+
+
+def forward(
+    argv: list[str],
+    socket_path: Optional[Path] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """Run a command through the daemon and print its output.
+
+    Args:
+        argv: Command line arguments; a leading --daemon is dropped
+        socket_path: Daemon socket (default_socket_path() if None)
+        stdout: Stream for command output (sys.stdout if None)
+        stderr: Stream for command errors (sys.stderr if None)
+
+    Returns:
+        The command's exit code, or None if the command is not supported
+        by the daemon, no daemon is listening or its reply is unusable (run
+        it locally instead)
+    """
+    if argv[:1] == ["--daemon"]:
+        argv = argv[1:]
+    if not argv or argv[0] not in DAEMON_COMMANDS:
+        return None
+
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    try:
+        # Relative paths in argv (e.g. --db) refer to this directory
+        cwd = os.getcwd()
+    except OSError:
+        return None
+    request = {
+        "argv": argv,
+        "columns": _terminal_columns(),
+        "cwd": cwd,
+        "terminal": _is_terminal(stdout),
+        "env": {name: os.environ[name] for name in TERMINAL_ENV if name in os.environ},
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path or default_socket_path()))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            response = _read_all(sock)
+    except OSError:
+        return None
+
+    try:
+        reply = json.loads(response)
+    except ValueError:
+        return None
+    # A truncated reply, or one from a daemon of another version
+    if not (
+        isinstance(reply, dict)
+        and isinstance(reply.get("stdout"), str)
+        and isinstance(reply.get("stderr"), str)
+        and type(reply.get("exit_code")) is int
+    ):
+        return None
+
+    stdout.write(reply["stdout"])
+    stderr.write(reply["stderr"])
+    exit_code: int = reply["exit_code"]
+    return exit_code
+
+
+def _is_terminal(stream: TextIO) -> bool:
+    """Whether a stream is a terminal, as Rich would detect it."""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _terminal_columns() -> int:
+    """Width Rich would use for output in this process."""
+    width = None
+    for fd in (0, 1, 2):
+        try:
+            width = os.get_terminal_size(fd).columns
+        except (AttributeError, ValueError, OSError):
+            continue
+        break
+    columns = os.environ.get("COLUMNS")
+    if columns is not None and columns.isdigit():
+        width = int(columns)
+    return width or 80
+
+
+def _read_all(sock: socket.socket) -> bytes:
+    """Read from a socket until the peer closes it."""
+    chunks = []
+    size = 0
+    while chunk := sock.recv(65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > MAX_RESPONSE_BYTES:
+            raise OSError("Daemon response too large")
+    return b"".join(chunks)
+
+
+def is_listening(socket_path: Path) -> bool:
+    """Check whether a daemon accepts connections on a socket file.
+
+    Args:
+        socket_path: Unix socket path
+
+    Returns:
+        True if a connection succeeds
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
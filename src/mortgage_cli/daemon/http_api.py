@@ -0,0 +1,487 @@
+"""Local HTTP JSON API answering calculations from a warm process.
+
+A minimal HTTP/1.1 server on asyncio streams, bound to 127.0.0.1 only.
+Connections are kept alive and requests on one connection are answered in
+order, so a client can pipeline many requests without waiting for each
+reply. Single-property calculations run inline on the event loop: each takes
+microseconds once profiles are warm, far less than the round trip a thread
+hand-off would add. Batches and matrices, whose cost grows with the request,
+run in a worker thread so one large request cannot stall other clients.
+
+Endpoints (POST a JSON object, get a JSON object back):
+    /analyze   {"price", "rent", "down"?, "profile"?}
+    /batch     {"listings": [{"price", "rent", "down"?}, ...], "profile"?}
+    /matrix    {"price_min", "price_max", "price_step"?, "down_min"?, "down_max"?,
+                "down_step"?, "rent"?, "layout"?, "profile"?}
+    /amortize  {"price", "down"?, "years"?, "profile"?}
+    /health    (GET) version and warm profiles
+"""
+
+import asyncio
+import json
+import math
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from mortgage_cli import __version__
+from mortgage_cli.config.cache import ProfileCache
+from mortgage_cli.config.manager import ConfigManager, ProfileNotFoundError
+from mortgage_cli.core.amortization import AmortizationGenerator
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.calculator import MortgageCalculator
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.output.json_fmt import JsonFormatter, analysis_payload
+from mortgage_cli.output.records import analysis_record, batch_records
+from mortgage_cli.utils.percentage import parse_percentage
+from mortgage_cli.utils.ranges import inclusive_range
+
+# The API never listens beyond the local machine
+LOCALHOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request line plus headers, and largest request body
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Largest matrix a single request may ask for, in cells
+MAX_MATRIX_CELLS = 1_000_000
+
+# Endpoints served, as path -> HTTP method
+ENDPOINTS: dict[str, str] = {
+    "/analyze": "POST",
+    "/batch": "POST",
+    "/matrix": "POST",
+    "/amortize": "POST",
+    "/health": "GET",
+}
+
+# Endpoints whose cost grows with the request, answered off the event loop
+OFFLOADED = frozenset({"/batch", "/matrix"})
+
+REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class ApiError(Exception):
+    """A request that cannot be answered, with the HTTP status to reply with."""
+
+    def __init__(self, status: int, message: str):
+        """Initialize error.
+
+        Args:
+            status: HTTP status code
+            message: Error message for the client
+        """
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class _WarmProfile:
+    """A profile with its analyzer and matrix engine compiled."""
+
+    profile: Profile
+    analyzer: InvestmentAnalyzer
+    engine: MatrixEngine
+
+
+class ApiHandlers:
+    """Endpoint implementations, keeping compiled profiles between requests.
+
+    Profiles are loaded through the in-memory profile cache, which notices
+    file changes; analyzers and matrix engines are rebuilt only when the
+    cache hands back a different profile object.
+    """
+
+    def __init__(self, config_manager: Optional[ConfigManager] = None):
+        """Initialize handlers.
+
+        Args:
+            config_manager: Profile source (default: the user's profiles)
+        """
+        self.config_manager = config_manager or ConfigManager()
+        self._warm: dict[str, _WarmProfile] = {}
+        # Offloaded handlers load profiles from worker threads
+        self._profile_lock = threading.Lock()
+        self._routes: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "/analyze": self.analyze,
+            "/batch": self.batch,
+            "/matrix": self.matrix,
+            "/amortize": self.amortize,
+            "/health": self.health,
+        }
+
+    def handle(self, method: str, path: str, body: bytes) -> tuple[int, bytes]:
+        """Answer one request.
+
+        Args:
+            method: HTTP method
+            path: Request path (without query string)
+            body: Request body
+
+        Returns:
+            (status, JSON response body)
+        """
+        try:
+            if path not in ENDPOINTS:
+                raise ApiError(404, f"Unknown endpoint '{path}'")
+            if method != ENDPOINTS[path]:
+                raise ApiError(405, f"{path} expects {ENDPOINTS[path]}")
+            result = self._routes[path](_parse_body(body))
+        except ApiError as e:
+            return e.status, _encode({"error": str(e)})
+        except ProfileNotFoundError as e:
+            return 404, _encode({"error": str(e)})
+        except ValueError as e:
+            return 400, _encode({"error": str(e)})
+        except Exception as e:
+            # Reported to the client; the server keeps running
+            return 500, _encode({"error": f"{type(e).__name__}: {e}"})
+        return 200, result if isinstance(result, bytes) else _encode(result)
+
+    def health(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Report the version and warm profiles."""
+        return {"status": "ok", "version": __version__, "profiles": sorted(self._warm)}
+
+    def analyze(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Analyze one property, answering like 'analyze --output json'."""
+        warm = self._profile(body)
+        result = warm.analyzer.evaluate(
+            PropertyInput(
+                price=_number(body, "price"),
+                expected_rent=_number(body, "rent"),
+                down_payment_percent=_percentage(body.get("down"), "down"),
+            )
+        )
+        return analysis_payload(analysis_record(result), result.warnings, warm.profile)
+
+    def batch(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Analyze many properties in one vectorized pass."""
+        warm = self._profile(body)
+        listings = body.get("listings")
+        if not isinstance(listings, list):
+            raise ApiError(400, "'listings' must be a list of objects")
+
+        count = len(listings)
+        prices = np.empty(count)
+        rents = np.empty(count)
+        downs = np.full(count, np.nan)
+        for row, listing in enumerate(listings):
+            if not isinstance(listing, dict):
+                raise ApiError(400, f"Listing {row + 1}: expected an object")
+            prices[row] = _number(listing, "price", f"Listing {row + 1}: ")
+            rents[row] = _number(listing, "rent", f"Listing {row + 1}: ")
+            down = _percentage(listing.get("down"), f"Listing {row + 1}: down")
+            if down is not None:
+                downs[row] = down
+
+        result = warm.analyzer.analyze_batch(prices, rents, downs)
+        warnings = warm.analyzer.batch_warnings(result)
+        return {
+            "results": [
+                analysis_payload(record, row_warnings, warm.profile)
+                for record, row_warnings in zip(batch_records(result), warnings)
+            ],
+            "count": count,
+        }
+
+    def matrix(self, body: dict[str, Any]) -> bytes:
+        """Evaluate a sensitivity matrix, answering like 'matrix --output json'."""
+        warm = self._profile(body)
+        layout = body.get("layout", "cells")
+        if layout not in ("cells", "columns"):
+            raise ApiError(400, f"Unknown layout '{layout}'. Supported: cells, columns")
+
+        price_axis = _axis(
+            "price",
+            _number(body, "price_min"),
+            _number(body, "price_max"),
+            _number(body, "price_step", default=20000),
+        )
+        down_axis = _axis(
+            "down",
+            _required_percentage(body.get("down_min", "10%"), "down_min"),
+            _required_percentage(body.get("down_max", "50%"), "down_max"),
+            _required_percentage(body.get("down_step", "5%"), "down_step"),
+        )
+        if _axis_size(*price_axis) * _axis_size(*down_axis) > MAX_MATRIX_CELLS:
+            raise ApiError(400, f"Matrix exceeds {MAX_MATRIX_CELLS:,} cells; use larger steps")
+        prices = inclusive_range(*price_axis)
+        down_payments = inclusive_range(*down_axis)
+        target_rent = _number(body, "rent", default=warm.profile.budget.target_rent)
+
+        matrix = warm.engine.evaluate(prices, down_payments)
+        out = BytesIO()
+        JsonFormatter().write_matrix(
+            matrix, target_rent, warm.profile, out, layout=layout, compact=True
+        )
+        return out.getvalue()
+
+    def amortize(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Build a yearly amortization schedule."""
+        profile = self._profile(body).profile
+        mortgage = profile.mortgage
+        price = _number(body, "price")
+        down_pct = _percentage(body.get("down"), "down")
+        years = body.get("years")
+        if years is not None and (isinstance(years, bool) or not isinstance(years, int)):
+            raise ApiError(400, "'years' must be an integer")
+
+        calculator = MortgageCalculator()
+        loan_amount = calculator.calculate_loan_amount(
+            price, mortgage.default_down_payment if down_pct is None else down_pct
+        )
+        effective_rate = calculator.calculate_effective_rate(
+            mortgage.interest_rate, mortgage.insurance_rate
+        )
+        schedule = AmortizationGenerator().generate_arrays(
+            principal=loan_amount,
+            annual_rate=effective_rate,
+            years=mortgage.duration_years,
+            original_property_value=price,
+            limit_years=years,
+        )
+        entries = schedule.to_entries() if loan_amount > 0 else []
+        return {
+            "loan_amount": loan_amount,
+            "effective_rate": effective_rate,
+            "monthly_payment": calculator.calculate_monthly_payment(
+                loan_amount, effective_rate, mortgage.duration_years
+            ),
+            "schedule": [
+                {
+                    "year": entry.year,
+                    "principal_paid": entry.principal_paid,
+                    "interest_paid": entry.interest_paid,
+                    "remaining_balance": entry.remaining_balance,
+                    "equity_percent": entry.equity_percent,
+                }
+                for entry in entries
+            ],
+        }
+
+    def _profile(self, body: dict[str, Any]) -> _WarmProfile:
+        """Load the requested profile, reusing its compiled form when unchanged."""
+        name = body.get("profile", "default")
+        if not isinstance(name, str):
+            raise ApiError(400, "'profile' must be a string")
+        with self._profile_lock:
+            profile = self.config_manager.load_profile(name)
+            warm = self._warm.get(name)
+            if warm is None or warm.profile is not profile:
+                warm = _WarmProfile(profile, InvestmentAnalyzer(profile), MatrixEngine(profile))
+                self._warm[name] = warm
+            return warm
+
+
+class ApiServer:
+    """HTTP/1.1 server for ApiHandlers on 127.0.0.1."""
+
+    def __init__(self, port: int = DEFAULT_PORT, handlers: Optional[ApiHandlers] = None):
+        """Initialize server.
+
+        Args:
+            port: TCP port to listen on (0 picks a free port)
+            handlers: Endpoint implementations (default: the user's profiles)
+        """
+        ProfileCache.keep_in_memory = True
+        self.port = port
+        self.handlers = handlers or ApiHandlers()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    def serve_forever(self, on_ready: Optional[Callable[[int], None]] = None) -> None:
+        """Listen until shutdown() is called or the process is interrupted.
+
+        Args:
+            on_ready: Called with the bound port once the server is listening
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        asyncio.run(self._serve(on_ready))
+
+    def shutdown(self) -> None:
+        """Stop serve_forever (safe to call from another thread)."""
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def _serve(self, on_ready: Optional[Callable[[int], None]]) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        server = await asyncio.start_server(
+            self._connection, LOCALHOST, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        if on_ready is not None:
+            on_ready(self.port)
+        async with server:
+            await self._stop.wait()
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests on one connection, in order, until it closes."""
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    # Client closed the connection between requests
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(431, _encode({"error": "Headers too large"}), False))
+                    break
+
+                try:
+                    method, path, keep_alive, length = _parse_head(head)
+                except ApiError as e:
+                    writer.write(_response(e.status, _encode({"error": str(e)}), False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if path in OFFLOADED:
+                    status, payload = await asyncio.get_running_loop().run_in_executor(
+                        None, self.handlers.handle, method, path, body
+                    )
+                else:
+                    status, payload = self.handlers.handle(method, path, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # Client went away mid-request or mid-reply; nothing to report to
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def _parse_head(head: bytes) -> tuple[str, str, bool, int]:
+    """Parse a request line and headers.
+
+    Returns:
+        (method, path, keep_alive, content_length)
+
+    Raises:
+        ApiError: If the request is malformed or its body too large
+    """
+    request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+    parts = request_line.split(" ")
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise ApiError(400, "Malformed request line")
+    method, target, version = parts
+
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if "chunked" in headers.get("transfer-encoding", ""):
+        raise ApiError(400, "Chunked request bodies are not supported; send Content-Length")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise ApiError(400, "Invalid Content-Length") from None
+    if length < 0:
+        raise ApiError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+
+    connection = headers.get("connection", "")
+    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+    return method, target.split("?", 1)[0], keep_alive, length
+
+
+def _response(status: int, payload: bytes, keep_alive: bool) -> bytes:
+    """Serialize an HTTP response with a JSON body."""
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + payload
+
+
+def _encode(document: Any) -> bytes:
+    """Encode a response document as compact JSON."""
+    return json.dumps(document, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _parse_body(body: bytes) -> dict[str, Any]:
+    """Decode a JSON object request body (empty means {})."""
+    if not body.strip():
+        return {}
+    try:
+        document = json.loads(body)
+    except ValueError:
+        raise ApiError(400, "Request body is not valid JSON") from None
+    if not isinstance(document, dict):
+        raise ApiError(400, "Request body must be a JSON object")
+    return document
+
+
+def _number(
+    body: dict[str, Any], name: str, prefix: str = "", default: Optional[float] = None
+) -> float:
+    """Read a numeric field (required unless a default is given)."""
+    value = body.get(name, default)
+    if value is None:
+        raise ApiError(400, f"{prefix}Missing '{name}'")
+    if isinstance(value, bool):
+        raise ApiError(400, f"{prefix}'{name}' must be a number")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{prefix}'{name}' must be a number") from None
+
+
+def _axis(name: str, start: float, end: float, step: float) -> tuple[float, float, float]:
+    """Check a matrix axis range, returning it as (start, end, step)."""
+    if not step > 0:
+        raise ApiError(400, f"'{name}_step' must be greater than 0")
+    if not start <= end:
+        raise ApiError(400, f"'{name}_min' must not exceed '{name}_max'")
+    return start, end, step
+
+
+def _axis_size(start: float, end: float, step: float) -> float:
+    """Number of values inclusive_range yields for a checked axis (inf if too many to count)."""
+    count = (end - start) / step + 0.5
+    return math.floor(count) + 1 if math.isfinite(count) else math.inf
+
+
+def _percentage(value: Any, name: str) -> Optional[float]:
+    """Parse an optional percentage given as a number or string like '20%'."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise ApiError(400, f"Invalid {name} '{value}'")
+    try:
+        return parse_percentage(str(value))
+    except ValueError:
+        raise ApiError(400, f"Invalid {name} '{value}'") from None
+
+
+def _required_percentage(value: Any, name: str) -> float:
+    """Parse a percentage that must be present."""
+    parsed = _percentage(value, name)
+    if parsed is None:
+        raise ApiError(400, f"Missing '{name}'")
+    return parsed
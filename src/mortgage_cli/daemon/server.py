@@ -0,0 +1,200 @@
+"""Unix socket server that runs commands in a warm process."""
+
+import importlib
+import io
+import json
+import os
+import socketserver
+import sys
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Iterator, Optional
+
+from mortgage_cli.daemon.client import DAEMON_COMMANDS, TERMINAL_ENV, is_listening
+
+
+def run_command(
+    argv: list[str],
+    columns: Optional[int] = None,
+    cwd: Optional[str] = None,
+    terminal: bool = False,
+    env: Optional[dict[str, str]] = None,
+) -> dict[str, object]:
+    """Run a CLI command in this process and capture its output.
+
+    Args:
+        argv: Command line arguments
+        columns: Terminal width to render at (80 if None)
+        cwd: Client working directory that relative paths in argv refer to
+             (the daemon's own if None)
+        terminal: Whether the client's stdout is a terminal
+        env: The client's TERMINAL_ENV variables
+
+    Returns:
+        Reply with stdout, stderr and exit_code
+    """
+    from mortgage_cli.main import app
+
+    env = dict(env or {})
+    env["COLUMNS"] = str(columns or 80)
+    # Output is captured, so tell Rich whether the client's stdout is a
+    # terminal, unless the client's own variables already decide it
+    if terminal and "TTY_COMPATIBLE" not in env and "FORCE_COLOR" not in env:
+        env["TTY_COMPATIBLE"] = "1"
+
+    saved_cwd = os.getcwd()
+    if cwd is not None:
+        try:
+            os.chdir(cwd)
+        except OSError as e:
+            return {"stdout": "", "stderr": f"Error: {e}\n", "exit_code": 1}
+
+    out = io.StringIO()
+    err = io.StringIO()
+    with _environment(env), redirect_stdout(out), redirect_stderr(err):
+        try:
+            _reset_consoles()
+            app(args=argv, prog_name="mortgage-cli")
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                err.write(f"{e.code}\n")
+                exit_code = 1
+        except Exception:
+            traceback.print_exc(file=err)
+            exit_code = 1
+        finally:
+            os.chdir(saved_cwd)
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit_code": exit_code}
+
+
+@contextmanager
+def _environment(values: dict[str, str]) -> Iterator[None]:
+    """Set COLUMNS and TERMINAL_ENV to a client's values for one request."""
+    names = ("COLUMNS",) + TERMINAL_ENV
+    saved = {name: os.environ.get(name) for name in names}
+    for name in names:
+        if name in values:
+            os.environ[name] = values[name]
+        else:
+            os.environ.pop(name, None)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _reset_consoles() -> None:
+    """Give the served commands fresh Rich consoles.
+
+    A Console fixes its color system when it is created, so the module-level
+    consoles are recreated under each client's terminal settings.
+    """
+    from rich.console import Console
+
+    from mortgage_cli.main import LAZY_COMMANDS
+
+    for name in DAEMON_COMMANDS:
+        module = sys.modules.get(LAZY_COMMANDS[name].split(":")[0])
+        if module is not None:
+            setattr(module, "console", Console())
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one forwarded command per connection."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # Liveness probe (is_listening): the client closed without a request
+            return
+        try:
+            request = json.loads(line)
+            argv = [str(arg) for arg in request["argv"]]
+            columns = int(request.get("columns") or 80)
+            cwd = request.get("cwd")
+            if cwd is not None and not isinstance(cwd, str):
+                raise TypeError("cwd must be a string")
+            terminal = bool(request.get("terminal"))
+            env = {
+                name: value
+                for name, value in dict(request.get("env") or {}).items()
+                if name in TERMINAL_ENV and isinstance(value, str)
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            reply: dict[str, object] = {
+                "stdout": "",
+                "stderr": "Error: Malformed daemon request\n",
+                "exit_code": 2,
+            }
+        else:
+            if argv[:1] and argv[0] in DAEMON_COMMANDS:
+                reply = run_command(argv, columns, cwd, terminal, env)
+            else:
+                reply = {
+                    "stdout": "",
+                    "stderr": f"Error: Command not served by the daemon: {' '.join(argv[:1])}\n",
+                    "exit_code": 2,
+                }
+        try:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+        except BrokenPipeError:
+            # The client went away (e.g. interrupted); nothing to report to
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server running CLI commands in a warm process.
+
+    Requests are handled one at a time; each command takes microseconds once
+    the process is warm, and serial handling keeps stdout capture and the
+    switch to each client's working directory simple.
+    """
+
+    def __init__(self, socket_path: Path):
+        """Bind the server socket.
+
+        Args:
+            socket_path: Where to create the Unix domain socket
+
+        Raises:
+            RuntimeError: If another daemon is already listening there
+        """
+        if socket_path.exists():
+            if is_listening(socket_path):
+                raise RuntimeError(f"A daemon is already listening on {socket_path}")
+            # Left behind by a daemon that did not shut down cleanly
+            socket_path.unlink()
+
+        self.socket_path = socket_path
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(socket_path), _RequestHandler)
+        os.chmod(socket_path, 0o600)
+        _warm_up()
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _warm_up() -> None:
+    """Import served commands and enable the in-memory profile cache."""
+    from mortgage_cli.config.cache import ProfileCache
+    from mortgage_cli.main import LAZY_COMMANDS
+
+    ProfileCache.keep_in_memory = True
+
+    # Their consoles are replaced for each request (see _reset_consoles)
+    for name in DAEMON_COMMANDS:
+        importlib.import_module(LAZY_COMMANDS[name].split(":")[0])
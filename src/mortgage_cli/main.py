@@ -1,25 +1,99 @@
 """Main CLI application."""
 
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
 import typer
+from typer.core import TyperGroup
+from typer.main import get_command_from_info, get_group
+from typer.models import CommandInfo
+
+if TYPE_CHECKING:
+    # The click that typer builds on (vendored by recent typer releases)
+    from typer import _click as click
+
+from mortgage_cli import IMPORT_STARTED, __version__, result_cache, timings
+from mortgage_cli.daemon.client import daemon_requested, forward
+
+# Commands are imported on first use so that startup (and --version) does not
+# pay for NumPy, pydantic and rich. Values are "module:attribute" where the
+# attribute is a command function or a Typer sub-app.
+LAZY_COMMANDS: dict[str, str] = {
+    "analyze": "mortgage_cli.commands.analyze:analyze",
+    "matrix": "mortgage_cli.commands.matrix:matrix",
+    "amortize": "mortgage_cli.commands.amortize:amortize",
+    "batch": "mortgage_cli.commands.batch:batch",
+    "simulate": "mortgage_cli.commands.simulate:simulate",
+    "cube": "mortgage_cli.commands.cube:cube",
+    "solve": "mortgage_cli.commands.solve:solve",
+    "query": "mortgage_cli.commands.query:query",
+    "serve": "mortgage_cli.commands.serve:serve",
+    "api": "mortgage_cli.commands.api:api",
+    "profile": "mortgage_cli.commands.profile:app",
+}
+
+# Seconds spent importing the package and lazily loaded commands, and when
+# the current run started, for --timings. The first run in a process is
+# measured from the package import; later ones (tests, the daemon) from
+# their own start.
+_import_seconds = time.perf_counter() - IMPORT_STARTED
+_run_started: Optional[float] = IMPORT_STARTED
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports each command's module when it is invoked."""
+
+    def main(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the CLI, resetting --timings and --cache state between runs."""
+        global _import_seconds, _run_started
+        if _run_started is None:
+            _import_seconds = 0.0
+            _run_started = time.perf_counter()
+        try:
+            return super().main(*args, **kwargs)
+        finally:
+            _run_started = None
+            result_cache.disable()
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        """List eagerly added commands followed by lazy ones."""
+        return list(self.commands) + [name for name in LAZY_COMMANDS if name not in self.commands]
+
+    def get_command(self, ctx: "click.Context", cmd_name: str) -> Optional["click.Command"]:
+        """Resolve a command, importing its module on first use."""
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            global _import_seconds
+            start = time.perf_counter()
+            self.add_command(_load_command(cmd_name), cmd_name)
+            _import_seconds += time.perf_counter() - start
+        return super().get_command(ctx, cmd_name)
+
+
+def _load_command(name: str) -> "click.Command":
+    """Import a lazy command and convert it to a Typer command or group."""
+    module_name, attr = LAZY_COMMANDS[name].split(":")
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        group = get_group(target)
+        group.name = name
+        return group
+    return get_command_from_info(
+        CommandInfo(name=name, callback=target),
+        pretty_exceptions_short=app.pretty_exceptions_short,
+        rich_markup_mode=app.rich_markup_mode,
+    )
 
-from mortgage_cli import __version__
-from mortgage_cli.commands.amortize import amortize
-from mortgage_cli.commands.analyze import analyze
-from mortgage_cli.commands.matrix import matrix
-from mortgage_cli.commands.profile import app as profile_app
 
 app = typer.Typer(
     name="mortgage-cli",
+    cls=LazyGroup,
     help="CLI tool for analyzing rental property investments.",
     no_args_is_help=True,
 )
 
-# Register commands
-app.command()(analyze)
-app.command()(matrix)
-app.command()(amortize)
-app.add_typer(profile_app, name="profile")
-
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -29,7 +103,8 @@ def version_callback(value: bool) -> None:
 
 
 @app.callback()
-def main(
+def cli(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None,
         "--version",
@@ -38,10 +113,81 @@ def main(
         is_eager=True,
         help="Show version and exit.",
     ),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon",
+        help="Run analyze, matrix and amortize through 'mortgage-cli serve' if it is running.",
+    ),
+    show_timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print per-stage timings and counters to stderr when the command finishes.",
+    ),
+    timings_json: Optional[Path] = typer.Option(
+        None,
+        "--timings-json",
+        help="Write per-stage timings and counters as JSON to a file ('-' for stderr).",
+        dir_okay=False,
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help=(
+            "Reuse stored output of analyze, matrix and amortize for identical inputs "
+            "and profile (also enabled by MORTGAGE_CLI_CACHE=1)."
+        ),
+    ),
 ) -> None:
     """mortgage-cli: Analyze rental property investments."""
-    pass
+    # --daemon is acted on by main() before parsing; reaching here means the
+    # command runs locally (unsupported command or no daemon listening)
+    if show_timings or timings_json is not None:
+        _start_timings(ctx, show_timings, timings_json)
+    if cache or result_cache.requested_by_env():
+        result_cache.enable()
 
 
-if __name__ == "__main__":
+def _start_timings(ctx: typer.Context, show: bool, json_path: Optional[Path]) -> None:
+    """Enable timing collection and report it when the command finishes.
+
+    Args:
+        ctx: Root context; the report is written when it closes
+        show: Print the human-readable report to stderr
+        json_path: File to write the JSON report to ('-' for stderr)
+    """
+    recorder = timings.enable(started=_run_started)
+    recorder.add("import", _import_seconds)
+
+    def report() -> None:
+        timings.disable()
+        if show:
+            sys.stderr.write(recorder.format_report())
+        if json_path is None:
+            return
+        if str(json_path) == "-":
+            sys.stderr.write(recorder.to_json())
+            return
+        try:
+            json_path.write_text(recorder.to_json())
+        except OSError as e:
+            sys.stderr.write(f"Error: Cannot write timings to '{json_path}': {e.strerror}\n")
+
+    ctx.call_on_close(report)
+
+
+def main() -> None:
+    """Console script entry point.
+
+    Forwards supported commands to a running daemon when requested, and
+    runs everything else (or everything, if no daemon answers) locally.
+    """
+    argv = sys.argv[1:]
+    if daemon_requested(argv):
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from mortgage_cli.models.profile import (
     Thresholds,
 )
 from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.simulation import Distribution, SimulationSpec
 from mortgage_cli.models.results import (
     AnalysisResult,
     UpfrontCosts,
@@ -34,4 +35,6 @@ __all__ = [
     "Verdict",
     "MatrixCell",
     "AmortizationEntry",
+    "Distribution",
+    "SimulationSpec",
 ]
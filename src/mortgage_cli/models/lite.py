@@ -0,0 +1,209 @@
+"""Slotted result types for hot paths.
+
+Each class mirrors the attributes of the pydantic model with the same name
+in models.results, without validation, per-instance __dict__ or field-set
+bookkeeping. The engine and formatters only read attributes, so they accept
+either kind; to_model() converts to the pydantic model when its schema or
+validation is needed.
+"""
+
+from typing import Any, ClassVar
+
+from mortgage_cli.models.results import (
+    AmortizationEntry,
+    AnalysisResult,
+    MatrixCell,
+    MonthlyBreakdown,
+    UpfrontCosts,
+    Verdict,
+)
+
+
+class _Slotted:
+    """Value-object behaviour shared by the slotted result types."""
+
+    __slots__: ClassVar[tuple[str, ...]] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Field values keyed by name (nested results stay objects)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _Slotted) or type(other) is not type(self):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class LiteUpfrontCosts(_Slotted):
+    """Slotted counterpart of UpfrontCosts."""
+
+    __slots__ = (
+        "down_payment",
+        "notary_legal",
+        "bank_arrangement",
+        "survey_valuation",
+        "mortgage_broker",
+        "other",
+    )
+
+    def __init__(
+        self,
+        down_payment: float,
+        notary_legal: float,
+        bank_arrangement: float,
+        survey_valuation: float,
+        mortgage_broker: float = 0.0,
+        other: float = 0.0,
+    ):
+        """Initialize with the fields of UpfrontCosts."""
+        self.down_payment = down_payment
+        self.notary_legal = notary_legal
+        self.bank_arrangement = bank_arrangement
+        self.survey_valuation = survey_valuation
+        self.mortgage_broker = mortgage_broker
+        self.other = other
+
+    @property
+    def total(self) -> float:
+        """Total upfront investment required."""
+        return (
+            self.down_payment
+            + self.notary_legal
+            + self.bank_arrangement
+            + self.survey_valuation
+            + self.mortgage_broker
+            + self.other
+        )
+
+    def to_model(self) -> UpfrontCosts:
+        """Convert to the validated pydantic model."""
+        return UpfrontCosts(**self.as_dict())
+
+
+class LiteMonthlyBreakdown(_Slotted):
+    """Slotted counterpart of MonthlyBreakdown."""
+
+    __slots__ = ("mortgage_payment", "fixed_costs")
+
+    def __init__(self, mortgage_payment: float, fixed_costs: float):
+        """Initialize with the fields of MonthlyBreakdown."""
+        self.mortgage_payment = mortgage_payment
+        self.fixed_costs = fixed_costs
+
+    @property
+    def total(self) -> float:
+        """Total monthly cost (break-even rent)."""
+        return self.mortgage_payment + self.fixed_costs
+
+    def to_model(self) -> MonthlyBreakdown:
+        """Convert to the validated pydantic model."""
+        return MonthlyBreakdown(**self.as_dict())
+
+
+class LiteAnalysisResult(_Slotted):
+    """Slotted counterpart of AnalysisResult."""
+
+    __slots__ = (
+        "property_price",
+        "expected_rent",
+        "down_payment_percent",
+        "upfront_costs",
+        "monthly",
+        "break_even_rent",
+        "cash_on_cash_return",
+        "monthly_surplus_shortfall",
+        "verdict",
+        "within_budget",
+        "warnings",
+    )
+
+    def __init__(
+        self,
+        property_price: float,
+        expected_rent: float,
+        down_payment_percent: float,
+        upfront_costs: LiteUpfrontCosts,
+        monthly: LiteMonthlyBreakdown,
+        break_even_rent: float,
+        cash_on_cash_return: float,
+        monthly_surplus_shortfall: float,
+        verdict: Verdict,
+        within_budget: bool,
+        warnings: list[str],
+    ):
+        """Initialize with the fields of AnalysisResult."""
+        self.property_price = property_price
+        self.expected_rent = expected_rent
+        self.down_payment_percent = down_payment_percent
+        self.upfront_costs = upfront_costs
+        self.monthly = monthly
+        self.break_even_rent = break_even_rent
+        self.cash_on_cash_return = cash_on_cash_return
+        self.monthly_surplus_shortfall = monthly_surplus_shortfall
+        self.verdict = verdict
+        self.within_budget = within_budget
+        self.warnings = warnings
+
+    def to_model(self) -> AnalysisResult:
+        """Convert to the validated pydantic model."""
+        return AnalysisResult(
+            **{
+                **self.as_dict(),
+                "upfront_costs": self.upfront_costs.to_model(),
+                "monthly": self.monthly.to_model(),
+            }
+        )
+
+
+class LiteMatrixCell(_Slotted):
+    """Slotted counterpart of MatrixCell."""
+
+    __slots__ = ("price", "down_payment_percent", "break_even_rent", "verdict", "within_budget")
+
+    def __init__(
+        self,
+        price: float,
+        down_payment_percent: float,
+        break_even_rent: float,
+        verdict: Verdict,
+        within_budget: bool,
+    ):
+        """Initialize with the fields of MatrixCell."""
+        self.price = price
+        self.down_payment_percent = down_payment_percent
+        self.break_even_rent = break_even_rent
+        self.verdict = verdict
+        self.within_budget = within_budget
+
+    def to_model(self) -> MatrixCell:
+        """Convert to the validated pydantic model."""
+        return MatrixCell(**self.as_dict())
+
+
+class LiteAmortizationEntry(_Slotted):
+    """Slotted counterpart of AmortizationEntry."""
+
+    __slots__ = ("year", "principal_paid", "interest_paid", "remaining_balance", "equity_percent")
+
+    def __init__(
+        self,
+        year: int,
+        principal_paid: float,
+        interest_paid: float,
+        remaining_balance: float,
+        equity_percent: float,
+    ):
+        """Initialize with the fields of AmortizationEntry."""
+        self.year = year
+        self.principal_paid = principal_paid
+        self.interest_paid = interest_paid
+        self.remaining_balance = remaining_balance
+        self.equity_percent = equity_percent
+
+    def to_model(self) -> AmortizationEntry:
+        """Convert to the validated pydantic model."""
+        return AmortizationEntry(**self.as_dict())
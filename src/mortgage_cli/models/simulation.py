@@ -0,0 +1,91 @@
+"""Monte Carlo simulation schema."""
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Parameters each distribution type requires
+REQUIRED_PARAMETERS: dict[str, tuple[str, ...]] = {
+    "fixed": ("value",),
+    "uniform": ("low", "high"),
+    "normal": ("mean", "std"),
+    "triangular": ("low", "mode", "high"),
+    "lognormal": ("mean", "std"),
+}
+
+
+class Distribution(BaseModel):
+    """Sampling distribution for one simulated input.
+
+    Lognormal parameters describe the sampled values themselves (not the
+    underlying normal), so they read the same way as normal parameters.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: Literal["fixed", "uniform", "normal", "triangular", "lognormal"]
+    value: float | None = Field(default=None, description="Constant value (fixed)")
+    low: float | None = Field(default=None, description="Lower bound (uniform, triangular)")
+    high: float | None = Field(default=None, description="Upper bound (uniform, triangular)")
+    mode: float | None = Field(default=None, description="Most likely value (triangular)")
+    mean: float | None = Field(default=None, description="Mean (normal, lognormal)")
+    std: float | None = Field(default=None, ge=0, description="Standard deviation (normal, lognormal)")
+    min: float | None = Field(default=None, description="Clip samples below this value")
+    max: float | None = Field(default=None, description="Clip samples above this value")
+
+    @model_validator(mode="after")
+    def _check_parameters(self) -> "Distribution":
+        """Ensure the parameters for the chosen type are present and ordered."""
+        missing = [name for name in REQUIRED_PARAMETERS[self.type] if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"{self.type} distribution requires: {', '.join(missing)}")
+
+        if self.type == "uniform":
+            low, high = self.parameters()
+            if low > high:
+                raise ValueError("low must not exceed high")
+        elif self.type == "triangular":
+            low, mode, high = self.parameters()
+            if low > high:
+                raise ValueError("low must not exceed high")
+            if not low <= mode <= high:
+                raise ValueError("mode must lie between low and high")
+        elif self.type == "lognormal":
+            mean, _ = self.parameters()
+            if mean <= 0:
+                raise ValueError("lognormal mean must be greater than 0")
+        return self
+
+    def parameters(self) -> tuple[float, ...]:
+        """Get the parameters the distribution type requires.
+
+        Returns:
+            Parameter values in REQUIRED_PARAMETERS order (all present once
+            the model is validated)
+        """
+        return tuple(float(getattr(self, name)) for name in REQUIRED_PARAMETERS[self.type])
+
+
+class MonthlyCostDistributions(BaseModel):
+    """Distributions for the fixed monthly cost components."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    property_tax: Distribution | None = None
+    insurance: Distribution | None = None
+    maintenance: Distribution | None = None
+    management: Distribution | None = None
+
+
+class SimulationSpec(BaseModel):
+    """Distributions for a Monte Carlo stress test.
+
+    Inputs without a distribution stay at the profile (or command line) value.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    interest_rate: Distribution | None = None
+    insurance_rate: Distribution | None = None
+    monthly_costs: MonthlyCostDistributions = Field(default_factory=MonthlyCostDistributions)
+    rent: Distribution | None = None
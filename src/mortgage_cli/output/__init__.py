@@ -5,12 +5,17 @@ from typing import Literal, Union
 from mortgage_cli.output.colors import verdict_to_color, verdict_to_style
 from mortgage_cli.output.csv_fmt import CsvFormatter
 from mortgage_cli.output.json_fmt import JsonFormatter
+from mortgage_cli.output.ndjson_fmt import NdjsonFormatter
 from mortgage_cli.output.summary import SummaryFormatter
 from mortgage_cli.output.table import TableFormatter
 
-OutputFormat = Literal["table", "json", "csv", "summary"]
+OutputFormat = Literal["table", "json", "ndjson", "csv", "summary"]
 
-Formatter = Union[TableFormatter, JsonFormatter, CsvFormatter, SummaryFormatter]
+Formatter = Union[TableFormatter, JsonFormatter, NdjsonFormatter, CsvFormatter, SummaryFormatter]
+
+# Machine-readable formatters; their write_* methods stream to a sink and
+# commands use them instead of printing through the Rich console
+STREAM_FORMATTERS = (JsonFormatter, NdjsonFormatter, CsvFormatter)
 
 
 def get_formatter(format_name: str) -> Formatter:
@@ -28,6 +33,7 @@ def get_formatter(format_name: str) -> Formatter:
     formatters = {
         "table": TableFormatter,
         "json": JsonFormatter,
+        "ndjson": NdjsonFormatter,
         "csv": CsvFormatter,
         "summary": SummaryFormatter,
     }
@@ -42,6 +48,10 @@ def get_formatter(format_name: str) -> Formatter:
 __all__ = [
     "TableFormatter",
     "JsonFormatter",
+    "NdjsonFormatter",
+    "CsvFormatter",
+    "SummaryFormatter",
+    "STREAM_FORMATTERS",
     "get_formatter",
     "verdict_to_color",
     "verdict_to_style",
@@ -2,14 +2,78 @@
 
 import csv
 from io import StringIO
-from typing import Any
+from itertools import repeat
+from typing import TYPE_CHECKING, Any
 
 from mortgage_cli.models.profile import Profile
-from mortgage_cli.models.results import AnalysisResult, MatrixCell
+from mortgage_cli.models.results import AnalysisResult
+from mortgage_cli.output.records import (
+    accepts_matrix_cells,
+    analysis_record,
+    batch_records,
+    matrix_rows,
+)
+from mortgage_cli.output.sink import Sink, text_stream
+
+if TYPE_CHECKING:
+    from mortgage_cli.core.boundary import BoundarySearch
+    from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+
+# Column layout shared by analyze and batch output
+ANALYSIS_COLUMNS: list[str] = [
+    "property_price",
+    "expected_rent",
+    "down_payment_percent",
+    "break_even_rent",
+    "cash_on_cash_return",
+    "monthly_surplus_shortfall",
+    "verdict",
+    "within_budget",
+    "upfront_total",
+    "mortgage_payment",
+    "fixed_costs",
+    "profile",
+]
+
+MATRIX_COLUMNS: list[str] = [
+    "price",
+    "down_payment_percent",
+    "break_even_rent",
+    "verdict",
+    "within_budget",
+]
+
+BOUNDARY_COLUMNS: list[str] = [
+    "from",
+    "to",
+    "down_payment_percent",
+    "price",
+]
+
+COMPARISON_COLUMNS: list[str] = [
+    "profile",
+    "interest_rate",
+    "duration_years",
+    "down_payment_percent",
+    "break_even_rent",
+    "cash_on_cash_return",
+    "upfront_cost",
+    "verdict",
+]
+
+
+class CsvDialect(csv.excel):
+    """Excel CSV with Unix line endings, like the rest of the CLI's output."""
+
+    lineterminator = "\n"
 
 
 class CsvFormatter:
-    """Format analysis results as CSV."""
+    """Format analysis results as CSV.
+
+    The write_* methods write rows straight to a text or binary sink; the
+    format_* methods return the same CSV as a string.
+    """
 
     def format_analysis(self, result: AnalysisResult, profile: Profile) -> str:
         """Format single property analysis as CSV.
@@ -22,58 +86,75 @@ class CsvFormatter:
             CSV string with headers and single data row
         """
         output = StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        headers = [
-            "property_price",
-            "expected_rent",
-            "down_payment_percent",
-            "break_even_rent",
-            "cash_on_cash_return",
-            "monthly_surplus_shortfall",
-            "verdict",
-            "within_budget",
-            "upfront_total",
-            "mortgage_payment",
-            "fixed_costs",
-            "profile",
-        ]
-        writer.writerow(headers)
-
-        # Data row
-        row = [
-            result.property_price,
-            result.expected_rent,
-            result.down_payment_percent,
-            round(result.break_even_rent, 2),
-            round(result.cash_on_cash_return, 4),
-            round(result.monthly_surplus_shortfall, 2),
-            result.verdict.value,
-            result.within_budget,
-            round(result.upfront_costs.total, 2),
-            round(result.monthly.mortgage_payment, 2),
-            round(result.monthly.fixed_costs, 2),
+        self.write_analysis(result, profile, output)
+        return output.getvalue()
+
+    def write_analysis(self, result: AnalysisResult, profile: Profile, sink: Sink) -> None:
+        """Write single property analysis as CSV.
+
+        Args:
+            result: Analysis result
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            writer.writerow(ANALYSIS_COLUMNS)
+            writer.writerow(self._analysis_row(analysis_record(result), profile))
+
+    def write_batch(
+        self,
+        batch: "BatchAnalysis",
+        profile: Profile,
+        sink: Sink,
+        include_header: bool = True,
+    ) -> None:
+        """Write batch analysis results as CSV rows.
+
+        Uses the same columns as format_analysis, one row per property.
+
+        Args:
+            batch: Batch analysis results
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+            include_header: Whether to write the header row first
+        """
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            if include_header:
+                writer.writerow(ANALYSIS_COLUMNS)
+            writer.writerows(
+                self._analysis_row(record, profile) for record in batch_records(batch)
+            )
+
+    def _analysis_row(self, record: dict[str, Any], profile: Profile) -> list[Any]:
+        """Build a data row in ANALYSIS_COLUMNS order."""
+        return [
+            record["property_price"],
+            record["expected_rent"],
+            record["down_payment_percent"],
+            round(record["break_even_rent"], 2),
+            round(record["cash_on_cash_return"], 4),
+            round(record["monthly_surplus_shortfall"], 2),
+            record["verdict"].value,
+            record["within_budget"],
+            round(record["upfront_total"], 2),
+            round(record["mortgage_payment"], 2),
+            round(record["fixed_costs"], 2),
             profile.name,
         ]
-        writer.writerow(row)
-
-        return output.getvalue()
 
+    @accepts_matrix_cells
     def format_matrix(
         self,
-        matrix: list[list[MatrixCell]],
-        prices: list[float],
-        down_payments: list[float],
+        matrix: "MatrixArrays",
         target_rent: float,
         profile: Profile,
     ) -> str:
         """Format sensitivity matrix as CSV.
 
         Args:
-            matrix: 2D list of MatrixCell objects
-            prices: List of purchase prices (columns)
-            down_payments: List of down payment percentages (rows)
+            matrix: Sensitivity matrix results
             target_rent: Target rent for comparison
             profile: Profile used for analysis
 
@@ -81,32 +162,48 @@ class CsvFormatter:
             CSV string with one row per cell
         """
         output = StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        headers = [
-            "price",
-            "down_payment_percent",
-            "break_even_rent",
-            "verdict",
-            "within_budget",
-        ]
-        writer.writerow(headers)
-
-        # Data rows
-        for row_idx, down_pct in enumerate(down_payments):
-            for col_idx, cell in enumerate(matrix[row_idx]):
-                row = [
-                    cell.price,
-                    cell.down_payment_percent,
-                    round(cell.break_even_rent, 2),
-                    cell.verdict.value,
-                    cell.within_budget,
-                ]
-                writer.writerow(row)
-
+        self.write_matrix(matrix, target_rent, profile, output)
         return output.getvalue()
 
+    @accepts_matrix_cells
+    def write_matrix(
+        self,
+        matrix: "MatrixArrays",
+        target_rent: float,
+        profile: Profile,
+        sink: Sink,
+    ) -> None:
+        """Write sensitivity matrix as CSV, one row per cell.
+
+        Args:
+            matrix: Sensitivity matrix results
+            target_rent: Target rent for comparison
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        prices = matrix.prices.tolist()
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            writer.writerow(MATRIX_COLUMNS)
+            for down, rents, verdicts, within_budget in matrix_rows(matrix):
+                writer.writerows(zip(prices, repeat(down), rents, verdicts, within_budget))
+
+    def write_boundaries(self, search: "BoundarySearch", sink: Sink) -> None:
+        """Write verdict boundaries as CSV, one row per boundary point.
+
+        Args:
+            search: Boundary search result
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            writer.writerow(BOUNDARY_COLUMNS)
+            for curve in search.curves:
+                writer.writerows(
+                    [curve.from_verdict.value, curve.to_verdict.value, down, price]
+                    for down, price in zip(curve.down_payments.tolist(), curve.prices.tolist())
+                )
+
     def format_profile_list(self, profiles: list[tuple[str, str]]) -> str:
         """Format profile list as CSV.
 
@@ -117,13 +214,20 @@ class CsvFormatter:
             CSV string
         """
         output = StringIO()
-        writer = csv.writer(output)
+        self.write_profile_list(profiles, output)
+        return output.getvalue()
 
-        writer.writerow(["name", "description"])
-        for name, description in profiles:
-            writer.writerow([name, description])
+    def write_profile_list(self, profiles: list[tuple[str, str]], sink: Sink) -> None:
+        """Write profile list as CSV.
 
-        return output.getvalue()
+        Args:
+            profiles: List of (name, description) tuples
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            writer.writerow(["name", "description"])
+            writer.writerows([name, description] for name, description in profiles)
 
     def format_profile_comparison(
         self,
@@ -142,31 +246,37 @@ class CsvFormatter:
             CSV string
         """
         output = StringIO()
-        writer = csv.writer(output)
-
-        headers = [
-            "profile",
-            "interest_rate",
-            "duration_years",
-            "down_payment_percent",
-            "break_even_rent",
-            "cash_on_cash_return",
-            "upfront_cost",
-            "verdict",
-        ]
-        writer.writerow(headers)
-
-        for profile, result in comparisons:
-            row = [
-                profile.name,
-                profile.mortgage.interest_rate,
-                profile.mortgage.duration_years,
-                result.down_payment_percent,
-                round(result.break_even_rent, 2),
-                round(result.cash_on_cash_return, 4),
-                round(result.upfront_costs.total, 2),
-                result.verdict.value,
-            ]
-            writer.writerow(row)
-
+        self.write_profile_comparison(comparisons, price, rent, output)
         return output.getvalue()
+
+    def write_profile_comparison(
+        self,
+        comparisons: list[tuple[Profile, AnalysisResult]],
+        price: float,
+        rent: float,
+        sink: Sink,
+    ) -> None:
+        """Write profile comparison as CSV.
+
+        Args:
+            comparisons: List of (profile, result) tuples
+            price: Property price analyzed
+            rent: Expected rent analyzed
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            writer = csv.writer(stream, CsvDialect)
+            writer.writerow(COMPARISON_COLUMNS)
+            writer.writerows(
+                [
+                    profile.name,
+                    profile.mortgage.interest_rate,
+                    profile.mortgage.duration_years,
+                    result.down_payment_percent,
+                    round(result.break_even_rent, 2),
+                    round(result.cash_on_cash_return, 4),
+                    round(result.upfront_costs.total, 2),
+                    result.verdict.value,
+                ]
+                for profile, result in comparisons
+            )
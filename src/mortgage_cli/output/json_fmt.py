@@ -1,14 +1,49 @@
 """JSON output formatter."""
 
+import io
 import json
-from typing import Any
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Iterator, TextIO
 
 from mortgage_cli.models.profile import Profile
-from mortgage_cli.models.results import AnalysisResult, MatrixCell
+from mortgage_cli.models.results import AnalysisResult
+from mortgage_cli.output.records import (
+    accepts_matrix_cells,
+    analysis_record,
+    batch_records,
+    matrix_rows,
+    round_cents,
+)
+from mortgage_cli.output.sink import Sink, text_stream
+
+if TYPE_CHECKING:
+    from mortgage_cli.core.boundary import BoundarySearch
+    from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+
+# Per-cell fields, in output order
+MATRIX_CELL_FIELDS = (
+    "price",
+    "down_payment_percent",
+    "break_even_rent",
+    "verdict",
+    "within_budget",
+)
+
+# Fields the columns layout emits; price and down payment are the envelope's axes
+MATRIX_COLUMN_FIELDS = ("break_even_rent", "verdict", "within_budget")
+
+# Stands in for the streamed part of the matrix envelope while it is encoded
+_PLACEHOLDER = "\x00matrix-body\x00"
+
+COMPACT_SEPARATORS = (",", ":")
 
 
 class JsonFormatter:
-    """Format analysis results as JSON."""
+    """Format analysis results as JSON.
+
+    The format_* methods return a document; the write_* methods write the
+    same document, followed by a newline, to a text or binary sink.
+    """
 
     def format_analysis(self, result: AnalysisResult, profile: Profile) -> str:
         """Format single property analysis as JSON.
@@ -20,85 +55,141 @@ class JsonFormatter:
         Returns:
             JSON string
         """
-        output = {
-            "property": {
-                "price": result.property_price,
-                "expected_rent": result.expected_rent,
-                "down_payment_percent": result.down_payment_percent,
-            },
-            "analysis": {
-                "break_even_rent": round(result.break_even_rent, 2),
-                "cash_on_cash_return": round(result.cash_on_cash_return, 4),
-                "monthly_surplus_shortfall": round(result.monthly_surplus_shortfall, 2),
-                "verdict": result.verdict.value,
-                "within_budget": result.within_budget,
-            },
-            "upfront_costs": {
-                "down_payment": round(result.upfront_costs.down_payment, 2),
-                "notary_legal": round(result.upfront_costs.notary_legal, 2),
-                "bank_arrangement": round(result.upfront_costs.bank_arrangement, 2),
-                "survey_valuation": round(result.upfront_costs.survey_valuation, 2),
-                "mortgage_broker": round(result.upfront_costs.mortgage_broker, 2),
-                "other": round(result.upfront_costs.other, 2),
-                "total": round(result.upfront_costs.total, 2),
-            },
-            "monthly": {
-                "mortgage_payment": round(result.monthly.mortgage_payment, 2),
-                "fixed_costs": round(result.monthly.fixed_costs, 2),
-                "total": round(result.monthly.total, 2),
-            },
-            "warnings": result.warnings,
-            "profile": {
-                "name": profile.name,
-                "interest_rate": profile.mortgage.interest_rate,
-                "duration_years": profile.mortgage.duration_years,
-                "target_rent": profile.budget.target_rent,
-                "budget": profile.budget.total_available,
-            },
-        }
-
+        output = analysis_payload(analysis_record(result), result.warnings, profile)
         return json.dumps(output, indent=2)
 
+    def write_analysis(self, result: AnalysisResult, profile: Profile, sink: Sink) -> None:
+        """Write single property analysis as JSON.
+
+        Args:
+            result: Analysis result
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        _write_document(self.format_analysis(result, profile), sink)
+
+    def write_batch_start(self, sink: Sink) -> None:
+        """Open a streamed batch document.
+
+        The document is {"results": [...], "count": N}, where each result
+        is the object format_analysis produces. It is written as
+        write_batch_start, write_batch for each chunk, then write_batch_end.
+
+        Args:
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            stream.write('{\n  "results": [')
+
+    def write_batch(
+        self,
+        batch: "BatchAnalysis",
+        warnings: list[list[str]],
+        profile: Profile,
+        sink: Sink,
+        first: bool = True,
+    ) -> None:
+        """Write one chunk of batch analysis results into a batch document.
+
+        Args:
+            batch: Batch analysis results
+            warnings: Warning messages for each property
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+            first: Whether no results precede this chunk in the document
+        """
+        with text_stream(sink) as stream:
+            for index, (record, row_warnings) in enumerate(zip(batch_records(batch), warnings)):
+                if index or not first:
+                    stream.write(",")
+                payload = analysis_payload(record, row_warnings, profile)
+                stream.write("\n    " + json.dumps(payload, indent=2).replace("\n", "\n    "))
+
+    def write_batch_end(self, count: int, sink: Sink) -> None:
+        """Close a streamed batch document.
+
+        Args:
+            count: Number of results written
+            sink: Text or binary stream to write to
+        """
+        with text_stream(sink) as stream:
+            stream.write("\n  ]" if count else "]")
+            stream.write(f',\n  "count": {count}\n}}\n')
+
+    @accepts_matrix_cells
     def format_matrix(
         self,
-        matrix: list[list[MatrixCell]],
-        prices: list[float],
-        down_payments: list[float],
+        matrix: "MatrixArrays",
         target_rent: float,
         profile: Profile,
     ) -> str:
         """Format sensitivity matrix as JSON.
 
         Args:
-            matrix: 2D list of MatrixCell objects
-            prices: List of purchase prices (columns)
-            down_payments: List of down payment percentages (rows)
+            matrix: Sensitivity matrix results
             target_rent: Target rent for comparison
             profile: Profile used for analysis
 
         Returns:
             JSON string
         """
-        cells: list[dict[str, Any]] = []
-
-        for row_idx, row in enumerate(matrix):
-            for col_idx, cell in enumerate(row):
-                cells.append(
-                    {
-                        "price": prices[col_idx],
-                        "down_payment_percent": down_payments[row_idx],
-                        "break_even_rent": round(cell.break_even_rent, 2),
-                        "verdict": cell.verdict.value,
-                        "within_budget": cell.within_budget,
-                    }
-                )
+        buffer = io.StringIO()
+        self._write_matrix(matrix, target_rent, profile, buffer)
+        return buffer.getvalue()
+
+    @accepts_matrix_cells
+    def write_matrix(
+        self,
+        matrix: "MatrixArrays",
+        target_rent: float,
+        profile: Profile,
+        sink: Sink,
+        layout: str = "cells",
+        compact: bool = False,
+    ) -> None:
+        """Write a sensitivity matrix as JSON, one matrix row at a time.
+
+        The envelope matches format_matrix. With the cells layout the matrix
+        holds a "cells" list of per-cell objects; with the columns layout it
+        holds a "columns" object mapping break_even_rent, verdict and
+        within_budget to one list per down payment, each in price order.
+        Prices and down payments are read from the envelope's axes rather
+        than repeated per cell, which is much smaller and faster to encode.
+
+        Args:
+            matrix: Sensitivity matrix results
+            target_rent: Target rent for comparison
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+            layout: "cells" or "columns"
+            compact: Omit indentation and whitespace
+
+        Raises:
+            ValueError: If layout is unknown
+        """
+        with text_stream(sink) as stream:
+            self._write_matrix(matrix, target_rent, profile, stream, layout, compact)
+            stream.write("\n")
+
+    def _write_matrix(
+        self,
+        matrix: "MatrixArrays",
+        target_rent: float,
+        profile: Profile,
+        stream: TextIO,
+        layout: str = "cells",
+        compact: bool = False,
+    ) -> None:
+        """Write the matrix document (without a trailing newline)."""
+        if layout not in ("cells", "columns"):
+            raise ValueError(f"Unknown matrix layout '{layout}'. Supported: cells, columns")
 
         output = {
             "matrix": {
-                "prices": prices,
-                "down_payments": down_payments,
+                "prices": matrix.prices.tolist(),
+                "down_payments": matrix.down_payments.tolist(),
                 "target_rent": target_rent,
-                "cells": cells,
+                layout: _PLACEHOLDER,
             },
             "profile": {
                 "name": profile.name,
@@ -107,8 +198,130 @@ class JsonFormatter:
                 "budget": profile.budget.total_available,
             },
         }
+        if compact:
+            envelope = json.dumps(output, separators=COMPACT_SEPARATORS)
+        else:
+            envelope = json.dumps(output, indent=2)
+        head, tail = envelope.split(json.dumps(_PLACEHOLDER))
+        # Indentation of the line holding the streamed key
+        depth = _line_indent(head)
 
-        return json.dumps(output, indent=2)
+        stream.write(head)
+        if layout == "cells":
+            self._write_cells(matrix, stream, compact, depth)
+        else:
+            self._write_columns(matrix, stream, compact, depth)
+        stream.write(tail)
+
+    def _write_cells(
+        self,
+        matrix: "MatrixArrays",
+        stream: TextIO,
+        compact: bool,
+        depth: int,
+    ) -> None:
+        """Stream the cells list, encoding one matrix row per json.dumps call."""
+        if not matrix.prices.size or not matrix.down_payments.size:
+            stream.write("[]")
+            return
+
+        prices = matrix.prices.tolist()
+        indent = "\n" + " " * depth
+        stream.write("[")
+        for index, row in enumerate(matrix_rows(matrix)):
+            payloads = matrix_row_payloads(prices, *row)
+            if compact:
+                encoded = json.dumps(payloads, separators=COMPACT_SEPARATORS)[1:-1]
+            else:
+                # Drop the list's brackets and shift its items to the cells' depth
+                encoded = json.dumps(payloads, indent=2)[1:-2].replace("\n", indent)
+            if index:
+                stream.write(",")
+            stream.write(encoded)
+        stream.write("]" if compact else indent + "]")
+
+    def _write_columns(
+        self,
+        matrix: "MatrixArrays",
+        stream: TextIO,
+        compact: bool,
+        depth: int,
+    ) -> None:
+        """Stream the columns object, one matrix row of one field at a time."""
+        if compact:
+            separators = COMPACT_SEPARATORS
+            open_, member_sep, close = "{", ",", "}"
+            rows_open, row_sep, rows_close = "[", ",", "]"
+        else:
+            separators = (", ", ": ")
+            pad = "\n" + " " * (depth + 2)
+            row_pad = pad + "  "
+            open_, member_sep, close = "{" + pad, "," + pad, "\n" + " " * depth + "}"
+            rows_open, row_sep, rows_close = "[" + row_pad, "," + row_pad, pad + "]"
+
+        stream.write(open_)
+        for index, field in enumerate(MATRIX_COLUMN_FIELDS):
+            if index:
+                stream.write(member_sep)
+            stream.write(json.dumps(field) + separators[1])
+            if not matrix.down_payments.size:
+                stream.write("[]")
+                continue
+            stream.write(rows_open)
+            for row, row_values in enumerate(_column_rows(field, matrix)):
+                if row:
+                    stream.write(row_sep)
+                stream.write(json.dumps(row_values, separators=separators))
+            stream.write(rows_close)
+        stream.write(close)
+
+    def write_boundaries(
+        self,
+        search: "BoundarySearch",
+        profile: Profile,
+        sink: Sink,
+        compact: bool = False,
+    ) -> None:
+        """Write verdict boundaries found by an adaptive matrix search.
+
+        Each boundary lists its points as parallel down_payment_percent and
+        price arrays, ordered by down payment.
+
+        Args:
+            search: Boundary search result
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+            compact: Omit indentation and whitespace
+        """
+        output = {
+            "boundaries": [
+                {
+                    "from": curve.from_verdict.value,
+                    "to": curve.to_verdict.value,
+                    "down_payment_percent": curve.down_payments.tolist(),
+                    "price": curve.prices.tolist(),
+                }
+                for curve in search.curves
+            ],
+            "resolution": {
+                "price": search.price_step,
+                "down_payment_percent": search.down_step,
+            },
+            "evaluations": search.evaluations,
+            "grid_points": search.grid_points,
+            "profile": {
+                "name": profile.name,
+                "interest_rate": profile.mortgage.interest_rate,
+                "duration_years": profile.mortgage.duration_years,
+                "target_rent": profile.budget.target_rent,
+                "budget": profile.budget.total_available,
+            },
+        }
+        if compact:
+            document = json.dumps(output, separators=COMPACT_SEPARATORS)
+        else:
+            document = json.dumps(output, indent=2)
+        _write_document(document, sink)
 
     def format_profile_list(self, profiles: list[tuple[str, str]]) -> str:
         """Format profile list as JSON.
@@ -126,6 +339,15 @@ class JsonFormatter:
         }
         return json.dumps(output, indent=2)
 
+    def write_profile_list(self, profiles: list[tuple[str, str]], sink: Sink) -> None:
+        """Write profile list as JSON.
+
+        Args:
+            profiles: List of (name, description) tuples
+            sink: Text or binary stream to write to
+        """
+        _write_document(self.format_profile_list(profiles), sink)
+
     def format_profile_comparison(
         self,
         comparisons: list[tuple[Profile, AnalysisResult]],
@@ -142,27 +364,154 @@ class JsonFormatter:
         Returns:
             JSON string
         """
-        results = []
-        for profile, result in comparisons:
-            results.append(
-                {
-                    "profile": profile.name,
-                    "interest_rate": profile.mortgage.interest_rate,
-                    "duration_years": profile.mortgage.duration_years,
-                    "down_payment_percent": result.down_payment_percent,
-                    "break_even_rent": round(result.break_even_rent, 2),
-                    "cash_on_cash_return": round(result.cash_on_cash_return, 4),
-                    "upfront_cost": round(result.upfront_costs.total, 2),
-                    "verdict": result.verdict.value,
-                }
-            )
-
         output = {
             "property": {
                 "price": price,
                 "expected_rent": rent,
             },
-            "comparison": results,
+            "comparison": [comparison_payload(profile, result) for profile, result in comparisons],
         }
 
         return json.dumps(output, indent=2)
+
+    def write_profile_comparison(
+        self,
+        comparisons: list[tuple[Profile, AnalysisResult]],
+        price: float,
+        rent: float,
+        sink: Sink,
+    ) -> None:
+        """Write profile comparison as JSON.
+
+        Args:
+            comparisons: List of (profile, result) tuples
+            price: Property price analyzed
+            rent: Expected rent analyzed
+            sink: Text or binary stream to write to
+        """
+        _write_document(self.format_profile_comparison(comparisons, price, rent), sink)
+
+
+def analysis_payload(
+    record: dict[str, Any],
+    warnings: list[str],
+    profile: Profile,
+) -> dict[str, Any]:
+    """Build the analysis JSON object from a flat record.
+
+    Args:
+        record: Flat analysis record (see output.records)
+        warnings: Warning messages for the property
+        profile: Profile used for analysis
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        "property": {
+            "price": record["property_price"],
+            "expected_rent": record["expected_rent"],
+            "down_payment_percent": record["down_payment_percent"],
+        },
+        "analysis": {
+            "break_even_rent": round(record["break_even_rent"], 2),
+            "cash_on_cash_return": round(record["cash_on_cash_return"], 4),
+            "monthly_surplus_shortfall": round(record["monthly_surplus_shortfall"], 2),
+            "verdict": record["verdict"].value,
+            "within_budget": record["within_budget"],
+        },
+        "upfront_costs": {
+            "down_payment": round(record["down_payment"], 2),
+            "notary_legal": round(record["notary_legal"], 2),
+            "bank_arrangement": round(record["bank_arrangement"], 2),
+            "survey_valuation": round(record["survey_valuation"], 2),
+            "mortgage_broker": round(record["mortgage_broker"], 2),
+            "other": round(record["other"], 2),
+            "total": round(record["upfront_total"], 2),
+        },
+        "monthly": {
+            "mortgage_payment": round(record["mortgage_payment"], 2),
+            "fixed_costs": round(record["fixed_costs"], 2),
+            "total": round(record["mortgage_payment"] + record["fixed_costs"], 2),
+        },
+        "warnings": warnings,
+        "profile": {
+            "name": profile.name,
+            "interest_rate": profile.mortgage.interest_rate,
+            "duration_years": profile.mortgage.duration_years,
+            "target_rent": profile.budget.target_rent,
+            "budget": profile.budget.total_available,
+        },
+    }
+
+
+def comparison_payload(profile: Profile, result: AnalysisResult) -> dict[str, Any]:
+    """Build one profile's entry of a profile comparison.
+
+    Args:
+        profile: Profile compared
+        result: Analysis result under that profile
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        "profile": profile.name,
+        "interest_rate": profile.mortgage.interest_rate,
+        "duration_years": profile.mortgage.duration_years,
+        "down_payment_percent": result.down_payment_percent,
+        "break_even_rent": round(result.break_even_rent, 2),
+        "cash_on_cash_return": round(result.cash_on_cash_return, 4),
+        "upfront_cost": round(result.upfront_costs.total, 2),
+        "verdict": result.verdict.value,
+    }
+
+
+def matrix_row_payloads(
+    prices: list[float],
+    down_payment: float,
+    rents: list[float],
+    verdicts: list[str],
+    within_budget: list[bool],
+) -> list[dict[str, Any]]:
+    """Build the JSON objects for one matrix row's cells.
+
+    Args:
+        prices: Purchase prices (matrix columns)
+        down_payment: Down payment percentage of the row
+        rents: Break-even rents, rounded, in price order
+        verdicts: Verdict values in price order
+        within_budget: Budget flags in price order
+
+    Returns:
+        JSON-serializable dicts with MATRIX_CELL_FIELDS keys, in price order
+    """
+    return [
+        dict(zip(MATRIX_CELL_FIELDS, values))
+        for values in zip(prices, repeat(down_payment), rents, verdicts, within_budget)
+    ]
+
+
+def _write_document(document: str, sink: Sink) -> None:
+    """Write a JSON document and a trailing newline to a sink."""
+    with text_stream(sink) as stream:
+        stream.write(document)
+        stream.write("\n")
+
+
+def _column_rows(field: str, matrix: "MatrixArrays") -> Iterator[list[Any]]:
+    """Yield one matrix row's values of a MATRIX_COLUMN_FIELDS field at a time."""
+    if field == "break_even_rent":
+        values = round_cents(matrix.break_even_rent)
+    elif field == "verdict":
+        values = matrix.verdict_values()
+    else:
+        values = matrix.within_budget
+    for row in values:
+        yield row.tolist()
+
+
+def _line_indent(text: str) -> int:
+    """Count the leading spaces of the last line of text."""
+    last_line = text[text.rfind("\n") + 1 :]
+    return len(last_line) - len(last_line.lstrip(" "))
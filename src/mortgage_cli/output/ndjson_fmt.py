@@ -0,0 +1,244 @@
+"""Newline-delimited JSON output formatter."""
+
+import json
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Iterable
+
+from mortgage_cli.models.lite import LiteAmortizationEntry
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import AnalysisResult
+from mortgage_cli.output.json_fmt import (
+    analysis_payload,
+    comparison_payload,
+    matrix_row_payloads,
+)
+from mortgage_cli.output.records import (
+    accepts_matrix_cells,
+    analysis_record,
+    batch_records,
+    matrix_rows,
+)
+from mortgage_cli.output.sink import Sink, text_stream
+
+if TYPE_CHECKING:
+    from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+
+
+class NdjsonFormatter:
+    """Format results as newline-delimited JSON, one object per line.
+
+    Each analysis, matrix cell, schedule year, profile or compared profile
+    becomes one compact JSON object using the same fields as the json
+    format. The write_* methods stream to a text or binary sink and flush as
+    they go (per matrix row or batch chunk), so consumers such as jq or log
+    shippers can process results before the command finishes. The format_*
+    methods return the same lines as a string.
+    """
+
+    def format_analysis(self, result: AnalysisResult, profile: Profile) -> str:
+        """Format single property analysis as one NDJSON line.
+
+        Args:
+            result: Analysis result
+            profile: Profile used for analysis
+
+        Returns:
+            NDJSON string
+        """
+        output = StringIO()
+        self.write_analysis(result, profile, output)
+        return output.getvalue()
+
+    def write_analysis(self, result: AnalysisResult, profile: Profile, sink: Sink) -> None:
+        """Write single property analysis as one NDJSON line.
+
+        Args:
+            result: Analysis result
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        payload = analysis_payload(analysis_record(result), result.warnings, profile)
+        self._write_lines([payload], sink)
+
+    def write_batch(
+        self,
+        batch: "BatchAnalysis",
+        warnings: list[list[str]],
+        profile: Profile,
+        sink: Sink,
+    ) -> None:
+        """Write batch analysis results, one line per property.
+
+        Args:
+            batch: Batch analysis results
+            warnings: Warning messages for each property
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        self._write_lines(
+            (
+                analysis_payload(record, row_warnings, profile)
+                for record, row_warnings in zip(batch_records(batch), warnings)
+            ),
+            sink,
+        )
+
+    @accepts_matrix_cells
+    def format_matrix(
+        self,
+        matrix: "MatrixArrays",
+        target_rent: float,
+        profile: Profile,
+    ) -> str:
+        """Format sensitivity matrix as NDJSON, one line per cell.
+
+        Args:
+            matrix: Sensitivity matrix results
+            target_rent: Target rent for comparison
+            profile: Profile used for analysis
+
+        Returns:
+            NDJSON string
+        """
+        output = StringIO()
+        self.write_matrix(matrix, target_rent, profile, output)
+        return output.getvalue()
+
+    @accepts_matrix_cells
+    def write_matrix(
+        self,
+        matrix: "MatrixArrays",
+        target_rent: float,
+        profile: Profile,
+        sink: Sink,
+    ) -> None:
+        """Write sensitivity matrix cells in row-major order, one line each.
+
+        Args:
+            matrix: Sensitivity matrix results
+            target_rent: Target rent for comparison
+            profile: Profile used for analysis
+            sink: Text or binary stream to write to
+        """
+        prices = matrix.prices.tolist()
+        if not prices:
+            return
+        with text_stream(sink) as stream:
+            for row in matrix_rows(matrix):
+                # Cell objects hold no nested objects, so a row encoded as one
+                # list splits into lines at its "},{" item boundaries
+                encoded = json.dumps(matrix_row_payloads(prices, *row), separators=(",", ":"))
+                stream.write(encoded[1:-1].replace("},{", "}\n{"))
+                stream.write("\n")
+                stream.flush()
+
+    def format_schedule(self, schedule: list[LiteAmortizationEntry]) -> str:
+        """Format an amortization schedule as NDJSON, one line per year.
+
+        Args:
+            schedule: Amortization entries
+
+        Returns:
+            NDJSON string
+        """
+        output = StringIO()
+        self.write_schedule(schedule, output)
+        return output.getvalue()
+
+    def write_schedule(self, schedule: list[LiteAmortizationEntry], sink: Sink) -> None:
+        """Write an amortization schedule, one line per year.
+
+        Args:
+            schedule: Amortization entries
+            sink: Text or binary stream to write to
+        """
+        self._write_lines(
+            (
+                {
+                    "year": entry.year,
+                    "principal_paid": entry.principal_paid,
+                    "interest_paid": entry.interest_paid,
+                    "remaining_balance": entry.remaining_balance,
+                    "equity_percent": entry.equity_percent,
+                }
+                for entry in schedule
+            ),
+            sink,
+        )
+
+    def format_profile_list(self, profiles: list[tuple[str, str]]) -> str:
+        """Format profile list as NDJSON, one line per profile.
+
+        Args:
+            profiles: List of (name, description) tuples
+
+        Returns:
+            NDJSON string
+        """
+        output = StringIO()
+        self.write_profile_list(profiles, output)
+        return output.getvalue()
+
+    def write_profile_list(self, profiles: list[tuple[str, str]], sink: Sink) -> None:
+        """Write profile list, one line per profile.
+
+        Args:
+            profiles: List of (name, description) tuples
+            sink: Text or binary stream to write to
+        """
+        self._write_lines(({"name": name, "description": desc} for name, desc in profiles), sink)
+
+    def format_profile_comparison(
+        self,
+        comparisons: list[tuple[Profile, AnalysisResult]],
+        price: float,
+        rent: float,
+    ) -> str:
+        """Format profile comparison as NDJSON, one line per profile.
+
+        Args:
+            comparisons: List of (profile, result) tuples
+            price: Property price analyzed
+            rent: Expected rent analyzed
+
+        Returns:
+            NDJSON string
+        """
+        output = StringIO()
+        self.write_profile_comparison(comparisons, price, rent, output)
+        return output.getvalue()
+
+    def write_profile_comparison(
+        self,
+        comparisons: list[tuple[Profile, AnalysisResult]],
+        price: float,
+        rent: float,
+        sink: Sink,
+    ) -> None:
+        """Write profile comparison, one line per profile.
+
+        Each line carries the analyzed price and rent so it stands alone.
+
+        Args:
+            comparisons: List of (profile, result) tuples
+            price: Property price analyzed
+            rent: Expected rent analyzed
+            sink: Text or binary stream to write to
+        """
+        self._write_lines(
+            (
+                {"price": price, "expected_rent": rent, **comparison_payload(profile, result)}
+                for profile, result in comparisons
+            ),
+            sink,
+        )
+
+    def _write_lines(self, objects: Iterable[dict[str, Any]], sink: Sink) -> None:
+        """Write objects as compact JSON lines in one write, then flush."""
+        lines = [json.dumps(obj, separators=(",", ":")) for obj in objects]
+        if not lines:
+            return
+        with text_stream(sink) as stream:
+            stream.write("\n".join(lines))
+            stream.write("\n")
+            stream.flush()
@@ -0,0 +1,166 @@
+"""Flat analysis records shared by the machine-readable formatters."""
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar, Union, cast
+from warnings import warn
+
+from mortgage_cli.models.lite import LiteAnalysisResult
+from mortgage_cli.models.results import AnalysisResult
+
+if TYPE_CHECKING:
+    # Annotation only: keeps NumPy out of the formatters' import path
+    import numpy as np
+
+    from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+
+# BatchAnalysis columns carried into each record (verdict is decoded separately)
+RECORD_FIELDS: tuple[str, ...] = (
+    "property_price",
+    "expected_rent",
+    "down_payment_percent",
+    "down_payment",
+    "notary_legal",
+    "bank_arrangement",
+    "survey_valuation",
+    "mortgage_broker",
+    "other",
+    "upfront_total",
+    "mortgage_payment",
+    "fixed_costs",
+    "break_even_rent",
+    "cash_on_cash_return",
+    "monthly_surplus_shortfall",
+    "within_budget",
+)
+
+# One matrix row's output values: down payment, break-even rents, verdicts, budget flags
+MatrixRow = tuple[float, list[float], list[str], list[bool]]
+
+# Distance from a half cent (in cents) below which NumPy's rounding is checked
+_TIE_TOLERANCE = 1e-6
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def analysis_record(result: Union[AnalysisResult, LiteAnalysisResult]) -> dict[str, Any]:
+    """Flatten an analysis result into a record.
+
+    Args:
+        result: Analysis result (pydantic or slotted)
+
+    Returns:
+        Dict keyed by RECORD_FIELDS plus "verdict"
+    """
+    upfront = result.upfront_costs
+    return {
+        "property_price": result.property_price,
+        "expected_rent": result.expected_rent,
+        "down_payment_percent": result.down_payment_percent,
+        "down_payment": upfront.down_payment,
+        "notary_legal": upfront.notary_legal,
+        "bank_arrangement": upfront.bank_arrangement,
+        "survey_valuation": upfront.survey_valuation,
+        "mortgage_broker": upfront.mortgage_broker,
+        "other": upfront.other,
+        "upfront_total": upfront.total,
+        "mortgage_payment": result.monthly.mortgage_payment,
+        "fixed_costs": result.monthly.fixed_costs,
+        "break_even_rent": result.break_even_rent,
+        "cash_on_cash_return": result.cash_on_cash_return,
+        "monthly_surplus_shortfall": result.monthly_surplus_shortfall,
+        "within_budget": result.within_budget,
+        "verdict": result.verdict,
+    }
+
+
+def batch_records(batch: "BatchAnalysis") -> Iterator[dict[str, Any]]:
+    """Yield one record per property in a batch.
+
+    Args:
+        batch: Batch analysis results
+
+    Yields:
+        Dicts with the same keys as analysis_record()
+    """
+    columns = [getattr(batch, name).tolist() for name in RECORD_FIELDS]
+    verdicts = batch.verdicts
+
+    for values, verdict in zip(zip(*columns), verdicts):
+        record = dict(zip(RECORD_FIELDS, values))
+        record["verdict"] = verdict
+        yield record
+
+
+def matrix_rows(matrix: "MatrixArrays") -> Iterator[MatrixRow]:
+    """Yield each matrix row's output values, converted in bulk.
+
+    Break-even rents are rounded to cents and verdicts decoded for the whole
+    matrix at once; each row then becomes Python values with one tolist()
+    call per column, so no per-cell objects are built.
+
+    Args:
+        matrix: Sensitivity matrix results
+
+    Yields:
+        (down payment, break-even rents, verdict values, budget flags) for
+        each row, with the lists in price order
+    """
+    rents = round_cents(matrix.break_even_rent)
+    verdicts = matrix.verdict_values()
+    for down, rent_row, verdict_row, budget_row in zip(
+        matrix.down_payments.tolist(), rents, verdicts, matrix.within_budget
+    ):
+        yield down, rent_row.tolist(), verdict_row.tolist(), budget_row.tolist()
+
+
+def round_cents(values: "np.ndarray") -> "np.ndarray":
+    """Round to cents exactly as round(value, 2) does for each value.
+
+    NumPy's round scales by 100 first, which can tip values within an ulp
+    of a half cent the other way; those few are re-rounded with round().
+
+    Args:
+        values: Amounts to round
+
+    Returns:
+        Rounded amounts
+    """
+    rounded: "np.ndarray" = values.round(2)
+    scaled = values * 100
+    ties = abs(scaled % 1 - 0.5) < _TIE_TOLERANCE
+    if ties.any():
+        rounded[ties] = [round(value, 2) for value in values[ties].tolist()]
+    return rounded
+
+
+def accepts_matrix_cells(method: _Method) -> _Method:
+    """Let a format_matrix/write_matrix method take the former cell arguments.
+
+    The matrix methods used to take (cells, prices, down_payments, ...)
+    where they now take a MatrixArrays; calls in the old form are converted
+    with MatrixArrays.from_cells and warn with a DeprecationWarning.
+
+    Args:
+        method: Formatter method whose first argument is a MatrixArrays
+
+    Returns:
+        The wrapped method
+    """
+
+    @wraps(method)
+    def wrapper(self: Any, matrix: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(matrix, list):
+            warn(
+                f"Passing a cell list to {method.__name__} is deprecated; "
+                "pass a MatrixArrays instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            from mortgage_cli.core.engine import MatrixArrays
+
+            prices, down_payments, *rest = args
+            matrix = MatrixArrays.from_cells(matrix, prices, down_payments)
+            args = tuple(rest)
+        return method(self, matrix, *args, **kwargs)
+
+    return cast(_Method, wrapper)
@@ -0,0 +1,52 @@
+"""Output sinks for the machine-readable formatters."""
+
+import io
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, TextIO, Union, cast
+
+# Where formatters write: a text stream (sys.stdout, open(path, "w")) or a
+# binary one (sys.stdout.buffer, open(path, "wb"), a socket file)
+Sink = Union[TextIO, BinaryIO]
+
+
+def is_binary(sink: Sink) -> bool:
+    """Check whether a sink takes bytes rather than str.
+
+    Args:
+        sink: Output stream
+
+    Returns:
+        True for binary streams
+    """
+    if isinstance(sink, io.TextIOBase):
+        return False
+    if isinstance(sink, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(sink, "mode", "")
+
+
+@contextmanager
+def text_stream(sink: Sink) -> Iterator[TextIO]:
+    """Get a text stream writing to a sink.
+
+    Text sinks are used as-is. Binary sinks are wrapped in a UTF-8 text
+    layer without newline translation, which is flushed and detached on
+    exit so the sink itself stays open.
+
+    Args:
+        sink: Output stream
+
+    Yields:
+        Text stream
+    """
+    if not is_binary(sink):
+        yield cast(TextIO, sink)
+        return
+
+    buffer = cast(BinaryIO, sink)
+    wrapper = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        wrapper.detach()
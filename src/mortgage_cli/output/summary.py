@@ -1,10 +1,16 @@
 """Summary/narrative output formatter."""
 
+from typing import TYPE_CHECKING
+
 from mortgage_cli.models.profile import Profile
-from mortgage_cli.models.results import AnalysisResult, MatrixCell, Verdict
+from mortgage_cli.models.results import AnalysisResult, Verdict
+from mortgage_cli.output.records import accepts_matrix_cells
 from mortgage_cli.utils.currency import format_currency
 from mortgage_cli.utils.percentage import format_percentage
 
+if TYPE_CHECKING:
+    from mortgage_cli.core.engine import MatrixArrays
+
 
 class SummaryFormatter:
     """Format analysis results as human-readable narrative."""
@@ -109,20 +115,17 @@ class SummaryFormatter:
             f"Unless you can command premium rents, consider alternative properties."
         )
 
+    @accepts_matrix_cells
     def format_matrix(
         self,
-        matrix: list[list[MatrixCell]],
-        prices: list[float],
-        down_payments: list[float],
+        matrix: "MatrixArrays",
         target_rent: float,
         profile: Profile,
     ) -> str:
         """Format sensitivity matrix as narrative summary.
 
         Args:
-            matrix: 2D list of MatrixCell objects
-            prices: List of purchase prices (columns)
-            down_payments: List of down payment percentages (rows)
+            matrix: Sensitivity matrix results
             target_rent: Target rent for comparison
             profile: Profile used for analysis
 
@@ -135,27 +138,13 @@ class SummaryFormatter:
         lines.append("")
 
         # Count verdicts
-        green_count = 0
-        yellow_count = 0
-        red_count = 0
-        over_budget_count = 0
-
-        viable_options = []
-
-        for row in matrix:
-            for cell in row:
-                if cell.verdict == Verdict.GREEN:
-                    green_count += 1
-                    viable_options.append(cell)
-                elif cell.verdict == Verdict.YELLOW:
-                    yellow_count += 1
-                    viable_options.append(cell)
-                elif cell.verdict == Verdict.RED:
-                    red_count += 1
-                elif cell.verdict == Verdict.OVER_BUDGET:
-                    over_budget_count += 1
-
-        total = len(matrix) * len(matrix[0]) if matrix else 0
+        counts = matrix.verdict_counts()
+        green_count = counts[Verdict.GREEN]
+        yellow_count = counts[Verdict.YELLOW]
+        red_count = counts[Verdict.RED]
+        over_budget_count = counts[Verdict.OVER_BUDGET]
+
+        total = matrix.verdict_codes.size
 
         lines.append(f"Analyzed {total} price/down-payment combinations:")
         lines.append(f"  - {green_count} good opportunities (green)")
@@ -167,13 +156,15 @@ class SummaryFormatter:
         lines.append("")
 
         # Best options
-        if viable_options:
-            # Sort by break-even rent (lowest first)
-            viable_options.sort(key=lambda x: x.break_even_rent)
-            best = viable_options[:3]
+        viable = matrix.verdict_mask(Verdict.GREEN, Verdict.YELLOW).ravel().nonzero()[0]
+        if viable.size:
+            # Sort by break-even rent (lowest first), keeping row-major order on ties
+            rents = matrix.break_even_rent.ravel()[viable]
+            best = viable[rents.argsort(kind="stable")[:3]].tolist()
 
             lines.append("Top opportunities (lowest break-even rent):")
-            for i, cell in enumerate(best, 1):
+            for i, index in enumerate(best, 1):
+                cell = matrix.cell(*divmod(index, len(matrix.prices)))
                 price = format_currency(cell.price)
                 down = format_percentage(cell.down_payment_percent)
                 be = format_currency(cell.break_even_rent)
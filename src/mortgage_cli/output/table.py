@@ -1,16 +1,22 @@
 """Rich terminal table output formatter."""
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from mortgage_cli.models.profile import Profile
-from mortgage_cli.models.results import AnalysisResult, MatrixCell, Verdict
+from mortgage_cli.models.results import AnalysisResult, Verdict
 from mortgage_cli.output.colors import verdict_to_label, verdict_to_style
+from mortgage_cli.output.records import accepts_matrix_cells
 from mortgage_cli.utils.currency import format_currency
 from mortgage_cli.utils.percentage import format_percentage
 
+if TYPE_CHECKING:
+    from mortgage_cli.core.engine import MatrixArrays
+
 
 class TableFormatter:
     """Format analysis results as Rich terminal tables."""
@@ -151,20 +157,17 @@ class TableFormatter:
         for warning in warnings:
             self.console.print(f"  [yellow]• {warning}[/yellow]")
 
+    @accepts_matrix_cells
     def format_matrix(
         self,
-        matrix: list[list[MatrixCell]],
-        prices: list[float],
-        down_payments: list[float],
+        matrix: "MatrixArrays",
         target_rent: float,
         profile: Profile,
     ) -> None:
         """Render sensitivity matrix as a colored table.
 
         Args:
-            matrix: 2D list of MatrixCell objects
-            prices: List of purchase prices (columns)
-            down_payments: List of down payment percentages (rows)
+            matrix: Sensitivity matrix results
             target_rent: Target rent for comparison
             profile: Profile used for analysis
         """
@@ -183,19 +186,23 @@ class TableFormatter:
         table.add_column("Down %", justify="right", style="dim")
 
         # Add price columns
-        for price in prices:
+        for price in matrix.prices.tolist():
             # Format as K (e.g., €100K)
             price_k = f"€{price / 1000:.0f}K"
             table.add_column(price_k, justify="right")
 
         # Add rows
-        for row_idx, down_pct in enumerate(down_payments):
+        styles = {verdict.value: verdict_to_style(verdict) for verdict in Verdict}
+        for down_pct, rents, verdicts in zip(
+            matrix.down_payments.tolist(),
+            matrix.break_even_rent.tolist(),
+            matrix.verdict_values().tolist(),
+        ):
             row_values = [format_percentage(down_pct)]
 
-            for col_idx, cell in enumerate(matrix[row_idx]):
-                style = verdict_to_style(cell.verdict)
-                value = format_currency(cell.break_even_rent)
-                row_values.append(f"[{style}]{value}[/{style}]")
+            for rent, verdict in zip(rents, verdicts):
+                style = styles[verdict]
+                row_values.append(f"[{style}]{format_currency(rent)}[/{style}]")
 
             table.add_row(*row_values)
 
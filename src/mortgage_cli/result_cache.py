@@ -0,0 +1,394 @@
+"""Content-addressed cache of command output for --cache.
+
+Output is stored under a key hashed from the command name, its inputs and
+the full profile, so editing a profile (or upgrading mortgage-cli) changes
+the key and stale entries are simply never read again; they age out of the
+size-bounded store least recently used first. Like timings, every hook is
+a no-op unless the CLI enabled caching, and only the standard library is
+imported at module level so main can import it cheaply.
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TextIO, cast
+
+from mortgage_cli import __version__, timings
+
+if TYPE_CHECKING:
+    from mortgage_cli.models.profile import Profile
+
+# Set to 1/true/yes to cache output without passing --cache
+CACHE_ENV = "MORTGAGE_CLI_CACHE"
+
+# Bump when the key recipe, entry layout or a cached output format changes
+CACHE_FORMAT = 3
+
+# Total size of stored output before the least recently used entries go
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+ENTRY_SUFFIX = ".out"
+
+# Output formats whose text does not depend on the terminal, so it can be replayed
+CACHED_FORMATS = ("json", "ndjson", "csv")
+
+
+class ResultCache:
+    """Directory of command outputs, one file per key, evicted LRU by size.
+
+    Reading an entry refreshes its modification time, which serves as the
+    recency for eviction. Writes are atomic and, like the profile cache,
+    best-effort: I/O errors only mean the command output is not cached.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache.
+
+        Args:
+            directory: Directory holding the entries
+            max_bytes: Total entry size kept after each write
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        """Get stored output and mark it as recently used.
+
+        Args:
+            key: Entry key (see cache_key)
+
+        Returns:
+            Stored output, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8", newline="") as f:
+                text = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return text
+
+    def copy_to(self, key: str, sink: TextIO) -> bool:
+        """Stream stored output to a sink and mark it as recently used.
+
+        Args:
+            key: Entry key (see cache_key)
+            sink: Stream to write the output to
+
+        Returns:
+            True if the entry existed and was written
+        """
+        path = self._path(key)
+        try:
+            f = open(path, encoding="utf-8", newline="")
+        except OSError:
+            return False
+        with f:
+            shutil.copyfileobj(f, sink)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    @contextmanager
+    def writing(self, key: str, sink: TextIO) -> Iterator[TextIO]:
+        """Write output to a sink while storing a copy under a key.
+
+        The copy goes to a temporary file in the cache directory, which is
+        renamed into place when the block finishes, so output is never
+        held in memory. Nothing is stored if the block raises or the copy
+        cannot be written; the sink gets the output either way.
+
+        Args:
+            key: Entry key (see cache_key)
+            sink: Stream the output belongs on
+
+        Yields:
+            Text stream to write the output to
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            copy = open(tmp_path, "w", encoding="utf-8", newline="")
+        except OSError:
+            yield sink
+            return
+
+        tee = _Tee(sink, copy)
+        try:
+            yield cast(TextIO, tee)
+        except BaseException:
+            tee.close_copy()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        if not tee.close_copy():
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with timings.stage("cache"):
+            try:
+                os.replace(tmp_path, path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                return
+            self.evict()
+
+    def put(self, key: str, text: str) -> None:
+        """Store output, then evict old entries beyond max_bytes.
+
+        Args:
+            key: Entry key (see cache_key)
+            text: Command output
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the total fits max_bytes.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry.
+
+        Returns:
+            Number of entries deleted
+        """
+        removed = 0
+        for path, _ in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+    def size(self) -> tuple[int, int]:
+        """Count stored entries.
+
+        Returns:
+            (entries, total bytes)
+        """
+        entries = self._entries()
+        return len(entries), sum(stat.st_size for _, stat in entries)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        """Stored entries with their stat results."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(ENTRY_SUFFIX):
+                        try:
+                            entries.append((Path(entry.path), entry.stat()))
+                        except OSError:
+                            continue
+        except OSError:
+            return []
+        return entries
+
+
+def cache_key(command: str, profile: "Profile", inputs: dict[str, Any]) -> str:
+    """Hash a command invocation into a cache key.
+
+    The profile is hashed through its canonical JSON dump (sorted keys), so
+    equal profiles give equal keys regardless of where they were loaded
+    from, and any changed setting gives a new key.
+
+    Args:
+        command: Command name
+        profile: Profile the command runs with
+        inputs: Every other input that affects the output (JSON-serializable)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    document = {
+        "format": CACHE_FORMAT,
+        "version": __version__,
+        "command": command,
+        "profile": profile.model_dump(mode="json"),
+        "inputs": inputs,
+    }
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    # Imported here to keep OpenSSL out of CLI startup
+    import hashlib
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+_cache: Optional[ResultCache] = None
+_enabled = False
+
+
+def enable(directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """Turn caching on for this run.
+
+    Args:
+        directory: Entry directory (default: cache/results in the config dir,
+            resolved on first use)
+        max_bytes: Total entry size kept
+    """
+    global _cache, _enabled
+    _enabled = True
+    _cache = ResultCache(directory, max_bytes) if directory is not None else None
+
+
+def disable() -> None:
+    """Turn caching off."""
+    global _cache, _enabled
+    _enabled = False
+    _cache = None
+
+
+def requested_by_env() -> bool:
+    """Check whether $MORTGAGE_CLI_CACHE asks for caching."""
+    return os.environ.get(CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def active() -> Optional[ResultCache]:
+    """Get the cache, if caching is enabled."""
+    global _cache
+    if not _enabled:
+        return None
+    if _cache is None:
+        from mortgage_cli.config.paths import get_cache_dir
+
+        _cache = ResultCache(get_cache_dir() / "results")
+    return _cache
+
+
+def lookup(command: str, profile: "Profile", inputs: dict[str, Any]) -> Optional[str]:
+    """Get the key for an invocation when caching is enabled.
+
+    Args:
+        command: Command name
+        profile: Profile the command runs with
+        inputs: Every other input that affects the output
+
+    Returns:
+        Cache key, or None when caching is disabled
+    """
+    if active() is None:
+        return None
+    return cache_key(command, profile, inputs)
+
+
+def replay(key: Optional[str], sink: Optional[TextIO] = None) -> bool:
+    """Write cached output for a key, if there is any.
+
+    Args:
+        key: Key from lookup() (None when caching is disabled)
+        sink: Stream to write to (sys.stdout if None)
+
+    Returns:
+        True if cached output was written and the command can stop
+    """
+    cache = active()
+    if key is None or cache is None:
+        return False
+    out = sink or sys.stdout
+    with timings.stage("cache"):
+        hit = cache.copy_to(key, out)
+    if not hit:
+        timings.count("result_cache_misses")
+        return False
+    timings.count("result_cache_hits")
+    with timings.stage("write"):
+        out.flush()
+    return True
+
+
+@contextmanager
+def recording(key: Optional[str], sink: Optional[TextIO] = None) -> Iterator[TextIO]:
+    """Store the output written in the block under a key.
+
+    Yields the sink itself when caching is disabled. Otherwise output goes
+    to the sink as it is written and is streamed into the cache alongside
+    (see ResultCache.writing); nothing is stored if the block raises.
+
+    Args:
+        key: Key from lookup() (None when caching is disabled)
+        sink: Stream the output belongs on (sys.stdout if None)
+
+    Yields:
+        Text stream to write the command output to
+    """
+    out = sink or sys.stdout
+    cache = active()
+    if key is None or cache is None:
+        yield out
+        return
+
+    with cache.writing(key, out) as stream:
+        yield stream
+
+
+class _Tee(io.TextIOBase):
+    """Text stream copying everything written to it into a second file.
+
+    Errors writing the copy are remembered in failed rather than raised, so
+    a full or read-only cache directory never interrupts command output.
+    """
+
+    def __init__(self, sink: TextIO, copy: TextIO):
+        self.sink = sink
+        self.copy = copy
+        self.failed = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.sink.write(text)
+        if not self.failed:
+            try:
+                self.copy.write(text)
+            except OSError:
+                self.failed = True
+        return len(text)
+
+    def flush(self) -> None:
+        self.sink.flush()
+
+    def close_copy(self) -> bool:
+        """Close the copy and report whether all of it was written."""
+        try:
+            self.copy.close()
+        except OSError:
+            self.failed = True
+        return not self.failed
@@ -0,0 +1,342 @@
+"""SQLite store of analysis results for --store and the query command."""
+
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from mortgage_cli.config.paths import get_results_db_path
+from mortgage_cli.core.compiled import VERDICTS
+from mortgage_cli.core.engine import BatchAnalysis, MatrixArrays
+from mortgage_cli.models.results import AnalysisResult
+
+# Stored as PRAGMA user_version; bump when the schema changes
+STORE_FORMAT = 1
+
+# Result columns in insert and query order (verdict is stored as its value)
+RESULT_COLUMNS: tuple[str, ...] = (
+    "property_price",
+    "expected_rent",
+    "down_payment_percent",
+    "upfront_total",
+    "break_even_rent",
+    "cash_on_cash_return",
+    "monthly_surplus_shortfall",
+    "verdict",
+    "within_budget",
+)
+
+# Columns query results can be ordered by
+ORDER_COLUMNS: tuple[str, ...] = (
+    "property_price",
+    "break_even_rent",
+    "cash_on_cash_return",
+    "created_at",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    profile TEXT NOT NULL,
+    property_price REAL NOT NULL,
+    expected_rent REAL NOT NULL,
+    down_payment_percent REAL NOT NULL,
+    upfront_total REAL NOT NULL,
+    break_even_rent REAL NOT NULL,
+    cash_on_cash_return REAL NOT NULL,
+    monthly_surplus_shortfall REAL NOT NULL,
+    verdict TEXT NOT NULL,
+    within_budget INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_verdict ON results (verdict, property_price);
+CREATE INDEX IF NOT EXISTS results_break_even ON results (break_even_rent);
+CREATE INDEX IF NOT EXISTS results_cash_on_cash ON results (cash_on_cash_return);
+CREATE INDEX IF NOT EXISTS results_profile ON results (profile, property_price);
+"""
+
+
+@dataclass(frozen=True)
+class ResultQuery:
+    """Filters for ResultStore.query; None leaves a field unfiltered."""
+
+    verdicts: Optional[tuple[str, ...]] = None
+    profile: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_return: Optional[float] = None
+    max_break_even: Optional[float] = None
+    run_id: Optional[int] = None
+    order_by: str = "property_price"
+    descending: bool = False
+    limit: Optional[int] = None
+
+
+def open_store(path: Optional[Path] = None) -> "ResultStore":
+    """Open the results store.
+
+    Args:
+        path: Database file (default: results.db in the config dir)
+
+    Returns:
+        Open ResultStore
+
+    Raises:
+        ValueError: If the database cannot be opened or has another format
+    """
+    path = path if path is not None else get_results_db_path()
+    try:
+        return ResultStore(path)
+    except (OSError, sqlite3.Error) as e:
+        raise ValueError(f"Cannot open results store '{path}': {e}") from None
+
+
+class ResultStore:
+    """Results of analyze, matrix and batch runs in a SQLite database.
+
+    Each invocation is recorded as a run, and its results are inserted with
+    executemany inside a single transaction, so an interrupted run leaves
+    nothing behind. Results are indexed on verdict, break-even rent,
+    cash-on-cash return and profile so that queries over a growing history
+    read only the matching rows.
+    """
+
+    def __init__(self, path: Path):
+        """Open (and if needed create) a store.
+
+        Args:
+            path: Database file
+
+        Raises:
+            ValueError: If the file is not a results store of this version
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        try:
+            self._migrate()
+        except (sqlite3.DatabaseError, ValueError):
+            self.connection.close()
+            raise
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    @contextmanager
+    def run(self, command: str, profile: str) -> Iterator["StoreRun"]:
+        """Record a run whose results are committed together.
+
+        Args:
+            command: Command that produced the results
+            profile: Name of the profile used
+
+        Yields:
+            StoreRun to insert results through; rolled back if the block raises
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (command, profile, created_at) VALUES (?, ?, ?)",
+                (command, profile, datetime.now(timezone.utc).isoformat(timespec="seconds")),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None
+            yield StoreRun(self.connection, run_id, profile)
+
+    def query(self, query: ResultQuery) -> list[dict[str, Any]]:
+        """Find stored results.
+
+        Args:
+            query: Filters, ordering and limit
+
+        Returns:
+            Matching results as dicts with run_id, created_at, profile and
+            RESULT_COLUMNS keys
+
+        Raises:
+            ValueError: If query.order_by is not one of ORDER_COLUMNS
+        """
+        if query.order_by not in ORDER_COLUMNS:
+            raise ValueError(
+                f"Cannot order by '{query.order_by}'. Use one of: {', '.join(ORDER_COLUMNS)}"
+            )
+
+        clauses = []
+        params: list[Any] = []
+        if query.verdicts:
+            clauses.append(f"verdict IN ({', '.join('?' * len(query.verdicts))})")
+            params.extend(query.verdicts)
+        for clause, value in (
+            ("results.profile = ?", query.profile),
+            ("property_price >= ?", query.min_price),
+            ("property_price <= ?", query.max_price),
+            ("cash_on_cash_return >= ?", query.min_return),
+            ("break_even_rent <= ?", query.max_break_even),
+            ("run_id = ?", query.run_id),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = (
+            "SELECT run_id, created_at, results.profile, "
+            f"{', '.join(RESULT_COLUMNS)} "
+            "FROM results JOIN runs ON runs.id = results.run_id"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {query.order_by} {'DESC' if query.descending else 'ASC'}, results.id"
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit)
+
+        names = ("run_id", "created_at", "profile", *RESULT_COLUMNS)
+        rows = []
+        for values in self.connection.execute(sql, params):
+            row = dict(zip(names, values))
+            row["within_budget"] = bool(row["within_budget"])
+            rows.append(row)
+        return rows
+
+    def runs(self) -> list[dict[str, Any]]:
+        """List recorded runs with their result counts, oldest first."""
+        cursor = self.connection.execute(
+            "SELECT runs.id, command, runs.profile, created_at, COUNT(results.id) "
+            "FROM runs LEFT JOIN results ON results.run_id = runs.id "
+            "GROUP BY runs.id ORDER BY runs.id"
+        )
+        names = ("run_id", "command", "profile", "created_at", "results")
+        return [dict(zip(names, values)) for values in cursor]
+
+    def _migrate(self) -> None:
+        """Create the schema, or check an existing one.
+
+        Raises:
+            ValueError: If the database was written by another store format
+        """
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, STORE_FORMAT):
+            raise ValueError(
+                f"'{self.path}' uses results store format {version}, expected {STORE_FORMAT}"
+            )
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {STORE_FORMAT}")
+
+
+class StoreRun:
+    """Inserts results for one run (see ResultStore.run)."""
+
+    def __init__(self, connection: sqlite3.Connection, run_id: int, profile: str):
+        """Initialize run.
+
+        Args:
+            connection: Store connection, inside the run's transaction
+            run_id: Row id of the run
+            profile: Name of the profile used
+        """
+        self.connection = connection
+        self.run_id = run_id
+        self.profile = profile
+        self.count = 0
+
+    def add_analysis(self, result: AnalysisResult) -> None:
+        """Store a single analysis.
+
+        Args:
+            result: Analysis result
+        """
+        self._insert(
+            [
+                (
+                    result.property_price,
+                    result.expected_rent,
+                    result.down_payment_percent,
+                    result.upfront_costs.total,
+                    result.break_even_rent,
+                    result.cash_on_cash_return,
+                    result.monthly_surplus_shortfall,
+                    result.verdict.value,
+                    result.within_budget,
+                )
+            ]
+        )
+
+    def add_batch(self, batch: BatchAnalysis) -> None:
+        """Store every property in a batch.
+
+        Args:
+            batch: Batch analysis results
+        """
+        self._insert_columns(
+            batch.property_price,
+            batch.expected_rent,
+            batch.down_payment_percent,
+            batch.upfront_total,
+            batch.break_even_rent,
+            batch.cash_on_cash_return,
+            batch.monthly_surplus_shortfall,
+            batch.verdict_codes,
+            batch.within_budget,
+        )
+
+    def add_matrix(self, matrix: MatrixArrays, target_rent: float) -> None:
+        """Store every matrix cell, judged against one rent.
+
+        Args:
+            matrix: Matrix results
+            target_rent: Rent the matrix verdicts were judged against
+        """
+        down_payments, prices = np.meshgrid(matrix.down_payments, matrix.prices, indexing="ij")
+        upfront_total = matrix.upfront_total.ravel()
+        surplus = target_rent - matrix.break_even_rent.ravel()
+        # Same convention as InvestmentAnalyzer: no return without upfront cost
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cash_on_cash = np.where(upfront_total > 0, surplus * 12 / upfront_total, 0.0)
+
+        self._insert_columns(
+            prices.ravel(),
+            np.full(upfront_total.shape, target_rent),
+            down_payments.ravel(),
+            upfront_total,
+            matrix.break_even_rent.ravel(),
+            cash_on_cash,
+            surplus,
+            matrix.verdict_codes.ravel(),
+            matrix.within_budget.ravel(),
+        )
+
+    def _insert_columns(self, *columns: np.ndarray) -> None:
+        """Insert results given as arrays in RESULT_COLUMNS order."""
+        *numbers, codes, within_budget = columns
+        verdicts = [VERDICTS[code].value for code in codes.tolist()]
+        self._insert(
+            zip(*(values.tolist() for values in numbers), verdicts, within_budget.tolist())
+        )
+
+    def _insert(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Insert result rows in RESULT_COLUMNS order."""
+        placeholders = ", ".join("?" * (len(RESULT_COLUMNS) + 2))
+        cursor = self.connection.executemany(
+            f"INSERT INTO results (run_id, profile, {', '.join(RESULT_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            ((self.run_id, self.profile, *row) for row in rows),
+        )
+        self.count += cursor.rowcount
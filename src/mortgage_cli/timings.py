@@ -0,0 +1,158 @@
+"""Per-stage wall-clock timings and counters for --timings.
+
+Instrumented code calls stage() and count() unconditionally; both are
+no-ops unless the CLI enabled recording, so the hooks cost next to nothing
+in normal runs. Only the standard library is used so the module can be
+imported before anything heavy.
+"""
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator, Optional
+
+# Stages reported in this order (others follow in first-seen order)
+STAGES: tuple[str, ...] = ("import", "profile", "compute", "format", "write")
+
+_NULL_STAGE = nullcontext()
+
+
+class Timings:
+    """Accumulated stage durations and event counters for one run."""
+
+    def __init__(self, started: Optional[float] = None):
+        """Initialize recorder.
+
+        Args:
+            started: perf_counter() value the total is measured from (now if None)
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        # Time spent in nested stages, one entry per open stage
+        self._nested: list[float] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a stage.
+
+        Args:
+            name: Stage name
+            seconds: Duration to add
+        """
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as part of a stage.
+
+        Stages may nest (the result cache is stored while writing). Time spent
+        in a nested stage is charged to the innermost stage only, so stages
+        never overlap and always sum to at most the total.
+
+        Args:
+            name: Stage name
+        """
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.add(name, elapsed - self._nested.pop())
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Counter name
+            n: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> dict[str, Any]:
+        """Timings as a JSON-serializable dict (seconds)."""
+        total = time.perf_counter() - self.started
+        stages = {name: self.stages[name] for name in self._ordered_stages()}
+        return {
+            "total": total,
+            "stages": stages,
+            "other": total - sum(stages.values()),
+            "counters": dict(self.counters),
+        }
+
+    def format_report(self) -> str:
+        """Human-readable report, one line per stage and counter."""
+        data = self.to_dict()
+        lines = ["Timings:"]
+        for name, seconds in data["stages"].items():
+            lines.append(f"  {name:<10} {seconds * 1000:>10.2f} ms")
+        lines.append(f"  {'other':<10} {data['other'] * 1000:>10.2f} ms")
+        lines.append(f"  {'total':<10} {data['total'] * 1000:>10.2f} ms")
+        if data["counters"]:
+            lines.append("Counters:")
+            for name, value in data["counters"].items():
+                lines.append(f"  {name:<22} {value:>10,}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        """Timings as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2) + "\n"
+
+    def _ordered_stages(self) -> list[str]:
+        known = [name for name in STAGES if name in self.stages]
+        return known + [name for name in self.stages if name not in STAGES]
+
+
+_recorder: Optional[Timings] = None
+
+
+def enable(started: Optional[float] = None) -> Timings:
+    """Start recording.
+
+    Args:
+        started: perf_counter() value the total is measured from (now if None)
+
+    Returns:
+        The active recorder
+    """
+    global _recorder
+    _recorder = Timings(started)
+    return _recorder
+
+
+def disable() -> None:
+    """Stop recording."""
+    global _recorder
+    _recorder = None
+
+
+def active() -> Optional[Timings]:
+    """Get the active recorder, if recording is enabled."""
+    return _recorder
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Time a block as part of a stage when recording is enabled.
+
+    Args:
+        name: Stage name (import, profile, compute, format, write, ...)
+
+    Returns:
+        Context manager (a shared no-op when recording is disabled)
+    """
+    if _recorder is None:
+        return _NULL_STAGE
+    return _recorder.stage(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Increment a counter when recording is enabled.
+
+    Args:
+        name: Counter name
+        n: Amount to add
+    """
+    if _recorder is not None:
+        _recorder.count(name, n)
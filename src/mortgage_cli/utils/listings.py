@@ -0,0 +1,64 @@
+"""Reading listing files (CSV or JSON Lines) one record at a time."""
+
+import csv
+import json
+from typing import Any, Iterator, TextIO
+
+# File extensions read as JSON Lines rather than CSV
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+def read_listings(stream: TextIO, input_format: str) -> Iterator[dict[str, Any]]:
+    """Yield records from a CSV or JSONL stream, one dict per record.
+
+    Args:
+        stream: Text stream to read
+        input_format: "csv" or "jsonl"
+
+    Yields:
+        One dict per CSV row or non-empty JSON line
+
+    Raises:
+        ValueError: If the stream is not UTF-8 text, or a JSON line is invalid
+            or not an object
+    """
+    # Lines read so far; decoding runs ahead in blocks, so a decode error
+    # can only be placed after the last complete line
+    line_number = 0
+    try:
+        if input_format == "csv":
+            reader = csv.DictReader(stream)
+            for record in reader:
+                line_number = reader.line_num
+                yield record
+            return
+
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number}: {e.msg}") from None
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number} is not a JSON object")
+            yield record
+    except UnicodeDecodeError:
+        raise ValueError(f"Invalid UTF-8 text after line {line_number}") from None
+
+
+def lookup(listing: dict[str, Any], columns: tuple[str, ...]) -> Any:
+    """Get the first present column value from a listing.
+
+    Args:
+        listing: Record read from a listing file
+        columns: Accepted column names, in order of preference
+
+    Returns:
+        The value, or None if no column is present
+    """
+    for column in columns:
+        if column in listing:
+            return listing[column]
+    return None
@@ -0,0 +1,20 @@
+"""Value range utilities for grid sweeps."""
+
+
+def inclusive_range(start: float, end: float, step: float) -> list[float]:
+    """Generate values from start to end (inclusive) with step.
+
+    Args:
+        start: First value
+        end: Last value (included when reached within half a step)
+        step: Increment
+
+    Returns:
+        List of values
+    """
+    result = []
+    current = start
+    while current <= end + step / 2:  # Small tolerance for floating point
+        result.append(current)
+        current += step
+    return result
@@ -0,0 +1,118 @@
+"""Unit tests for AmortizationGenerator."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.amortization import AmortizationGenerator
+from mortgage_cli.core.calculator import MortgageCalculator
+
+
+def _monthly_schedule(principal: float, annual_rate: float, years: int) -> list[tuple[float, float, float]]:
+    """Reference month-by-month schedule as (principal, interest, balance) per year."""
+    monthly_rate = annual_rate / 12
+    payment = MortgageCalculator.calculate_monthly_payment(principal, annual_rate, years)
+    balance = principal
+    rows = []
+    for _ in range(years):
+        year_principal = 0.0
+        year_interest = 0.0
+        for _ in range(12):
+            interest = balance * monthly_rate
+            year_interest += interest
+            year_principal += payment - interest
+            balance -= payment - interest
+        rows.append((year_principal, year_interest, balance))
+    return rows
+
+
+@pytest.fixture
+def generator() -> AmortizationGenerator:
+    """Provide an AmortizationGenerator instance."""
+    return AmortizationGenerator()
+
+
+class TestGenerateSchedule:
+    """Tests for the entry-based schedule."""
+
+    def test_one_entry_per_year(self, generator: AmortizationGenerator):
+        """Full schedule has one entry per loan year."""
+        schedule = generator.generate_schedule(100000, 0.041, 20, 125000)
+
+        assert [e.year for e in schedule] == list(range(1, 21))
+
+    def test_limit_years(self, generator: AmortizationGenerator):
+        """limit_years truncates the schedule."""
+        schedule = generator.generate_schedule(100000, 0.041, 20, 125000, limit_years=5)
+
+        assert len(schedule) == 5
+
+    def test_limit_beyond_term(self, generator: AmortizationGenerator):
+        """limit_years beyond the term stops at the last loan year."""
+        schedule = generator.generate_schedule(100000, 0.041, 20, 125000, limit_years=30)
+
+        assert len(schedule) == 20
+
+    def test_zero_principal_is_empty(self, generator: AmortizationGenerator):
+        """Zero principal yields no schedule."""
+        assert generator.generate_schedule(0, 0.041, 20, 125000) == []
+
+    def test_paid_off_at_term(self, generator: AmortizationGenerator):
+        """Balance reaches zero and equity reaches 100% at the end of the term."""
+        schedule = generator.generate_schedule(100000, 0.041, 20, 125000)
+
+        assert schedule[-1].remaining_balance == 0
+        assert schedule[-1].equity_percent == 1.0
+        assert sum(e.principal_paid for e in schedule) == pytest.approx(100000, abs=0.1)
+
+    def test_zero_rate(self, generator: AmortizationGenerator):
+        """Zero rate pays equal principal with no interest."""
+        schedule = generator.generate_schedule(120000, 0, 20, 150000)
+
+        assert all(e.principal_paid == 6000 for e in schedule)
+        assert all(e.interest_paid == 0 for e in schedule)
+
+
+class TestGenerateArrays:
+    """Tests for the closed-form array engine."""
+
+    @pytest.mark.parametrize("annual_rate,years", [(0.041, 20), (0.065, 30), (0.02, 10)])
+    def test_matches_monthly_iteration(
+        self,
+        generator: AmortizationGenerator,
+        annual_rate: float,
+        years: int,
+    ):
+        """Closed form agrees with stepping through every month."""
+        schedule = generator.generate_arrays(150000, annual_rate, years, 200000)
+        expected = _monthly_schedule(150000, annual_rate, years)
+
+        np.testing.assert_allclose(schedule.principal_paid, [r[0] for r in expected], atol=1e-6)
+        np.testing.assert_allclose(schedule.interest_paid, [r[1] for r in expected], atol=1e-6)
+        np.testing.assert_allclose(schedule.remaining_balance, [r[2] for r in expected], atol=1e-6)
+
+    def test_batch_matches_individual_schedules(self, generator: AmortizationGenerator):
+        """Many loans are generated in one pass with the same results."""
+        principals = np.array([50000.0, 100000.0, 250000.0])
+        rates = np.array([0.03, 0.041, 0.055])
+        batch = generator.generate_arrays(principals, rates, 25, principals * 1.25)
+
+        assert batch.principal_paid.shape == (3, 25)
+        for i in range(3):
+            single = generator.generate_arrays(principals[i], rates[i], 25, principals[i] * 1.25)
+            np.testing.assert_allclose(batch.interest_paid[i], single.interest_paid)
+            np.testing.assert_allclose(batch.remaining_balance[i], single.remaining_balance)
+
+    def test_totals(self, generator: AmortizationGenerator):
+        """Totals cover principal and interest over the schedule."""
+        schedule = generator.generate_arrays(100000, 0.041, 20, 125000)
+        payment = MortgageCalculator.calculate_monthly_payment(100000, 0.041, 20)
+
+        assert schedule.total_principal == pytest.approx(100000)
+        assert schedule.total_principal + schedule.total_interest == pytest.approx(payment * 240)
+
+    def test_to_entries_requires_single_loan(self, generator: AmortizationGenerator):
+        """Entries can only be materialized for a single loan."""
+        batch = generator.generate_arrays([100000, 200000], 0.041, 20, 250000)
+
+        with pytest.raises(ValueError):
+            batch.to_entries()
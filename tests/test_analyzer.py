@@ -3,6 +3,7 @@
 import pytest
 
 from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.calculator import MortgageCalculator
 from mortgage_cli.models.profile import Profile
 from mortgage_cli.models.property import PropertyInput
 from mortgage_cli.models.results import Verdict
@@ -36,6 +37,11 @@ class TestAnalyzerBasics:
 
         assert result.down_payment_percent == 0.30
 
+    def test_calculator_argument_deprecated(self, default_profile: Profile):
+        """Passing a calculator warns that it is ignored."""
+        with pytest.warns(DeprecationWarning, match="calculator"):
+            InvestmentAnalyzer(default_profile, MortgageCalculator())
+
 
 class TestUpfrontCosts:
     """Tests for upfront cost calculations."""
@@ -228,3 +234,72 @@ class TestSpreadsheetIntegration:
         )
 
         assert result.break_even_rent == pytest.approx(expected_break_even, rel=0.005)
+
+
+class TestAnalyzeBatch:
+    """Tests for the columnar batch API."""
+
+    PRICES = [50000, 100000, 130000, 200000, 300000, 500000]
+    RENTS = [800, 900, 900, 500, 500, 2000]
+    DOWNS = [0.20, 0.10, float("nan"), 0.30, 0.0, 0.25]
+
+    def test_matches_scalar_analyze(self, default_profile: Profile):
+        """Every column matches the scalar AnalysisResult."""
+        analyzer = InvestmentAnalyzer(default_profile)
+        batch = analyzer.analyze_batch(self.PRICES, self.RENTS, self.DOWNS)
+
+        assert len(batch) == len(self.PRICES)
+        for i, (price, rent, down) in enumerate(zip(self.PRICES, self.RENTS, self.DOWNS)):
+            expected = analyzer.analyze(
+                PropertyInput(
+                    price=price,
+                    expected_rent=rent,
+                    down_payment_percent=None if down != down else down,
+                )
+            )
+            assert batch.down_payment_percent[i] == expected.down_payment_percent
+            assert batch.notary_legal[i] == pytest.approx(expected.upfront_costs.notary_legal)
+            assert batch.survey_valuation[i] == pytest.approx(expected.upfront_costs.survey_valuation)
+            assert batch.upfront_total[i] == pytest.approx(expected.upfront_costs.total)
+            assert batch.mortgage_payment[i] == pytest.approx(expected.monthly.mortgage_payment)
+            assert batch.break_even_rent[i] == pytest.approx(expected.break_even_rent)
+            assert batch.cash_on_cash_return[i] == pytest.approx(expected.cash_on_cash_return)
+            assert batch.monthly_surplus_shortfall[i] == pytest.approx(
+                expected.monthly_surplus_shortfall
+            )
+            assert bool(batch.within_budget[i]) == expected.within_budget
+            assert batch.verdicts[i] == expected.verdict
+
+    def test_default_down_payment(self, default_profile: Profile):
+        """Omitting the down payment column uses the profile default."""
+        analyzer = InvestmentAnalyzer(default_profile)
+        batch = analyzer.analyze_batch([100000, 150000], [900, 900])
+
+        assert list(batch.down_payment_percent) == [0.20, 0.20]
+
+    def test_result_at_matches_analyze(self, default_profile: Profile):
+        """Materialized rows equal analyze(), including warnings."""
+        analyzer = InvestmentAnalyzer(default_profile)
+        batch = analyzer.analyze_batch(self.PRICES, self.RENTS, self.DOWNS)
+
+        result = analyzer.result_at(batch, 5)
+        expected = analyzer.analyze(
+            PropertyInput(price=500000, expected_rent=2000, down_payment_percent=0.25)
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "prices,rents,downs",
+        [
+            ([100000, 0], [900, 900], None),
+            ([100000, 150000], [900, -1], None),
+            ([100000, 150000], [900, 900], [0.2, 1.5]),
+            ([100000, 150000], [900], None),
+        ],
+    )
+    def test_invalid_columns_raise(self, default_profile: Profile, prices, rents, downs):
+        """Invalid or mismatched columns raise ValueError."""
+        analyzer = InvestmentAnalyzer(default_profile)
+
+        with pytest.raises(ValueError):
+            analyzer.analyze_batch(prices, rents, downs)
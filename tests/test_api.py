@@ -0,0 +1,113 @@
+"""Tests for the mortgage_cli.api library facade."""
+
+import json
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli import api
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.core.solver import GoalSolver
+from mortgage_cli.main import app
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.results import Verdict
+
+runner = CliRunner()
+
+
+class TestAnalyze:
+    """Tests for analyze and analyze_batch."""
+
+    def test_matches_analyzer(self, default_profile):
+        """analyze returns the analyzer's numbers as a plain dataclass."""
+        result = api.analyze(150000, 900, down=0.3, profile=default_profile)
+        expected = InvestmentAnalyzer(default_profile).analyze(
+            PropertyInput(price=150000, expected_rent=900, down_payment_percent=0.3)
+        )
+
+        assert result.break_even_rent == pytest.approx(expected.break_even_rent)
+        assert result.cash_on_cash_return == pytest.approx(expected.cash_on_cash_return)
+        assert result.upfront_total == pytest.approx(expected.upfront_costs.total)
+        assert result.verdict == expected.verdict.value
+        assert result.down_payment_percent == 0.3
+
+    def test_matches_cli(self):
+        """The default profile gives the same verdict as 'analyze -o json'."""
+        shown = runner.invoke(app, ["analyze", "-p", "150000", "-r", "900", "-o", "json"])
+        analysis = json.loads(shown.stdout)["analysis"]
+
+        result = api.analyze(150000, 900)
+
+        assert result.verdict == analysis["verdict"]
+        assert result.break_even_rent == pytest.approx(analysis["break_even_rent"], abs=0.01)
+
+    def test_invalid_input(self):
+        """Out-of-range inputs raise ValueError."""
+        with pytest.raises(ValueError):
+            api.analyze(-1, 900)
+
+    def test_batch(self, default_profile):
+        """analyze_batch agrees with single analyses."""
+        batch = api.analyze_batch([100000, 500000], [900, 2000], profile=default_profile)
+
+        assert isinstance(batch.break_even_rent, np.ndarray)
+        assert batch.verdicts[0].value == api.analyze(100000, 900).verdict
+        assert batch.verdicts[1].value == api.analyze(500000, 2000).verdict
+
+
+class TestMatrixAndAmortize:
+    """Tests for matrix and amortize."""
+
+    def test_matrix_matches_engine(self, default_profile):
+        """matrix returns the engine's arrays."""
+        result = api.matrix([100000, 150000], [0.1, 0.2, 0.3], profile=default_profile)
+        expected = MatrixEngine(default_profile).evaluate([100000, 150000], [0.1, 0.2, 0.3])
+
+        np.testing.assert_allclose(result.break_even_rent, expected.break_even_rent)
+        assert result.break_even_rent.shape == (3, 2)
+
+    def test_amortize(self):
+        """amortize returns the loan and a schedule limited to the requested years."""
+        result = api.amortize(150000, years=3)
+
+        assert result.loan_amount == 120000
+        assert list(result.schedule.years) == [1, 2, 3]
+        # Same payment as analyze, which uses the compiled annuity factor
+        analysis = api.analyze(150000, 1000)
+        assert result.monthly_payment == pytest.approx(
+            analysis.mortgage_payment, rel=1e-12
+        )
+
+
+class TestSolvers:
+    """Tests for the goal-seek functions."""
+
+    def test_max_price_matches_solver(self, default_profile):
+        """max_price defaults the down payment to the profile's."""
+        prices, _ = api.max_price(1000, profile=default_profile)
+        expected, _ = GoalSolver(default_profile).max_price(
+            1000, default_profile.mortgage.default_down_payment, Verdict.GREEN
+        )
+
+        np.testing.assert_allclose(prices, expected)
+
+    def test_rent_for_return_round_trips(self):
+        """The rent for a return gives that return when analyzed."""
+        rent = float(api.rent_for_return(150000, 0.05))
+
+        assert api.analyze(150000, rent).cash_on_cash_return == pytest.approx(0.05)
+
+    def test_min_down_and_max_rate(self):
+        """The other solvers return arrays."""
+        min_down, _ = api.min_down_payment(150000, 1000, verdict="yellow")
+        rate = api.max_interest_rate(150000, 1100)
+
+        assert 0 <= float(min_down) <= 1
+        assert float(rate) > 0
+
+    def test_unknown_verdict(self):
+        """Only green and yellow can be solved for."""
+        with pytest.raises(ValueError, match="Cannot solve for verdict"):
+            api.max_price(1000, verdict="red")
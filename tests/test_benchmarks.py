@@ -0,0 +1,80 @@
+"""Tests for the benchmark harness."""
+
+import pytest
+
+from benchmarks import suite  # noqa: F401  (registers the benchmarks)
+from benchmarks.harness import (
+    compare,
+    load_results,
+    registered,
+    run_suite,
+    save_results,
+)
+
+
+def _document(results: dict[str, float]) -> dict:
+    """Build a minimal results document from median timings."""
+    return {
+        "format": 1,
+        "results": {
+            name: {"min": median, "median": median, "mean": median}
+            for name, median in results.items()
+        },
+    }
+
+
+class TestCompare:
+    """Tests for baseline comparison."""
+
+    def test_statuses(self):
+        """Changes beyond the threshold are flagged in both directions."""
+        baseline = _document({"slower": 1.0, "faster": 1.0, "same": 1.0, "gone": 1.0})
+        current = _document({"slower": 1.25, "faster": 0.5, "same": 1.05, "added": 1.0})
+
+        statuses = {c.name: c.status for c in compare(baseline, current, threshold=0.10)}
+
+        assert statuses == {
+            "slower": "regression",
+            "faster": "improvement",
+            "same": "ok",
+            "gone": "missing",
+            "added": "new",
+        }
+
+    def test_threshold_is_configurable(self):
+        """A looser threshold tolerates larger slowdowns."""
+        baseline = _document({"bench": 1.0})
+        current = _document({"bench": 1.25})
+
+        assert compare(baseline, current, threshold=0.30)[0].status == "ok"
+
+
+class TestSuite:
+    """Tests for the benchmark suite."""
+
+    def test_covers_every_formatter(self):
+        """Each formatter has analysis and matrix benchmarks."""
+        names = {bench.name for bench in registered("format.")}
+
+        for formatter in ("table", "json", "csv", "summary"):
+            assert f"format.analysis[{formatter}]" in names
+            assert f"format.matrix[{formatter}]" in names
+
+    def test_run_and_round_trip(self, tmp_path):
+        """Results are written and read back as JSON."""
+        document = run_suite("amortize.generate_arrays[10]", repeat=1, min_time=0.0)
+        path = tmp_path / "baseline.json"
+
+        save_results(document, path)
+        loaded = load_results(path)
+
+        assert set(loaded["results"]) == {"amortize.generate_arrays[10]"}
+        assert loaded["results"]["amortize.generate_arrays[10]"]["median"] > 0
+
+    def test_rejects_unknown_file(self, tmp_path):
+        """Loading a file that is not a results document fails clearly."""
+        path = tmp_path / "other.json"
+        path.write_text('{"format": 99}')
+
+        with pytest.raises(ValueError, match="not a benchmark results file"):
+            load_results(path)
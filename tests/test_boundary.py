@@ -0,0 +1,104 @@
+"""Unit tests for the adaptive verdict boundary search."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.boundary import find_boundaries
+from mortgage_cli.core.compiled import VERDICT_CODES
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.results import Verdict
+
+PRICE_RANGE = (50_000, 500_000)
+DOWN_RANGE = (0.0, 0.9)
+
+
+def search_points(search) -> set[tuple[int, int, float, float]]:
+    """Every boundary point as (from code, to code, down, price)."""
+    return {
+        (VERDICT_CODES[curve.from_verdict], VERDICT_CODES[curve.to_verdict], down, price)
+        for curve in search.curves
+        for down, price in zip(curve.down_payments.tolist(), curve.prices.tolist())
+    }
+
+
+def dense_points(profile: Profile, search) -> set[tuple[int, int, float, float]]:
+    """Verdict changes along each row of a dense matrix on the same lattice."""
+    columns = round((PRICE_RANGE[1] - PRICE_RANGE[0]) / search.price_step)
+    rows = round((DOWN_RANGE[1] - DOWN_RANGE[0]) / search.down_step)
+    prices = PRICE_RANGE[0] + np.arange(columns + 1) * search.price_step
+    downs = DOWN_RANGE[0] + np.arange(rows + 1) * search.down_step
+    codes = MatrixEngine(profile).evaluate(prices, downs).verdict_codes
+
+    changed_rows, changed_columns = np.nonzero(codes[:, 1:] != codes[:, :-1])
+    return {
+        (
+            int(codes[row, column]),
+            int(codes[row, column + 1]),
+            round(float(downs[row]), 10),
+            round(float(prices[column] + search.price_step / 2), 6),
+        )
+        for row, column in zip(changed_rows, changed_columns)
+    }
+
+
+class TestFindBoundaries:
+    """Tests for find_boundaries."""
+
+    @pytest.mark.parametrize(
+        ("price_resolution", "down_resolution"),
+        [(20_000, 0.05), (1_000, 0.01), (250, 0.002)],
+    )
+    def test_matches_dense_matrix(
+        self, default_profile: Profile, price_resolution: float, down_resolution: float
+    ):
+        """Boundaries equal the verdict changes of the dense grid."""
+        search = find_boundaries(
+            default_profile, *PRICE_RANGE, price_resolution, *DOWN_RANGE, down_resolution
+        )
+
+        assert search_points(search) == dense_points(default_profile, search)
+
+    def test_evaluates_fewer_points(self, default_profile: Profile):
+        """At fine resolution only a small share of the grid is evaluated."""
+        search = find_boundaries(default_profile, *PRICE_RANGE, 250, *DOWN_RANGE, 0.002)
+
+        assert search.evaluations < search.grid_points / 20
+
+    def test_all_transitions_found(self, default_profile: Profile):
+        """The default profile crosses every verdict over this range."""
+        search = find_boundaries(default_profile, *PRICE_RANGE, 1_000, *DOWN_RANGE, 0.01)
+
+        transitions = {(curve.from_verdict, curve.to_verdict) for curve in search.curves}
+        assert (Verdict.GREEN, Verdict.YELLOW) in transitions
+        assert (Verdict.YELLOW, Verdict.RED) in transitions
+        assert (Verdict.RED, Verdict.OVER_BUDGET) in transitions
+
+    def test_points_ordered_by_down_payment(self, default_profile: Profile):
+        """Each curve lists its points in down payment order."""
+        search = find_boundaries(default_profile, *PRICE_RANGE, 1_000, *DOWN_RANGE, 0.01)
+
+        for curve in search.curves:
+            assert np.all(np.diff(curve.down_payments) > 0)
+
+    def test_single_down_payment(self, default_profile: Profile):
+        """A single row is searched along price only."""
+        search = find_boundaries(default_profile, *PRICE_RANGE, 1_000, 0.2, 0.2, 0.05)
+
+        assert search.down_step == 0.0
+        assert [len(curve.prices) for curve in search.curves] == [1] * len(search.curves)
+        green_yellow = search.curves[0]
+        assert green_yellow.from_verdict == Verdict.GREEN
+        assert 100_000 < green_yellow.prices[0] < 120_000
+
+    def test_step_fits_range(self, default_profile: Profile):
+        """Steps divide the range evenly and never exceed the resolution."""
+        search = find_boundaries(default_profile, 50_000, 400_000, 20_000, 0.0, 0.9, 0.3)
+
+        assert search.price_step == pytest.approx(350_000 / 18)
+        assert search.down_step == pytest.approx(0.3)
+
+    def test_invalid_resolution(self, default_profile: Profile):
+        """Resolutions must be positive."""
+        with pytest.raises(ValueError, match="Resolutions must be positive"):
+            find_boundaries(default_profile, *PRICE_RANGE, 0, *DOWN_RANGE, 0.01)
@@ -0,0 +1,72 @@
+"""Integration tests for amortize command."""
+
+import json
+
+from typer.testing import CliRunner
+
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+
+class TestAmortizeCommand:
+    """Tests for the amortize command."""
+
+    def test_amortize_basic(self):
+        """Basic amortize command renders a schedule table."""
+        result = runner.invoke(app, ["amortize", "--price", "150000", "--years", "3"])
+
+        assert result.exit_code == 0
+        assert "Amortization Schedule" in result.stdout
+        assert "Total Interest Paid" in result.stdout
+
+    def test_amortize_ndjson_output(self):
+        """NDJSON output has one object per schedule year."""
+        result = runner.invoke(
+            app, ["amortize", "--price", "150000", "--years", "3", "--output", "ndjson"]
+        )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [row["year"] for row in rows] == [1, 2, 3]
+        assert set(rows[0]) == {
+            "year",
+            "principal_paid",
+            "interest_paid",
+            "remaining_balance",
+            "equity_percent",
+        }
+        assert rows[0]["remaining_balance"] > rows[2]["remaining_balance"]
+
+    def test_amortize_table_rounds_to_cents(self):
+        """Table amounts are the schedule's cent-rounded values, as in NDJSON output."""
+        args = ["amortize", "--price", "150000", "--years", "6"]
+        rows = [
+            json.loads(line)
+            for line in runner.invoke(app, args + ["--output", "ndjson"]).stdout.splitlines()
+        ]
+
+        result = runner.invoke(app, args, env={"COLUMNS": "120"})
+
+        assert result.exit_code == 0
+        # 4142.502... rounds to 4142.50 first, which the table shows as €4,142
+        assert rows[4]["interest_paid"] == 4142.5
+        assert "€4,142 " in result.stdout
+        total_interest = sum(row["interest_paid"] for row in rows)
+        assert f"Total Interest Paid: €{total_interest:,.0f}" in result.stdout
+
+    def test_amortize_ndjson_without_loan(self):
+        """A fully paid purchase has no schedule lines."""
+        result = runner.invoke(
+            app, ["amortize", "--price", "150000", "--down", "100%", "--output", "ndjson"]
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+
+    def test_amortize_invalid_output_format(self):
+        """Unsupported formats are rejected."""
+        result = runner.invoke(app, ["amortize", "--price", "150000", "--output", "csv"])
+
+        assert result.exit_code == 1
+        assert "Unknown format" in result.stdout
@@ -1,6 +1,8 @@
 """Integration tests for analyze command."""
 
 import json
+import subprocess
+import sys
 
 import pytest
 from typer.testing import CliRunner
@@ -69,6 +71,47 @@ class TestAnalyzeCommand:
         assert "mortgage_payment" in data["monthly"]
         assert "fixed_costs" in data["monthly"]
 
+    def test_analyze_ndjson_output(self):
+        """NDJSON output is the JSON object on a single line."""
+        args = ["analyze", "--price", "150000", "--rent", "900", "--output"]
+        expected = json.loads(runner.invoke(app, args + ["json"]).stdout)
+
+        result = runner.invoke(app, args + ["ndjson"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == expected
+
+    def test_analyze_csv_output_not_wrapped(self):
+        """CSV output is written as-is, not wrapped to the terminal width."""
+        result = runner.invoke(
+            app, ["analyze", "--price", "150000", "--rent", "900", "--output", "csv"]
+        )
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("property_price,") and lines[0].endswith(",profile")
+        assert lines[1].endswith(",default")
+
+    def test_analyze_csv_bytes(self):
+        """CSV on stdout ends lines with a bare newline."""
+        result = subprocess.run(
+            [sys.executable, "-m", "mortgage_cli", "analyze", "-p", "150000", "-r", "900",
+             "-o", "csv"],
+            capture_output=True,
+            check=True,
+        )
+
+        assert result.stdout == (
+            b"property_price,expected_rent,down_payment_percent,break_even_rent,"
+            b"cash_on_cash_return,monthly_surplus_shortfall,verdict,within_budget,"
+            b"upfront_total,mortgage_payment,fixed_costs,profile\n"
+            b"150000.0,900.0,0.2,983.52,-0.0275,-83.52,yellow,True,36400.0,733.52,250.0,"
+            b"default\n"
+        )
+
     def test_analyze_shows_warnings(self):
         """Warnings appear when break-even exceeds rent."""
         result = runner.invoke(
@@ -0,0 +1,180 @@
+"""Integration tests for batch command."""
+
+import csv
+import json
+from io import StringIO
+
+import pytest
+
+from typer.testing import CliRunner
+
+from mortgage_cli.config.defaults import DEFAULT_PROFILE
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.main import app
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.output.csv_fmt import CsvFormatter
+
+runner = CliRunner()
+
+LISTINGS_CSV = """id,price,rent,down
+a,100000,900,
+b,150000,900,30%
+c,500000,2000,0.25
+"""
+
+
+def _analyze_csv_rows(price: float, rent: float, down: float | None = None) -> list[list[str]]:
+    """Format a single analysis with CsvFormatter and parse it back."""
+    profile = DEFAULT_PROFILE
+    result = InvestmentAnalyzer(profile).analyze(
+        PropertyInput(price=price, expected_rent=rent, down_payment_percent=down)
+    )
+    return list(csv.reader(StringIO(CsvFormatter().format_analysis(result, profile))))
+
+
+class TestBatchCommand:
+    """Tests for the batch command."""
+
+    def test_batch_csv_matches_analyze(self, tmp_path):
+        """CSV output matches analyze --output csv row for row."""
+        listings = tmp_path / "listings.csv"
+        listings.write_text(LISTINGS_CSV)
+
+        result = runner.invoke(app, ["batch", str(listings)])
+
+        assert result.exit_code == 0
+        rows = list(csv.reader(StringIO(result.stdout)))
+        assert rows[0] == _analyze_csv_rows(100000, 900)[0]
+        assert rows[1] == _analyze_csv_rows(100000, 900)[1]
+        assert rows[2] == _analyze_csv_rows(150000, 900, 0.30)[1]
+        assert rows[3] == _analyze_csv_rows(500000, 2000, 0.25)[1]
+
+    def test_batch_small_chunks(self, tmp_path):
+        """Chunk size does not change the output."""
+        listings = tmp_path / "listings.csv"
+        listings.write_text(LISTINGS_CSV)
+
+        whole = runner.invoke(app, ["batch", str(listings)])
+        chunked = runner.invoke(app, ["batch", str(listings), "--chunk-size", "1"])
+
+        assert chunked.exit_code == 0
+        assert chunked.stdout == whole.stdout
+
+    def test_batch_jsonl_input_json_output(self, tmp_path):
+        """JSONL input produces one document of analyze-style JSON objects."""
+        listings = tmp_path / "listings.jsonl"
+        listings.write_text(
+            '{"price": 150000, "rent": 900}\n'
+            '\n'
+            '{"price": 500000, "expected_rent": 2000, "down": 0.25}\n'
+        )
+
+        result = runner.invoke(app, ["batch", str(listings), "--output", "json"])
+
+        assert result.exit_code == 0
+        document = json.loads(result.stdout)
+        assert document["count"] == 2
+        expected = json.loads(
+            runner.invoke(
+                app, ["analyze", "--price", "150000", "--rent", "900", "--output", "json"]
+            ).stdout
+        )
+        assert document["results"][0] == expected
+        assert document["results"][1]["analysis"]["verdict"] == "over_budget"
+        assert document["results"][1]["warnings"]
+
+    @pytest.mark.parametrize("chunk_size", ["1", "2", "10"])
+    def test_batch_json_is_one_document(self, tmp_path, chunk_size):
+        """Chunks stream into the same indented document json.dumps writes."""
+        listings = tmp_path / "listings.csv"
+        listings.write_text(LISTINGS_CSV)
+
+        result = runner.invoke(
+            app, ["batch", str(listings), "-o", "json", "--chunk-size", chunk_size]
+        )
+
+        assert result.exit_code == 0
+        document = json.loads(result.stdout)
+        assert result.stdout == json.dumps(document, indent=2) + "\n"
+        assert document["count"] == len(document["results"]) == 3
+
+    def test_batch_json_empty(self):
+        """No listings still produce a valid document."""
+        result = runner.invoke(app, ["batch", "-o", "json"], input="price,rent\n")
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {"results": [], "count": 0}
+
+    def test_batch_ndjson_output(self, tmp_path):
+        """NDJSON output holds the same objects as json output, one per line."""
+        listings = tmp_path / "listings.csv"
+        listings.write_text(LISTINGS_CSV)
+
+        as_json = runner.invoke(app, ["batch", str(listings), "--output", "json"])
+        result = runner.invoke(app, ["batch", str(listings), "--output", "ndjson"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line) for line in lines] == json.loads(as_json.stdout)["results"]
+
+    def test_batch_reads_stdin(self):
+        """Listings are read from stdin when no file is given."""
+        result = runner.invoke(app, ["batch"], input=LISTINGS_CSV)
+
+        assert result.exit_code == 0
+        assert len(result.stdout.strip().splitlines()) == 4
+
+    def test_batch_missing_price(self):
+        """Missing required field reports the listing number."""
+        result = runner.invoke(app, ["batch"], input="price,rent\n100000,900\n,900\n")
+
+        assert result.exit_code == 1
+        assert "listing 2" in result.stdout.lower()
+
+    def test_batch_jsonl_line_not_object(self):
+        """A JSONL line that is not an object reports its line number."""
+        result = runner.invoke(
+            app, ["batch", "-f", "jsonl"], input='{"price": 100000, "rent": 900}\n42\n'
+        )
+
+        assert result.exit_code == 1
+        assert "Line 2 is not a JSON object" in result.stdout
+
+    def test_batch_undecodable_file(self, tmp_path):
+        """A file that is not UTF-8 text is reported as an error."""
+        listings = tmp_path / "listings.csv"
+        listings.write_bytes(b"price,rent\n100000,900\n\xff\xfe,900\n")
+
+        result = runner.invoke(app, ["batch", str(listings)])
+
+        assert result.exit_code == 1
+        assert "Invalid UTF-8 text" in result.stdout
+
+    def test_batch_invalid_value(self):
+        """Out-of-range values are rejected."""
+        result = runner.invoke(app, ["batch"], input="price,rent\n100000,0\n")
+
+        assert result.exit_code == 1
+        assert "expected_rent" in result.stdout
+
+    def test_batch_invalid_output_format(self):
+        """Invalid output format shows error."""
+        result = runner.invoke(app, ["batch", "--output", "table"], input=LISTINGS_CSV)
+
+        assert result.exit_code == 1
+        assert "unknown format" in result.stdout.lower()
+
+    def test_batch_workers_match_serial(self, tmp_path):
+        """Worker processes produce the same output in the same order."""
+        listings = tmp_path / "listings.csv"
+        header, rows = LISTINGS_CSV.split("\n", 1)
+        listings.write_text(header + "\n" + rows * 20)
+
+        serial = runner.invoke(app, ["batch", str(listings), "--chunk-size", "7"])
+        parallel = runner.invoke(
+            app, ["batch", str(listings), "--chunk-size", "7", "--workers", "3"]
+        )
+
+        assert parallel.exit_code == 0
+        assert parallel.stdout == serial.stdout
@@ -0,0 +1,85 @@
+"""Integration tests for cube command."""
+
+import json
+
+from typer.testing import CliRunner
+
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+BASE_ARGS = [
+    "cube",
+    "--price-min", "100000",
+    "--price-max", "140000",
+    "--price-step", "20000",
+    "--down-min", "10%",
+    "--down-max", "30%",
+    "--down-step", "10%",
+]
+
+
+class TestCubeCommand:
+    """Tests for the cube command."""
+
+    def test_cube_defaults_to_profile_terms(self, tmp_path):
+        """Without rate, term or rent ranges the profile values are used."""
+        result = runner.invoke(app, BASE_ARGS + ["--out", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Wrote 9 cells (3 x 3 x 1 x 1 x 1)" in result.stdout
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert len(manifest["axes"]["interest_rate"]) == 1
+        assert (tmp_path / "break_even_rent.npy").exists()
+
+    def test_cube_all_axes(self, tmp_path):
+        """Rate, term and rent ranges add dimensions."""
+        result = runner.invoke(
+            app,
+            BASE_ARGS
+            + [
+                "--out", str(tmp_path),
+                "--rate-min", "3%", "--rate-max", "4%", "--rate-step", "0.5%",
+                "--terms", "20,25",
+                "--rent-min", "800", "--rent-max", "1000", "--rent-step", "100",
+            ],
+        )
+
+        assert result.exit_code == 0
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["arrays"]["cash_on_cash_return"]["shape"] == [3, 3, 3, 2, 3]
+
+    def test_cube_refuses_to_overwrite(self, tmp_path):
+        """An existing cube is kept unless --force is given."""
+        args = BASE_ARGS + ["--out", str(tmp_path)]
+        assert runner.invoke(app, args).exit_code == 0
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 1
+        assert "--force" in result.stdout
+
+        assert runner.invoke(app, args + ["--force"]).exit_code == 0
+
+    def test_cube_out_is_a_file(self, tmp_path):
+        """An --out path that is a file is reported as an error."""
+        out = tmp_path / "cube"
+        out.write_text("")
+
+        result = runner.invoke(app, BASE_ARGS + ["--out", str(out)])
+
+        assert result.exit_code == 1
+        assert "Cannot write cube" in result.stdout
+
+    def test_cube_invalid_terms(self, tmp_path):
+        """Non-numeric loan terms are an error."""
+        result = runner.invoke(app, BASE_ARGS + ["--out", str(tmp_path), "--terms", "20,x"])
+
+        assert result.exit_code == 1
+        assert "Invalid loan terms" in result.stdout
+
+    def test_cube_non_positive_step(self, tmp_path):
+        """A zero step would never end the range."""
+        result = runner.invoke(app, BASE_ARGS + ["--out", str(tmp_path), "--rent-step", "0"])
+
+        assert result.exit_code == 1
+        assert "--rent-step must be positive" in result.stdout
@@ -96,3 +96,140 @@ class TestMatrixCommand:
 
         assert result.exit_code == 0
         assert "Legend" in result.stdout or "GREEN" in result.stdout
+
+    def test_matrix_workers(self):
+        """Matrix output is unchanged when evaluated by worker processes."""
+        args = [
+            "matrix",
+            "--price-min", "100000",
+            "--price-max", "200000",
+            "--output", "json",
+        ]
+        serial = runner.invoke(app, args)
+        parallel = runner.invoke(app, args + ["--workers", "2"])
+
+        assert parallel.exit_code == 0
+        assert json.loads(parallel.stdout) == json.loads(serial.stdout)
+
+    def test_matrix_json_columns_layout(self):
+        """The columns layout holds each value field as one list per down payment."""
+        args = [
+            "matrix",
+            "--price-min", "100000",
+            "--price-max", "140000",
+            "--down-min", "10%",
+            "--down-max", "20%",
+            "--output", "json",
+            "--compact",
+        ]
+        cells_output = runner.invoke(app, args).stdout
+        cells = json.loads(cells_output)["matrix"]["cells"]
+
+        result = runner.invoke(app, args + ["--json-layout", "columns"])
+
+        assert result.exit_code == 0
+        matrix = json.loads(result.stdout)["matrix"]
+        columns = matrix["columns"]
+        assert set(columns) == {"break_even_rent", "verdict", "within_budget"}
+        prices, down_payments = matrix["prices"], matrix["down_payments"]
+        for field, rows in columns.items():
+            assert len(rows) == len(down_payments) == 3
+            assert [len(row) for row in rows] == [len(prices)] * 3
+            assert [value for row in rows for value in row] == [cell[field] for cell in cells]
+        # The axes appear once, in the envelope, instead of once per cell
+        assert [cell["price"] for cell in cells[:3]] == prices
+        assert len(result.stdout) < len(cells_output) * 0.4
+
+    def test_matrix_json_compact(self):
+        """Compact JSON is a single line with the same content."""
+        args = ["matrix", "--price-min", "100000", "--price-max", "140000", "--output", "json"]
+        indented = runner.invoke(app, args)
+
+        result = runner.invoke(app, args + ["--compact"])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("\n") == 1
+        assert len(result.stdout) < len(indented.stdout)
+        assert json.loads(result.stdout) == json.loads(indented.stdout)
+
+    def test_matrix_ndjson_output(self):
+        """NDJSON output has one line per cell, matching the JSON cells."""
+        args = [
+            "matrix",
+            "--price-min", "100000",
+            "--price-max", "140000",
+            "--down-min", "10%",
+            "--down-max", "20%",
+            "--output",
+        ]
+        cells = json.loads(runner.invoke(app, args + ["json"]).stdout)["matrix"]["cells"]
+
+        result = runner.invoke(app, args + ["ndjson"])
+
+        assert result.exit_code == 0
+        assert [json.loads(line) for line in result.stdout.splitlines()] == cells
+
+    def test_matrix_csv_line_endings(self):
+        """CSV rows end with a bare newline."""
+        result = runner.invoke(
+            app, ["matrix", "--price-min", "100000", "--price-max", "120000", "-o", "csv"]
+        )
+
+        assert result.exit_code == 0
+        assert b"\r" not in result.stdout_bytes
+        assert result.stdout_bytes.startswith(
+            b"price,down_payment_percent,break_even_rent,verdict,within_budget\n"
+        )
+
+    def test_matrix_unknown_json_layout(self):
+        """An unknown JSON layout is an error."""
+        result = runner.invoke(
+            app,
+            ["matrix", "--price-min", "100000", "--price-max", "120000", "--json-layout", "rows"],
+        )
+
+        assert result.exit_code == 1
+        assert "Unknown JSON layout" in result.stdout
+
+
+class TestMatrixAdaptive:
+    """Tests for matrix --adaptive."""
+
+    ARGS = [
+        "matrix",
+        "--price-min", "50000",
+        "--price-max", "400000",
+        "--price-step", "1000",
+        "--down-min", "0%",
+        "--down-max", "90%",
+        "--down-step", "10%",
+        "--adaptive",
+    ]
+
+    def test_adaptive_json(self):
+        """JSON output lists boundary curves and evaluation counts."""
+        result = runner.invoke(app, self.ARGS + ["-o", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        first = data["boundaries"][0]
+        assert (first["from"], first["to"]) == ("green", "yellow")
+        assert len(first["price"]) == len(first["down_payment_percent"])
+        assert data["evaluations"] < data["grid_points"]
+        assert data["resolution"]["price"] == 1000
+
+    def test_adaptive_csv(self):
+        """CSV output has one row per boundary point."""
+        result = runner.invoke(app, self.ARGS + ["-o", "csv"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "from,to,down_payment_percent,price"
+        assert lines[1] == "green,yellow,0.0,89500.0"
+
+    def test_adaptive_rejects_table(self):
+        """Boundaries are only written as json or csv."""
+        result = runner.invoke(app, self.ARGS)
+
+        assert result.exit_code == 1
+        assert "--adaptive supports json and csv" in result.stdout
@@ -135,3 +135,23 @@ class TestProfileCompareCommand:
         assert "comparison" in data
         assert len(data["comparison"]) == 1
         assert data["comparison"][0]["profile"] == "default"
+
+    def test_profile_compare_ndjson(self):
+        """Profile compare NDJSON has one self-contained line per profile."""
+        result = runner.invoke(
+            app,
+            [
+                "profile", "compare",
+                "--price", "150000",
+                "--rent", "900",
+                "--profiles", "default,default",
+                "--output", "ndjson",
+            ],
+        )
+
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert len(lines) == 2
+        assert lines[0]["profile"] == "default"
+        assert lines[0]["price"] == 150000.0
+        assert lines[0]["expected_rent"] == 900.0
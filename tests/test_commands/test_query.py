@@ -0,0 +1,138 @@
+"""Integration tests for --store and the query command."""
+
+import csv
+import json
+from io import StringIO
+
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+MATRIX_ARGS = ["matrix", "--price-min", "100000", "--price-max", "300000", "-o", "csv"]
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Results store path in a temporary directory."""
+    return str(tmp_path / "results.db")
+
+
+class TestStoreOption:
+    """Tests for --store on analyze, matrix and batch."""
+
+    def test_matrix_stores_every_cell(self, db):
+        """Every matrix cell becomes a stored result."""
+        result = runner.invoke(app, [*MATRIX_ARGS, "--store", "--db", db])
+        assert result.exit_code == 0
+
+        listed = runner.invoke(app, ["query", "--runs", "--db", db, "-o", "json"])
+        [run] = json.loads(listed.stdout)["runs"]
+        assert run["command"] == "matrix"
+        assert run["results"] == 11 * 9
+
+    def test_analyze_stores_result(self, db):
+        """analyze --store saves the analysis shown."""
+        shown = runner.invoke(
+            app, ["analyze", "-p", "150000", "-r", "900", "-o", "json", "--store", "--db", db]
+        )
+
+        queried = runner.invoke(app, ["query", "--db", db, "-o", "json"])
+        [row] = json.loads(queried.stdout)["results"]
+        analysis = json.loads(shown.stdout)["analysis"]
+        assert row["verdict"] == analysis["verdict"]
+        assert row["break_even_rent"] == pytest.approx(analysis["break_even_rent"], abs=0.01)
+
+    def test_batch_stores_all_listings(self, db):
+        """batch --store saves one result per listing."""
+        result = runner.invoke(
+            app,
+            ["batch", "--store", "--db", db],
+            input="price,rent\n100000,900\n150000,900\n500000,2000\n",
+        )
+        assert result.exit_code == 0
+
+        queried = runner.invoke(app, ["query", "--db", db, "-o", "ndjson"])
+        prices = [json.loads(line)["property_price"] for line in queried.stdout.splitlines()]
+        assert prices == [100000, 150000, 500000]
+
+    def test_failed_batch_stores_nothing(self, db):
+        """A batch that fails part way leaves no partial run behind."""
+        result = runner.invoke(
+            app,
+            ["batch", "--store", "--db", db, "--chunk-size", "1"],
+            input="price,rent\n100000,900\nabc,900\n",
+        )
+        assert result.exit_code == 1
+
+        listed = runner.invoke(app, ["query", "--runs", "--db", db, "-o", "json"])
+        assert json.loads(listed.stdout)["runs"] == []
+
+    def test_store_rejected_with_adaptive(self, db):
+        """Boundary searches have no cells to store."""
+        result = runner.invoke(app, [*MATRIX_ARGS, "--adaptive", "--store", "--db", db])
+
+        assert result.exit_code == 1
+        assert "--adaptive" in result.stdout
+
+
+class TestQueryCommand:
+    """Tests for the query command."""
+
+    @pytest.fixture(autouse=True)
+    def stored_matrix(self, db):
+        """Store a matrix to query."""
+        runner.invoke(app, [*MATRIX_ARGS, "--rent", "1100", "--store", "--db", db])
+
+    def test_filters(self, db):
+        """Verdict, price and return filters select matching results only."""
+        result = runner.invoke(
+            app,
+            [
+                "query", "--db", db,
+                "--verdict", "green", "--max-price", "180000", "--min-return", "4%",
+                "-o", "csv",
+            ],
+        )
+
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(StringIO(result.stdout)))
+        assert rows
+        for row in rows:
+            assert row["verdict"] == "green"
+            assert float(row["property_price"]) <= 180000
+            assert float(row["cash_on_cash_return"]) >= 0.04
+
+    def test_sort_and_limit(self, db):
+        """--sort return lists the best returns first."""
+        result = runner.invoke(
+            app, ["query", "--db", db, "--sort", "return", "-n", "3", "-o", "json"]
+        )
+
+        returns = [row["cash_on_cash_return"] for row in json.loads(result.stdout)["results"]]
+        assert len(returns) == 3
+        assert returns == sorted(returns, reverse=True)
+
+    def test_table(self, db):
+        """Table output shows stored results."""
+        result = runner.invoke(app, ["query", "--db", db, "--verdict", "green", "-n", "2"])
+
+        assert result.exit_code == 0
+        assert "Stored Results (2)" in result.stdout
+        assert "GOOD" in result.stdout
+
+    def test_unknown_verdict(self, db):
+        """Unknown verdicts are rejected."""
+        result = runner.invoke(app, ["query", "--db", db, "--verdict", "purple"])
+
+        assert result.exit_code == 1
+        assert "Unknown verdict" in result.stdout
+
+    def test_missing_store(self, tmp_path):
+        """Querying before anything was stored is an error."""
+        result = runner.invoke(app, ["query", "--db", str(tmp_path / "none.db")])
+
+        assert result.exit_code == 1
+        assert "No results store" in result.stdout
@@ -0,0 +1,82 @@
+"""Integration tests for simulate command."""
+
+import json
+
+import pytest
+
+from typer.testing import CliRunner
+
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+DISTRIBUTIONS_YAML = """simulation:
+  interest_rate:
+    type: normal
+    mean: 0.04
+    std: 0.01
+    min: 0
+  rent:
+    type: uniform
+    low: 850
+    high: 1050
+"""
+
+
+class TestSimulateCommand:
+    """Tests for the simulate command."""
+
+    def test_simulate_table(self, tmp_path):
+        """Table output shows percentiles and verdict probabilities."""
+        spec = tmp_path / "stress.yaml"
+        spec.write_text(DISTRIBUTIONS_YAML)
+
+        result = runner.invoke(
+            app,
+            ["simulate", "-p", "150000", "-r", "950", "-D", str(spec), "--draws", "2000"],
+        )
+
+        assert result.exit_code == 0
+        assert "Break-Even Rent" in result.stdout
+        assert "P95" in result.stdout
+        assert "Probability of a monthly shortfall" in result.stdout
+
+    def test_simulate_json_reproducible(self, tmp_path):
+        """JSON output is identical for the same seed."""
+        spec = tmp_path / "stress.yaml"
+        spec.write_text(DISTRIBUTIONS_YAML)
+        args = [
+            "simulate", "-p", "150000", "-r", "950", "-D", str(spec),
+            "--draws", "2000", "--seed", "7", "-o", "json",
+        ]
+
+        first = runner.invoke(app, args)
+        second = runner.invoke(app, args)
+
+        assert first.exit_code == 0
+        assert first.stdout == second.stdout
+        data = json.loads(first.stdout)
+        assert data["simulation"]["draws"] == 2000
+        assert data["simulation"]["seed"] == 7
+        assert sum(data["verdict_probabilities"].values()) == pytest.approx(1.0, abs=1e-3)
+        assert set(data["percentiles"]["break_even_rent"]) == {"p5", "p25", "p50", "p75", "p95"}
+
+    def test_simulate_invalid_distribution(self, tmp_path):
+        """Invalid distributions are reported with their location."""
+        spec = tmp_path / "stress.yaml"
+        spec.write_text("rent:\n  type: uniform\n  low: 900\n")
+
+        result = runner.invoke(app, ["simulate", "-p", "150000", "-r", "950", "-D", str(spec)])
+
+        assert result.exit_code == 1
+        assert "rent" in result.stdout
+        assert "requires: high" in result.stdout
+
+    def test_simulate_missing_file(self, tmp_path):
+        """Missing distributions file is an error."""
+        result = runner.invoke(
+            app, ["simulate", "-p", "150000", "-r", "950", "-D", str(tmp_path / "missing.yaml")]
+        )
+
+        assert result.exit_code == 1
+        assert "Cannot read" in result.stdout
@@ -0,0 +1,96 @@
+"""Integration tests for solve command."""
+
+import json
+
+from typer.testing import CliRunner
+
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+
+class TestSolveCommand:
+    """Tests for the solve command."""
+
+    def test_max_price_table(self):
+        """Table output shows the price limit and what sets it."""
+        result = runner.invoke(app, ["solve", "max-price", "--rent", "950", "--down", "20%"])
+
+        assert result.exit_code == 0
+        assert "Max Price" in result.stdout
+        assert "€104,292" in result.stdout
+        assert "rent" in result.stdout
+
+    def test_options_are_combined(self):
+        """Every price is solved with every down payment."""
+        result = runner.invoke(
+            app,
+            [
+                "solve", "max-rate",
+                "-p", "100000", "-p", "120000",
+                "-d", "20%", "-d", "30%", "-d", "40%",
+                "-o", "ndjson",
+            ],
+        )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert len(rows) == 6
+        assert [(row["price"], row["down_payment_percent"]) for row in rows[:2]] == [
+            (100000, 0.2),
+            (100000, 0.3),
+        ]
+
+    def test_rent_json(self):
+        """JSON output lists one result per target return."""
+        result = runner.invoke(
+            app, ["solve", "rent", "-p", "165000", "--return", "5%", "--return", "8%", "-o", "json"]
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["goal"] == "rent"
+        assert [row["rent"] for row in data["results"]] == [1223.53, 1323.53]
+
+    def test_unsolvable_is_null(self):
+        """Targets without a solution are reported as null/empty."""
+        result = runner.invoke(app, ["solve", "min-down", "-p", "300000", "-o", "csv"])
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines()[1].startswith("300000.0,1000.0,,")
+
+    def test_input_file(self, tmp_path):
+        """Targets are read from a CSV file, with profile defaults for missing columns."""
+        targets = tmp_path / "targets.csv"
+        targets.write_text("price,rent\n100000,1000\n150000,\n")
+
+        result = runner.invoke(app, ["solve", "max-rate", "-i", str(targets), "-o", "csv"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "price,target_rent,down_payment_percent,max_interest_rate"
+        assert lines[2].startswith("150000.0,1000.0,0.2,")
+
+    def test_input_file_missing_price(self, tmp_path):
+        """Goals that need a price reject rows without one."""
+        targets = tmp_path / "targets.jsonl"
+        targets.write_text('{"rent": 900}\n')
+
+        result = runner.invoke(app, ["solve", "min-down", "-i", str(targets)])
+
+        assert result.exit_code == 1
+        assert "Row 1: missing 'price'" in result.stdout
+
+    def test_price_required(self):
+        """Goals that need a price fail without one."""
+        result = runner.invoke(app, ["solve", "max-rate"])
+
+        assert result.exit_code == 1
+        assert "--price is required" in result.stdout
+
+    def test_unknown_goal(self):
+        """Unknown goals are rejected."""
+        result = runner.invoke(app, ["solve", "min-price"])
+
+        assert result.exit_code == 1
+        assert "Unknown goal 'min-price'" in result.stdout
@@ -0,0 +1,127 @@
+"""Unit tests for CompiledProfile."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.calculator import MortgageCalculator
+from mortgage_cli.core.compiled import VERDICTS, CompiledProfile, annuity_factor
+from mortgage_cli.models.profile import CostItem, Profile
+from mortgage_cli.models.results import Verdict
+
+
+class TestAnnuityFactor:
+    """Tests for the precomputed payment factor."""
+
+    @pytest.mark.parametrize("rate", [0.001, 0.02, 0.041, 0.08, 0.25])
+    @pytest.mark.parametrize("years", [1, 15, 20, 30, 50])
+    def test_matches_pmt(self, rate: float, years: int):
+        """Factor times principal equals the PMT formula."""
+        expected = MortgageCalculator.calculate_monthly_payment(100000, rate, years)
+
+        assert 100000 * annuity_factor(rate, years) == pytest.approx(expected, rel=1e-9)
+
+    def test_zero_rate(self):
+        """Zero rate spreads the principal evenly."""
+        assert annuity_factor(0.0, 20) == pytest.approx(1 / 240)
+
+
+class TestCompiledProfile:
+    """Tests for compiled profile constants and formulas."""
+
+    def test_purchase_costs_are_linear(self, default_profile: Profile):
+        """Percentage items fold into the rate, fixed items into the constant."""
+        compiled = CompiledProfile.from_profile(default_profile)
+
+        assert compiled.purchase_rate == pytest.approx(0.04)
+        assert compiled.purchase_fixed == pytest.approx(400)
+        for price in (0, 50000, 165000):
+            assert compiled.upfront_total(price, 0.2) == pytest.approx(
+                price * 0.2 + default_profile.purchase_costs.calculate_total(price)
+            )
+
+    def test_upfront_items_match_cost_items(self, default_profile: Profile):
+        """Each line item matches CostItem.calculate."""
+        profile = default_profile.model_copy(deep=True)
+        profile.purchase_costs.mortgage_broker = CostItem(type="percentage", value=0.005)
+        compiled = CompiledProfile.from_profile(profile)
+
+        items = compiled.upfront_items(165000, 0.2)
+
+        assert items["down_payment"] == pytest.approx(33000)
+        for name in ("notary_legal", "bank_arrangement", "survey_valuation", "mortgage_broker", "other"):
+            expected = getattr(profile.purchase_costs, name).calculate(165000)
+            assert items[name] == pytest.approx(expected)
+
+    def test_scalar_and_vector_agree(self, default_profile: Profile):
+        """Scalar and array methods give identical results."""
+        compiled = CompiledProfile.from_profile(default_profile)
+        loans = np.array([-1.0, 0.0, 50000.0, 132000.0, 400000.0])
+        within_budget = np.array([True, True, True, False, True])
+
+        payments = compiled.monthly_payments(loans)
+        break_even = payments + compiled.fixed_monthly
+        codes = compiled.verdict_codes(break_even, within_budget)
+
+        for i, loan in enumerate(loans.tolist()):
+            assert payments[i] == compiled.monthly_payment(loan)
+            assert VERDICTS[codes[i]] == compiled.verdict(float(break_even[i]), bool(within_budget[i]))
+
+    def test_verdict_without_target_rent(self, default_profile: Profile):
+        """A zero target rent is always RED when within budget."""
+        profile = default_profile.model_copy(deep=True)
+        profile.budget.target_rent = 0
+        compiled = CompiledProfile.from_profile(profile)
+
+        assert compiled.verdict(100, True) == Verdict.RED
+        assert compiled.verdict(100, False) == Verdict.OVER_BUDGET
+        assert VERDICTS[compiled.verdict_codes(np.array([100.0]), np.array([True]))[0]] == Verdict.RED
+
+
+class TestClassify:
+    """Tests for the vectorized verdict classifier."""
+
+    def test_codes_are_compact(self, default_profile: Profile):
+        """Verdict codes come back as uint8 with budget flags alongside."""
+        compiled = CompiledProfile.from_profile(default_profile)
+        budget = compiled.budget
+        break_even = np.array([[500.0, 900.0], [1500.0, 500.0]])
+        upfront = np.array([[budget, budget + 1], [0.0, budget]])
+
+        codes, within_budget = compiled.classify(break_even, upfront)
+
+        assert codes.dtype == np.uint8
+        assert within_budget.tolist() == [[True, False], [True, True]]
+        assert [[VERDICTS[c] for c in row] for row in codes.tolist()] == [
+            [Verdict.GREEN, Verdict.OVER_BUDGET],
+            [Verdict.RED, Verdict.GREEN],
+        ]
+
+    def test_broadcasts_upfront(self, default_profile: Profile):
+        """A single upfront total applies to every break-even rent."""
+        compiled = CompiledProfile.from_profile(default_profile)
+        break_even = np.array([500.0, 900.0, 1500.0])
+
+        codes, within_budget = compiled.classify(break_even, compiled.budget + 1)
+
+        assert within_budget.shape == break_even.shape
+        assert not within_budget.any()
+        assert set(codes.tolist()) == {VERDICTS.index(Verdict.OVER_BUDGET)}
+
+    def test_nan_is_red(self, default_profile: Profile):
+        """A NaN break-even rent never passes a threshold."""
+        compiled = CompiledProfile.from_profile(default_profile)
+
+        assert compiled.verdict(float("nan"), True) == Verdict.RED
+
+    def test_inverted_thresholds_skip_yellow(self, default_profile: Profile):
+        """A yellow threshold below the green one leaves no yellow band."""
+        profile = default_profile.model_copy(deep=True)
+        profile.thresholds.green_below = 1.0
+        profile.thresholds.yellow_below = 0.8
+        compiled = CompiledProfile.from_profile(profile)
+        target = profile.budget.target_rent
+
+        break_even = np.array([0.7, 0.9, 1.1]) * target
+        codes = compiled.verdict_codes(break_even, True)
+
+        assert [VERDICTS[c] for c in codes.tolist()] == [Verdict.GREEN, Verdict.GREEN, Verdict.RED]
@@ -1,5 +1,7 @@
 """Tests for configuration management."""
 
+import json
+
 import pytest
 
 from mortgage_cli.config.defaults import DEFAULT_PROFILE
@@ -13,9 +15,8 @@ from mortgage_cli.models.profile import Profile
 
 @pytest.fixture
 def config_manager(tmp_path):
-    """Create a ConfigManager with a temporary profiles directory."""
-    profiles_dir = tmp_path / "profiles"
-    return ConfigManager(profiles_dir=profiles_dir)
+    """Create a ConfigManager with temporary profiles and cache directories."""
+    return ConfigManager(profiles_dir=tmp_path / "profiles", cache_dir=tmp_path / "cache")
 
 
 class TestLoadProfile:
@@ -191,3 +192,126 @@ class TestCreateProfile:
 
         with pytest.raises(ProfileExistsError):
             config_manager.create_profile("existing")
+
+
+class TestProfileCache:
+    """Tests for the parsed-profile cache."""
+
+    def _fail_yaml(self, monkeypatch):
+        """Make any YAML parse fail the test."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite a fresh cache entry")
+
+        monkeypatch.setattr("mortgage_cli.config.manager.yaml.safe_load", fail)
+
+    def test_cache_hit_skips_yaml(self, tmp_path, monkeypatch):
+        """A second manager loads the profile from the cache."""
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        saved = DEFAULT_PROFILE.model_copy(update={"name": "cached", "description": "From cache"})
+        ConfigManager(profiles_dir, cache_dir).save_profile(saved)
+        ConfigManager(profiles_dir, cache_dir).load_profile("cached")
+
+        self._fail_yaml(monkeypatch)
+        profile = ConfigManager(profiles_dir, cache_dir).load_profile("cached")
+
+        assert profile == saved
+        assert (tmp_path / "cache" / "profiles.json").exists()
+
+    def test_list_profiles_populates_cache(self, tmp_path, monkeypatch):
+        """Listing caches every valid profile."""
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        manager = ConfigManager(profiles_dir, cache_dir)
+        manager.create_profile("first", description="First")
+        manager.create_profile("second", description="Second")
+        manager.list_profiles()
+
+        self._fail_yaml(monkeypatch)
+        profiles = ConfigManager(profiles_dir, cache_dir).list_profiles()
+
+        assert ("first", "First") in profiles
+        assert ("second", "Second") in profiles
+
+    def test_modified_file_invalidates(self, config_manager: ConfigManager):
+        """Editing a profile file is picked up on the next load."""
+        config_manager.create_profile("edited", description="Before")
+        config_manager.load_profile("edited")
+
+        path = config_manager._get_profile_path("edited")
+        path.write_text(path.read_text().replace("Before", "After, longer"))
+
+        assert config_manager.load_profile("edited").description == "After, longer"
+
+    def test_default_cache_stays_in_config_dir(self, tmp_path, monkeypatch):
+        """A custom profiles directory does not move the cache next to it."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+        profiles_dir = tmp_path / "custom" / "profiles"
+        manager = ConfigManager(profiles_dir=profiles_dir)
+        manager.create_profile("fresh")
+        manager.load_profile("fresh")
+
+        assert (tmp_path / "config" / "mortgage-cli" / "cache" / "profiles.json").exists()
+        assert not (tmp_path / "custom" / "cache").exists()
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """An unreadable cache file falls back to YAML."""
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        ConfigManager(profiles_dir, cache_dir).create_profile("fresh")
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "profiles.json").write_text("{not json")
+
+        profile = ConfigManager(profiles_dir, cache_dir).load_profile("fresh")
+
+        assert profile.name == "fresh"
+
+    @pytest.mark.parametrize("field", ["mtime_ns", "size", "profile", "thresholds"])
+    def test_partial_cache_entry_is_ignored(self, tmp_path, field):
+        """A cache entry with missing fields is a miss, not an error."""
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        manager = ConfigManager(profiles_dir, cache_dir)
+        manager.create_profile("fresh", description="Fresh")
+        manager.load_profile("fresh")
+
+        cache_file = cache_dir / "profiles.json"
+        payload = json.loads(cache_file.read_text())
+        (entry,) = payload["entries"].values()
+        if field == "thresholds":
+            del entry["profile"][field]
+        else:
+            del entry[field]
+        cache_file.write_text(json.dumps(payload))
+
+        profile = ConfigManager(profiles_dir, cache_dir).load_profile("fresh")
+
+        assert profile.description == "Fresh"
+
+    def test_truncated_cache_entries_are_ignored(self, tmp_path):
+        """Entries that are not objects fall back to YAML."""
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        manager = ConfigManager(profiles_dir, cache_dir)
+        manager.create_profile("fresh")
+        manager.load_profile("fresh")
+
+        cache_file = cache_dir / "profiles.json"
+        payload = json.loads(cache_file.read_text())
+        payload["entries"] = {key: None for key in payload["entries"]}
+        cache_file.write_text(json.dumps(payload))
+
+        assert ConfigManager(profiles_dir, cache_dir).load_profile("fresh").name == "fresh"
+
+    def test_invalid_profile_not_cached(self, config_manager: ConfigManager):
+        """Profiles that fail validation are not cached."""
+        config_manager.ensure_directories()
+        config_manager._get_profile_path("broken").write_text("name: broken\n")
+
+        with pytest.raises(Exception):
+            config_manager.load_profile("broken")
+        assert config_manager.cache.get(
+            config_manager._get_profile_path("broken"),
+            config_manager._get_profile_path("broken").stat(),
+        ) is None
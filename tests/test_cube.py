@@ -0,0 +1,123 @@
+"""Unit tests for sensitivity cubes."""
+
+import json
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.compiled import VERDICTS
+from mortgage_cli.core.cube import (
+    MANIFEST_NAME,
+    CubeAxes,
+    _CubeEvaluator,
+    open_cube,
+    write_cube,
+)
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.property import PropertyInput
+
+
+def small_axes() -> CubeAxes:
+    """Axes covering every verdict, including over budget."""
+    return CubeAxes.from_values(
+        prices=[60000, 120000, 400000],
+        down_payments=[0.0, 0.2, 0.5],
+        interest_rates=[0.0, 0.035, 0.06],
+        durations=[15, 25],
+        rents=[700, 1100],
+    )
+
+
+class TestWriteCube:
+    """Tests for cube evaluation and storage."""
+
+    def test_cells_match_analyzer(self, default_profile: Profile, tmp_path):
+        """Every stored cell matches a single-property analysis."""
+        axes = small_axes()
+        write_cube(default_profile, axes, tmp_path)
+        cube = open_cube(tmp_path)
+
+        for p, price in enumerate(axes.prices):
+            for d, down in enumerate(axes.down_payments):
+                for r, rate in enumerate(axes.interest_rates):
+                    for t, term in enumerate(axes.durations):
+                        profile = default_profile.model_copy(deep=True)
+                        profile.mortgage.interest_rate = float(rate)
+                        profile.mortgage.duration_years = int(term)
+                        analyzer = InvestmentAnalyzer(profile)
+                        for n, rent in enumerate(axes.rents):
+                            result = analyzer.analyze(
+                                PropertyInput(
+                                    price=float(price),
+                                    expected_rent=float(rent),
+                                    down_payment_percent=float(down),
+                                )
+                            )
+                            cell = (p, d, r, t)
+                            assert cube["break_even_rent"][cell] == pytest.approx(
+                                result.break_even_rent, rel=1e-9
+                            )
+                            assert VERDICTS[cube["verdict_codes"][cell]] == result.verdict
+                            assert cube["cash_on_cash_return"][cell + (n,)] == pytest.approx(
+                                result.cash_on_cash_return, rel=1e-9, abs=1e-12
+                            )
+
+    @pytest.mark.parametrize("chunk_cells", [1, 30, 40, 80])
+    def test_chunking_does_not_change_results(
+        self, default_profile: Profile, tmp_path, monkeypatch, chunk_cells: int
+    ):
+        """A cube written in chunks equals one written at once."""
+        axes = small_axes()
+        write_cube(default_profile, axes, tmp_path / "whole")
+
+        # Each chunk stays within chunk_cells, or one price and down payment
+        evaluate = _CubeEvaluator.evaluate
+        sizes = []
+
+        def spy(self, prices, down_payments):
+            block = evaluate(self, prices, down_payments)
+            sizes.append(block["cash_on_cash_return"].size)
+            return block
+
+        monkeypatch.setattr(_CubeEvaluator, "evaluate", spy)
+        write_cube(default_profile, axes, tmp_path / "chunked", chunk_cells=chunk_cells)
+        assert max(sizes) <= max(chunk_cells, 12)
+        assert sum(sizes) == axes.cells
+        whole = open_cube(tmp_path / "whole")
+        chunked = open_cube(tmp_path / "chunked")
+
+        for name in whole.arrays:
+            np.testing.assert_array_equal(whole[name], chunked[name])
+
+    def test_manifest_describes_files(self, default_profile: Profile, tmp_path):
+        """The manifest lists axes, shapes and verdict labels."""
+        write_cube(default_profile, small_axes(), tmp_path)
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+
+        assert manifest["axes"]["duration_years"] == [15, 25]
+        assert manifest["arrays"]["cash_on_cash_return"]["shape"] == [3, 3, 3, 2, 2]
+        assert manifest["arrays"]["break_even_rent"]["axes"] == [
+            "price", "down_payment_percent", "interest_rate", "duration_years",
+        ]
+        assert manifest["arrays"]["verdict_codes"]["labels"] == [v.value for v in VERDICTS]
+
+    def test_arrays_open_memory_mapped(self, default_profile: Profile, tmp_path):
+        """Opened arrays are memory maps, sliceable without loading the cube."""
+        write_cube(default_profile, small_axes(), tmp_path)
+        cube = open_cube(tmp_path)
+
+        assert isinstance(cube["cash_on_cash_return"], np.memmap)
+        assert cube["cash_on_cash_return"][:, 1, 0, 0, 0].shape == (3,)
+        assert cube.axis_index("interest_rate", 0.035) == 1
+
+    def test_open_without_manifest(self, tmp_path):
+        """Opening a directory without a cube is an error."""
+        with pytest.raises(ValueError, match="No cube manifest"):
+            open_cube(tmp_path)
+
+    def test_empty_axis_rejected(self):
+        """Every axis needs at least one value."""
+        with pytest.raises(ValueError, match="rent axis is empty"):
+            CubeAxes.from_values([100000], [0.2], [0.04], [20], [])
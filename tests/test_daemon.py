@@ -0,0 +1,196 @@
+"""Tests for the local daemon and its client."""
+
+import io
+import json
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli.config.cache import ProfileCache
+from mortgage_cli.config.defaults import DEFAULT_PROFILE
+from mortgage_cli.config.manager import ConfigManager
+from mortgage_cli.daemon.client import daemon_requested, forward, is_listening
+from mortgage_cli.daemon import server
+from mortgage_cli.daemon.server import DaemonServer
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon in a background thread and yield its socket path."""
+    socket_path = tmp_path / "daemon.sock"
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    ProfileCache.keep_in_memory = False
+
+
+def _forward(argv: list[str], socket_path) -> tuple[int | None, str, str]:
+    """Forward a command and capture what the client would print."""
+    out, err = io.StringIO(), io.StringIO()
+    exit_code = forward(argv, socket_path, stdout=out, stderr=err)
+    return exit_code, out.getvalue(), err.getvalue()
+
+
+class _TerminalIO(io.StringIO):
+    """Captured stream that reports itself as a terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class TestDaemon:
+    """Tests for forwarding commands to the daemon."""
+
+    def test_analyze_matches_local(self, daemon):
+        """Forwarded output matches running the command locally."""
+        args = ["analyze", "--price", "150000", "--rent", "900", "--output", "json"]
+
+        exit_code, stdout, _ = _forward(args, daemon)
+        local = runner.invoke(app, args)
+
+        assert exit_code == 0
+        assert json.loads(stdout) == json.loads(local.stdout)
+
+    def test_leading_daemon_flag_is_dropped(self, daemon):
+        """--daemon before the command is accepted."""
+        exit_code, stdout, _ = _forward(["--daemon", "amortize", "--price", "150000"], daemon)
+
+        assert exit_code == 0
+        assert stdout == runner.invoke(app, ["amortize", "--price", "150000"]).stdout
+
+    def test_errors_and_exit_codes_are_forwarded(self, daemon):
+        """Command errors come back with their exit code."""
+        exit_code, stdout, _ = _forward(
+            ["analyze", "--price", "150000", "--rent", "900", "--profile", "missing"], daemon
+        )
+
+        assert exit_code == 1
+        assert "Profile 'missing' not found" in stdout
+
+    def test_relative_paths_follow_client_cwd(self, tmp_path, monkeypatch):
+        """Relative paths resolve against the client's directory, not the daemon's."""
+        daemon_dir = tmp_path / "daemon"
+        client_dir = tmp_path / "client"
+        daemon_dir.mkdir()
+        client_dir.mkdir()
+        socket_path = tmp_path / "daemon.sock"
+        process = subprocess.Popen(
+            [sys.executable, "-m", "mortgage_cli", "serve", "--socket", str(socket_path)],
+            cwd=daemon_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while not (socket_path.exists() and is_listening(socket_path)):
+                assert process.poll() is None and time.monotonic() < deadline
+                time.sleep(0.05)
+
+            monkeypatch.chdir(client_dir)
+            exit_code, _, _ = _forward(
+                ["analyze", "-p", "150000", "-r", "900", "--store", "--db", "rel.db"],
+                socket_path,
+            )
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(10)
+
+        assert exit_code == 0
+        assert (client_dir / "rel.db").exists()
+        assert not (daemon_dir / "rel.db").exists()
+
+    def test_terminal_output_keeps_colors(self, daemon, monkeypatch):
+        """A client on a terminal gets colored output; a piped one does not."""
+        for name in ("NO_COLOR", "FORCE_COLOR", "TTY_COMPATIBLE"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("TERM", "xterm-256color")
+        args = ["analyze", "--price", "150000", "--rent", "900"]
+
+        terminal = _TerminalIO()
+        assert forward(args, daemon, stdout=terminal, stderr=io.StringIO()) == 0
+        exit_code, piped, _ = _forward(args, daemon)
+
+        assert "\x1b[" in terminal.getvalue()
+        assert exit_code == 0
+        assert "\x1b[" not in piped
+
+    def test_bad_reply_runs_locally(self, daemon, monkeypatch):
+        """A reply without the expected fields falls back to a local run."""
+        monkeypatch.setattr(server, "run_command", lambda *args: {"stdout": ""})
+
+        assert _forward(["analyze", "-p", "1", "-r", "1"], daemon) == (None, "", "")
+
+    def test_unsupported_command_runs_locally(self, daemon):
+        """Commands the daemon does not serve are not forwarded."""
+        assert _forward(["profile", "list"], daemon)[0] is None
+
+    def test_no_daemon_runs_locally(self, tmp_path):
+        """Without a listening daemon the client falls back."""
+        assert _forward(["analyze", "-p", "1", "-r", "1"], tmp_path / "none.sock")[0] is None
+
+    def test_second_daemon_refused(self, daemon):
+        """Only one daemon can listen on a socket."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            DaemonServer(daemon)
+
+    def test_stale_socket_replaced(self, tmp_path):
+        """A socket file left by a dead daemon is cleaned up."""
+        socket_path = tmp_path / "stale.sock"
+        DaemonServer(socket_path).socket.close()  # leave the file behind
+
+        server = DaemonServer(socket_path)
+        server.server_close()
+        ProfileCache.keep_in_memory = False
+
+        assert not socket_path.exists()
+
+
+class TestDaemonRequested:
+    """Tests for client mode selection."""
+
+    def test_flag(self, monkeypatch):
+        """--daemon before the command enables forwarding."""
+        monkeypatch.delenv("MORTGAGE_CLI_DAEMON", raising=False)
+
+        assert daemon_requested(["--daemon", "analyze"])
+        assert not daemon_requested(["analyze"])
+
+    def test_env(self, monkeypatch):
+        """MORTGAGE_CLI_DAEMON enables forwarding."""
+        monkeypatch.setenv("MORTGAGE_CLI_DAEMON", "1")
+
+        assert daemon_requested(["analyze"])
+
+
+class TestInMemoryProfiles:
+    """Tests for the daemon's in-memory profile cache."""
+
+    def test_memory_hit_and_invalidation(self, tmp_path, monkeypatch):
+        """Profiles stay in memory until their file changes."""
+        monkeypatch.setattr(ProfileCache, "keep_in_memory", True)
+        profiles_dir = tmp_path / "profiles"
+        cache_dir = tmp_path / "cache"
+        saved = DEFAULT_PROFILE.model_copy(update={"name": "warm", "description": "Before"})
+        ConfigManager(profiles_dir, cache_dir).save_profile(saved)
+
+        first = ConfigManager(profiles_dir, cache_dir).load_profile("warm")
+        second = ConfigManager(profiles_dir, cache_dir).load_profile("warm")
+        assert second is first
+
+        path = profiles_dir / "warm.yaml"
+        path.write_text(path.read_text().replace("Before", "After edit"))
+
+        reloaded = ConfigManager(profiles_dir, cache_dir).load_profile("warm")
+        assert reloaded.description == "After edit"
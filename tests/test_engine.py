@@ -0,0 +1,112 @@
+"""Unit tests for the vectorized MatrixEngine."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import VERDICTS, MatrixEngine
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.results import Verdict
+
+
+PRICES = [50000, 100000, 130000, 150000, 200000, 300000, 500000]
+DOWNS = [0.0, 0.10, 0.20, 0.35, 0.50, 1.0]
+
+
+class TestMatrixEngineShape:
+    """Tests for result layout."""
+
+    def test_shape_is_rows_by_columns(self, default_profile: Profile):
+        """Rows are down payments, columns are prices."""
+        result = MatrixEngine(default_profile).evaluate(PRICES, DOWNS)
+
+        assert result.shape == (len(DOWNS), len(PRICES))
+        assert result.break_even_rent.shape == result.shape
+        assert result.upfront_total.shape == result.shape
+        assert result.verdict_codes.shape == result.shape
+        assert result.within_budget.shape == result.shape
+
+    def test_verdict_codes_are_compact(self, default_profile: Profile):
+        """Verdict codes are stored as uint8."""
+        result = MatrixEngine(default_profile).evaluate(PRICES, DOWNS)
+
+        assert result.verdict_codes.dtype == np.uint8
+
+    def test_to_cells_layout(self, default_profile: Profile):
+        """Materialized cells follow the same row/column layout."""
+        result = MatrixEngine(default_profile).evaluate(PRICES, DOWNS)
+        cells = result.to_cells()
+
+        assert len(cells) == len(DOWNS)
+        assert all(len(row) == len(PRICES) for row in cells)
+        assert cells[2][1].price == 100000
+        assert cells[2][1].down_payment_percent == 0.20
+        assert cells[2][1].verdict == result.verdict_at(2, 1)
+
+    def test_cell_on_demand(self, default_profile: Profile):
+        """A single cell matches the fully materialized matrix."""
+        result = MatrixEngine(default_profile).evaluate(PRICES, DOWNS)
+
+        assert result.cell(3, 4) == result.to_cells()[3][4]
+
+    def test_verdict_summaries(self, default_profile: Profile):
+        """Verdict values, masks and counts agree with the codes."""
+        result = MatrixEngine(default_profile).evaluate(PRICES, DOWNS)
+        verdicts = [
+            result.verdict_at(row, col) for row in range(len(DOWNS)) for col in range(len(PRICES))
+        ]
+
+        assert result.verdict_values().ravel().tolist() == [v.value for v in verdicts]
+        assert result.verdict_counts() == {v: verdicts.count(v) for v in Verdict}
+        green = result.verdict_mask(Verdict.GREEN).ravel().tolist()
+        assert green == [v == Verdict.GREEN for v in verdicts]
+
+
+class TestMatrixEngineMatchesAnalyzer:
+    """The vectorized engine must agree with the scalar analyzer."""
+
+    @pytest.mark.parametrize("profile_fixture", ["default_profile", "spreadsheet_profile"])
+    def test_matches_scalar_analyzer(self, profile_fixture: str, request: pytest.FixtureRequest):
+        """Every cell matches InvestmentAnalyzer.analyze."""
+        profile = request.getfixturevalue(profile_fixture)
+        result = MatrixEngine(profile).evaluate(PRICES, DOWNS)
+        analyzer = InvestmentAnalyzer(profile)
+
+        for row, down_pct in enumerate(DOWNS):
+            for col, price in enumerate(PRICES):
+                expected = analyzer.analyze(
+                    PropertyInput(
+                        price=price,
+                        expected_rent=profile.budget.target_rent,
+                        down_payment_percent=down_pct,
+                    )
+                )
+                assert result.break_even_rent[row, col] == pytest.approx(expected.break_even_rent)
+                assert result.upfront_total[row, col] == pytest.approx(expected.upfront_costs.total)
+                assert bool(result.within_budget[row, col]) == expected.within_budget
+                assert result.verdict_at(row, col) == expected.verdict
+
+    def test_zero_rate_profile(self, default_profile: Profile):
+        """Zero effective rate falls back to simple division."""
+        profile = default_profile.model_copy(deep=True)
+        profile.mortgage.interest_rate = 0
+        profile.mortgage.insurance_rate = 0
+
+        result = MatrixEngine(profile).evaluate([120000], [0.0])
+
+        # €120,000 over 20 years = €500/month + €250 fixed
+        assert result.break_even_rent[0, 0] == pytest.approx(750.0)
+
+    def test_zero_target_rent_is_red(self, default_profile: Profile):
+        """A zero target rent makes every in-budget cell red."""
+        profile = default_profile.model_copy(deep=True)
+        profile.budget.target_rent = 0
+
+        result = MatrixEngine(profile).evaluate([50000], [0.20])
+
+        assert result.verdict_at(0, 0) == Verdict.RED
+
+    def test_verdict_code_order(self):
+        """Verdict codes index the Verdict enum in declaration order."""
+        assert VERDICTS == (Verdict.GREEN, Verdict.YELLOW, Verdict.RED, Verdict.OVER_BUDGET)
@@ -0,0 +1,217 @@
+"""Tests for the local HTTP JSON API."""
+
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli.config.cache import ProfileCache
+from mortgage_cli.daemon.http_api import ApiServer
+from mortgage_cli.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def api_port():
+    """Run the API on a free port in a background thread and yield the port."""
+    server = ApiServer(port=0)
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"on_ready": lambda port: ready.set()}, daemon=True
+    )
+    thread.start()
+    assert ready.wait(10)
+    yield server.port
+    server.shutdown()
+    thread.join()
+    ProfileCache.keep_in_memory = False
+
+
+def _post(port: int, path: str, body: object) -> tuple[int, dict]:
+    """POST a JSON body and decode the JSON reply."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("POST", path, json.dumps(body))
+    response = connection.getresponse()
+    document = json.loads(response.read())
+    connection.close()
+    return response.status, document
+
+
+class TestEndpoints:
+    """Tests for the API endpoints."""
+
+    def test_analyze_matches_cli(self, api_port):
+        """/analyze answers with the same document as 'analyze -o json'."""
+        status, document = _post(api_port, "/analyze", {"price": 150000, "rent": 900})
+        local = runner.invoke(app, ["analyze", "-p", "150000", "-r", "900", "-o", "json"])
+
+        assert status == 200
+        assert document == json.loads(local.stdout)
+
+    def test_batch(self, api_port):
+        """/batch analyzes every listing, honouring per-listing down payments."""
+        status, document = _post(
+            api_port,
+            "/batch",
+            {
+                "listings": [
+                    {"price": 150000, "rent": 900},
+                    {"price": 150000, "rent": 900, "down": "30%"},
+                ]
+            },
+        )
+
+        assert status == 200
+        assert document["count"] == 2
+        single = _post(api_port, "/analyze", {"price": 150000, "rent": 900, "down": 0.3})[1]
+        assert document["results"][1] == single
+
+    def test_matrix_matches_cli(self, api_port):
+        """/matrix answers with the same document as 'matrix -o json'."""
+        status, document = _post(
+            api_port, "/matrix", {"price_min": 100000, "price_max": 140000, "layout": "columns"}
+        )
+        local = runner.invoke(
+            app,
+            [
+                "matrix", "--price-min", "100000", "--price-max", "140000",
+                "-o", "json", "--json-layout", "columns",
+            ],
+        )
+
+        assert status == 200
+        assert document == json.loads(local.stdout)
+
+    def test_amortize(self, api_port):
+        """/amortize returns the loan and a yearly schedule."""
+        status, document = _post(api_port, "/amortize", {"price": 150000, "years": 3})
+
+        assert status == 200
+        assert document["loan_amount"] == 120000
+        assert [entry["year"] for entry in document["schedule"]] == [1, 2, 3]
+
+    def test_health_lists_warm_profiles(self, api_port):
+        """Profiles used by earlier requests stay warm."""
+        _post(api_port, "/analyze", {"price": 150000, "rent": 900})
+
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=10)
+        connection.request("GET", "/health")
+        document = json.loads(connection.getresponse().read())
+
+        assert document["status"] == "ok"
+        assert document["profiles"] == ["default"]
+
+
+class TestErrors:
+    """Tests for error replies."""
+
+    @pytest.mark.parametrize(
+        "path, body, status, message",
+        [
+            ("/analyze", {"rent": 900}, 400, "Missing 'price'"),
+            ("/analyze", {"price": "abc", "rent": 900}, 400, "must be a number"),
+            ("/analyze", {"price": 1, "rent": 1, "profile": "missing"}, 404, "not found"),
+            ("/batch", {"listings": [{"price": 1}]}, 400, "Listing 1: Missing 'rent'"),
+            ("/matrix", {"price_min": 1, "price_max": 2, "layout": "rows"}, 400, "layout"),
+            (
+                "/matrix",
+                {"price_min": 1, "price_max": 2, "down_step": "0%"},
+                400,
+                "'down_step' must be greater than 0",
+            ),
+            (
+                "/matrix",
+                {"price_min": 1, "price_max": 2, "price_step": -5},
+                400,
+                "'price_step' must be greater than 0",
+            ),
+            ("/matrix", {"price_min": 2, "price_max": 1}, 400, "must not exceed"),
+            (
+                "/matrix",
+                {"price_min": 0, "price_max": 1e9, "price_step": 1, "down_step": "1%"},
+                400,
+                "exceeds 1,000,000 cells",
+            ),
+            ("/nope", {}, 404, "Unknown endpoint"),
+            ("/health", {}, 405, "expects GET"),
+        ],
+    )
+    def test_error_status(self, api_port, path, body, status, message):
+        """Bad requests get a status and an error message."""
+        got_status, document = _post(api_port, path, body)
+
+        assert got_status == status
+        assert message in document["error"]
+
+    def test_server_survives_rejected_matrix(self, api_port):
+        """A rejected matrix request leaves the server answering other requests."""
+        status, _ = _post(
+            api_port, "/matrix", {"price_min": 1, "price_max": 2, "down_step": "0%"}
+        )
+
+        assert status == 400
+        assert _post(api_port, "/analyze", {"price": 150000, "rent": 900})[0] == 200
+
+    def test_invalid_json(self, api_port):
+        """A body that is not JSON is a bad request."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=10)
+        connection.request("POST", "/analyze", "{not json")
+        response = connection.getresponse()
+
+        assert response.status == 400
+        assert "not valid JSON" in json.loads(response.read())["error"]
+
+
+class TestConnections:
+    """Tests for keep-alive and pipelining."""
+
+    def test_keep_alive(self, api_port):
+        """Several requests share one connection."""
+        connection = http.client.HTTPConnection("127.0.0.1", api_port, timeout=10)
+        for price in (100000, 150000, 200000):
+            connection.request("POST", "/analyze", json.dumps({"price": price, "rent": 900}))
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["property"]["price"] == price
+        connection.close()
+
+    def test_pipelined_requests_answered_in_order(self, api_port):
+        """Requests sent back to back are answered in the order they were sent."""
+        requests = b""
+        prices = [100000 + step * 1000 for step in range(50)]
+        for price in prices:
+            body = json.dumps({"price": price, "rent": 900}).encode()
+            requests += b"POST /analyze HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (
+                len(body),
+                body,
+            )
+        # The last request closes the connection once answered
+        requests += b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n"
+
+        with socket.create_connection(("127.0.0.1", api_port), timeout=10) as client:
+            client.sendall(requests)
+            received = b""
+            while chunk := client.recv(65536):
+                received += chunk
+
+        replies = [
+            json.loads(part.split(b"\r\n\r\n", 1)[1])
+            for part in received.split(b"HTTP/1.1 ")[1:]
+        ]
+        assert [reply["property"]["price"] for reply in replies[:-1]] == prices
+        assert replies[-1]["status"] == "ok"
+
+    def test_malformed_request_closes_connection(self, api_port):
+        """A request that is not HTTP gets a 400 and the connection is closed."""
+        with socket.create_connection(("127.0.0.1", api_port), timeout=10) as client:
+            client.sendall(b"hello\r\n\r\n")
+            received = b""
+            while chunk := client.recv(65536):
+                received += chunk
+
+        assert received.startswith(b"HTTP/1.1 400")
+        assert b"Connection: close" in received
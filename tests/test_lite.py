@@ -0,0 +1,72 @@
+"""Tests for the slotted result types."""
+
+import pytest
+
+from mortgage_cli.core.amortization import AmortizationGenerator
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.models.lite import LiteAnalysisResult, LiteMatrixCell
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.results import AnalysisResult, MatrixCell, Verdict
+
+
+class TestLiteTypes:
+    """Tests for the slotted counterparts of the pydantic results."""
+
+    def test_no_instance_dict(self):
+        """Instances carry their fields in slots only."""
+        cell = LiteMatrixCell(100000.0, 0.2, 950.0, Verdict.GREEN, True)
+
+        assert not hasattr(cell, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(cell, "extra", 1)
+
+    def test_cell_to_model(self):
+        """to_model() builds the equivalent pydantic model."""
+        cell = LiteMatrixCell(100000.0, 0.2, 950.0, Verdict.GREEN, True)
+
+        model = cell.to_model()
+
+        assert isinstance(model, MatrixCell)
+        assert model.model_dump() == cell.as_dict()
+
+    def test_equality(self):
+        """Equal fields make equal values."""
+        first = LiteMatrixCell(100000.0, 0.2, 950.0, Verdict.GREEN, True)
+        second = LiteMatrixCell(100000.0, 0.2, 950.0, Verdict.GREEN, True)
+
+        assert first == second
+        assert first != LiteMatrixCell(100000.0, 0.2, 951.0, Verdict.GREEN, True)
+
+
+class TestHotPaths:
+    """The engine produces slotted results that match the pydantic ones."""
+
+    def test_evaluate_matches_analyze(self, default_profile: Profile):
+        """evaluate() and analyze() agree field for field."""
+        analyzer = InvestmentAnalyzer(default_profile)
+        property_input = PropertyInput(price=150000, expected_rent=900)
+
+        lite = analyzer.evaluate(property_input)
+        model = analyzer.analyze(property_input)
+
+        assert isinstance(lite, LiteAnalysisResult)
+        assert isinstance(model, AnalysisResult)
+        assert lite.to_model() == model
+        assert lite.upfront_costs.total == pytest.approx(model.upfront_costs.total)
+        assert lite.monthly.total == pytest.approx(model.monthly.total)
+
+    def test_matrix_cells_are_slotted(self, default_profile: Profile):
+        """to_cells() materializes slotted cells."""
+        cells = MatrixEngine(default_profile).evaluate([100000, 150000], [0.2]).to_cells()
+
+        assert all(isinstance(cell, LiteMatrixCell) for cell in cells[0])
+
+    def test_generate_schedule_keeps_models(self):
+        """generate_schedule() still returns pydantic entries."""
+        generator = AmortizationGenerator()
+        entries = generator.generate_schedule(100000, 0.041, 20, 125000, limit_years=2)
+        lite = generator.generate_arrays(100000, 0.041, 20, 125000, limit_years=2).to_entries()
+
+        assert [entry.to_model() for entry in lite] == entries
@@ -0,0 +1,198 @@
+"""Tests for formatter output sinks."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from mortgage_cli.config.defaults import DEFAULT_PROFILE
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.output import CsvFormatter, JsonFormatter, NdjsonFormatter
+from mortgage_cli.output.csv_fmt import CsvDialect
+from mortgage_cli.output.json_fmt import MATRIX_CELL_FIELDS
+from mortgage_cli.output.sink import is_binary, text_stream
+
+PRICES = [100_000.0, 120_000.0, 140_000.0]
+DOWNS = [0.1, 0.2]
+
+
+def _matrix_args() -> tuple:
+    matrix = MatrixEngine(DEFAULT_PROFILE).evaluate(PRICES, DOWNS)
+    return matrix, 1000.0, DEFAULT_PROFILE
+
+
+class TestSink:
+    """Tests for text and binary sink handling."""
+
+    def test_is_binary(self, tmp_path):
+        """Byte streams are binary, text streams are not."""
+        assert is_binary(io.BytesIO())
+        assert not is_binary(io.StringIO())
+        with open(tmp_path / "out.bin", "wb") as f:
+            assert is_binary(f)
+        with open(tmp_path / "out.txt", "w") as f:
+            assert not is_binary(f)
+
+    def test_binary_sink_stays_open(self):
+        """Wrapping a binary sink writes UTF-8 and leaves it open."""
+        sink = io.BytesIO()
+
+        with text_stream(sink) as stream:
+            stream.write("€1\r\n")
+
+        assert not sink.closed
+        assert sink.getvalue() == "€1\r\n".encode()
+
+
+class TestStreamingFormatters:
+    """write_* methods produce the same output as format_* methods."""
+
+    def test_csv_matrix_binary_sink(self):
+        """CSV matrix rows written to a binary sink match format_matrix."""
+        sink = io.BytesIO()
+
+        CsvFormatter().write_matrix(*_matrix_args(), sink)
+
+        assert sink.getvalue().decode() == CsvFormatter().format_matrix(*_matrix_args())
+        rows = list(csv.reader(io.StringIO(sink.getvalue().decode())))
+        assert len(rows) == 1 + len(PRICES) * len(DOWNS)
+
+    def test_csv_analysis_text_file(self, tmp_path):
+        """CSV analysis can be written straight to a file."""
+        result = InvestmentAnalyzer(DEFAULT_PROFILE).analyze(
+            PropertyInput(price=150_000, expected_rent=900)
+        )
+        path = tmp_path / "analysis.csv"
+
+        with open(path, "w", newline="") as f:
+            CsvFormatter().write_analysis(result, DEFAULT_PROFILE, f)
+
+        expected = CsvFormatter().format_analysis(result, DEFAULT_PROFILE)
+        assert path.read_bytes() == expected.encode()
+
+    def test_json_matrix_ends_with_newline(self):
+        """JSON documents written to a sink end with a newline."""
+        sink = io.BytesIO()
+
+        JsonFormatter().write_matrix(*_matrix_args(), sink)
+
+        text = sink.getvalue().decode()
+        assert text == JsonFormatter().format_matrix(*_matrix_args()) + "\n"
+        assert json.loads(text)["matrix"]["prices"] == PRICES
+
+    def test_ndjson_matrix_binary_sink(self):
+        """NDJSON lines written to a binary sink match format_matrix."""
+        sink = io.BytesIO()
+
+        NdjsonFormatter().write_matrix(*_matrix_args(), sink)
+
+        assert sink.getvalue().decode() == NdjsonFormatter().format_matrix(*_matrix_args())
+
+    def test_matrix_rows_match_cells(self):
+        """Cells encoded from the arrays match materialized cells."""
+        matrix = _matrix_args()[0]
+        lines = NdjsonFormatter().format_matrix(*_matrix_args()).splitlines()
+
+        expected = [
+            {
+                "price": cell.price,
+                "down_payment_percent": cell.down_payment_percent,
+                "break_even_rent": round(cell.break_even_rent, 2),
+                "verdict": cell.verdict.value,
+                "within_budget": cell.within_budget,
+            }
+            for row in matrix.to_cells()
+            for cell in row
+        ]
+        assert [json.loads(line) for line in lines] == expected
+        document = json.loads(JsonFormatter().format_matrix(*_matrix_args()))
+        assert document["matrix"]["cells"] == expected
+
+
+def _baseline_csv(cells: list, profile) -> str:
+    """CSV matrix as the per-cell formatter wrote it."""
+    output = io.StringIO()
+    writer = csv.writer(output, CsvDialect)
+    writer.writerow(MATRIX_CELL_FIELDS)
+    for row in cells:
+        for cell in row:
+            writer.writerow(
+                [
+                    cell.price,
+                    cell.down_payment_percent,
+                    round(cell.break_even_rent, 2),
+                    cell.verdict.value,
+                    cell.within_budget,
+                ]
+            )
+    return output.getvalue()
+
+
+def _baseline_json(cells: list, prices: list, downs: list, target_rent: float, profile) -> str:
+    """JSON matrix as the per-cell formatter wrote it."""
+    output = {
+        "matrix": {
+            "prices": prices,
+            "down_payments": downs,
+            "target_rent": target_rent,
+            "cells": [
+                {
+                    "price": prices[col],
+                    "down_payment_percent": downs[row],
+                    "break_even_rent": round(cell.break_even_rent, 2),
+                    "verdict": cell.verdict.value,
+                    "within_budget": cell.within_budget,
+                }
+                for row, cells_row in enumerate(cells)
+                for col, cell in enumerate(cells_row)
+            ],
+        },
+        "profile": {
+            "name": profile.name,
+            "interest_rate": profile.mortgage.interest_rate,
+            "duration_years": profile.mortgage.duration_years,
+            "budget": profile.budget.total_available,
+        },
+    }
+    return json.dumps(output, indent=2)
+
+
+class TestMatrixFormatterCompatibility:
+    """Tests that array-based matrix formatting matches the per-cell formatters."""
+
+    def test_dense_grid_matches_per_cell_output(self):
+        """Half-cent ties round as round(value, 2) does, byte for byte."""
+        # A zero rate makes break-even rents exact fractions, with many half-cent ties
+        profile = DEFAULT_PROFILE.model_copy(deep=True)
+        profile.mortgage.interest_rate = 0.0
+        profile.mortgage.insurance_rate = 0.0
+        prices = [float(price) for price in range(100_000, 103_001)]
+        downs = [0.1, 0.2, 0.25]
+        matrix = MatrixEngine(profile).evaluate(prices, downs)
+        cells = matrix.to_cells()
+
+        rents = matrix.break_even_rent.tolist()
+        python_rounded = [[round(value, 2) for value in row] for row in rents]
+        assert (matrix.break_even_rent.round(2) != python_rounded).any()
+
+        assert CsvFormatter().format_matrix(matrix, 1000.0, profile) == _baseline_csv(
+            cells, profile
+        )
+        assert JsonFormatter().format_matrix(matrix, 1000.0, profile) == _baseline_json(
+            cells, prices, downs, 1000.0, profile
+        )
+
+    def test_cell_list_arguments_deprecated(self):
+        """The former (cells, prices, down_payments, ...) form still works."""
+        matrix, target_rent, profile = _matrix_args()
+        expected = JsonFormatter().format_matrix(matrix, target_rent, profile)
+
+        with pytest.warns(DeprecationWarning, match="MatrixArrays"):
+            legacy = JsonFormatter().format_matrix(
+                matrix.to_cells(), PRICES, DOWNS, target_rent, profile
+            )
+
+        assert legacy == expected
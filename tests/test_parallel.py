@@ -0,0 +1,69 @@
+"""Tests for process-pool matrix and batch execution."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.core.parallel import _tile_slices, analyze_chunks, evaluate_matrix
+from mortgage_cli.models.profile import Profile
+
+
+class TestTileSlices:
+    """Tests for grid tiling."""
+
+    def test_tiles_cover_grid_once(self):
+        """Tiles cover every cell exactly once."""
+        coverage = np.zeros((7, 11), dtype=int)
+        for rows, cols in _tile_slices(7, 11, tile_cells=6):
+            coverage[rows, cols] += 1
+
+        assert (coverage == 1).all()
+
+    def test_wide_rows_split_columns(self):
+        """Rows wider than a tile are split into column tiles."""
+        tiles = _tile_slices(2, 10, tile_cells=4)
+
+        assert all(cols.stop - cols.start <= 4 for _, cols in tiles)
+
+
+class TestEvaluateMatrix:
+    """Tests for parallel matrix evaluation."""
+
+    def test_parallel_matches_in_process(self, default_profile: Profile):
+        """Tiled worker results are reassembled in the original layout."""
+        prices = np.arange(50000, 400001, 5000)
+        downs = np.arange(0.0, 0.61, 0.05)
+
+        expected = MatrixEngine(default_profile).evaluate(prices, downs)
+        result = evaluate_matrix(default_profile, prices, downs, workers=2, tile_cells=50)
+
+        np.testing.assert_array_equal(result.break_even_rent, expected.break_even_rent)
+        np.testing.assert_array_equal(result.upfront_total, expected.upfront_total)
+        np.testing.assert_array_equal(result.verdict_codes, expected.verdict_codes)
+        np.testing.assert_array_equal(result.within_budget, expected.within_budget)
+
+
+class TestAnalyzeChunks:
+    """Tests for parallel batch analysis."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, default_profile: Profile, workers: int):
+        """Chunks come back in submission order with warnings attached."""
+        chunks = [
+            (np.full(3, price), np.full(3, 900.0), np.full(3, np.nan))
+            for price in (100000.0, 200000.0, 500000.0, 150000.0, 120000.0)
+        ]
+
+        results = list(
+            analyze_chunks(default_profile, iter(chunks), workers=workers, with_warnings=True)
+        )
+
+        assert [r.property_price[0] for r, _ in results] == [c[0][0] for c in chunks]
+        assert all(len(w) == 3 for _, w in results)
+
+    def test_invalid_chunk_raises(self, default_profile: Profile):
+        """Validation errors from workers propagate to the caller."""
+        chunks = [(np.array([0.0]), np.array([900.0]), np.array([np.nan]))]
+
+        with pytest.raises(ValueError):
+            list(analyze_chunks(default_profile, chunks, workers=2))
@@ -0,0 +1,223 @@
+"""Tests for the --cache result cache."""
+
+import io
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli import result_cache
+from mortgage_cli.main import app
+from mortgage_cli.result_cache import ResultCache, cache_key
+
+runner = CliRunner()
+
+MATRIX_ARGS = ["matrix", "--price-min", "100000", "--price-max", "140000", "--output", "json"]
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    """Never leak an enabled cache between tests."""
+    yield
+    result_cache.disable()
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """Point the config dir (and so the cache) at a temporary directory."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv(result_cache.CACHE_ENV, raising=False)
+    return tmp_path / "mortgage-cli"
+
+
+def counters(path):
+    """Counters from a --timings-json report."""
+    return json.loads(path.read_text())["counters"]
+
+
+class TestCacheKey:
+    """Tests for cache key hashing."""
+
+    def test_deterministic(self, default_profile):
+        """Equal invocations hash to the same key, whatever the input order."""
+        first = cache_key("analyze", default_profile, {"price": 1, "rent": 2})
+        second = cache_key("analyze", default_profile.model_copy(), {"rent": 2, "price": 1})
+
+        assert first == second
+        assert len(first) == 64
+
+    def test_profile_change_changes_key(self, default_profile):
+        """Any profile setting is part of the key."""
+        changed = default_profile.model_copy(
+            update={"budget": default_profile.budget.model_copy(update={"target_rent": 1001})}
+        )
+
+        assert cache_key("analyze", default_profile, {}) != cache_key("analyze", changed, {})
+
+    def test_command_and_inputs_change_key(self, default_profile):
+        """The command name and inputs are part of the key."""
+        base = cache_key("analyze", default_profile, {"price": 1})
+
+        assert cache_key("matrix", default_profile, {"price": 1}) != base
+        assert cache_key("analyze", default_profile, {"price": 2}) != base
+
+
+class TestResultCache:
+    """Tests for the on-disk store."""
+
+    def test_put_get(self, tmp_path):
+        """Stored output reads back unchanged, newlines included."""
+        cache = ResultCache(tmp_path / "results")
+        cache.put("a", "x,y\r\n1,2\r\n")
+
+        assert cache.get("a") == "x,y\r\n1,2\r\n"
+        assert cache.get("b") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Writes beyond max_bytes drop the least recently used entries."""
+        cache = ResultCache(tmp_path, max_bytes=25)
+        for index, key in enumerate(("a", "b")):
+            cache.put(key, "x" * 10)
+            os.utime(tmp_path / f"{key}.out", ns=(index, index))
+
+        # Reading "a" makes "b" the least recently used
+        cache.get("a")
+        cache.put("c", "x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size() == (2, 20)
+
+    def test_clear(self, tmp_path):
+        """clear() deletes every entry."""
+        cache = ResultCache(tmp_path)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        assert cache.clear() == 2
+        assert cache.size() == (0, 0)
+
+    def test_writing_streams_to_sink(self, tmp_path):
+        """Output reaches the sink as it is written and is stored at the end."""
+        cache = ResultCache(tmp_path)
+        sink = io.StringIO()
+
+        with cache.writing("a", sink) as out:
+            out.write("first\n")
+            assert sink.getvalue() == "first\n"
+            assert cache.get("a") is None
+            out.write("second\n")
+
+        assert cache.get("a") == "first\nsecond\n"
+        assert [path.name for path in tmp_path.iterdir()] == ["a.out"]
+
+    def test_writing_discards_failed_output(self, tmp_path):
+        """Nothing is stored when the block raises."""
+        cache = ResultCache(tmp_path)
+        sink = io.StringIO()
+
+        with pytest.raises(ValueError):
+            with cache.writing("a", sink) as out:
+                out.write("partial")
+                raise ValueError("boom")
+
+        assert sink.getvalue() == "partial"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writing_to_unwritable_directory(self, tmp_path):
+        """Output still reaches the sink when the cache cannot be written."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ResultCache(blocker / "results")
+        sink = io.StringIO()
+
+        with cache.writing("a", sink) as out:
+            out.write("text")
+
+        assert sink.getvalue() == "text"
+        assert cache.get("a") is None
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """A cache that was never written to has no entries."""
+        assert ResultCache(tmp_path / "missing").size() == (0, 0)
+
+
+class TestCacheOption:
+    """Tests for --cache on the commands."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            MATRIX_ARGS,
+            [*MATRIX_ARGS[:-1], "csv"],
+            [*MATRIX_ARGS, "--adaptive", "--price-step", "1000"],
+            ["analyze", "-p", "150000", "-r", "900", "-o", "ndjson"],
+            ["amortize", "-p", "150000", "-o", "ndjson"],
+        ],
+    )
+    def test_second_run_replays_output(self, config_home, tmp_path, args):
+        """A repeated command is answered from the cache with identical output."""
+        path = tmp_path / "timings.json"
+
+        first = runner.invoke(app, ["--cache", "--timings-json", str(path), *args])
+        first_counters = counters(path)
+        second = runner.invoke(app, ["--cache", "--timings-json", str(path), *args])
+        second_counters = counters(path)
+
+        assert first.exit_code == second.exit_code == 0
+        assert second.stdout == first.stdout
+        assert first_counters["result_cache_misses"] == 1
+        assert second_counters["result_cache_hits"] == 1
+        assert "analyses" not in second_counters
+        assert result_cache.ResultCache(config_home / "cache" / "results").size()[0] == 1
+
+    def test_changed_input_misses(self, config_home, tmp_path):
+        """Different inputs are computed afresh."""
+        path = tmp_path / "timings.json"
+        runner.invoke(app, ["--cache", *MATRIX_ARGS])
+
+        runner.invoke(app, ["--cache", "--timings-json", str(path), *MATRIX_ARGS, "--compact"])
+
+        assert counters(path)["result_cache_misses"] == 1
+
+    def test_profile_edit_invalidates(self, config_home, tmp_path):
+        """Saving a changed profile makes earlier results unreachable."""
+        from mortgage_cli.config.defaults import DEFAULT_PROFILE
+        from mortgage_cli.config.manager import ConfigManager
+
+        ConfigManager().save_profile(DEFAULT_PROFILE.model_copy(update={"name": "cached"}))
+        args = ["--cache", *MATRIX_ARGS, "--profile", "cached"]
+        before = runner.invoke(app, args)
+
+        thresholds = DEFAULT_PROFILE.thresholds.model_copy(update={"green_below": 0.5})
+        ConfigManager().save_profile(
+            DEFAULT_PROFILE.model_copy(update={"name": "cached", "thresholds": thresholds})
+        )
+        after = runner.invoke(app, args)
+
+        assert after.exit_code == 0
+        assert after.stdout != before.stdout
+
+    def test_environment_variable(self, config_home, monkeypatch):
+        """MORTGAGE_CLI_CACHE=1 enables the cache without --cache."""
+        monkeypatch.setenv(result_cache.CACHE_ENV, "1")
+
+        runner.invoke(app, MATRIX_ARGS)
+
+        assert ResultCache(config_home / "cache" / "results").size()[0] == 1
+
+    def test_table_output_not_cached(self, config_home):
+        """Terminal output is always rendered afresh."""
+        result = runner.invoke(app, ["--cache", *MATRIX_ARGS[:-2]])
+
+        assert result.exit_code == 0
+        assert ResultCache(config_home / "cache" / "results").size() == (0, 0)
+
+    def test_off_by_default(self, config_home):
+        """Without --cache nothing is stored."""
+        runner.invoke(app, MATRIX_ARGS)
+
+        assert not (config_home / "cache" / "results").exists()
+        assert result_cache.active() is None
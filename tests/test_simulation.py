@@ -0,0 +1,148 @@
+"""Tests for Monte Carlo simulation."""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.simulation import MonteCarloSimulator
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.results import Verdict
+from mortgage_cli.models.simulation import Distribution, SimulationSpec
+
+STRESS_SPEC = SimulationSpec(
+    interest_rate=Distribution(type="normal", mean=0.04, std=0.01, min=0.0),
+    monthly_costs={"maintenance": Distribution(type="triangular", low=50, mode=100, high=250)},
+    rent=Distribution(type="uniform", low=850, high=1050),
+)
+
+
+class TestMonteCarloSimulator:
+    """Tests for MonteCarloSimulator."""
+
+    def test_same_seed_same_results(self, default_profile):
+        """The same seed reproduces every draw exactly."""
+        simulator = MonteCarloSimulator(default_profile, STRESS_SPEC)
+
+        first = simulator.run(150000, 950, draws=5000, seed=42)
+        second = simulator.run(150000, 950, draws=5000, seed=42)
+        other = simulator.run(150000, 950, draws=5000, seed=43)
+
+        np.testing.assert_array_equal(first.break_even_rent, second.break_even_rent)
+        np.testing.assert_array_equal(first.verdict_codes, second.verdict_codes)
+        assert not np.array_equal(first.break_even_rent, other.break_even_rent)
+
+    def test_no_distributions_matches_analyzer(self, default_profile):
+        """Without distributions every draw equals the scalar analysis."""
+        simulator = MonteCarloSimulator(default_profile, SimulationSpec())
+        expected = InvestmentAnalyzer(default_profile).analyze(
+            PropertyInput(price=150000, expected_rent=950)
+        )
+
+        result = simulator.run(150000, 950, draws=10)
+
+        np.testing.assert_allclose(result.break_even_rent, expected.break_even_rent)
+        np.testing.assert_allclose(result.cash_on_cash_return, expected.cash_on_cash_return)
+        assert result.upfront_total == pytest.approx(expected.upfront_costs.total)
+        assert result.verdict_probabilities()[expected.verdict] == 1.0
+
+    def test_fixed_distribution_overrides_profile(self, default_profile):
+        """A fixed distribution replaces the profile value."""
+        spec = SimulationSpec(interest_rate=Distribution(type="fixed", value=0.05))
+        profile = default_profile.model_copy(
+            update={"mortgage": default_profile.mortgage.model_copy(update={"interest_rate": 0.05})}
+        )
+        expected = InvestmentAnalyzer(profile).analyze(
+            PropertyInput(price=150000, expected_rent=950)
+        )
+
+        result = MonteCarloSimulator(default_profile, spec).run(150000, 950, draws=10)
+
+        np.testing.assert_allclose(result.break_even_rent, expected.break_even_rent)
+
+    def test_probabilities_sum_to_one(self, default_profile):
+        """Verdict probabilities cover every draw."""
+        result = MonteCarloSimulator(default_profile, STRESS_SPEC).run(150000, 950, draws=5000)
+
+        probabilities = result.verdict_probabilities()
+
+        assert set(probabilities) == set(Verdict)
+        assert sum(probabilities.values()) == pytest.approx(1.0)
+        assert 0.0 < result.shortfall_probability < 1.0
+
+    def test_percentiles_are_ordered(self, default_profile):
+        """Percentiles increase with rank."""
+        result = MonteCarloSimulator(default_profile, STRESS_SPEC).run(150000, 950, draws=5000)
+
+        for values in result.percentiles().values():
+            ordered = list(values.values())
+            assert ordered == sorted(ordered)
+
+    def test_clipping(self, default_profile):
+        """Samples respect min and max bounds."""
+        spec = SimulationSpec(
+            rent=Distribution(type="normal", mean=950, std=500, min=800, max=1100)
+        )
+
+        result = MonteCarloSimulator(default_profile, spec).run(150000, 950, draws=5000)
+
+        assert result.rent.min() >= 800
+        assert result.rent.max() <= 1100
+
+    def test_lognormal_matches_requested_mean(self, default_profile):
+        """Lognormal mean/std describe the sampled values."""
+        spec = SimulationSpec(rent=Distribution(type="lognormal", mean=950, std=100))
+
+        result = MonteCarloSimulator(default_profile, spec).run(150000, 950, draws=200_000)
+
+        assert result.rent.mean() == pytest.approx(950, rel=0.01)
+        assert result.rent.std() == pytest.approx(100, rel=0.05)
+
+    @pytest.mark.parametrize("price, rent", [(0, 950), (-150000, 950), (150000, -1)])
+    def test_invalid_inputs(self, default_profile, price, rent):
+        """Non-positive prices and negative rents are rejected."""
+        simulator = MonteCarloSimulator(default_profile, SimulationSpec())
+
+        with pytest.raises(ValueError):
+            simulator.run(price, rent, draws=10)
+
+    def test_zero_rent_allowed(self, default_profile):
+        """A zero expected rent is a valid (if grim) scenario."""
+        result = MonteCarloSimulator(default_profile, SimulationSpec()).run(150000, 0, draws=10)
+
+        assert (result.monthly_surplus_shortfall < 0).all()
+
+
+class TestDistribution:
+    """Tests for Distribution validation."""
+
+    def test_missing_parameters(self):
+        """Each type requires its parameters."""
+        with pytest.raises(ValidationError, match="requires: std"):
+            Distribution(type="normal", mean=0.04)
+
+    def test_low_above_high(self):
+        """Bounds must be ordered."""
+        with pytest.raises(ValidationError, match="low must not exceed high"):
+            Distribution(type="uniform", low=2, high=1)
+
+    def test_mode_outside_bounds(self):
+        """Triangular mode must lie within the bounds."""
+        with pytest.raises(ValidationError, match="mode must lie between"):
+            Distribution(type="triangular", low=1, mode=5, high=3)
+
+    def test_lognormal_mean_positive(self):
+        """Lognormal means must be positive."""
+        with pytest.raises(ValidationError, match="lognormal mean"):
+            Distribution(type="lognormal", mean=0, std=1)
+
+    def test_parameters_in_required_order(self):
+        """parameters() returns only the type's parameters, in order."""
+        distribution = Distribution(type="triangular", low=1, mode=2, high=3, min=0)
+
+        assert distribution.parameters() == (1.0, 2.0, 3.0)
+
+    def test_unknown_field(self):
+        """Unknown keys are rejected."""
+        with pytest.raises(ValidationError):
+            SimulationSpec(vacancy=Distribution(type="fixed", value=0.1))
@@ -0,0 +1,179 @@
+"""Unit tests for the goal-seek solvers."""
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.solver import RATE_CEILING, GoalSolver
+from mortgage_cli.models.profile import Profile
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.models.results import Verdict
+
+GOOD = {
+    Verdict.GREEN: {Verdict.GREEN},
+    Verdict.YELLOW: {Verdict.GREEN, Verdict.YELLOW},
+}
+
+
+def verdict_at(profile: Profile, price: float, down: float, target_rent: float) -> Verdict:
+    """Verdict of a single analysis against a target rent."""
+    profile = profile.model_copy(deep=True)
+    profile.budget.target_rent = target_rent
+    result = InvestmentAnalyzer(profile).analyze(
+        PropertyInput(price=price, expected_rent=target_rent, down_payment_percent=down)
+    )
+    return result.verdict
+
+
+class TestMaxPrice:
+    """Tests for GoalSolver.max_price."""
+
+    @pytest.mark.parametrize("verdict", [Verdict.GREEN, Verdict.YELLOW])
+    @pytest.mark.parametrize("target_rent", [800, 1000, 1500])
+    @pytest.mark.parametrize("down", [0.0, 0.2, 0.5])
+    def test_boundary(self, default_profile: Profile, verdict, target_rent, down):
+        """Just below the limit meets the goal; just above does not."""
+        prices, _ = GoalSolver(default_profile).max_price(target_rent, down, verdict)
+        price = float(prices)
+
+        assert verdict_at(default_profile, price * 0.9999, down, target_rent) in GOOD[verdict]
+        assert verdict_at(default_profile, price * 1.0001, down, target_rent) not in GOOD[verdict]
+
+    @pytest.mark.parametrize("verdict", [Verdict.GREEN, Verdict.YELLOW])
+    @pytest.mark.parametrize("down", [0.0, 0.2, 0.5])
+    def test_limit_meets_goal(self, default_profile: Profile, verdict, down):
+        """The returned price itself meets the goal when analyzed."""
+        prices, _ = GoalSolver(default_profile).max_price(1000, down, verdict)
+
+        assert verdict_at(default_profile, float(prices), down, 1000) in GOOD[verdict]
+
+    def test_inverted_thresholds(self, default_profile: Profile):
+        """A YELLOW threshold below the GREEN one solves YELLOW like GREEN."""
+        profile = default_profile.model_copy(deep=True)
+        profile.thresholds.yellow_below = 0.5
+        solver = GoalSolver(profile)
+
+        yellow, _ = solver.max_price(1000, 0.2, Verdict.YELLOW)
+        green, _ = solver.max_price(1000, 0.2, Verdict.GREEN)
+
+        assert yellow == green
+        assert verdict_at(profile, float(yellow), 0.2, 1000) == Verdict.GREEN
+
+    def test_limited_by_budget(self, default_profile: Profile):
+        """A large down payment makes the budget the binding limit."""
+        prices, by_budget = GoalSolver(default_profile).max_price([1000, 1000], [0.1, 0.5])
+
+        assert by_budget.tolist() == [False, True]
+        # Upfront cost at the limit uses the whole budget
+        assert prices[1] * (0.5 + 0.04) + 400 == pytest.approx(80000)
+
+    def test_unreachable(self, default_profile: Profile):
+        """A target rent below the fixed costs allows no price."""
+        prices, _ = GoalSolver(default_profile).max_price(200, 0.2)
+
+        assert np.isnan(prices)
+
+    def test_margin_below_price_step(self, default_profile: Profile):
+        """A margin too small for a one-cent price allows no price, not a negative one."""
+        solver = GoalSolver(default_profile)
+        green_below = default_profile.thresholds.green_below
+        target_rent = (solver.compiled.fixed_monthly + 1e-6) / green_below
+
+        prices, _ = solver.max_price(target_rent, 0.2)
+
+        assert np.isnan(prices)
+
+
+class TestMinDownPayment:
+    """Tests for GoalSolver.min_down_payment."""
+
+    @pytest.mark.parametrize("price", [80000, 120000, 150000])
+    def test_boundary(self, default_profile: Profile, price: float):
+        """Just above the minimum is GREEN; just below is not."""
+        min_down, max_down = GoalSolver(default_profile).min_down_payment(price, 1000)
+        down = float(min_down)
+
+        assert verdict_at(default_profile, price, min(down + 1e-4, 1.0), 1000) == Verdict.GREEN
+        if down > 0:
+            assert verdict_at(default_profile, price, down - 1e-4, 1000) != Verdict.GREEN
+        assert price * (float(max_down) + 0.04) + 400 == pytest.approx(80000)
+
+    @pytest.mark.parametrize("verdict", [Verdict.GREEN, Verdict.YELLOW])
+    @pytest.mark.parametrize("price", [80000, 120000, 150000])
+    def test_limit_meets_goal(self, default_profile: Profile, verdict, price: float):
+        """The returned down payment itself meets the goal when analyzed."""
+        min_down, _ = GoalSolver(default_profile).min_down_payment(price, 1000, verdict)
+
+        assert verdict_at(default_profile, price, float(min_down), 1000) in GOOD[verdict]
+
+    def test_no_affordable_down_payment(self, default_profile: Profile):
+        """Expensive properties need more down payment than the budget allows."""
+        min_down, max_down = GoalSolver(default_profile).min_down_payment(300000, 1000)
+
+        assert np.isnan(min_down)
+        assert 0 < max_down < 0.25
+
+    def test_cheap_property_needs_no_down_payment(self, default_profile: Profile):
+        """When even a full loan is GREEN the minimum is zero."""
+        min_down, _ = GoalSolver(default_profile).min_down_payment(50000, 1000)
+
+        assert min_down == 0.0
+
+
+class TestRentForReturn:
+    """Tests for GoalSolver.rent_for_return."""
+
+    @pytest.mark.parametrize("target", [-0.02, 0.0, 0.05, 0.12])
+    def test_round_trip(self, default_profile: Profile, target: float):
+        """Analyzing at the solved rent gives the target return."""
+        rent = float(GoalSolver(default_profile).rent_for_return(165000, 0.2, target))
+        result = InvestmentAnalyzer(default_profile).analyze(
+            PropertyInput(price=165000, expected_rent=rent, down_payment_percent=0.2)
+        )
+
+        assert result.cash_on_cash_return == pytest.approx(target, abs=1e-12)
+
+    def test_zero_return_is_break_even(self, default_profile: Profile):
+        """A zero return needs exactly the break-even rent."""
+        rent = GoalSolver(default_profile).rent_for_return(165000, 0.2, 0.0)
+        result = InvestmentAnalyzer(default_profile).analyze(
+            PropertyInput(price=165000, expected_rent=950, down_payment_percent=0.2)
+        )
+
+        assert rent == pytest.approx(result.break_even_rent)
+
+
+class TestMaxInterestRate:
+    """Tests for GoalSolver.max_interest_rate."""
+
+    @pytest.mark.parametrize("price", [80000, 100000, 120000])
+    def test_boundary(self, default_profile: Profile, price: float):
+        """Slightly lower rates stay GREEN; slightly higher ones do not."""
+        rate = float(GoalSolver(default_profile).max_interest_rate(price, 1000, 0.2))
+
+        for delta, expected in ((-1e-6, True), (1e-6, False)):
+            profile = default_profile.model_copy(deep=True)
+            profile.mortgage.interest_rate = rate + delta
+            assert (verdict_at(profile, price, 0.2, 1000) == Verdict.GREEN) is expected
+
+    def test_vectorized_matches_scalar(self, default_profile: Profile):
+        """Solving many targets at once gives the same rates."""
+        solver = GoalSolver(default_profile)
+        prices = np.linspace(60000, 140000, 50)
+
+        rates = solver.max_interest_rate(prices, 1000, 0.2)
+
+        for price, rate in zip(prices[::10], rates[::10]):
+            assert solver.max_interest_rate(price, 1000, 0.2) == pytest.approx(rate, nan_ok=True)
+
+    def test_unreachable_and_unbounded(self, default_profile: Profile):
+        """No rate works for expensive properties; any rate for a cash purchase."""
+        rates = GoalSolver(default_profile).max_interest_rate([250000, 60000], 1000, [0.2, 1.0])
+
+        assert np.isnan(rates[0])
+        assert rates[1] == RATE_CEILING
+
+    def test_red_is_not_a_goal(self, default_profile: Profile):
+        """Only GREEN and YELLOW can be solved for."""
+        with pytest.raises(ValueError, match="Use green or yellow"):
+            GoalSolver(default_profile).max_interest_rate(100000, 1000, 0.2, Verdict.RED)
@@ -0,0 +1,117 @@
+"""Cold-start tests for the CLI entry point.
+
+These check what gets imported; startup times are measured by the
+benchmarks (see benchmarks/suite.py, "startup").
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import mortgage_cli
+
+HEAVY_MODULES = ("numpy", "numpy_financial", "pydantic", "rich", "yaml")
+
+CLI_MODULES = ("typer", "click", "rich")
+
+SRC_DIR = str(Path(mortgage_cli.__file__).resolve().parent.parent)
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    """Run code in a fresh interpreter that imports this checkout."""
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _heavy_loaded(args: list[str]) -> set[str]:
+    """Run the CLI with args and report which heavy modules it imported."""
+    completed = _run(
+        f"""
+        import sys
+        from mortgage_cli.main import app
+        try:
+            app({args!r})
+        except SystemExit:
+            pass
+        heavy = {HEAVY_MODULES!r}
+        sys.stderr.write(",".join(m for m in heavy if m in sys.modules))
+        """
+    )
+    return set(filter(None, completed.stderr.split(",")))
+
+
+class TestStartup:
+    """Startup must not pay for modules the invoked command does not use."""
+
+    def test_version_loads_no_heavy_modules(self):
+        """--version only needs Typer."""
+        assert _heavy_loaded(["--version"]) == set()
+
+    def test_profile_list_skips_numpy(self):
+        """Profile listing does not load the numerical stack."""
+        loaded = _heavy_loaded(["profile", "list"])
+
+        assert "numpy" not in loaded
+        assert "numpy_financial" not in loaded
+
+    def test_command_loads_on_use(self):
+        """Running a command imports its dependencies."""
+        loaded = _heavy_loaded(["analyze", "--price", "150000", "--rent", "900"])
+
+        assert "numpy" in loaded
+
+    def test_import_loads_no_commands(self):
+        """Importing mortgage_cli.main loads no command module or heavy dependency."""
+        completed = _run(
+            f"""
+            import sys
+            import mortgage_cli.main
+            loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+            loaded += [m for m in sys.modules if m.startswith("mortgage_cli.commands.")]
+            print(",".join(loaded))
+            """
+        )
+
+        assert completed.stdout.strip() == ""
+
+
+class TestLibraryApi:
+    """mortgage_cli.api must stay usable without the CLI stack."""
+
+    def test_import_loads_nothing_heavy(self):
+        """Importing the API loads neither the numerical stack nor the CLI."""
+        completed = _run(
+            f"""
+            import sys
+            import mortgage_cli.api
+            modules = {(*HEAVY_MODULES, *CLI_MODULES)!r}
+            print(",".join(m for m in modules if m in sys.modules))
+            """
+        )
+
+        assert completed.stdout.strip() == ""
+
+    def test_calls_never_load_cli(self):
+        """Running every kind of computation leaves Typer and Rich unloaded."""
+        completed = _run(
+            f"""
+            import sys
+            from mortgage_cli import api
+            api.analyze(150000, 900)
+            api.analyze_batch([150000], [900])
+            api.matrix([100000, 150000], [0.2])
+            api.amortize(150000)
+            api.max_price(950)
+            print(",".join(m for m in {CLI_MODULES!r} if m in sys.modules))
+            """
+        )
+
+        assert completed.stdout.strip() == ""
@@ -0,0 +1,173 @@
+"""Tests for the SQLite results store."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from mortgage_cli.core.analyzer import InvestmentAnalyzer
+from mortgage_cli.core.engine import MatrixEngine
+from mortgage_cli.models.property import PropertyInput
+from mortgage_cli.store import STORE_FORMAT, ResultQuery, ResultStore, open_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An empty store in a temporary directory."""
+    with ResultStore(tmp_path / "results.db") as results:
+        yield results
+
+
+class TestResultStore:
+    """Tests for ResultStore."""
+
+    def test_analysis_round_trip(self, store, default_profile):
+        """A stored analysis reads back with every metric."""
+        result = InvestmentAnalyzer(default_profile).analyze(
+            PropertyInput(price=150000, expected_rent=900)
+        )
+        with store.run("analyze", "default") as run:
+            run.add_analysis(result)
+
+        [row] = store.query(ResultQuery())
+        assert row["run_id"] == 1
+        assert row["profile"] == "default"
+        assert row["property_price"] == 150000
+        assert row["break_even_rent"] == pytest.approx(result.break_even_rent)
+        assert row["cash_on_cash_return"] == pytest.approx(result.cash_on_cash_return)
+        assert row["upfront_total"] == pytest.approx(result.upfront_costs.total)
+        assert row["verdict"] == result.verdict.value
+        assert row["within_budget"] is True
+
+    def test_batch_matches_analyzer(self, store, default_profile):
+        """Batch rows are stored in order with the analyzer's values."""
+        analyzer = InvestmentAnalyzer(default_profile)
+        batch = analyzer.analyze_batch(
+            np.array([100000.0, 150000.0, 500000.0]),
+            np.array([900.0, 900.0, 2000.0]),
+        )
+        with store.run("batch", "default") as run:
+            run.add_batch(batch)
+
+        rows = store.query(ResultQuery())
+        assert [row["property_price"] for row in rows] == [100000, 150000, 500000]
+        assert [row["verdict"] for row in rows] == [v.value for v in batch.verdicts]
+        assert run.count == 3
+
+    def test_matrix_cells_match_analyzer(self, store, default_profile):
+        """Matrix cells get the return the analyzer gives at the target rent."""
+        matrix = MatrixEngine(default_profile).evaluate([100000, 150000], [0.1, 0.2, 0.3])
+        with store.run("matrix", "default") as run:
+            run.add_matrix(matrix, 1000)
+
+        rows = store.query(ResultQuery())
+        assert len(rows) == 6
+        analyzer = InvestmentAnalyzer(default_profile)
+        for row in rows:
+            expected = analyzer.analyze(
+                PropertyInput(
+                    price=row["property_price"],
+                    expected_rent=1000,
+                    down_payment_percent=row["down_payment_percent"],
+                )
+            )
+            assert row["cash_on_cash_return"] == pytest.approx(expected.cash_on_cash_return)
+            assert row["verdict"] == expected.verdict.value
+
+    def test_filters(self, store, default_profile):
+        """Verdict, price and return filters combine."""
+        matrix = MatrixEngine(default_profile).evaluate(
+            np.arange(60000, 300001, 20000), [0.1, 0.2, 0.3]
+        )
+        with store.run("matrix", "default") as run:
+            run.add_matrix(matrix, 1000)
+
+        rows = store.query(
+            ResultQuery(verdicts=("green",), max_price=180000, min_return=0.04)
+        )
+
+        assert rows
+        for row in rows:
+            assert row["verdict"] == "green"
+            assert row["property_price"] <= 180000
+            assert row["cash_on_cash_return"] >= 0.04
+        prices = [row["property_price"] for row in rows]
+        assert prices == sorted(prices)
+
+    def test_order_and_limit(self, store, default_profile):
+        """Results can be ordered by return, highest first, and limited."""
+        matrix = MatrixEngine(default_profile).evaluate([100000, 150000, 200000], [0.2])
+        with store.run("matrix", "default") as run:
+            run.add_matrix(matrix, 1000)
+
+        rows = store.query(
+            ResultQuery(order_by="cash_on_cash_return", descending=True, limit=2)
+        )
+
+        assert len(rows) == 2
+        assert rows[0]["cash_on_cash_return"] >= rows[1]["cash_on_cash_return"]
+
+    def test_rejects_unknown_order(self, store):
+        """Only ORDER_COLUMNS can be used for ordering."""
+        with pytest.raises(ValueError, match="Cannot order by"):
+            store.query(ResultQuery(order_by="verdict; DROP TABLE results"))
+
+    def test_failed_run_rolls_back(self, store, default_profile):
+        """Nothing from a run that raises is kept."""
+        matrix = MatrixEngine(default_profile).evaluate([100000], [0.2])
+        with pytest.raises(RuntimeError):
+            with store.run("matrix", "default") as run:
+                run.add_matrix(matrix, 1000)
+                raise RuntimeError
+
+        assert store.query(ResultQuery()) == []
+        assert store.runs() == []
+
+    def test_runs(self, store, default_profile):
+        """Runs are listed with their result counts."""
+        matrix = MatrixEngine(default_profile).evaluate([100000, 150000], [0.2])
+        with store.run("matrix", "default") as run:
+            run.add_matrix(matrix, 1000)
+
+        [listed] = store.runs()
+        assert listed["command"] == "matrix"
+        assert listed["results"] == 2
+
+    def test_queries_use_indexes(self, store):
+        """Verdict and price filters are answered from an index."""
+        plan = store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM results "
+            "WHERE verdict = 'green' AND property_price <= 180000"
+        ).fetchall()
+
+        assert "USING INDEX results_verdict" in plan[0][-1]
+
+
+class TestOpenStore:
+    """Tests for open_store."""
+
+    def test_other_format_rejected(self, tmp_path):
+        """A database from another store format is not reused."""
+        path = tmp_path / "results.db"
+        connection = sqlite3.connect(path)
+        connection.execute(f"PRAGMA user_version = {STORE_FORMAT + 1}")
+        connection.close()
+
+        with pytest.raises(ValueError, match="format"):
+            open_store(path)
+
+    def test_not_a_database(self, tmp_path):
+        """A file that is not SQLite gives a ValueError."""
+        path = tmp_path / "results.db"
+        path.write_text("not a database" * 100)
+
+        with pytest.raises(ValueError, match="Cannot open results store"):
+            open_store(path)
+
+    def test_default_location(self, tmp_path, monkeypatch):
+        """Without a path the store lives in the config dir."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        open_store().close()
+
+        assert (tmp_path / "mortgage-cli" / "results.db").exists()
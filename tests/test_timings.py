@@ -0,0 +1,163 @@
+"""Tests for --timings stage timing and counters."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from mortgage_cli import timings
+from mortgage_cli.main import app
+from mortgage_cli.timings import Timings
+
+runner = CliRunner()
+
+MATRIX_ARGS = ["matrix", "--price-min", "100000", "--price-max", "140000", "--output", "json"]
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    """Never leak an active recorder between tests."""
+    yield
+    timings.disable()
+
+
+class TestTimings:
+    """Tests for the Timings recorder."""
+
+    def test_stage_accumulates(self):
+        """Repeated stages add up."""
+        recorder = Timings()
+        recorder.add("compute", 0.25)
+        recorder.add("compute", 0.5)
+
+        assert recorder.stages["compute"] == pytest.approx(0.75)
+
+    def test_stage_context_records_on_error(self):
+        """A stage is recorded even when its block raises."""
+        recorder = Timings()
+        with pytest.raises(RuntimeError):
+            with recorder.stage("compute"):
+                raise RuntimeError
+
+        assert "compute" in recorder.stages
+
+    def test_nested_stage_is_exclusive(self, monkeypatch):
+        """Time in a nested stage is charged to the innermost stage only."""
+        clock = iter([0.0, 1.0, 3.0, 4.0, 10.0])
+        monkeypatch.setattr(timings.time, "perf_counter", lambda: next(clock))
+        recorder = Timings(started=0.0)
+        with recorder.stage("write"):
+            with recorder.stage("cache"):
+                pass
+
+        data = recorder.to_dict()
+        assert data["stages"] == {"write": pytest.approx(2.0), "cache": pytest.approx(2.0)}
+        assert data["other"] == pytest.approx(6.0)
+
+    def test_counters(self):
+        """Counters increment by the given amount."""
+        recorder = Timings()
+        recorder.count("analyses")
+        recorder.count("analyses", 9)
+
+        assert recorder.counters == {"analyses": 10}
+
+    def test_known_stages_reported_in_pipeline_order(self):
+        """Known stages come first in pipeline order, others after."""
+        recorder = Timings()
+        for name in ("write", "custom", "import", "compute"):
+            recorder.add(name, 0.1)
+
+        assert list(recorder.to_dict()["stages"]) == ["import", "compute", "write", "custom"]
+
+    def test_report_lists_stages_and_counters(self):
+        """The text report names every stage and counter."""
+        recorder = Timings()
+        recorder.add("format", 0.002)
+        recorder.count("cells_rendered", 1200)
+
+        report = recorder.format_report()
+
+        assert "format" in report
+        assert "2.00 ms" in report
+        assert "cells_rendered" in report
+        assert "1,200" in report
+
+    def test_disabled_hooks_are_noops(self):
+        """Module-level hooks do nothing unless recording is enabled."""
+        with timings.stage("compute"):
+            pass
+        timings.count("analyses")
+
+        assert timings.active() is None
+
+    def test_enabled_hooks_record(self):
+        """Module-level hooks feed the active recorder."""
+        recorder = timings.enable()
+        with timings.stage("compute"):
+            pass
+        timings.count("analyses", 3)
+
+        assert "compute" in recorder.stages
+        assert recorder.counters["analyses"] == 3
+
+
+class TestTimingsOption:
+    """Tests for the global --timings options."""
+
+    def test_report_on_stderr(self):
+        """--timings prints the report to stderr, leaving stdout untouched."""
+        result = runner.invoke(app, ["--timings", *MATRIX_ARGS])
+
+        assert result.exit_code == 0
+        json.loads(result.stdout)
+        assert "Timings:" in result.stderr
+        for name in ("import", "profile", "compute", "format", "write", "total"):
+            assert name in result.stderr
+        assert "cells_rendered" in result.stderr
+
+    def test_json_report_file(self, tmp_path):
+        """--timings-json writes stage seconds and counters to a file."""
+        path = tmp_path / "timings.json"
+
+        result = runner.invoke(app, ["--timings-json", str(path), *MATRIX_ARGS])
+
+        assert result.exit_code == 0
+        report = json.loads(path.read_text())
+        assert set(report["stages"]) >= {"compute", "format", "write"}
+        assert report["counters"]["analyses"] == 3 * 9
+        assert report["counters"]["cells_rendered"] == 3 * 9
+        assert report["total"] >= sum(report["stages"].values())
+
+    def test_profile_cache_counters(self, tmp_path, monkeypatch):
+        """Profile loads count cache misses and hits."""
+        from mortgage_cli.config.manager import ConfigManager
+        from mortgage_cli.config.defaults import DEFAULT_PROFILE
+
+        profiles_dir = tmp_path / "profiles"
+        monkeypatch.setattr(
+            "mortgage_cli.config.manager.get_profiles_dir", lambda: profiles_dir
+        )
+        ConfigManager().save_profile(DEFAULT_PROFILE.model_copy(update={"name": "cached"}))
+        args = ["analyze", "-p", "150000", "-r", "900", "--profile", "cached", "-o", "json"]
+        path = tmp_path / "timings.json"
+
+        runner.invoke(app, ["--timings-json", str(path), *args])
+        first = json.loads(path.read_text())["counters"]
+        runner.invoke(app, ["--timings-json", str(path), *args])
+        second = json.loads(path.read_text())["counters"]
+
+        assert first["profile_cache_misses"] == 1
+        assert second["profile_cache_hits"] == 1
+
+    def test_recording_stops_after_command(self):
+        """The recorder is disabled once the command finishes."""
+        runner.invoke(app, ["--timings", *MATRIX_ARGS])
+
+        assert timings.active() is None
+
+    def test_no_report_by_default(self):
+        """Without the options nothing is reported."""
+        result = runner.invoke(app, MATRIX_ARGS)
+
+        assert "Timings:" not in result.stderr